@@ -14,16 +14,23 @@
 
 from model_navigator.__version__ import __version__  # noqa: F401
 from model_navigator.configuration import (  # noqa: F401  # noqa: F401
+    BatchSizeSearch,
     DeviceKind,
     Format,
     Framework,
     JitType,
     MaxThroughputAndMinLatencyStrategy,
     MaxThroughputStrategy,
+    MaxThroughputWithConstraintsStrategy,
     MaxThroughputWithLatencyBudgetStrategy,
     MinLatencyStrategy,
     OnnxConfig,
+    OnnxExecutionMode,
+    OnnxGraphOptimizationLevel,
+    OnnxSessionOptions,
     OptimizationProfile,
+    PackageCompression,
+    ParetoObjective,
     SelectedRuntimeStrategy,
     TensorFlowConfig,
     TensorFlowTensorRTConfig,
@@ -36,6 +43,8 @@ from model_navigator.configuration import (  # noqa: F401  # noqa: F401
     TorchExportConfig,
     TorchScriptConfig,
     TorchTensorRTConfig,
+    WorkloadAwareStrategy,
+    WorkloadObjective,
 )
 from model_navigator.frameworks import (  # noqa: F401
     is_tf_available,
@@ -49,6 +58,7 @@ if is_torch_available():
     from model_navigator.inplace import (  # noqa: F401, F403
         InplaceConfig,
         Module,
+        ModuleRuntimesObjective,
         OptimizeConfig,
         bundle,
         inplace_config,
@@ -56,6 +66,7 @@ if is_torch_available():
         module,
         optimize,
         profile,
+        search_module_runtimes,
     )
 if is_tf_available():
     from model_navigator import tensorflow  # noqa: F401
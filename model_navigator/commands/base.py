@@ -61,6 +61,10 @@ class CommandOutput(DataObject):
         )
 
 
+def _filter_dict_for_func(data_dict: Dict[str, Any], func: Callable) -> Dict[str, Any]:
+    return {k: v for k, v in data_dict.items() if k in getfullargspec(func).args}
+
+
 class CommandMeta(abc.ABCMeta):  # noqa: B024
     """Metaclass for command."""
 
@@ -82,12 +86,26 @@ class Command(metaclass=CommandMeta):
     """Base class for command definition."""
 
     _is_required: bool = False
+    _is_concurrent: bool = False
+    _is_cacheable: bool = False
+    _is_device_exclusive: bool = False
     _requires: Optional[List[str]] = None
 
-    def __init_subclass__(cls, is_required: bool = False, requires: Optional[List[str]] = None, **kwargs):
+    def __init_subclass__(
+        cls,
+        is_required: bool = False,
+        is_concurrent: bool = False,
+        is_cacheable: bool = False,
+        is_device_exclusive: bool = False,
+        requires: Optional[List[str]] = None,
+        **kwargs,
+    ):
         """Initialization of a command subclass."""
         super().__init_subclass__(**kwargs)
         cls._is_required = is_required
+        cls._is_concurrent = is_concurrent
+        cls._is_cacheable = is_cacheable
+        cls._is_device_exclusive = is_device_exclusive
         cls._requires = requires if requires is not None else []
 
     @classmethod
@@ -99,6 +117,42 @@ class Command(metaclass=CommandMeta):
         """
         return cls._is_required
 
+    @classmethod
+    def is_concurrent(cls):
+        """Indicates if Command can be run concurrently with other commands.
+
+        Such commands execute their workload for serialized models in child processes and do not measure
+        performance, so they do not share state with the main process nor affect each other results.
+
+        Returns:
+            True if command can be run concurrently, False otherwise
+        """
+        return cls._is_concurrent
+
+    @classmethod
+    def is_cacheable(cls):
+        """Indicates if the model produced by Command can be restored from the artifact cache.
+
+        Such commands produce the model only in the directory of the model config path, and their result
+        depends only on the source or parent model and command arguments.
+
+        Returns:
+            True if command result can be cached, False otherwise
+        """
+        return cls._is_cacheable
+
+    @classmethod
+    def is_device_exclusive(cls):
+        """Indicates if Command run concurrently has to be the only unit running on its device.
+
+        Such commands search for limits of the device, e.g. the maximal batch size fitting into the device memory,
+        so their results depend on other units sharing the device.
+
+        Returns:
+            True if command requires the device for itself, False otherwise
+        """
+        return cls._is_device_exclusive
+
     @classmethod
     def requires(cls):
         """Return required commands to execute current command.
@@ -118,18 +172,25 @@ class Command(metaclass=CommandMeta):
         Returns:
             Output with command result
         """
-
-        def _filter_dict_for_func(data_dict: Dict[str, Any], func: Callable):
-            return {k: v for k, v in data_dict.items() if k in getfullargspec(func).args}
-
         do_execute = self._pre_run(*args, **_filter_dict_for_func(kwargs, self._pre_run))
         if do_execute:
-            output = self._run(*args, **_filter_dict_for_func(kwargs, self._run))
+            output = self._run(*args, **self.get_run_args(kwargs))
         else:
             output = CommandOutput(CommandStatus.SKIPPED)
         self._post_run(output, *args, **_filter_dict_for_func(kwargs, self._post_run))
         return output
 
+    def get_run_args(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Select keyword arguments accepted by the command execution.
+
+        Args:
+            kwargs: Keyword arguments passed to the command
+
+        Returns:
+            Keyword arguments of `_run` method
+        """
+        return _filter_dict_for_func(kwargs, self._run)
+
     def _pre_run(self, *args, **kwargs) -> bool:
         """Pre-run command execution.
 
@@ -35,7 +35,9 @@ from model_navigator.utils import devices
 from model_navigator.utils.common import parse_kwargs_to_cmd
 
 
-class ConvertONNX2TRT(Convert2TensorRTWithMaxBatchSizeSearch):
+class ConvertONNX2TRT(
+    Convert2TensorRTWithMaxBatchSizeSearch, is_concurrent=True, is_cacheable=True, is_device_exclusive=True
+):
     """Command that converts ONNX checkpoint to TensorRT model plan."""
 
     def _run(
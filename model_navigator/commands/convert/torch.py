@@ -31,7 +31,7 @@ from model_navigator.utils import devices
 from model_navigator.utils.common import parse_kwargs_to_cmd
 
 
-class ConvertTorchScript2ONNX(Command):
+class ConvertTorchScript2ONNX(Command, is_concurrent=True, is_cacheable=True):
     """Convert TorchScript to ONNX."""
 
     def _run(
@@ -101,7 +101,9 @@ class ConvertTorchScript2ONNX(Command):
         return CommandOutput(status=CommandStatus.OK)
 
 
-class ConvertExportedProgram2TorchTensorRT(Convert2TensorRTWithMaxBatchSizeSearch):
+class ConvertExportedProgram2TorchTensorRT(
+    Convert2TensorRTWithMaxBatchSizeSearch, is_concurrent=True, is_cacheable=True, is_device_exclusive=True
+):
     """Convert ExportedProgram to Torch-TensorRT."""
 
     def _run(
@@ -18,7 +18,9 @@ import shutil
 from typing import Optional, Union
 
 from model_navigator.commands.base import Command, CommandOutput, CommandStatus
+from model_navigator.core.logger import LOGGER
 from model_navigator.core.workspace import Workspace
+from model_navigator.frameworks.onnx.utils import ONNX_RT_OPTIMIZED_MODEL_KEY_SUFFIX, ONNX_RT_OPTIMIZED_MODEL_SUFFIX
 
 
 class CopyModel(Command):
@@ -81,3 +83,49 @@ class CopyModelFromPath(Command):
         shutil.copy(src=model_path, dst=destination_model_path)
 
         return CommandOutput(status=CommandStatus.OK)
+
+
+class CopyParentModel(Command):
+    """Copy parent model files command."""
+
+    def _run(
+        self,
+        workspace: Workspace,
+        path: pathlib.Path,
+        parent_path: Optional[pathlib.Path] = None,
+        log_path: Optional[pathlib.Path] = None,
+    ) -> CommandOutput:
+        """Run copy of the parent model with its additional files, e.g. ONNX external data.
+
+        Args:
+            workspace (Path): Model Navigator workspace path.
+            path (Path): model path to copy to. Relative to workspace path.
+            parent_path (Optional[Path], optional): parent model path to copy from. Relative to workspace path.
+            log_path (Optional[Path], optional): path to the log file. Logs of the parent are not copied.
+
+        Returns:
+            CommandOutput: Status OK.
+        """
+        destination_model_path = workspace.path / path
+        if destination_model_path.exists():
+            return CommandOutput(status=CommandStatus.SKIPPED)
+        assert parent_path is not None, "parent_path must be provided"
+
+        source_model_path = workspace.path / parent_path
+        if not source_model_path.exists():
+            LOGGER.warning(f"Parent model {parent_path} is not available.")
+            return CommandOutput(status=CommandStatus.FAIL)
+
+        destination_model_path.parent.mkdir(parents=True, exist_ok=True)
+        skipped_files = {log_path.name} if log_path is not None else set()
+        for source_file in source_model_path.parent.iterdir():
+            if not source_file.is_file() or source_file.name in skipped_files:
+                continue
+
+            # models optimized by ONNX Runtime depend on session options of the parent
+            if source_file.name.endswith((ONNX_RT_OPTIMIZED_MODEL_SUFFIX, ONNX_RT_OPTIMIZED_MODEL_KEY_SUFFIX)):
+                continue
+
+            shutil.copy(src=source_file, dst=destination_model_path.parent / source_file.name)
+
+        return CommandOutput(status=CommandStatus.OK)
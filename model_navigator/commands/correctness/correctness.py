@@ -81,7 +81,7 @@ class TolerancePerOutputName(Dict[str, Tolerance]):
         return tol_per_out
 
 
-class Correctness(Command):
+class Correctness(Command, is_concurrent=True):
     """Correctness Command."""
 
     def _run(
@@ -152,6 +152,7 @@ class Correctness(Command):
                 correctness_script.correctness,
                 args=parse_kwargs_to_cmd(kwargs),
                 run_in_isolation=run_in_isolation,
+                worker_key=f"{runner_cls.name()}:{path}",
             )
             per_output_tolerance = TolerancePerOutputName.from_json(json.load(temp_file))
 
@@ -19,13 +19,13 @@ import sys
 from typing import Dict, Optional
 
 import fire
-import numpy as np
 
 from model_navigator.commands.correctness.correctness import Tolerance, TolerancePerOutputName
+from model_navigator.commands.warm_worker import get_warm_runner
+from model_navigator.core.comparison import compare_tensors
 from model_navigator.core.dataloader import load_samples
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata
-from model_navigator.runners.registry import get_runner
 
 
 def get_model() -> object:
@@ -78,14 +78,15 @@ def correctness(
 
     input_metadata = TensorMetadata.from_json(input_metadata)
     output_metadata = TensorMetadata.from_json(output_metadata)
-    runner = get_runner(runner_name)(
+    runner = get_warm_runner(
+        runner_name,
         model=model,
         input_metadata=input_metadata,
         output_metadata=output_metadata,
         navigator_workspace=navigator_workspace,
         batch_dim=batch_dim,
         **runner_config,
-    )  # pytype: disable=not-instantiable
+    )
 
     per_output_tolerance = TolerancePerOutputName({name: Tolerance(0.0, 0.0) for name in output_metadata})
     with runner:
@@ -102,26 +103,19 @@ def correctness(
                 sys.exit(1)
 
             for name in output_metadata:
-                if any(np.isnan(comp_output[name]).flatten()):
+                comparison = compare_tensors(original_output[name], comp_output[name])
+                if comparison.nan_count > 0:
                     LOGGER.error(f"Comparison output {name} contains NaN")
                     sys.exit(1)
 
-                if any(np.isinf(comp_output[name]).flatten()):
+                if comparison.inf_count > 0:
                     LOGGER.error(f"Comparison output {name} contains inf")
                     sys.exit(1)
 
-                out0, out1 = original_output[name], comp_output[name]
-                absdiff = np.abs(out0 - out1)
-                absout1 = np.abs(out1)
-
-                reldiff = absdiff / absout1
-                max_reldiff = np.amax(reldiff)
-                max_absdiff = np.amax(absdiff)
-
-                if max_absdiff > per_output_tolerance[name].atol:
-                    per_output_tolerance[name].atol = float(max_absdiff)
-                if max_reldiff > per_output_tolerance[name].rtol:
-                    per_output_tolerance[name].rtol = float(max_reldiff)
+                if comparison.max_abs_error > per_output_tolerance[name].atol:
+                    per_output_tolerance[name].atol = comparison.max_abs_error
+                if comparison.max_rel_error > per_output_tolerance[name].rtol:
+                    per_output_tolerance[name].rtol = comparison.max_rel_error
 
     results_path = pathlib.Path(results_path)
     with results_path.open("w") as f:
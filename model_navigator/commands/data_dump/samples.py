@@ -13,14 +13,20 @@
 # limitations under the License.
 """Commands for fetching and dumping model IO."""
 
-from typing import Any, Optional, Type
+from typing import Any, Iterable, Iterator, List, Optional, Type
 
 import numpy as np
 
 from model_navigator.commands.base import Command, CommandOutput, CommandStatus
-from model_navigator.configuration import OptimizationProfile, SizedDataLoader, TensorRTProfile
+from model_navigator.configuration import OptimizationProfile, Sample, SizedDataLoader
 from model_navigator.configuration.runner.runner_config import RunnerConfig
-from model_navigator.core.dataloader import IndiciesFilteredDataloader, extract_sample, load_samples, samples_to_npz
+from model_navigator.core.dataloader import (  # noqa: F401
+    IndiciesFilteredDataloader,
+    load_samples,
+    samples_to_npz,
+    samples_to_store,
+)
+from model_navigator.core.ingestion import DataloaderIngestion
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata
 from model_navigator.core.workspace import Workspace
@@ -40,8 +46,8 @@ class FetchInputModelData(Command, is_required=True):
         input_metadata: TensorMetadata,
         batch_dim: Optional[int],
         seed: int,
-        dataloader_trt_profile: TensorRTProfile,
         optimization_profile: OptimizationProfile,
+        input_samples_collected: bool = False,
         raise_on_error: Optional[bool] = False,
     ) -> CommandOutput:
         """Run the command.
@@ -51,6 +57,9 @@ class FetchInputModelData(Command, is_required=True):
             2) conversion samples - samples spanning all dimensions sizes from min to max,
             3) correctness samples - `sample_count` samples for verifying correctness.
 
+        Samples are fetched in a single pass over the dataloader. The pass is skipped when samples
+        were already saved to the workspace by InferInputMetadata.
+
         Args:
             workspace: Workspace of current execution.
             framework: Model framework.
@@ -59,50 +68,31 @@ class FetchInputModelData(Command, is_required=True):
             input_metadata: Input metadata.
             batch_dim: Batch dimension.
             seed: Random seed.
-            dataloader_trt_profile: Model TensorRT Profile.
             optimization_profile: Performance configuration with dataloader override
+            input_samples_collected: Flag indicating that samples were saved when inferring input metadata.
             raise_on_error: If True raise an error when one of the samples is invalid. Defaults to False.
 
         Returns:
             CommandOutput: Fetched samples.
         """
-        num_samples = len(dataloader)
-        if sample_count > num_samples:
-            LOGGER.warning(
-                f"Requested sample_count ({sample_count}) is larger than "
-                f"the number of available samples ({num_samples}). Using {num_samples} samples."
-            )
-            sample_count = num_samples
-
-        LOGGER.info("Collecting input samples for model.")
-        np.random.seed(seed)
-        correctness_samples_ind = set(np.random.choice(num_samples, size=sample_count, replace=False))
-        profiling_sample_ind, conversion_samples_ind = self._collect_samples(
-            dataloader,
-            input_metadata,
-            dataloader_trt_profile,
-            framework,
-            correctness_samples_ind,
-        )
-
         sample_data_path = workspace.path / "model_input"
-        sample_data_path.mkdir(parents=True, exist_ok=True)
-
-        LOGGER.info("Saving samples into the workspace.")
-        for samples_ind, dirname in [
-            ([profiling_sample_ind], "profiling"),
-            (correctness_samples_ind, "correctness"),
-            (conversion_samples_ind, "conversion"),
-        ]:
-            sample_path = sample_data_path / dirname
-            if dirname == "profiling" and optimization_profile.dataloader is not None:
-                LOGGER.info("Using performance dataloader for profiling sample. Collecting first item only.")
-                samples = IndiciesFilteredDataloader(optimization_profile.dataloader, [0])
-            else:
-                samples = IndiciesFilteredDataloader(dataloader, samples_ind)
-            samples_to_npz(
-                samples,
-                sample_path,
+        if not input_samples_collected:
+            LOGGER.info("Collecting input samples for model.")
+            DataloaderIngestion(
+                pytree_metadata=input_metadata.pytree_metadata,
+                framework=framework,
+                batch_dim=batch_dim,
+                samples_path=sample_data_path,
+                sample_count=sample_count,
+                seed=seed,
+                raise_on_error=raise_on_error,
+            ).run(dataloader)
+
+        if optimization_profile.dataloader is not None:
+            LOGGER.info("Using performance dataloader for profiling sample. Collecting first item only.")
+            samples_to_store(
+                IndiciesFilteredDataloader(optimization_profile.dataloader, [0]),
+                sample_data_path / "profiling",
                 batch_dim,
                 metadata=input_metadata,
                 framework=framework,
@@ -113,52 +103,6 @@ class FetchInputModelData(Command, is_required=True):
             status=CommandStatus.OK,
         )
 
-    @staticmethod
-    def _collect_samples(dataloader, input_metadata, trt_profile, framework, correctness_samples_ind):
-        profiling_sample_ind = None
-        correctness_samples_ind = []
-        conversion_samples_ind = []
-        conversion_min_max_sampled = {
-            name: {ax: {"min": False, "max": False} for ax in range(len(input_metadata[name].shape))}
-            for name in input_metadata
-        }
-        for i, sample in enumerate(dataloader):
-            if i >= len(dataloader):
-                break
-            sample = extract_sample(sample, input_metadata, framework)
-
-            do_sample_conversion = False
-            do_sample_profiling = False
-            for name in input_metadata:
-                if name not in trt_profile:
-                    if not conversion_min_max_sampled[name]:
-                        do_sample_conversion = True
-                        conversion_min_max_sampled[name] = True
-                else:
-                    for (ax, shapes), tensor_dim in zip(
-                        enumerate(zip(trt_profile[name].min, trt_profile[name].opt, trt_profile[name].max)),
-                        sample[name].shape,
-                    ):
-                        if tensor_dim == shapes[0] and not conversion_min_max_sampled[name][ax]["min"]:
-                            do_sample_conversion = True
-                            conversion_min_max_sampled[name][ax]["min"] = True
-                        if tensor_dim == shapes[2] and not conversion_min_max_sampled[name][ax]["max"]:
-                            do_sample_conversion = True
-                            conversion_min_max_sampled[name][ax]["max"] = True
-                            do_sample_profiling = True
-
-            if do_sample_conversion:
-                conversion_samples_ind.append(i)
-            if do_sample_profiling:
-                profiling_sample_ind = i
-
-        if not conversion_samples_ind:
-            conversion_samples_ind = correctness_samples_ind[:1]
-        if profiling_sample_ind is None:
-            profiling_sample_ind = correctness_samples_ind[0]
-
-        return profiling_sample_ind, conversion_samples_ind
-
 
 class FetchOutputModelData(Command, is_required=True):
     """Command for saving model outputs."""
@@ -173,9 +117,14 @@ class FetchOutputModelData(Command, is_required=True):
         batch_dim: Optional[int],
         runner_config: Optional[RunnerConfig] = None,
         raise_on_error: Optional[bool] = True,
+        dataloader_max_batch_size: Optional[int] = None,
     ) -> CommandOutput:
         """Run the command and save model outputs.
 
+        The runner is activated once for all samples. When batching is enabled, consecutive samples with the same
+        shapes apart from the batch dimension are concatenated into batches with up to the largest batch size
+        of the dataloader rows and outputs are split back per sample.
+
         Args:
             framework: Model framework.
             workspace: Model Navigator workspace path.
@@ -187,6 +136,7 @@ class FetchOutputModelData(Command, is_required=True):
             runner_config: Additional runner arguments.
             raise_on_error: If True raise an error when one of the samples is invalid.
                 Defaults to True.
+            dataloader_max_batch_size: Largest batch size in the dataloader. When None, samples are not batched.
 
         Returns:
             CommandOutput
@@ -199,18 +149,89 @@ class FetchOutputModelData(Command, is_required=True):
             model=model, input_metadata=input_metadata, output_metadata=output_metadata, **runner_kwargs
         )
 
-        for input_sample, sample_name in [
-            ("profiling_sample", "profiling"),
-            ("correctness_samples", "correctness"),
-            ("conversion_samples", "conversion"),
-        ]:
-            samples = load_samples(samples_name=input_sample, workspace=workspace.path, batch_dim=batch_dim)
-            with runner:
-                outputs = (runner.infer(sample) for sample in samples)
+        max_batch_size = 1
+        if dataloader_max_batch_size and _is_batching_supported(input_metadata, batch_dim):
+            max_batch_size = dataloader_max_batch_size
+        with runner:
+            for input_sample, sample_name in [
+                ("profiling_sample", "profiling"),
+                ("correctness_samples", "correctness"),
+                ("conversion_samples", "conversion"),
+            ]:
+                samples = load_samples(samples_name=input_sample, workspace=workspace.path, batch_dim=batch_dim)
+                outputs = _infer_batched(runner, samples, batch_dim, max_batch_size)
 
                 sample_path = output_data_path / sample_name
-                samples_to_npz(outputs, sample_path, batch_dim, raise_on_error=raise_on_error, num_samples=len(samples))
+                samples_to_store(outputs, sample_path, batch_dim, raise_on_error=raise_on_error)
 
         return CommandOutput(
             status=CommandStatus.OK,
         )
+
+
+def _infer_batched(
+    runner: NavigatorRunner, samples: Iterable[Sample], batch_dim: Optional[int], max_batch_size: int
+) -> Iterator[Sample]:
+    """Infer samples in batches of consecutive samples with the same shapes and yield outputs per sample.
+
+    Samples of a batched dataloader already hold several rows, so the batch is limited by the number of rows.
+    """
+    batch, batch_size = [], 0
+    for sample in samples:
+        sample_batch_size = _get_batch_size(sample, batch_dim)
+        if batch and (
+            batch_size + sample_batch_size > max_batch_size or not _have_same_shapes(batch[0], sample, batch_dim)
+        ):
+            yield from _infer_batch(runner, batch, batch_dim)
+            batch, batch_size = [], 0
+        batch.append(sample)
+        batch_size += sample_batch_size
+
+    if batch:
+        yield from _infer_batch(runner, batch, batch_dim)
+
+
+def _infer_batch(runner: NavigatorRunner, batch: List[Sample], batch_dim: Optional[int]) -> Iterator[Sample]:
+    if len(batch) == 1:
+        yield runner.infer(batch[0])
+        return
+
+    batch_sample = {name: np.concatenate([sample[name] for sample in batch], axis=batch_dim) for name in batch[0]}
+    batch_size = sum(_get_batch_size(sample, batch_dim) for sample in batch)
+    outputs = runner.infer(batch_sample)
+    if not all(tensor.ndim > batch_dim and tensor.shape[batch_dim] == batch_size for tensor in outputs.values()):
+        LOGGER.debug("Outputs of batched samples cannot be split by batch dimension. Inferring samples one by one.")
+        for sample in batch:
+            yield runner.infer(sample)
+        return
+
+    start = 0
+    for sample in batch:
+        sample_batch_size = _get_batch_size(sample, batch_dim)
+        item = (slice(None),) * batch_dim + (slice(start, start + sample_batch_size),)
+        yield {name: tensor[item] for name, tensor in outputs.items()}
+        start += sample_batch_size
+
+
+def _get_batch_size(sample: Sample, batch_dim: Optional[int]) -> int:
+    if batch_dim is None:
+        return 1
+    return next(iter(sample.values())).shape[batch_dim]
+
+
+def _is_batching_supported(input_metadata: TensorMetadata, batch_dim: Optional[int]) -> bool:
+    return batch_dim is not None and all(
+        len(spec.shape) > batch_dim and spec.shape[batch_dim] == -1 for spec in input_metadata.values()
+    )
+
+
+def _have_same_shapes(sample: Sample, other_sample: Sample, batch_dim: Optional[int]) -> bool:
+    # samples with different number of rows are concatenated along the batch dimension
+    def _shape(tensor):
+        shape = tuple(tensor.shape)
+        return shape if batch_dim is None else shape[:batch_dim] + shape[batch_dim + 1 :]
+
+    return sample.keys() == other_sample.keys() and all(
+        _shape(sample[name]) == _shape(other_sample[name]) and sample[name].dtype == other_sample[name].dtype
+        for name in sample
+    )
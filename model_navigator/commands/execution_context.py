@@ -27,9 +27,11 @@ from typing import Callable, List, Optional, Union
 
 import fire
 
+from model_navigator.commands.warm_worker import WARM_WORKERS
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import ModelNavigatorUserInputError
+from model_navigator.utils.devices import get_assigned_device
 from model_navigator.utils.environment import use_multiprocessing
 
 
@@ -108,6 +110,7 @@ class ExecutionContext(contextlib.AbstractContextManager):
         args: List,
         allow_failure: bool = False,
         run_in_isolation: bool = False,
+        worker_key: Optional[str] = None,
     ):
         """Execute Python script in current runtime.
 
@@ -117,6 +120,8 @@ class ExecutionContext(contextlib.AbstractContextManager):
             args: Additional arguments to be passed to function during execution
             allow_failure: if True, do not raise exception when script execution failed
             run_in_isolation: if True, command is run in a child process
+            worker_key: if provided, isolated command is run in a warm worker process kept alive for the key
+                and reused by following commands with the same key
 
         Note: isolation can be overridden by `use_multiprocessing`.
 
@@ -130,8 +135,19 @@ class ExecutionContext(contextlib.AbstractContextManager):
         cmd = self._bake_command([sys.executable, script_path_relative.as_posix()] + filtered_args)
         unwrapped_args = self._unwrap_args(args)
 
-        if run_in_isolation and use_multiprocessing():
-            child_process = mp.Process(target=self._execute_function, args=(func, unwrapped_args, allow_failure, cmd))
+        device = get_assigned_device()
+        if run_in_isolation and use_multiprocessing() and worker_key and WARM_WORKERS.max_workers > 0:
+            if device is not None:
+                worker_key = f"{worker_key}@{device}"
+            exitcode = WARM_WORKERS.execute(
+                worker_key, self._execute_function, (func, unwrapped_args, allow_failure, cmd, device)
+            )
+            if exitcode and not allow_failure:
+                raise ModelNavigatorUserInputError(f"Process exited with {exitcode}. Check previous logs for errors.")
+        elif run_in_isolation and use_multiprocessing():
+            child_process = mp.Process(
+                target=self._execute_function, args=(func, unwrapped_args, allow_failure, cmd, device)
+            )
             child_process.start()
             child_process.join()
             if child_process.exitcode and not allow_failure:
@@ -141,15 +157,18 @@ class ExecutionContext(contextlib.AbstractContextManager):
         else:
             self._execute_function(func, unwrapped_args, allow_failure, cmd)
 
-    def _execute_function(self, func, unwrapped_args, allow_failure, cmd):
+    def _execute_function(self, func, unwrapped_args, allow_failure, cmd, device=None):
         """Execute the given function using Fire and provided args.
 
         This can be run in the main or child process. For the latter the logging system
-        has to be configured (as the child is spawned i.e. no logging is configured).
+        has to be configured (as the child is spawned i.e. no logging is configured)
+        and the assigned CUDA device is made the only visible one.
         """
         process_name = mp.current_process().name
         if process_name != "MainProcess":
             self._workspace.configure_logging()
+            if device is not None:
+                os.environ["CUDA_VISIBLE_DEVICES"] = device
             LOGGER.debug("Running command: {} in the child process: {}", cmd, process_name)
 
         try:
@@ -183,12 +202,18 @@ class ExecutionContext(contextlib.AbstractContextManager):
         if dry_run:
             return run_cmd
 
+        env = None
+        device = get_assigned_device()
+        if device is not None:
+            env = {**os.environ, "CUDA_VISIBLE_DEVICES": device}
+
         process = subprocess.Popen(
             run_cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             encoding="utf-8",
             cwd=self._workspace.path,
+            env=env,
         )
 
         process_output = ""
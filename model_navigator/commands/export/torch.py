@@ -30,7 +30,7 @@ from model_navigator.exceptions import ModelNavigatorConfigurationError
 from model_navigator.utils.common import parse_kwargs_to_cmd
 
 
-class ExportTorch2TorchScript(Command):
+class ExportTorch2TorchScript(Command, is_cacheable=True):
     """Command for export PyTorch model to TorchScript.
 
     Example of use:
@@ -122,7 +122,7 @@ class ExportTorch2TorchScript(Command):
         return CommandOutput(status=CommandStatus.OK)
 
 
-class ExportTorch2ONNX(Command):
+class ExportTorch2ONNX(Command, is_cacheable=True):
     """Command for export PyTorch model to ONNX.
 
     Example of use:
@@ -227,7 +227,7 @@ class ExportTorch2ONNX(Command):
         return CommandOutput(status=CommandStatus.OK)
 
 
-class ExportExportedProgram(Command):
+class ExportExportedProgram(Command, is_cacheable=True):
     """Command for exporting Torch models to ExportedProgram."""
 
     def _run(
@@ -313,7 +313,7 @@ class ExportExportedProgram(Command):
         return CommandOutput(status=CommandStatus.OK)
 
 
-class ExportTorch2DynamoONNX(Command):
+class ExportTorch2DynamoONNX(Command, is_cacheable=True):
     """Command for exporting Torch models to ONNX with dynamo."""
 
     def _run(
@@ -210,6 +210,7 @@ class FindMaxBatchSize(Command):
                     args=parse_kwargs_to_cmd(kwargs),
                     allow_failure=True,
                     run_in_isolation=run_in_isolation,
+                    worker_key=f"{runner_cls.name()}:{model_path}",
                 )
             except Exception:
                 pass
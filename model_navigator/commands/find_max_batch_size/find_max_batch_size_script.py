@@ -19,11 +19,11 @@ from typing import Dict, Optional
 import fire
 
 from model_navigator.commands.performance import Profiler
+from model_navigator.commands.warm_worker import get_warm_runner
 from model_navigator.configuration import OptimizationProfile
 from model_navigator.core.dataloader import load_samples
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata
-from model_navigator.runners.registry import get_runner
 
 
 def get_model() -> object:
@@ -77,17 +77,21 @@ def find_max_batch_size(
     else:
         model = get_model()
 
-    runner = get_runner(runner_name)(
+    runner = get_warm_runner(
+        runner_name,
         model=model,
         input_metadata=TensorMetadata.from_json(input_metadata),
         output_metadata=TensorMetadata.from_json(output_metadata),
         disable_fallback=False,
         enable_timer=True,
         **runner_config,
-    )  # pytype: disable=not-instantiable
+    )
+    profile = OptimizationProfile.from_dict(optimization_profile)
+    # the maximal batch size is searched with a single request in flight
+    profile.concurrency = None
     try:
         Profiler(
-            profile=OptimizationProfile.from_dict(optimization_profile),
+            profile=profile,
             input_metadata=TensorMetadata.from_json(input_metadata),
             batch_dim=batch_dim,
             results_path=results_path,
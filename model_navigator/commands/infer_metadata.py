@@ -23,6 +23,7 @@ from model_navigator.commands.execution_context import ExecutionContext
 from model_navigator.configuration import OptimizationProfile, SizedDataLoader, SizedIterable, TensorRTProfile
 from model_navigator.configuration.runner.runner_config import RunnerConfig
 from model_navigator.core.dataloader import extract_sample, load_samples, to_numpy, validate_sample_input
+from model_navigator.core.ingestion import DataloaderIngestion, assert_sample_has_pytree_metadata
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import (
     FRAMEWORK_TO_TENSOR_TYPE,
@@ -117,12 +118,7 @@ def _assert_all_inputs_have_same_pytree_metadata(
     pytree_metadata: PyTreeMetadata,
 ) -> bool:
     for sample in dataloader:
-        if not pytree_metadata.is_compatible_with(sample):
-            raise ModelNavigatorUserInputError(
-                f"All inputs must have the same structure.\n"
-                f"Input structure: {pytree_metadata}\n"
-                f"Sample: {sample}."
-            )
+        assert_sample_has_pytree_metadata(sample, pytree_metadata)
 
 
 class InferInputMetadata(Command, is_required=True):
@@ -136,9 +132,16 @@ class InferInputMetadata(Command, is_required=True):
         optimization_profile: OptimizationProfile,
         _input_names: Optional[Tuple[str, ...]] = None,
         batch_dim: Optional[int] = None,
+        workspace: Optional[Workspace] = None,
+        sample_count: int = 0,
+        seed: int = 0,
     ) -> CommandOutput:
         """Execute the InferInputMetadata command.
 
+        The dataloader is read once. When the workspace is provided, input samples for profiling, correctness
+        and conversion are saved to the workspace in the same pass and FetchInputModelData does not read
+        the dataloader again.
+
         Args:
             framework: Framework of model to run inference
             model: A model object or path to file
@@ -146,6 +149,9 @@ class InferInputMetadata(Command, is_required=True):
             optimization_profile: Optimization profile
             _input_names: Name of model inputs
             batch_dim: Location of batch dimension in data samples
+            workspace: Workspace where input samples are saved
+            sample_count: Number of correctness samples to save
+            seed: Random seed for selecting correctness samples
 
         Returns:
             CommandOutput object
@@ -162,7 +168,6 @@ class InferInputMetadata(Command, is_required=True):
         pytree_metadata = PyTreeMetadata.from_sample(
             sample, tensor_type=FRAMEWORK_TO_TENSOR_TYPE[framework], names=_input_names, prefix="input"
         )
-        _assert_all_inputs_have_same_pytree_metadata(dataloader, pytree_metadata)
         input_sample = {}
         input_dtypes = {}
         for n, t in pytree_metadata.flatten_sample(sample).items():
@@ -176,10 +181,17 @@ class InferInputMetadata(Command, is_required=True):
         input_names = list(input_sample.keys())
 
         input_ndims = [t.ndim for t in input_sample.values()]
-        num_samples = len(dataloader)
-        axes_shapes = _extract_axes_shapes(
-            dataloader, pytree_metadata, input_names, input_ndims, num_samples, framework
+        if workspace is not None:
+            LOGGER.info("Collecting input samples for model.")
+        ingestion = DataloaderIngestion(
+            pytree_metadata=pytree_metadata,
+            framework=framework,
+            batch_dim=batch_dim,
+            samples_path=workspace.path / "model_input" if workspace is not None else None,
+            sample_count=sample_count,
+            seed=seed,
         )
+        axes_shapes = ingestion.run(dataloader)
         dataloader_max_batch_size = _extract_max_batch_size(axes_shapes, batch_dim)
         dataloader_trt_profile = _get_trt_profile_from_axes_shapes(axes_shapes, batch_dim)
         input_metadata = _get_metadata_from_axes_shapes(pytree_metadata, axes_shapes, batch_dim, input_dtypes)
@@ -215,6 +227,7 @@ class InferInputMetadata(Command, is_required=True):
                 "input_metadata": input_metadata,
                 "dataloader_trt_profile": dataloader_trt_profile,
                 "dataloader_max_batch_size": dataloader_max_batch_size,
+                "input_samples_collected": workspace is not None,
             },
         )
 
@@ -22,7 +22,7 @@ from model_navigator.core.workspace import Workspace
 from model_navigator.utils.common import parse_kwargs_to_cmd
 
 
-class GraphSurgeonOptimize(Command):
+class GraphSurgeonOptimize(Command, is_concurrent=True):
     """Command for optimizing ONNX model with Graph Surgeon."""
 
     def _run(
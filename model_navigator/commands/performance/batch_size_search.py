@@ -0,0 +1,207 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Adaptive search of batch sizes for profiling."""
+
+import math
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from model_navigator.commands.performance.results import ProfilingResults
+from model_navigator.commands.performance.utils import is_throughput_saturated
+from model_navigator.core.logger import LOGGER
+
+DEFAULT_PROBE_FACTOR = 4
+DEFAULT_MAX_REFINEMENT_STEPS = 4
+MIN_COST_PER_SAMPLE = 1e-9  # ms
+
+
+class AdaptiveBatchSizeSearch:
+    """Search for batch sizes worth profiling based on a model of latency growth.
+
+    The search probes batch sizes growing geometrically until the throughput saturates or the maximal batch size
+    is reached. Average latencies of probes are fitted with a linear model `latency = overhead + cost * batch_size`,
+    which describes throughput approaching `1 / cost` for large batches. The model predicts the batch size where
+    throughput saturates (the knee) and the largest batch size meeting the latency budget. Only the ranges between
+    probes containing these batch sizes are refined with bisection, starting from the predicted values.
+
+    Example:
+        AdaptiveBatchSizeSearch(
+            measure=lambda batch_size: profile(batch_size),
+            max_batch_size=1024,
+            throughput_cutoff_threshold=0.05,
+        ).run()
+    """
+
+    def __init__(
+        self,
+        measure: Callable[[int], ProfilingResults],
+        max_batch_size: int,
+        throughput_cutoff_threshold: Optional[float],
+        latency_budget: Optional[float] = None,
+        probe_factor: int = DEFAULT_PROBE_FACTOR,
+        max_refinement_steps: int = DEFAULT_MAX_REFINEMENT_STEPS,
+    ) -> None:
+        """Initialize the search.
+
+        Args:
+            measure: Callable profiling the batch size and returning the result
+            max_batch_size: Largest batch size that can be probed
+            throughput_cutoff_threshold: Minimum throughput increase between probes to continue probing.
+                When None, throughput saturation is not verified and batch sizes are probed up to max_batch_size.
+            latency_budget: Latency budget in milliseconds. When provided, the largest batch size meeting
+                the budget is searched.
+            probe_factor: Ratio between consecutive probed batch sizes
+            max_refinement_steps: Maximal number of additional measurements refining each searched batch size
+        """
+        self._measure = measure
+        self._max_batch_size = max_batch_size
+        self._throughput_cutoff_threshold = throughput_cutoff_threshold
+        self._latency_budget = latency_budget
+        self._probe_factor = probe_factor
+        self._max_refinement_steps = max_refinement_steps
+        self._results: Dict[int, ProfilingResults] = {}
+
+    def run(self) -> List[int]:
+        """Run the search.
+
+        Returns:
+            Measured batch sizes up to the throughput knee or the latency budget in ascending order
+        """
+        self._results = {}
+        self._probe()
+        model = self._fit_latency_model()
+
+        knee_batch_size = self._refine_knee(model)
+        budget_batch_size = self._refine_latency_budget(model)
+        LOGGER.debug(f"Throughput knee batch size: {knee_batch_size}, latency budget batch size: {budget_batch_size}")
+
+        limit = max(knee_batch_size, budget_batch_size or 0)
+        return [batch_size for batch_size in sorted(self._results) if batch_size <= limit]
+
+    def _get_result(self, batch_size: int) -> ProfilingResults:
+        if batch_size not in self._results:
+            self._results[batch_size] = self._measure(batch_size)
+
+        return self._results[batch_size]
+
+    @property
+    def _probe_cutoff_threshold(self) -> Optional[float]:
+        # probes are more than 2 times apart, so the threshold defined for doubled batch size is compounded
+        if self._throughput_cutoff_threshold is None:
+            return None
+
+        return (1 + self._throughput_cutoff_threshold) ** math.log2(self._probe_factor) - 1
+
+    def _probe(self) -> None:
+        batch_size = 1
+        prev_result = None
+        while True:
+            result = self._get_result(batch_size)
+            if is_throughput_saturated(result, prev_result, self._probe_cutoff_threshold):
+                LOGGER.debug(f"Throughput saturated when probing batch size {batch_size}.")
+                break
+
+            if batch_size >= self._max_batch_size:
+                break
+
+            prev_result = result
+            batch_size = min(batch_size * self._probe_factor, self._max_batch_size)
+
+    def _fit_latency_model(self) -> Optional[Tuple[float, float]]:
+        if len(self._results) < 2:
+            return None
+
+        batch_sizes = sorted(self._results)
+        latencies = [self._results[batch_size].avg_latency for batch_size in batch_sizes]
+        cost, overhead = np.polyfit(np.asarray(batch_sizes, dtype=np.float64), np.asarray(latencies), deg=1)
+        LOGGER.debug(f"Fitted latency model: {overhead:.3f} ms + {cost:.6f} ms * batch size.")
+
+        return max(float(overhead), 0.0), max(float(cost), MIN_COST_PER_SAMPLE)
+
+    def _refine_knee(self, model: Optional[Tuple[float, float]]) -> int:
+        best_batch_size = max(self._results, key=lambda batch_size: self._results[batch_size].throughput)
+        if self._throughput_cutoff_threshold is None:
+            return best_batch_size
+
+        # smallest batch size reaching the throughput close to the best one
+        target_throughput = self._results[best_batch_size].throughput * (1 - self._throughput_cutoff_threshold)
+
+        def _is_below_knee(batch_size: int) -> bool:
+            return self._get_result(batch_size).throughput < target_throughput
+
+        guess = None
+        if model is not None:
+            # batch size where modeled throughput reaches the target share of throughput for the best batch size
+            overhead, cost = model
+            threshold = self._throughput_cutoff_threshold
+            denominator = overhead + cost * best_batch_size * threshold
+            if denominator > 0:
+                guess = (1 - threshold) * best_batch_size * overhead / denominator
+
+        _, upper = self._bisect(_is_below_knee, guess)
+        return upper if upper is not None else best_batch_size
+
+    def _refine_latency_budget(self, model: Optional[Tuple[float, float]]) -> Optional[int]:
+        if self._latency_budget is None:
+            return None
+
+        def _meets_budget(batch_size: int) -> bool:
+            return self._get_result(batch_size).avg_latency <= self._latency_budget
+
+        guess = None
+        if model is not None:
+            overhead, cost = model
+            guess = (self._latency_budget - overhead) / cost
+
+        lower, _ = self._bisect(_meets_budget, guess)
+        return lower
+
+    def _bisect(self, predicate: Callable[[int], bool], guess: Optional[float]) -> Tuple[Optional[int], Optional[int]]:
+        """Find the boundary between batch sizes satisfying and not satisfying monotonic predicate.
+
+        Returns:
+            The largest measured batch size satisfying predicate and the smallest larger batch size not satisfying it
+        """
+        lower, upper = None, None
+        for batch_size in sorted(self._results):
+            if not predicate(batch_size):
+                upper = batch_size
+                break
+            lower = batch_size
+
+        if lower is None or upper is None:
+            return lower, upper
+
+        candidate = None
+        if guess is not None and lower < guess < upper:
+            candidate = min(max(math.ceil(guess), lower + 1), upper - 1)
+
+        for _ in range(self._max_refinement_steps):
+            if upper - lower <= 1:
+                break
+
+            is_guess = candidate is not None
+            batch_size = candidate if is_guess else (lower + upper) // 2
+            candidate = None
+            if predicate(batch_size):
+                lower, neighbour = batch_size, batch_size + 1
+            else:
+                upper, neighbour = batch_size, batch_size - 1
+
+            # accurate prediction is confirmed by measuring the adjacent batch size instead of bisecting
+            if is_guess and lower < neighbour < upper:
+                candidate = neighbour
+
+        return lower, upper
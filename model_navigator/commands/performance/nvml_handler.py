@@ -13,9 +13,11 @@
 # limitations under the License.
 """NVML handler."""
 
-from typing import ContextManager, Optional
+import os
+from typing import ContextManager, Optional, Tuple
 
 import numpy as np
+import psutil
 from pynvml import (
     NVML_CLOCK_GRAPHICS,
     NVMLError,
@@ -84,6 +86,26 @@ class NvmlHandler(ContextManager):
         with np.errstate(invalid="ignore"):
             return np.divide(gpu_clocks_sum, gpus_running)
 
+    @property
+    def device_memory(self) -> Optional[int]:
+        """Returns memory in bytes used by the current process on all gpus (if they exist)."""
+        if not self._nvml_exists:
+            return None
+
+        pid = os.getpid()
+        used_memory = 0
+        for i in range(self.gpu_count):
+            try:
+                handle = nvmlDeviceGetHandleByIndex(i)
+                for process in nvmlDeviceGetComputeRunningProcesses(handle):
+                    if process.pid == pid and process.usedGpuMemory is not None:
+                        used_memory += process.usedGpuMemory
+            except NVMLError as e:
+                LOGGER.debug(f"Unable to collect NVML data for GPU {i}: {str(e)}")
+                continue
+
+        return used_memory
+
     @property
     def gpu_count(self) -> int:
         """Returns number of available gpus."""
@@ -95,3 +117,9 @@ class NvmlHandler(ContextManager):
         except NVMLError as e:
             LOGGER.debug(f"Unable to collect NVML device count: {str(e)}")
             return 0
+
+
+def get_process_memory() -> Tuple[int, Optional[int]]:
+    """Returns host memory and device memory in bytes used by the current process."""
+    with NvmlHandler() as nvml_handler:
+        return psutil.Process().memory_info().rss, nvml_handler.device_memory
@@ -116,6 +116,7 @@ class Performance(Command, requires=[Correctness.name]):
                 parse_kwargs_to_cmd(kwargs),
                 allow_failure=True,
                 run_in_isolation=run_in_isolation,
+                worker_key=f"{runner_cls.name()}:{path}",
             )
 
             with jsonlines.open(temp_file.name, "r") as f:
@@ -126,6 +127,7 @@ class Performance(Command, requires=[Correctness.name]):
                 batch_size = f"{result.batch_size:6}" if result.batch_size is not None else "-"
                 results_str.append(
                     f"""Batch: {batch_size}, """
+                    f"""Concurrency: {result.concurrency:4}, """
                     f"""Throughput: {result.throughput:10.2f} [infer/sec], """
                     f"""Avg Latency: {result.avg_latency:10.2f} [ms]"""
                 )
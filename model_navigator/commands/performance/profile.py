@@ -21,12 +21,11 @@ from typing import Any, Optional, Type
 from jsonlines import jsonlines
 
 from model_navigator.commands.base import Command, CommandOutput, CommandStatus
-from model_navigator.commands.data_dump.samples import samples_to_npz
 from model_navigator.commands.execution_context import ExecutionContext
 from model_navigator.commands.performance.results import ProfilingResults
 from model_navigator.configuration import Format, OptimizationProfile, SizedDataLoader
 from model_navigator.configuration.runner.runner_config import RunnerConfig
-from model_navigator.core.dataloader import extract_bs1, extract_sample, load_samples
+from model_navigator.core.dataloader import extract_bs1, extract_sample, load_samples, samples_to_store
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata
 from model_navigator.core.workspace import Workspace
@@ -127,6 +126,7 @@ class Profile(Command):
                     args=parse_kwargs_to_cmd(kwargs),
                     allow_failure=True,
                     run_in_isolation=run_in_isolation,
+                    worker_key=f"{runner_cls.name()}:{path}",
                 )
 
                 with jsonlines.open(temp_file.name, "r") as f:
@@ -166,6 +166,6 @@ class Profile(Command):
                 sample = extract_sample(sample, input_metadata, framework)
                 metadata = {n: t.shape for n, t in sample.items()}
                 profiler_sample = extract_bs1(sample, batch_dim)
-                samples_to_npz([profiler_sample], profiler_samples, batch_dim, raise_on_error=True)
+                samples_to_store([profiler_sample], profiler_samples, batch_dim, raise_on_error=True)
 
                 yield idx, metadata
@@ -19,6 +19,7 @@ from typing import Dict, Optional
 import fire
 
 from model_navigator.commands.performance.profiler import Profiler
+from model_navigator.commands.warm_worker import get_warm_runner
 from model_navigator.configuration import OptimizationProfile
 from model_navigator.core.dataloader import load_samples
 from model_navigator.core.tensor import TensorMetadata
@@ -76,7 +77,19 @@ def profile(
     if runner_config is None:
         runner_config = {}
 
-    runner = get_runner(runner_name)(
+    def _create_runner():
+        return get_runner(runner_name)(
+            model=model,
+            input_metadata=TensorMetadata.from_json(input_metadata),
+            output_metadata=TensorMetadata.from_json(output_metadata),
+            navigator_workspace=navigator_workspace,
+            batch_dim=batch_dim,
+            enable_timer=True,
+            **runner_config,
+        )  # pytype: disable=not-instantiable
+
+    runner = get_warm_runner(
+        runner_name,
         model=model,
         input_metadata=TensorMetadata.from_json(input_metadata),
         output_metadata=TensorMetadata.from_json(output_metadata),
@@ -84,7 +97,7 @@ def profile(
         batch_dim=batch_dim,
         enable_timer=True,
         **runner_config,
-    )  # pytype: disable=not-instantiable
+    )
 
     Profiler(
         profile=OptimizationProfile.from_dict(optimization_profile),
@@ -95,6 +108,7 @@ def profile(
         runner=runner,
         profiling_sample=profiling_sample,
         sample_id=sample_id,
+        runner_factory=_create_runner,
     )
 
 
@@ -16,21 +16,30 @@
 import math
 import pathlib
 import queue
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence
 
 import numpy as np
+import psutil
 from jsonlines import jsonlines
 
+from model_navigator.commands.performance.batch_size_search import AdaptiveBatchSizeSearch
 from model_navigator.commands.performance.nvml_handler import NvmlHandler
 from model_navigator.commands.performance.results import ProfilingResults
 from model_navigator.commands.performance.utils import is_measurement_stable, is_throughput_saturated
-from model_navigator.configuration import OptimizationProfile, Sample
+from model_navigator.commands.warm_worker import get_warm_runner_memory_baseline
+from model_navigator.configuration import BatchSizeSearch, OptimizationProfile, Sample
 from model_navigator.core.dataloader import expand_sample
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata
 from model_navigator.exceptions import ModelNavigatorError
 from model_navigator.runners.base import InferenceStep, NavigatorRunner, NavigatorStabilizedRunner
 
+MAX_BATCH_SIZE = 2**30
+# each request in flight is served by a separate runner instance, so the concurrency limits the number of instances
+MAX_CONCURRENCY = 16
+
 
 class Profiler:
     """Runs profiling on a runner a profiling sample.
@@ -67,6 +76,8 @@ class Profiler:
         self._input_metadata = input_metadata
         self._batch_dim = batch_dim
         self._results_path = results_path
+        self._host_memory_baseline = 0
+        self._device_memory_baseline = None
 
         if self._batch_dim is None:
             batch_sizes = [None]
@@ -81,79 +92,204 @@ class Profiler:
             batch_sizes = (2 ** np.arange(31, dtype=np.int32)).tolist()
 
         self._batch_sizes = batch_sizes
+        self._adaptive_search = (
+            self._batch_dim is not None
+            and self._profile.batch_size_search == BatchSizeSearch.ADAPTIVE
+            and (self._profile.max_batch_size is not None or not self._profile.batch_sizes)
+        )
+        self._concurrency = sorted(set(self._profile.concurrency)) if self._profile.concurrency else [1]
 
     def run(
         self,
         runner: NavigatorRunner,
         profiling_sample: Sample,
         sample_id: int,
+        runner_factory: Optional[Callable[[], NavigatorRunner]] = None,
     ) -> List[ProfilingResults]:
         """Run profiling.
 
+        When the profile requests concurrency above 1, the requests are sent from a pool of threads. Each thread
+        obtains own runner instance from `runner_factory`, as runners are not safe to call from multiple threads.
+        When no factory is provided, only concurrency 1 is profiled. Runners safe for concurrent callers,
+        e.g. `RunnerPool`, are shared by all threads instead. Concurrency is limited to `MAX_CONCURRENCY`.
+
+        When the profile selects adaptive batch size search, batch sizes are chosen by `AdaptiveBatchSizeSearch`
+        instead of profiling powers of two until the throughput saturates.
+
+        Host and device memory in results are the memory used by the process above its usage before the runner
+        was activated.
+
         Args:
             runner: Runner to profile.
             profiling_sample: Sample used for profiling.
             sample_id: Identifier of profiled sample.
+            runner_factory: Optional callable creating additional instances of profiled runner.
 
         Returns:
-            List[ProfilingResults]: Results for each of the batch sizes from profiler configuration.
+            List[ProfilingResults]: Results for each of the batch sizes and concurrency levels from profiler
+                configuration.
         """
         results = []
+        concurrency_levels = self._concurrency
+        if runner.is_stabilized() and concurrency_levels != [1]:
+            LOGGER.warning(f"Runner {runner.name()} stabilize measurements on its own. Profiling only concurrency 1.")
+            concurrency_levels = [1]
+        elif runner_factory is None and not runner.is_thread_safe() and concurrency_levels != [1]:
+            LOGGER.warning(
+                f"Runner {runner.name()} cannot be profiled with concurrency without additional runner instances. "
+                "Profiling only concurrency 1."
+            )
+            concurrency_levels = [1]
+        elif concurrency_levels[-1] > MAX_CONCURRENCY:
+            LOGGER.warning(f"Profiling concurrency is limited to {MAX_CONCURRENCY}.")
+            concurrency_levels = [value for value in concurrency_levels if value <= MAX_CONCURRENCY] or [
+                MAX_CONCURRENCY
+            ]
+
+        workers_runners = self._create_workers_runners(runner, runner_factory, max(concurrency_levels))
+        with NvmlHandler() as nvml_handler:
+            # memory used by the runtime is measured against the process memory before activating the runner,
+            # warm runners are activated before profiling and keep the memory from before their activation
+            memory_baseline = get_warm_runner_memory_baseline(runner)
+            if memory_baseline is not None:
+                self._host_memory_baseline, self._device_memory_baseline = memory_baseline
+            else:
+                self._host_memory_baseline = psutil.Process().memory_info().rss
+                self._device_memory_baseline = nvml_handler.device_memory
+            with runner:
+                try:
+                    for worker_runner in workers_runners:
+                        worker_runner.activate()
+
+                    def _profile_batch_size(batch_size: Optional[int]) -> List[ProfilingResults]:
+                        return self._profile_batch_size(
+                            runner,
+                            nvml_handler,
+                            profiling_sample,
+                            batch_size,
+                            sample_id,
+                            concurrency_levels,
+                            workers_runners,
+                        )
+
+                    if self._adaptive_search:
+                        self._run_adaptive_search(_profile_batch_size, results)
+                    else:
+                        self._run_sweep(_profile_batch_size, results)
+                finally:
+                    for worker_runner in workers_runners:
+                        worker_runner.deactivate()
+
+                    for result in results:
+                        with jsonlines.open(self._results_path.as_posix(), "a") as f:
+                            f.write(result.to_dict(parse=True))
+
+        return results
+
+    def _profile_batch_size(
+        self,
+        runner: NavigatorRunner,
+        nvml_handler: NvmlHandler,
+        profiling_sample: Sample,
+        batch_size: Optional[int],
+        sample_id: int,
+        concurrency_levels: Sequence[int],
+        workers_runners: Sequence[NavigatorRunner],
+    ) -> List[ProfilingResults]:
+        LOGGER.debug(f"Performance profiling for {runner.name()} started.")
+        if batch_size:
+            LOGGER.debug(f"Batch size: {batch_size}.")
+        sample = expand_sample(profiling_sample, self._input_metadata, self._batch_dim, batch_size)
+        batch_results = []
+        for concurrency in concurrency_levels:
+            concurrency_result = self._run_measurement(
+                runner, nvml_handler, sample, batch_size, sample_id, concurrency, workers_runners
+            )
+            # memory is read after measurements, when buffers of the batch size are allocated
+            concurrency_result.host_memory = max(psutil.Process().memory_info().rss - self._host_memory_baseline, 0)
+            device_memory = nvml_handler.device_memory
+            if device_memory is not None:
+                concurrency_result.device_memory = max(device_memory - (self._device_memory_baseline or 0), 0)
+            LOGGER.debug(
+                f"Performance profiling result for {runner.name()}, batch size: {batch_size} "
+                f"and concurrency: {concurrency}:\n{concurrency_result}"
+            )
+            batch_results.append(concurrency_result)
+
+        # Saturation is verified on the lowest profiled concurrency
+        profiling_result = batch_results[0]
+        total_latency = profiling_result.avg_latency
+        total_steps_latency = sum(
+            result.avg_time
+            for step_name, result in profiling_result.detailed_results.items()
+            if step_name != InferenceStep.TOTAL.value
+        )
+        steps_coverage = total_steps_latency / total_latency
+        LOGGER.debug(f"Inference steps coverage: {steps_coverage:.3f}")
+
+        return batch_results
+
+    def _run_sweep(
+        self,
+        profile_batch_size: Callable[[Optional[int]], List[ProfilingResults]],
+        results: List[ProfilingResults],
+    ) -> None:
         prev_results = queue.Queue(maxsize=self._profile.throughput_backoff_limit + 1)
-        with runner, NvmlHandler() as nvml_handler:
-            try:
-                for batch_size in self._batch_sizes:
-                    LOGGER.debug(f"Performance profiling for {runner.name()} started.")
-                    if batch_size:
-                        LOGGER.debug(f"Batch size: {batch_size}.")
-                    sample = expand_sample(profiling_sample, self._input_metadata, self._batch_dim, batch_size)
-                    profiling_result = self._run_measurement(runner, nvml_handler, sample, batch_size, sample_id)
-                    LOGGER.debug(
-                        f"Performance profiling result for {runner.name()} "
-                        f"and batch size: {batch_size}:\n{profiling_result}"
-                    )
-                    total_latency = profiling_result.avg_latency
-                    total_steps_latency = sum(
-                        result.avg_time
-                        for step_name, result in profiling_result.detailed_results.items()
-                        if step_name != InferenceStep.TOTAL.value
-                    )
-                    steps_coverage = total_steps_latency / total_latency
-                    LOGGER.debug(f"Inference steps coverage: {steps_coverage:.3f}")
+        for batch_size in self._batch_sizes:
+            batch_results = profile_batch_size(batch_size)
+            profiling_result = batch_results[0]
 
-                    prev_result = sorted(
-                        (item for item in prev_results.queue), key=lambda x: x.throughput, reverse=True
-                    )
-                    prev_result = prev_result[0] if len(prev_result) > 0 else None
+            prev_result = sorted((item[0] for item in prev_results.queue), key=lambda x: x.throughput, reverse=True)
+            prev_result = prev_result[0] if len(prev_result) > 0 else None
 
-                    if is_throughput_saturated(
-                        profiling_result, prev_result, self._profile.throughput_cutoff_threshold
-                    ):
-                        if self._profile.throughput_backoff_limit == 0:
-                            break
+            if is_throughput_saturated(profiling_result, prev_result, self._profile.throughput_cutoff_threshold):
+                if self._profile.throughput_backoff_limit == 0:
+                    break
 
-                        prev_results.put(profiling_result)
+                prev_results.put(batch_results)
 
-                        if prev_results.full():
-                            break
+                if prev_results.full():
+                    break
 
-                    else:
-                        # Pop first element as is a valid result already recorded
-                        if not prev_results.empty():
-                            prev_results.get()
+            else:
+                # Pop first element as is a valid result already recorded
+                if not prev_results.empty():
+                    prev_results.get()
 
-                        while not prev_results.empty():
-                            prev_result = prev_results.get()
-                            results.append(prev_result)
+                while not prev_results.empty():
+                    prev_result = prev_results.get()
+                    results.extend(prev_result)
 
-                        prev_results.put(profiling_result)
-                        results.append(profiling_result)
-            finally:
-                for result in results:
-                    with jsonlines.open(self._results_path.as_posix(), "a") as f:
-                        f.write(result.to_dict(parse=True))
+                prev_results.put(batch_results)
+                results.extend(batch_results)
 
-        return results
+    def _run_adaptive_search(
+        self,
+        profile_batch_size: Callable[[Optional[int]], List[ProfilingResults]],
+        results: List[ProfilingResults],
+    ) -> None:
+        batch_results: Dict[int, List[ProfilingResults]] = {}
+
+        def _measure(batch_size: int) -> ProfilingResults:
+            batch_results[batch_size] = profile_batch_size(batch_size)
+            return batch_results[batch_size][0]
+
+        search = AdaptiveBatchSizeSearch(
+            measure=_measure,
+            max_batch_size=self._profile.max_batch_size or MAX_BATCH_SIZE,
+            throughput_cutoff_threshold=self._profile.throughput_cutoff_threshold,
+            latency_budget=self._profile.latency_budget,
+        )
+        # Keep results collected before a failure or an interruption, e.g. for the maximal batch size search
+        batch_sizes = None
+        try:
+            batch_sizes = search.run()
+        finally:
+            if batch_sizes is None:
+                batch_sizes = sorted(batch_results)
+            LOGGER.debug(f"Adaptive search profiled batch sizes: {sorted(batch_results)}")
+            for batch_size in batch_sizes:
+                results.extend(batch_results[batch_size])
 
     def _run_window_measurement(
         self,
@@ -172,6 +308,59 @@ class Profiler:
 
         return ProfilingResults.from_measurements(measurements, gpu_clocks, batch_size, sample_id)
 
+    def _create_workers_runners(
+        self,
+        runner: NavigatorRunner,
+        runner_factory: Optional[Callable[[], NavigatorRunner]],
+        max_concurrency: int,
+    ) -> List[NavigatorRunner]:
+        if max_concurrency == 1 or runner_factory is None or runner.is_thread_safe():
+            return []
+        if max_concurrency > MAX_CONCURRENCY:
+            raise ModelNavigatorError(f"Concurrency {max_concurrency} exceeds the limit {MAX_CONCURRENCY}.")
+
+        LOGGER.debug(f"Creating {max_concurrency - 1} additional runner instances for concurrent profiling.")
+        return [runner_factory() for _ in range(max_concurrency - 1)]
+
+    def _run_concurrent_window_measurement(
+        self,
+        runners: Sequence[NavigatorRunner],
+        nvml_handler: NvmlHandler,
+        sample: Sample,
+        batch_size: Optional[int],
+        sample_id: int,
+        concurrency: int,
+    ) -> ProfilingResults:
+        # runners are not safe to call from multiple threads, so each worker needs own instance,
+        # unless the runner serves concurrent callers on its own, e.g. the runner pool
+        if runners[0].is_thread_safe():
+            runners = [runners[0]] * concurrency
+        elif len(runners) < concurrency:
+            raise ModelNavigatorError(
+                f"Concurrency {concurrency} requires {concurrency} runner instances, got {len(runners)}."
+            )
+
+        lock = threading.Lock()
+        measurements = []
+
+        def _worker(worker_id: int):
+            worker_runner = runners[worker_id]
+            worker_measurements = []
+            for _ in range(self._profile.window_size):
+                worker_runner.infer(sample)
+                worker_measurements.append(worker_runner.last_inference_time())
+
+            with lock:
+                measurements.extend(worker_measurements)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for future in [executor.submit(_worker, worker_id) for worker_id in range(concurrency)]:
+                future.result()
+
+        gpu_clocks = [nvml_handler.gpu_clock]
+
+        return ProfilingResults.from_measurements(measurements, gpu_clocks, batch_size, sample_id, concurrency)
+
     def _measurements_result(self, profiling_results: List[ProfilingResults], last_n: int = 3) -> ProfilingResults:
         if len(profiling_results) < last_n:
             raise ModelNavigatorError(
@@ -188,6 +377,8 @@ class Profiler:
         sample: Sample,
         batch_size: Optional[int],
         sample_id: int,
+        concurrency: int = 1,
+        workers_runners: Sequence[NavigatorRunner] = (),
     ) -> ProfilingResults:
         profiling_results = []
 
@@ -199,7 +390,12 @@ class Profiler:
         else:
             for idx in range(self._profile.max_trials):
                 measurement_id = idx + 1
-                profiling_result = self._run_window_measurement(runner, nvml_handler, sample, batch_size, sample_id)
+                if concurrency == 1:
+                    profiling_result = self._run_window_measurement(runner, nvml_handler, sample, batch_size, sample_id)
+                else:
+                    profiling_result = self._run_concurrent_window_measurement(
+                        [runner, *workers_runners], nvml_handler, sample, batch_size, sample_id, concurrency
+                    )
                 profiling_results.append(profiling_result)
                 LOGGER.debug(
                     f"Measurement [{measurement_id}]: {profiling_result.throughput} infer/sec, {profiling_result.avg_latency} ms"
@@ -16,10 +16,11 @@
 import collections
 import dataclasses
 import warnings
-from typing import Dict, List, Mapping, Optional
+from typing import Dict, List, Mapping, Optional, Sequence
 
 import numpy as np
 
+from model_navigator.commands.performance.sketch import LatencySketch
 from model_navigator.runners.base import InferenceStep, InferenceTime, NavigatorStabilizedRunner
 from model_navigator.utils.common import DataObject
 
@@ -34,6 +35,7 @@ class ProfilingStepResults(DataObject):
     p90_time: float  # ms
     p95_time: float  # ms
     p99_time: float  # ms
+    sketch: Optional[LatencySketch] = None
 
     @classmethod
     def from_dict(cls, d: Mapping) -> "ProfilingStepResults":
@@ -52,6 +54,27 @@ class ProfilingStepResults(DataObject):
             p90_time=d["p90_time"],
             p95_time=d["p95_time"],
             p99_time=d["p99_time"],
+            sketch=LatencySketch.from_dict(d["sketch"]) if d.get("sketch") else None,
+        )
+
+    @classmethod
+    def from_sketch(cls, sketch: LatencySketch) -> "ProfilingStepResults":
+        """Instantiate ProfilingStepResults from a latency sketch.
+
+        Args:
+            sketch: Sketch with all measurements of the step.
+
+        Returns:
+            ProfilingStepResults
+        """
+        return cls(
+            avg_time=sketch.mean(),
+            std_time=sketch.std(),
+            p50_time=sketch.percentile(50),
+            p90_time=sketch.percentile(90),
+            p95_time=sketch.percentile(95),
+            p99_time=sketch.percentile(99),
+            sketch=sketch,
         )
 
 
@@ -70,6 +93,9 @@ class ProfilingResults(DataObject):
     throughput: float  # infer / sec
     request_count: int
     avg_gpu_clock: Optional[float] = None  # MHz
+    concurrency: int = 1
+    host_memory: Optional[int] = None  # bytes used by the process above usage before runner activation
+    device_memory: Optional[int] = None  # bytes used by the process above usage before runner activation
 
     detailed_results: Dict[str, ProfilingStepResults] = dataclasses.field(default_factory=dict)
 
@@ -97,6 +123,9 @@ class ProfilingResults(DataObject):
             batch_size=d.get("batch_size"),
             request_count=d["request_count"],
             avg_gpu_clock=d.get("avg_gpu_clock"),
+            concurrency=d.get("concurrency", 1),
+            host_memory=d.get("host_memory"),
+            device_memory=d.get("device_memory"),
             avg_latency=d["avg_latency"],
             std_latency=d["std_latency"],
             p50_latency=d["p50_latency"],
@@ -109,39 +138,41 @@ class ProfilingResults(DataObject):
 
     @classmethod
     def from_measurements(
-        cls, measurements: List[InferenceTime], gpu_clocks: List[float], batch_size: Optional[int], sample_id: int
+        cls,
+        measurements: List[InferenceTime],
+        gpu_clocks: List[float],
+        batch_size: Optional[int],
+        sample_id: int,
+        concurrency: int = 1,
     ) -> "ProfilingResults":
         """Instantiate ProfilingResults from a list of measurements.
 
+        Throughput for concurrency above 1 is obtained from the Little's law as all requests are kept in flight.
+        Statistics of each step are read from a latency sketch, so results of windows, samples and batch sizes
+        can be merged without keeping the measurements.
+
         Args:
             measurements: List of measurements.
             gpu_clocks: List of GPU clocks.
             batch_size: Batch size.
             sample_id: Sample id
+            concurrency: Number of requests in flight during measurements.
 
         Returns:
             ProfilingResults
         """
-        measurements = np.array(measurements)
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=RuntimeWarning)
             avg_gpu_clock = np.nanmean([gpu_clock for gpu_clock in gpu_clocks if gpu_clock is not None])
 
-        step_measurements: Dict[str, List[float]] = collections.defaultdict(list)
-        for measurement in measurements:
-            for step_name, step_measurement in measurement.items():
-                step_measurements[step_name].append(step_measurement)
-
+        step_names = dict.fromkeys(step_name for measurement in measurements for step_name in measurement)
         detailed_results = {
-            step_name: ProfilingStepResults(
-                avg_time=float(np.mean(detailed_results)),
-                std_time=float(np.std(detailed_results)),
-                p50_time=float(np.percentile(detailed_results, 50)),
-                p90_time=float(np.percentile(detailed_results, 90)),
-                p95_time=float(np.percentile(detailed_results, 95)),
-                p99_time=float(np.percentile(detailed_results, 99)),
+            step_name: ProfilingStepResults.from_sketch(
+                LatencySketch.from_values(
+                    measurement[step_name] for measurement in measurements if step_name in measurement
+                )
             )
-            for step_name, detailed_results in step_measurements.items()
+            for step_name in step_names
         }
 
         assert InferenceStep.TOTAL.value in detailed_results
@@ -149,6 +180,7 @@ class ProfilingResults(DataObject):
             sample_id=sample_id,
             batch_size=batch_size,
             avg_gpu_clock=float(avg_gpu_clock),
+            concurrency=concurrency,
             request_count=len(measurements),
             detailed_results=detailed_results,
             avg_latency=detailed_results[InferenceStep.TOTAL.value].avg_time,
@@ -157,47 +189,57 @@ class ProfilingResults(DataObject):
             p90_latency=detailed_results[InferenceStep.TOTAL.value].p90_time,
             p95_latency=detailed_results[InferenceStep.TOTAL.value].p95_time,
             p99_latency=detailed_results[InferenceStep.TOTAL.value].p99_time,
-            throughput=(1000 * (batch_size or 1) / detailed_results[InferenceStep.TOTAL.value].avg_time),
+            throughput=(1000 * (batch_size or 1) * concurrency / detailed_results[InferenceStep.TOTAL.value].avg_time),
         )
 
     @classmethod
     def from_profiling_results(cls, profiling_results: List["ProfilingResults"]) -> "ProfilingResults":
-        """Instantiate ProfilingResults as a mean of other profiling results.
+        """Instantiate ProfilingResults as a combination of other profiling results.
+
+        When all results carry latency sketches, the sketches are merged and statistics are computed
+        from all combined measurements. Otherwise, statistics of results are averaged. Results without
+        detailed results, e.g. loaded from older packages, are combined from their latency statistics.
 
         Args:
-            profiling_results (List[ProfilingResults]): List of profiling results to average.
+            profiling_results (List[ProfilingResults]): List of profiling results to combine.
 
         Returns:
             ProfilingResults
         """
         batch_size = profiling_results[0].batch_size
+        concurrency = profiling_results[0].concurrency
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=RuntimeWarning)
-            avg_gpu_clock = np.nanmean([result.avg_gpu_clock for result in profiling_results])
+            avg_gpu_clock = np.nanmean([
+                result.avg_gpu_clock for result in profiling_results if result.avg_gpu_clock is not None
+            ])
 
         step_measurements: Dict[str, List[ProfilingStepResults]] = collections.defaultdict(list)
         for result in profiling_results:
             assert result.batch_size == batch_size, "Batch size must be the same for all profiling results"
-            for step_name, step_result in result.detailed_results.items():
+            assert result.concurrency == concurrency, "Concurrency must be the same for all profiling results"
+            detailed_results = result.detailed_results
+            if InferenceStep.TOTAL.value not in detailed_results:
+                detailed_results = {InferenceStep.TOTAL.value: result._total_step_results()}
+            for step_name, step_result in detailed_results.items():
                 step_measurements[step_name].append(step_result)
 
         detailed_results = {
-            step_name: ProfilingStepResults(
-                avg_time=float(np.mean([result.avg_time for result in detailed_results])),
-                std_time=float(np.std([result.std_time for result in detailed_results])),
-                p50_time=float(np.percentile([result.p50_time for result in detailed_results], 50)),
-                p90_time=float(np.percentile([result.p90_time for result in detailed_results], 90)),
-                p95_time=float(np.percentile([result.p95_time for result in detailed_results], 95)),
-                p99_time=float(np.percentile([result.p99_time for result in detailed_results], 99)),
-            )
+            step_name: cls._combine_step_results(detailed_results)
             for step_name, detailed_results in step_measurements.items()
         }
 
+        host_memory = [result.host_memory for result in profiling_results if result.host_memory is not None]
+        device_memory = [result.device_memory for result in profiling_results if result.device_memory is not None]
+
         assert InferenceStep.TOTAL.value in detailed_results
         return cls(
             sample_id=profiling_results[0].sample_id,
             batch_size=batch_size,
             avg_gpu_clock=float(avg_gpu_clock),
+            concurrency=concurrency,
+            host_memory=max(host_memory) if host_memory else None,
+            device_memory=max(device_memory) if device_memory else None,
             request_count=int(np.mean([result.request_count for result in profiling_results])),
             detailed_results=detailed_results,
             avg_latency=detailed_results[InferenceStep.TOTAL.value].avg_time,
@@ -206,7 +248,36 @@ class ProfilingResults(DataObject):
             p90_latency=detailed_results[InferenceStep.TOTAL.value].p90_time,
             p95_latency=detailed_results[InferenceStep.TOTAL.value].p95_time,
             p99_latency=detailed_results[InferenceStep.TOTAL.value].p99_time,
-            throughput=(1000 * (batch_size or 1) / detailed_results[InferenceStep.TOTAL.value].avg_time),
+            throughput=(1000 * (batch_size or 1) * concurrency / detailed_results[InferenceStep.TOTAL.value].avg_time),
+        )
+
+    def _total_step_results(self) -> ProfilingStepResults:
+        return ProfilingStepResults(
+            avg_time=self.avg_latency,
+            std_time=self.std_latency,
+            p50_time=self.p50_latency,
+            p90_time=self.p90_latency,
+            p95_time=self.p95_latency,
+            p99_time=self.p99_latency,
+        )
+
+    @staticmethod
+    def _combine_step_results(step_results: List[ProfilingStepResults]) -> ProfilingStepResults:
+        if all(result.sketch is not None for result in step_results):
+            sketch = LatencySketch(relative_accuracy=step_results[0].sketch.relative_accuracy)
+            for result in step_results:
+                sketch.merge(result.sketch)
+
+            return ProfilingStepResults.from_sketch(sketch)
+
+        # results collected without sketches
+        return ProfilingStepResults(
+            avg_time=float(np.mean([result.avg_time for result in step_results])),
+            std_time=float(np.mean([result.std_time for result in step_results])),
+            p50_time=float(np.percentile([result.p50_time for result in step_results], 50)),
+            p90_time=float(np.percentile([result.p90_time for result in step_results], 90)),
+            p95_time=float(np.percentile([result.p95_time for result in step_results], 95)),
+            p99_time=float(np.percentile([result.p99_time for result in step_results], 99)),
         )
 
     @classmethod
@@ -240,9 +311,12 @@ class ProfilingResults(DataObject):
     def __str__(self) -> str:
         """Get string representation."""
         avg_gpu_clock = f"{self.avg_gpu_clock:.4f}" if self.avg_gpu_clock is not None else "-"
+        host_memory = f"{self.host_memory / 2**20:.1f}" if self.host_memory is not None else "-"
+        device_memory = f"{self.device_memory / 2**20:.1f}" if self.device_memory is not None else "-"
         return (
             f"Sample ID: {self.sample_id}\n"
             f"Batch: {self.batch_size}\n"
+            f"Concurrency: {self.concurrency}\n"
             f"Request count: {self.request_count}\n"
             f"Throughput: {self.throughput:.4f} [infer/sec]\n"
             f"Avg Latency: {self.avg_latency:.4f} [ms]\n"
@@ -251,5 +325,29 @@ class ProfilingResults(DataObject):
             f"p90 Latency: {self.p90_latency:.4f} [ms]\n"
             f"p95 Latency: {self.p95_latency:.4f} [ms]\n"
             f"p99 Latency: {self.p99_latency:.4f} [ms]\n"
-            f"Avg GPU clock: {avg_gpu_clock} [MHz]"
+            f"Avg GPU clock: {avg_gpu_clock} [MHz]\n"
+            f"Host memory: {host_memory} [MiB]\n"
+            f"Device memory: {device_memory} [MiB]"
         )
+
+
+def combine_by_batch_size(profiling_results: Sequence[ProfilingResults]) -> Dict[Optional[int], ProfilingResults]:
+    """Combine results of samples profiled with the same batch size.
+
+    Latency sketches of samples are merged, so percentiles are computed from all measurements of the batch size
+    instead of aggregating percentiles of samples.
+
+    Args:
+        profiling_results: Results profiled with a single concurrency.
+
+    Returns:
+        Combined result for each batch size
+    """
+    results_by_batch_size: Dict[Optional[int], List[ProfilingResults]] = {}
+    for result in profiling_results:
+        results_by_batch_size.setdefault(result.batch_size, []).append(result)
+
+    return {
+        batch_size: ProfilingResults.from_profiling_results(results)
+        for batch_size, results in results_by_batch_size.items()
+    }
@@ -0,0 +1,204 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Mergeable latency sketch."""
+
+import collections
+import dataclasses
+import math
+from typing import Dict, Iterable, Mapping, Optional, Sequence
+
+import numpy as np
+
+from model_navigator.utils.common import DataObject
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+MIN_TRACKED_LATENCY = 1e-6  # ms
+
+
+@dataclasses.dataclass
+class LatencySketch(DataObject):
+    """Histogram of latencies with logarithmic buckets.
+
+    Each bucket covers values which differ at most by the relative accuracy, so percentiles computed from
+    the sketch are within the relative accuracy from the exact values. Memory is bounded by the number of
+    buckets covering the range of observed latencies and does not grow with the number of measurements.
+    Sketches are merged by adding bucket counts, which gives exact percentiles of the combined measurements
+    instead of percentiles of percentiles.
+
+    Args:
+        relative_accuracy: Maximal relative error of percentiles
+        count: Number of recorded values
+        total: Sum of recorded values
+        total_squares: Sum of squares of recorded values
+        min_value: Smallest recorded value
+        max_value: Largest recorded value
+        buckets: Mapping of bucket index to number of values in the bucket
+    """
+
+    relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY
+    count: int = 0
+    total: float = 0.0  # ms
+    total_squares: float = 0.0  # ms^2
+    min_value: Optional[float] = None  # ms
+    max_value: Optional[float] = None  # ms
+    buckets: Dict[int, int] = dataclasses.field(default_factory=dict)
+
+    @property
+    def _gamma(self) -> float:
+        return (1 + self.relative_accuracy) / (1 - self.relative_accuracy)
+
+    @classmethod
+    def from_values(
+        cls, values: Iterable[float], relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY
+    ) -> "LatencySketch":
+        """Create sketch from values.
+
+        Args:
+            values: Latencies in milliseconds
+            relative_accuracy: Maximal relative error of percentiles
+
+        Returns:
+            LatencySketch
+        """
+        sketch = cls(relative_accuracy=relative_accuracy)
+        sketch.add(values)
+        return sketch
+
+    @classmethod
+    def from_dict(cls, d: Mapping) -> "LatencySketch":
+        """Instantiate LatencySketch from a json dictionary.
+
+        Args:
+            d (Mapping): Data dictionary.
+
+        Returns:
+            LatencySketch
+        """
+        return cls(
+            relative_accuracy=d["relative_accuracy"],
+            count=d["count"],
+            total=d["total"],
+            total_squares=d["total_squares"],
+            min_value=d.get("min_value"),
+            max_value=d.get("max_value"),
+            # keys are stored as strings in json
+            buckets={int(index): count for index, count in d["buckets"].items()},
+        )
+
+    def add(self, values: Iterable[float]) -> None:
+        """Record values in the sketch.
+
+        Args:
+            values: Latencies in milliseconds
+        """
+        values = np.asarray(list(values), dtype=np.float64)
+        if values.size == 0:
+            return
+
+        self.count += int(values.size)
+        self.total += float(values.sum())
+        self.total_squares += float(np.square(values).sum())
+        self.min_value = float(values.min()) if self.min_value is None else min(self.min_value, float(values.min()))
+        self.max_value = float(values.max()) if self.max_value is None else max(self.max_value, float(values.max()))
+
+        indices = np.ceil(np.log(np.maximum(values, MIN_TRACKED_LATENCY)) / math.log(self._gamma)).astype(np.int64)
+        for index, count in zip(*np.unique(indices, return_counts=True)):
+            self.buckets[int(index)] = self.buckets.get(int(index), 0) + int(count)
+
+    def merge(self, other: "LatencySketch") -> None:
+        """Add values recorded in other sketch.
+
+        Args:
+            other: Sketch to merge, must have the same relative accuracy
+        """
+        if not math.isclose(self.relative_accuracy, other.relative_accuracy):
+            raise ValueError("Only sketches with the same relative accuracy can be merged.")
+
+        if other.count == 0:
+            return
+
+        self.count += other.count
+        self.total += other.total
+        self.total_squares += other.total_squares
+        self.min_value = other.min_value if self.min_value is None else min(self.min_value, other.min_value)
+        self.max_value = other.max_value if self.max_value is None else max(self.max_value, other.max_value)
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def mean(self) -> float:
+        """Mean of recorded values."""
+        return self.total / self.count
+
+    def std(self) -> float:
+        """Population standard deviation of recorded values."""
+        mean = self.mean()
+        return math.sqrt(max(self.total_squares / self.count - mean * mean, 0.0))
+
+    def percentile(self, q: float) -> float:
+        """Approximate percentile of recorded values.
+
+        Args:
+            q: Percentile to compute, between 0 and 100
+
+        Returns:
+            Percentile value in milliseconds
+        """
+        if self.count == 0:
+            raise ValueError("Cannot compute percentile of an empty sketch.")
+
+        rank = q / 100 * (self.count - 1)
+        cumulative_count = 0
+        for index in sorted(self.buckets):
+            cumulative_count += self.buckets[index]
+            if cumulative_count > rank:
+                # value in the middle of the bucket in terms of relative error
+                value = 2 * self._gamma**index / (self._gamma + 1)
+                return min(max(value, self.min_value), self.max_value)
+
+        return self.max_value
+
+
+def mixture_percentile(sketches: Sequence[LatencySketch], weights: Sequence[float], q: float) -> float:
+    """Approximate percentile of the mixture of latencies recorded in sketches.
+
+    Each sketch contributes to the mixture with its weight regardless of the number of recorded values,
+    e.g. sketches of batch sizes weighted by their share in the traffic.
+
+    Args:
+        sketches: Non-empty sketches with the same relative accuracy
+        weights: Weight of each sketch
+        q: Percentile to compute, between 0 and 100
+
+    Returns:
+        Percentile value in milliseconds
+    """
+    mixture = collections.defaultdict(float)
+    for sketch, weight in zip(sketches, weights):
+        if not math.isclose(sketch.relative_accuracy, sketches[0].relative_accuracy):
+            raise ValueError("Only sketches with the same relative accuracy can be mixed.")
+        for index, count in sketch.buckets.items():
+            mixture[index] += weight * count / sketch.count
+
+    min_value = min(sketch.min_value for sketch in sketches)
+    max_value = max(sketch.max_value for sketch in sketches)
+    gamma = sketches[0]._gamma
+    rank = q / 100 * sum(mixture.values())
+    cumulative_weight = 0.0
+    for index in sorted(mixture):
+        cumulative_weight += mixture[index]
+        if cumulative_weight >= rank:
+            value = 2 * gamma**index / (gamma + 1)
+            return min(max(value, min_value), max_value)
+
+    return max_value
@@ -0,0 +1,291 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Warm worker processes reused between isolated subcommands.
+
+The worker is a long-lived child process that executes the same functions as `ExecutionContext` would execute in
+a freshly spawned process. Runners created through `get_warm_runner` inside the worker are kept active between
+executions, so the model is loaded only once per worker while the execution stays isolated from the main process.
+"""
+
+import atexit
+import collections
+import multiprocessing as mp
+import pathlib
+import threading
+import traceback
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from model_navigator.core.logger import LOGGER
+from model_navigator.runners.base import NavigatorRunner
+from model_navigator.runners.registry import get_runner
+from model_navigator.utils.environment import max_warm_workers
+
+_IN_WARM_WORKER = False
+_WARM_RUNNERS: Dict[Tuple, NavigatorRunner] = {}
+# host and device memory of the process before activation of each warm runner
+_MEMORY_BASELINES: Dict[int, Tuple[int, Optional[int]]] = {}
+# options applied to the runner on each use, so commands share a single loaded model
+_CALL_OPTIONS = ("enable_timer", "disable_fallback")
+# arguments which do not change the loaded model
+_IGNORED_ARGUMENTS = ("input_metadata", "output_metadata", "navigator_workspace", "batch_dim")
+
+
+def get_warm_runner(runner_name: str, model: Any, **kwargs) -> NavigatorRunner:
+    """Create runner or reuse the runner already activated in the warm worker.
+
+    Outside warm worker or for models that are not stored on disk a new runner instance is always created.
+    Runners obtained in warm worker are not deactivated when leaving runner context. Runners are cached by
+    the runner name, the model and arguments selecting the device or runtime configuration, while the timer and
+    the provider fallback are set on each use.
+
+    Args:
+        runner_name: Name of the runner.
+        model: Path to the model or model object.
+        kwargs: Additional runner arguments.
+
+    Returns:
+        Runner instance
+    """
+    runner_cls = get_runner(runner_name)
+    if not _IN_WARM_WORKER or not isinstance(model, pathlib.Path):
+        return runner_cls(model=model, **kwargs)  # pytype: disable=not-instantiable
+
+    key = (
+        runner_name,
+        model.as_posix(),
+        repr(
+            sorted(
+                (name, value)
+                for name, value in kwargs.items()
+                if name not in _CALL_OPTIONS and name not in _IGNORED_ARGUMENTS
+            )
+        ),
+    )
+    call_options = {name: value for name, value in kwargs.items() if name in _CALL_OPTIONS}
+    runner = _WARM_RUNNERS.get(key)
+    if runner is None:
+        LOGGER.debug(f"Creating warm runner {runner_name} for model {model.as_posix()}.")
+        # performance commands import the execution context, which uses warm workers
+        from model_navigator.commands.performance.nvml_handler import get_process_memory
+
+        runner = runner_cls(model=model, **kwargs)  # pytype: disable=not-instantiable
+        _MEMORY_BASELINES[id(runner)] = get_process_memory()
+        runner.activate()
+        runner.is_persistent = True
+        _WARM_RUNNERS[key] = runner
+    else:
+        LOGGER.debug(f"Reusing warm runner {runner_name} for model {model.as_posix()}.")
+        runner.set_call_options(**call_options)
+
+    return runner
+
+
+def get_warm_runner_memory_baseline(runner: NavigatorRunner) -> Optional[Tuple[int, Optional[int]]]:
+    """Get host and device memory in bytes used by the process before the warm runner was activated.
+
+    Args:
+        runner: Runner obtained from `get_warm_runner`.
+
+    Returns:
+        Host and device memory or None when the runner is not a warm runner
+    """
+    return _MEMORY_BASELINES.get(id(runner))
+
+
+def _release_warm_runners() -> None:
+    for runner in _WARM_RUNNERS.values():
+        runner.is_persistent = False
+        runner.deactivate()
+
+    _WARM_RUNNERS.clear()
+    _MEMORY_BASELINES.clear()
+
+
+def _worker_loop(connection) -> None:
+    global _IN_WARM_WORKER
+    _IN_WARM_WORKER = True
+
+    try:
+        while True:
+            task = connection.recv()
+            if task is None:
+                break
+
+            target, args = task
+            try:
+                target(*args)
+                exitcode = 0
+            except SystemExit as e:
+                exitcode = e.code if isinstance(e.code, int) else int(e.code is not None)
+            except Exception:
+                LOGGER.debug(f"Warm worker task failed: {traceback.format_exc()}")
+                exitcode = 1
+
+            connection.send(exitcode)
+    finally:
+        _release_warm_runners()
+        connection.close()
+
+
+class WarmWorker:
+    """Long-lived child process executing functions sent through a pipe."""
+
+    def __init__(self, key: str):
+        """Start the worker process.
+
+        Args:
+            key: Identifier of the worker, e.g. model path and runner name.
+        """
+        self.key = key
+        self._connection, child_connection = mp.Pipe()
+        self._process = mp.Process(target=_worker_loop, args=(child_connection,), name=f"WarmWorker-{key}")
+        self._process.start()
+        child_connection.close()
+
+    @property
+    def is_alive(self) -> bool:
+        """Flag indicating if worker process is still running."""
+        return self._process.is_alive()
+
+    def execute(self, target: Callable, args: Tuple) -> int:
+        """Execute function in the worker process.
+
+        Args:
+            target: Function to execute.
+            args: Arguments passed to the function.
+
+        Returns:
+            Exit code of the execution. Non-zero when function failed or worker process died.
+        """
+        try:
+            self._connection.send((target, args))
+            return self._connection.recv()
+        except (EOFError, OSError):
+            self._process.join()
+            LOGGER.warning(f"Warm worker {self.key} exited unexpectedly with {self._process.exitcode}.")
+            return self._process.exitcode or 1
+
+    def shutdown(self) -> None:
+        """Stop the worker process and release all its runners."""
+        if self._process.is_alive():
+            try:
+                self._connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self._process.join()
+
+        self._connection.close()
+
+
+class WarmWorkersPool:
+    """Pool of warm workers with least recently used eviction.
+
+    Number of workers alive is limited by `max_warm_workers`, because each worker keeps its models
+    loaded on the device. The pool can be used from multiple threads; workers busy with an execution
+    are never evicted.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """Initialize the pool.
+
+        Args:
+            max_workers: Maximal number of workers alive. When None, value is read from environment.
+        """
+        self._max_workers = max_workers
+        self._workers: collections.OrderedDict = collections.OrderedDict()
+        self._busy = set()
+        self._lock = threading.Lock()
+
+    @property
+    def max_workers(self) -> int:
+        """Maximal number of workers alive."""
+        return self._max_workers if self._max_workers is not None else max_warm_workers()
+
+    def execute(self, key: str, target: Callable, args: Tuple) -> int:
+        """Execute function in the worker assigned to the key.
+
+        The worker is dropped when the execution fails, so the state of failed runner is never reused.
+        When no worker can be started because all of them are busy, the function is executed
+        in a short-lived worker.
+
+        Args:
+            key: Identifier of the worker.
+            target: Function to execute.
+            args: Arguments passed to the function.
+
+        Returns:
+            Exit code of the execution.
+        """
+        with self._lock:
+            worker = self._get_worker(key)
+            if worker is not None:
+                self._busy.add(key)
+
+        if worker is None:
+            LOGGER.debug(f"No warm worker available for {key}. Executing in short-lived worker.")
+            worker = WarmWorker(key)
+            try:
+                return worker.execute(target, args)
+            finally:
+                worker.shutdown()
+
+        exitcode = 1
+        try:
+            exitcode = worker.execute(target, args)
+        finally:
+            with self._lock:
+                self._busy.discard(key)
+                if exitcode:
+                    self._shutdown_worker(key)
+
+        return exitcode
+
+    def shutdown(self) -> None:
+        """Stop all workers."""
+        with self._lock:
+            for key in list(self._workers):
+                self._shutdown_worker(key)
+
+    def _get_worker(self, key: str) -> Optional[WarmWorker]:
+        if key in self._busy:
+            return None
+
+        worker = self._workers.get(key)
+        if worker is not None and not worker.is_alive:
+            self._shutdown_worker(key)
+            worker = None
+
+        if worker is None:
+            idle_keys = [worker_key for worker_key in self._workers if worker_key not in self._busy]
+            while idle_keys and len(self._workers) >= self.max_workers:
+                self._shutdown_worker(idle_keys.pop(0))
+
+            if len(self._workers) >= self.max_workers:
+                return None
+
+            LOGGER.debug(f"Starting warm worker for {key}.")
+            worker = WarmWorker(key)
+            self._workers[key] = worker
+
+        self._workers.move_to_end(key)
+        return worker
+
+    def _shutdown_worker(self, key: str) -> None:
+        worker = self._workers.pop(key)
+        LOGGER.debug(f"Stopping warm worker for {key}.")
+        worker.shutdown()
+
+
+WARM_WORKERS = WarmWorkersPool()
+atexit.register(WARM_WORKERS.shutdown)
@@ -181,6 +181,63 @@ class TensorType(Enum):
     JAX = "jax"
 
 
+class BatchSizeSearch(Enum):
+    """Methods of selecting batch sizes profiled when no batch sizes are provided explicitly.
+
+    Args:
+        SWEEP (str): Profile powers of two in ascending order until the throughput saturates.
+        ADAPTIVE (str): Probe a few batch sizes, fit the latency curve and refine the batch sizes around
+            the throughput saturation and the latency budget.
+    """
+
+    SWEEP = "sweep"
+    ADAPTIVE = "adaptive"
+
+
+class PackageCompression(Enum):
+    """Compression of files saved in the .nav package.
+
+    Args:
+        STORED (str): Save files without compression.
+        DEFLATED (str): Compress files with zlib.
+        BZIP2 (str): Compress files with bzip2.
+        LZMA (str): Compress files with LZMA.
+    """
+
+    STORED = "stored"
+    DEFLATED = "deflated"
+    BZIP2 = "bzip2"
+    LZMA = "lzma"
+
+
+class OnnxExecutionMode(Enum):
+    """Execution modes of operators in ONNX Runtime session.
+
+    Args:
+        SEQUENTIAL (str): Execute operators one after another.
+        PARALLEL (str): Execute independent branches of the graph in parallel.
+    """
+
+    SEQUENTIAL = "sequential"
+    PARALLEL = "parallel"
+
+
+class OnnxGraphOptimizationLevel(Enum):
+    """Graph optimization levels of ONNX Runtime session.
+
+    Args:
+        DISABLE (str): Disable all graph optimizations.
+        BASIC (str): Semantics preserving optimizations like constant folding and redundant nodes elimination.
+        EXTENDED (str): Basic optimizations and complex node fusions.
+        ALL (str): Extended optimizations and layout optimizations.
+    """
+
+    DISABLE = "disable"
+    BASIC = "basic"
+    EXTENDED = "extended"
+    ALL = "all"
+
+
 class TensorRTCompatibilityLevel(Enum):
     """Compatibility level for TensorRT.
 
@@ -231,7 +288,11 @@ class OptimizationProfile(DataObject):
     are stable (within `stability_percentage` from the mean) within three consecutive windows.
     If the measurements are not stable after `max_trials` trials, the profiler will stop with an error.
     Profiler will also stop profiling when the throughput does not increase at least by `throughput_cutoff_threshold`.
-
+    When `concurrency` is provided, each batch size is profiled with every listed number of requests in flight.
+    Each request in flight is served by a separate runner instance, so the concurrency is limited to 16 and
+    the maximal batch size search always uses a single request.
+    When `batch_size_search` is adaptive, only a few batch sizes are probed and the profiler refines batch sizes
+    around the throughput saturation and the largest batch size meeting `latency_budget`.
 
     Args:
         max_batch_size: Maximal batch size used during conversion and profiling. None mean automatic search is enabled.
@@ -245,6 +306,9 @@ class OptimizationProfile(DataObject):
         throughput_backoff_limit: Back-off limit to run multiple more profiling steps to avoid stop at local minimum
                                   when throughput saturate based on `throughput_cutoff_threshold`.
         dataloader: Optional dataloader for profiling. Use only 1 sample.
+        concurrency: List of numbers of in-flight requests to profile for each batch size. None mean single request.
+        batch_size_search: Method of selecting batch sizes when `batch_sizes` are not provided.
+        latency_budget: Latency budget in milliseconds used by the adaptive batch size search.
     """
 
     max_batch_size: Optional[int] = None
@@ -257,6 +321,9 @@ class OptimizationProfile(DataObject):
     throughput_cutoff_threshold: Optional[float] = DEFAULT_THROUGHPUT_CUTOFF_THRESHOLD
     throughput_backoff_limit: int = DEFAULT_THROUGHPUT_BACKOFF_LIMIT
     dataloader: Optional[SizedDataLoader] = None
+    concurrency: Optional[List[int]] = None
+    batch_size_search: BatchSizeSearch = BatchSizeSearch.SWEEP
+    latency_budget: Optional[float] = None
 
     def __post_init__(self):
         """Validate OptimizationProfile definition to avoid unsupported configurations."""
@@ -286,6 +353,16 @@ class OptimizationProfile(DataObject):
         if self.min_trials > self.max_trials:
             raise ModelNavigatorConfigurationError("`max_trials` must be greater or equal `min_trials`.")
 
+        if self.concurrency is not None:
+            if len(self.concurrency) == 0:
+                raise ModelNavigatorConfigurationError("`concurrency` must contain at least one value.")
+
+            if any(value < 1 for value in self.concurrency):
+                raise ModelNavigatorConfigurationError("`concurrency` values must be greater or equal 1.")
+
+        if self.latency_budget is not None and self.latency_budget <= 0:
+            raise ModelNavigatorConfigurationError("`latency_budget` must be greater than 0.0.")
+
     def to_dict(self, filter_fields: Optional[List[str]] = None, parse: bool = False) -> Dict:
         """Serialize to a dictionary.
 
@@ -330,6 +407,11 @@ class OptimizationProfile(DataObject):
             throughput_backoff_limit=optimization_profile_dict.get(
                 "throughput_backoff_limit", DEFAULT_THROUGHPUT_BACKOFF_LIMIT
             ),
+            concurrency=optimization_profile_dict.get("concurrency"),
+            batch_size_search=BatchSizeSearch(
+                optimization_profile_dict.get("batch_size_search", BatchSizeSearch.SWEEP.value)
+            ),
+            latency_budget=optimization_profile_dict.get("latency_budget"),
         )
 
 
@@ -813,6 +895,73 @@ class TorchTensorRTConfig(CustomConfigForTensorRT):
         return cls(**config_dict)
 
 
+@dataclasses.dataclass
+class OnnxSessionOptions(DataObject):
+    """Options of ONNX Runtime inference session.
+
+    Options set to None use the ONNX Runtime defaults.
+
+    Args:
+        intra_op_num_threads: Number of threads used to parallelize execution within nodes. 0 means default.
+        inter_op_num_threads: Number of threads used to parallelize execution of nodes in parallel execution mode.
+            0 means default.
+        execution_mode: Execution mode of operators in the graph.
+        graph_optimization_level: Graph optimizations applied when the session is created.
+        enable_cpu_mem_arena: Enable memory arena on CPU.
+        enable_mem_pattern: Enable memory pattern optimization.
+    """
+
+    intra_op_num_threads: Optional[int] = None
+    inter_op_num_threads: Optional[int] = None
+    execution_mode: Optional[Union[str, OnnxExecutionMode]] = None
+    graph_optimization_level: Optional[Union[str, OnnxGraphOptimizationLevel]] = None
+    enable_cpu_mem_arena: Optional[bool] = None
+    enable_mem_pattern: Optional[bool] = None
+
+    def __post_init__(self) -> None:
+        """Parse enums and validate options."""
+        for name in ("intra_op_num_threads", "inter_op_num_threads"):
+            value = getattr(self, name)
+            if value is not None and value < 0:
+                raise ModelNavigatorConfigurationError(f"`{name}` must be greater or equal to 0. Provided: {value}.")
+
+        if self.execution_mode is not None:
+            self.execution_mode = OnnxExecutionMode(self.execution_mode)
+        if self.graph_optimization_level is not None:
+            self.graph_optimization_level = OnnxGraphOptimizationLevel(self.graph_optimization_level)
+
+    @classmethod
+    def from_dict(cls, options_dict: Mapping) -> "OnnxSessionOptions":
+        """Instantiate OnnxSessionOptions from a dictionary.
+
+        Args:
+            options_dict: Dictionary with session options
+
+        Returns:
+            OnnxSessionOptions
+        """
+        return cls(**options_dict)
+
+    @property
+    def key(self) -> str:
+        """Short identifier of options which differ from defaults, used in the model key."""
+        parts = []
+        if self.intra_op_num_threads is not None:
+            parts.append(f"intra{self.intra_op_num_threads}")
+        if self.inter_op_num_threads is not None:
+            parts.append(f"inter{self.inter_op_num_threads}")
+        if self.execution_mode is not None:
+            parts.append(self.execution_mode.value)
+        if self.graph_optimization_level is not None:
+            parts.append(f"opt_{self.graph_optimization_level.value}")
+        if self.enable_cpu_mem_arena is not None:
+            parts.append("arena" if self.enable_cpu_mem_arena else "noarena")
+        if self.enable_mem_pattern is not None:
+            parts.append("mempattern" if self.enable_mem_pattern else "nomempattern")
+
+        return "_".join(parts) or "default"
+
+
 @dataclasses.dataclass
 class OnnxConfig(CustomConfigForFormat):
     """ONNX custom config used for ONNX export and conversion.
@@ -827,6 +976,13 @@ class OnnxConfig(CustomConfigForFormat):
         graph_surgeon_optimization: Enables polygraphy graph surgeon optimization: fold_constants, infer_shapes, toposort, cleanup.
         export_device: Device used for ONNX export.
         model_path: optional path to onnx model file, if provided the model will be loaded from the file instead of exporting to onnx
+        session_options: ONNX Runtime session options used by ONNX runners. When a sequence is provided, the first options
+            are used for exported models and each next options are profiled on a separate copy of every ONNX model,
+            so the best options are selected like any other runtime.
+        cache_optimized_model: Store the model optimized by ONNX Runtime next to the ONNX model, so following
+            activations of the CPU and CUDA runners load it without repeating graph optimizations. The optimized
+            model is specific to the hardware and the ONNX Runtime version used to create it, so it is created again
+            when the hash of the model, ONNX Runtime version, providers or session options change.
     """
 
     opset: Optional[int] = DEFAULT_ONNX_OPSET
@@ -837,6 +993,22 @@ class OnnxConfig(CustomConfigForFormat):
     graph_surgeon_optimization: bool = True
     export_device: Optional[str] = None
     model_path: Optional[Union[str, pathlib.Path]] = None
+    session_options: Optional[Union[OnnxSessionOptions, Sequence[OnnxSessionOptions]]] = None
+    cache_optimized_model: bool = False
+
+    def __post_init__(self) -> None:
+        """Parse session options."""
+        if self.session_options is not None:
+            session_options = (
+                self.session_options if isinstance(self.session_options, (list, tuple)) else (self.session_options,)
+            )
+            self.session_options = tuple(
+                options if isinstance(options, OnnxSessionOptions) else OnnxSessionOptions.from_dict(options)
+                for options in session_options
+            )
+            keys = [options.key for options in self.session_options]
+            if len(set(keys)) != len(keys):
+                raise ModelNavigatorConfigurationError(f"ONNX `session_options` must be unique. Provided: {keys}.")
 
     @property
     def format(self) -> Format:
@@ -979,7 +1151,22 @@ class MinLatencyStrategy(RuntimeSearchStrategy):
 class MaxThroughputStrategy(RuntimeSearchStrategy):
     """Get runtime with the highest throughput."""
 
-    pass
+    def __init__(self, concurrency: Optional[int] = None) -> None:
+        """Initialize the class.
+
+        Args:
+            concurrency: Number of requests in flight at which throughput is compared.
+                When None, results for the lowest profiled concurrency are used.
+        """
+        super().__init__()
+        self.concurrency = concurrency
+
+    def __str__(self):
+        """Return name of strategy."""
+        if self.concurrency is None:
+            return super().__str__()
+
+        return f"{self.__class__.__name__}(concurrency={self.concurrency})"
 
 
 class MaxThroughputAndMinLatencyStrategy(RuntimeSearchStrategy):
@@ -991,18 +1178,194 @@ class MaxThroughputAndMinLatencyStrategy(RuntimeSearchStrategy):
 class MaxThroughputWithLatencyBudgetStrategy(RuntimeSearchStrategy):
     """Get runtime with the hightest throughput within the latency budget."""
 
-    def __init__(self, latency_budget: float) -> None:
+    def __init__(self, latency_budget: float, concurrency: Optional[int] = None) -> None:
         """Initialize the class.
 
         Args:
             latency_budget: Latency budget in milliseconds.
+            concurrency: Number of requests in flight at which throughput and latency are compared.
+                When None, results for the lowest profiled concurrency are used.
+        """
+        super().__init__()
+        self.latency_budget = latency_budget
+        self.concurrency = concurrency
+
+    def __str__(self):
+        """Return name of strategy."""
+        if self.concurrency is None:
+            return f"{self.__class__.__name__}({self.latency_budget}[ms])"
+
+        return f"{self.__class__.__name__}({self.latency_budget}[ms], concurrency={self.concurrency})"
+
+
+class MaxThroughputWithConstraintsStrategy(RuntimeSearchStrategy):
+    """Get runtime with the highest throughput which satisfies latency, memory and accuracy constraints.
+
+    Constraints are verified for each profiled batch size separately. Runtimes without memory measurements
+    do not satisfy memory constraints.
+    """
+
+    def __init__(
+        self,
+        p99_latency_budget: Optional[float] = None,
+        max_host_memory: Optional[int] = None,
+        max_device_memory: Optional[int] = None,
+        max_atol: Optional[float] = None,
+        max_rtol: Optional[float] = None,
+        concurrency: Optional[int] = None,
+    ) -> None:
+        """Initialize the class.
+
+        Args:
+            p99_latency_budget: Maximal 99th percentile of latency in milliseconds.
+            max_host_memory: Maximal host memory in bytes added to the process by the runtime.
+            max_device_memory: Maximal device memory in bytes added to the process by the runtime.
+            max_atol: Maximal absolute tolerance of outputs measured by the correctness check.
+            max_rtol: Maximal relative tolerance of outputs measured by the correctness check.
+            concurrency: Number of requests in flight at which throughput and latency are compared.
+                When None, results for the lowest profiled concurrency are used.
+
+        Raises:
+            ModelNavigatorConfigurationError: when a constraint is negative.
+        """
+        super().__init__()
+        self.p99_latency_budget = p99_latency_budget
+        self.max_host_memory = max_host_memory
+        self.max_device_memory = max_device_memory
+        self.max_atol = max_atol
+        self.max_rtol = max_rtol
+        self.concurrency = concurrency
+
+        for name, value in self.constraints.items():
+            if value < 0:
+                raise ModelNavigatorConfigurationError(f"`{name}` must be greater or equal to 0. Provided: {value}.")
+
+    @property
+    def constraints(self) -> Dict[str, float]:
+        """Return constraints which were provided."""
+        constraints = {
+            "p99_latency_budget": self.p99_latency_budget,
+            "max_host_memory": self.max_host_memory,
+            "max_device_memory": self.max_device_memory,
+            "max_atol": self.max_atol,
+            "max_rtol": self.max_rtol,
+        }
+        return {name: value for name, value in constraints.items() if value is not None}
+
+    def __str__(self):
+        """Return name of strategy."""
+        parameters = [f"{name}={value}" for name, value in self.constraints.items()]
+        if self.concurrency is not None:
+            parameters.append(f"concurrency={self.concurrency}")
+
+        return f"{self.__class__.__name__}({', '.join(parameters)})"
+
+
+class ParetoObjective(Enum):
+    """Objectives of the Pareto front of runtimes.
+
+    Args:
+        THROUGHPUT (str): Maximize throughput.
+        P50_LATENCY (str): Minimize median latency.
+        P99_LATENCY (str): Minimize 99th percentile of latency.
+        STD_LATENCY (str): Minimize standard deviation of latency.
+        HOST_MEMORY (str): Minimize host memory allocated by the runtime.
+        DEVICE_MEMORY (str): Minimize device memory allocated by the runtime.
+        ATOL (str): Minimize absolute tolerance of outputs.
+        RTOL (str): Minimize relative tolerance of outputs.
+    """
+
+    THROUGHPUT = "throughput"
+    P50_LATENCY = "p50_latency"
+    P99_LATENCY = "p99_latency"
+    STD_LATENCY = "std_latency"
+    HOST_MEMORY = "host_memory"
+    DEVICE_MEMORY = "device_memory"
+    ATOL = "atol"
+    RTOL = "rtol"
+
+
+DEFAULT_PARETO_OBJECTIVES = (
+    ParetoObjective.THROUGHPUT,
+    ParetoObjective.P99_LATENCY,
+    ParetoObjective.DEVICE_MEMORY,
+    ParetoObjective.ATOL,
+)
+
+
+class WorkloadObjective(Enum):
+    """Objectives of the workload aware runtime selection.
+
+    Args:
+        LATENCY (str): Minimize the expected latency of requests in the workload.
+        P99_LATENCY (str): Minimize the 99th percentile of latency of requests in the workload.
+        THROUGHPUT (str): Maximize the number of requests per second sustained under the workload.
+    """
+
+    LATENCY = "latency"
+    P99_LATENCY = "p99_latency"
+    THROUGHPUT = "throughput"
+
+
+class WorkloadAwareStrategy(RuntimeSearchStrategy):
+    """Get runtime which is the best for the expected distribution of request batch sizes.
+
+    Latency curves of runtimes are interpolated between profiled batch sizes and weighted with the traffic
+    histogram, so a runtime which wins only at large batch sizes is not selected for traffic of small requests.
+    """
+
+    def __init__(
+        self,
+        traffic: Dict[Union[int, Tuple[int, ...]], float],
+        objective: WorkloadObjective = WorkloadObjective.LATENCY,
+        latency_budget: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        batch_dim: int = 0,
+    ) -> None:
+        """Initialize the class.
+
+        Args:
+            traffic: Histogram of requests. Keys are batch sizes or shapes of the input with the batch dimension,
+                values are number or fraction of requests.
+            objective: Objective optimized for the traffic.
+            latency_budget: Maximal expected p99 latency in milliseconds. Runtimes exceeding it are not selected.
+            concurrency: Number of requests in flight at which runtimes are compared.
+                When None, results for the lowest profiled concurrency are used.
+            batch_dim: Batch dimension in shapes used as keys of the traffic histogram.
+
+        Raises:
+            ModelNavigatorConfigurationError: when the histogram is empty or contains invalid values.
         """
         super().__init__()
+        histogram = {}
+        for key, weight in traffic.items():
+            batch_size = key[batch_dim] if isinstance(key, tuple) else key
+            if not isinstance(batch_size, (int, np.integer)) or batch_size < 1:
+                raise ModelNavigatorConfigurationError(
+                    f"Batch size in traffic histogram must be a positive integer, got {key}."
+                )
+            if weight < 0:
+                raise ModelNavigatorConfigurationError(f"Traffic weight must not be negative, got {weight}.")
+            histogram[int(batch_size)] = histogram.get(int(batch_size), 0.0) + float(weight)
+
+        total = sum(histogram.values())
+        if total <= 0:
+            raise ModelNavigatorConfigurationError("Traffic histogram must contain at least one request.")
+
+        self.traffic = {batch_size: weight / total for batch_size, weight in sorted(histogram.items()) if weight > 0}
+        self.objective = WorkloadObjective(objective)
         self.latency_budget = latency_budget
+        self.concurrency = concurrency
 
     def __str__(self):
         """Return name of strategy."""
-        return f"{self.__class__.__name__}({self.latency_budget}[ms])"
+        parameters = [self.objective.value]
+        if self.latency_budget is not None:
+            parameters.append(f"{self.latency_budget}[ms]")
+        if self.concurrency is not None:
+            parameters.append(f"concurrency={self.concurrency}")
+
+        return f"{self.__class__.__name__}({', '.join(parameters)})"
 
 
 class SelectedRuntimeStrategy(RuntimeSearchStrategy):
@@ -59,3 +59,26 @@ DEFAULT_COMPARISON_REPORT_FILE = "report.yaml"
 
 # Subcommands isolation
 NAVIGATOR_USE_MULTIPROCESSING = "NAVIGATOR_USE_MULTIPROCESSING"
+NAVIGATOR_MAX_WARM_WORKERS = "NAVIGATOR_MAX_WARM_WORKERS"
+DEFAULT_MAX_WARM_WORKERS = 1
+
+# Execution units scheduling
+NAVIGATOR_MAX_PARALLEL_UNITS = "NAVIGATOR_MAX_PARALLEL_UNITS"
+DEFAULT_MAX_PARALLEL_UNITS = 1
+NAVIGATOR_PARALLEL_DEVICES = "NAVIGATOR_PARALLEL_DEVICES"
+NAVIGATOR_DEVICE_SLOTS = "NAVIGATOR_DEVICE_SLOTS"
+DEFAULT_DEVICE_SLOTS = 1
+
+# Package archive
+NAVIGATOR_PACKAGE_WORKERS = "NAVIGATOR_PACKAGE_WORKERS"
+DEFAULT_MAX_PACKAGE_WORKERS = 8
+
+# Resume pipelines from the previous run in the workspace
+NAVIGATOR_RESUME = "NAVIGATOR_RESUME"
+
+# Artifact cache
+NAVIGATOR_ARTIFACT_CACHE_TYPE = "NAVIGATOR_ARTIFACT_CACHE_TYPE"
+NAVIGATOR_ARTIFACT_CACHE_DIR = "NAVIGATOR_ARTIFACT_CACHE_DIR"
+NAVIGATOR_ARTIFACT_CACHE_MAX_SIZE = "NAVIGATOR_ARTIFACT_CACHE_MAX_SIZE"
+DEFAULT_ARTIFACT_CACHE_TYPE = "none"
+DEFAULT_ARTIFACT_CACHE_MAX_SIZE = 20 * 2**30  # bytes
@@ -21,12 +21,17 @@ from typing import Any, Callable, Dict, List, Optional, Union
 from model_navigator.configuration import (
     Format,
     JitType,
+    OnnxSessionOptions,
     TensorRTCompatibilityLevel,
     TensorRTPrecision,
     TensorRTPrecisionMode,
     TensorRTProfile,
 )
-from model_navigator.configuration.runner.runner_config import DeviceRunnerConfig, TorchRunnerConfig
+from model_navigator.configuration.runner.runner_config import (
+    DeviceRunnerConfig,
+    OnnxRunnerConfig,
+    TorchRunnerConfig,
+)
 from model_navigator.utils.common import DataObject
 from model_navigator.utils.format_helpers import FORMAT2SUFFIX, is_source_format
 
@@ -403,6 +408,8 @@ class ONNXModelConfig(_SerializedModelConfig, format=Format.ONNX):
         device: Optional[str] = None,
         export_device: Optional[str] = None,
         model_path: Optional[Union[str, pathlib.Path]] = None,
+        session_options: Optional[OnnxSessionOptions] = None,
+        cache_optimized_model: bool = False,
     ) -> None:
         """Initializes ONNX model configuration class.
 
@@ -417,6 +424,9 @@ class ONNXModelConfig(_SerializedModelConfig, format=Format.ONNX):
             device: runtime device e.g. "cuda:0"
             export_device: Device used for export
             model_path: optional path to onnx model file, if provided the model will be loaded from the file instead of exporting to ONNX
+            session_options: ONNX Runtime session options used by runners. When parent is an ONNX model,
+                the model is a copy of the parent profiled with different session options.
+            cache_optimized_model: Store and reuse the model optimized by ONNX Runtime
         """
         super().__init__(parent=parent)
         self.opset = opset
@@ -426,10 +436,22 @@ class ONNXModelConfig(_SerializedModelConfig, format=Format.ONNX):
         self.dynamo_dynamic_shapes = dynamo_dynamic_shapes
         self.custom_args = custom_args
         self.export_device = export_device
-        self.runner_config = DeviceRunnerConfig(device=device)
+        self.runner_config = OnnxRunnerConfig(
+            device=device,
+            session_options=session_options,
+            cache_optimized_model=cache_optimized_model,
+        )
         self.model_path = model_path
 
+    @property
+    def is_session_options_variant(self) -> bool:
+        """Flag indicating that the model is a copy of the parent ONNX model using different session options."""
+        return self.parent is not None and self.parent.format == Format.ONNX
+
     def _get_path_params_as_array_of_strings(self) -> List[str]:
+        if self.is_session_options_variant:
+            return [self.runner_config.session_options.key]
+
         return ["dynamo"] if self.dynamo_export else []
 
     @classmethod
@@ -444,6 +466,8 @@ class ONNXModelConfig(_SerializedModelConfig, format=Format.ONNX):
             device=data_dict.get("device"),
             export_device=data_dict.get("export_device"),
             model_path=data_dict.get("model_path"),
+            session_options=cls._parse_string(OnnxSessionOptions.from_dict, data_dict.get("session_options")),
+            cache_optimized_model=data_dict.get("cache_optimized_model", False),
         )
 
 
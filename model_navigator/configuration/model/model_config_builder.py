@@ -371,6 +371,7 @@ class ModelConfigBuilder:
             model_configs: Dictionary mapping model formats to lists of model configs
         """
         onnx_config = _get_custom_config(custom_configs=custom_configs, custom_config_cls=config_api.OnnxConfig)
+        base_session_options, *variants_session_options = onnx_config.session_options or (None,)
         if framework in (Framework.TENSORFLOW, Framework.JAX):
             for model_configuration in model_configs[Format.TF_SAVEDMODEL]:
                 model_configs[Format.ONNX].append(
@@ -383,6 +384,8 @@ class ModelConfigBuilder:
                         custom_args=onnx_config.custom_args,
                         device=onnx_config.device,
                         export_device=onnx_config.export_device,
+                        session_options=base_session_options,
+                        cache_optimized_model=onnx_config.cache_optimized_model,
                     )
                 )
         if framework == Framework.ONNX:
@@ -396,6 +399,8 @@ class ModelConfigBuilder:
                     custom_args=onnx_config.custom_args,
                     device=onnx_config.device,
                     export_device=onnx_config.export_device,
+                    session_options=base_session_options,
+                    cache_optimized_model=onnx_config.cache_optimized_model,
                 )
             )
         if framework == Framework.TORCH:
@@ -410,6 +415,8 @@ class ModelConfigBuilder:
                         custom_args=onnx_config.custom_args,
                         device=onnx_config.device,
                         export_device=onnx_config.export_device,
+                        session_options=base_session_options,
+                        cache_optimized_model=onnx_config.cache_optimized_model,
                         model_path=onnx_config.model_path,
                     )
                 )
@@ -426,6 +433,26 @@ class ModelConfigBuilder:
                         custom_args=onnx_config.custom_args,
                         device=onnx_config.device,
                         export_device=onnx_config.export_device,
+                        session_options=base_session_options,
+                        cache_optimized_model=onnx_config.cache_optimized_model,
+                    )
+                )
+
+        # every ONNX model is copied for each additional session options, so options are profiled without re-export
+        for model_configuration in list(model_configs[Format.ONNX]):
+            for session_options in variants_session_options:
+                model_configs[Format.ONNX].append(
+                    model_config.ONNXModelConfig(
+                        parent=model_configuration,
+                        opset=model_configuration.opset,
+                        dynamo_export=model_configuration.dynamo_export,
+                        graph_surgeon_optimization=False,
+                        dynamic_axes=model_configuration.dynamic_axes,
+                        custom_args=model_configuration.custom_args,
+                        device=onnx_config.device,
+                        export_device=model_configuration.export_device,
+                        session_options=session_options,
+                        cache_optimized_model=onnx_config.cache_optimized_model,
                     )
                 )
 
@@ -461,7 +488,12 @@ class ModelConfigBuilder:
                 )
             )
         else:
-            for model_configuration, precision in product(model_configs[Format.ONNX], trt_config.precision):
+            onnx_model_configs = [
+                model_configuration
+                for model_configuration in model_configs[Format.ONNX]
+                if not model_configuration.is_session_options_variant
+            ]
+            for model_configuration, precision in product(onnx_model_configs, trt_config.precision):
                 model_configs[Format.TENSORRT].append(
                     model_config.TensorRTModelConfig(
                         parent=model_configuration,
@@ -17,6 +17,7 @@
 from abc import ABC, abstractmethod
 from typing import Callable, Dict, List, Optional
 
+from model_navigator.configuration import OnnxSessionOptions
 from model_navigator.utils.common import DataObject
 
 
@@ -119,3 +120,41 @@ class DeviceRunnerConfig(RunnerConfig):
         return cls(
             device=data_dict.get("device"),
         )
+
+
+class OnnxRunnerConfig(DeviceRunnerConfig):
+    """ONNX runners configuration class."""
+
+    def __init__(
+        self,
+        device: Optional[str],
+        session_options: Optional[OnnxSessionOptions] = None,
+        cache_optimized_model: Optional[bool] = None,
+    ) -> None:
+        """Initializes ONNX runners configuration class.
+
+        Args:
+            device: The target device on which mode has to be loaded
+            session_options: ONNX Runtime session options
+            cache_optimized_model: Store and reuse the model optimized by ONNX Runtime
+        """
+        super().__init__(device=device)
+        self.session_options = session_options
+        self.cache_optimized_model = cache_optimized_model
+
+    @classmethod
+    def from_dict(cls, data_dict: Dict) -> "OnnxRunnerConfig":
+        """Initializes ONNX runners configuration from dictionary.
+
+        Args:
+            data_dict: dictionary data
+
+        Returns:
+            OnnxRunnerConfig object
+        """
+        session_options = data_dict.get("session_options")
+        return cls(
+            device=data_dict.get("device"),
+            session_options=OnnxSessionOptions.from_dict(session_options) if session_options is not None else None,
+            cache_optimized_model=data_dict.get("cache_optimized_model"),
+        )
@@ -0,0 +1,564 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Content addressed cache of exported and converted models.
+
+Artifacts produced by export and conversion commands are stored under a key which is the hash of the command name,
+model parameters or parent model files, model configuration, command arguments (including input and output
+metadata) and versions of frameworks, tools and GPU. Running the command again for unchanged inputs restores
+the artifact from the cache instead of executing the command.
+
+Example:
+```
+from model_navigator.core.artifact_cache import get_artifact_cache
+
+cache = get_artifact_cache()
+if cache is not None and cache.get(key, model_dir) is None:
+    ...  # produce the model in model_dir
+    cache.put(key, model_dir, output)
+```
+
+You can use your own cache class if you implement the `ArtifactCache` abstract class and register it with the
+`_register_cache_class` decorator.
+
+Example:
+```
+@_register_cache_class("MyCache")
+class MyCache(ArtifactCache):
+    def get(self, key, path):
+        return None
+
+    def put(self, key, path, output):
+        pass
+```
+
+To change default behavior, you can set the environment variables:
+* NAVIGATOR_ARTIFACT_CACHE_TYPE - cache type (none), set to `disk` to enable cache
+* NAVIGATOR_ARTIFACT_CACHE_DIR - directory of the disk cache (`artifacts` in the inplace cache directory)
+* NAVIGATOR_ARTIFACT_CACHE_MAX_SIZE - disk budget in bytes, least recently used artifacts are evicted above it
+"""
+
+import dataclasses
+import hashlib
+import importlib.metadata
+import inspect
+import json
+import os
+import pathlib
+import pickle
+import platform
+import shutil
+import time
+import uuid
+import weakref
+from abc import ABC, abstractmethod
+from enum import Enum
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, TypeVar
+
+import numpy as np
+
+from model_navigator.__version__ import __version__
+from model_navigator.configuration.model.model_config import ModelConfig
+from model_navigator.core.logger import LOGGER
+from model_navigator.frameworks import is_tf_available, is_torch_available
+from model_navigator.utils.common import DataObject
+from model_navigator.utils.environment import (
+    artifact_cache_dir,
+    artifact_cache_max_size,
+    artifact_cache_type,
+    get_gpu_info,
+)
+
+ENTRY_FILENAME = "entry.json"
+OUTPUT_FILENAME = "output.pkl"
+ARTIFACT_DIRNAME = "artifact"
+
+# arguments which do not change the produced artifact
+IGNORED_ARGS = {"workspace", "model", "verbose", "timing_cache_dir"}
+
+VERSIONED_PACKAGES = [
+    "torch",
+    "torch-tensorrt",
+    "tensorflow",
+    "jax",
+    "onnx",
+    "onnxruntime",
+    "onnxruntime-gpu",
+    "onnx_graphsurgeon",
+    "tensorrt",
+    "polygraphy",
+    "tf2onnx",
+]
+
+_HASH_CHUNK_SIZE = 2**20
+
+
+class ArtifactCacheType(Enum):
+    """Implementations types of the artifact cache."""
+
+    DISK = "disk"
+    """Artifacts are stored in the local directory"""
+
+    NONE = "none"
+    """Artifacts are not cached"""
+
+
+@dataclasses.dataclass
+class CachedArtifact(DataObject):
+    """Artifact restored from the cache.
+
+    Args:
+        output: Output of the command which produced the artifact
+    """
+
+    output: Optional[Dict[str, Any]] = None
+
+
+class ArtifactCache(ABC):
+    """Abstract class for the artifact cache."""
+
+    @abstractmethod
+    def get(self, key: str, path: pathlib.Path) -> Optional[CachedArtifact]:
+        """Restore artifact stored under the key.
+
+        Args:
+            key: Key of the artifact
+            path: Directory where files of the artifact are restored
+
+        Returns:
+            Restored artifact or None when artifact is not cached
+        """
+
+    @abstractmethod
+    def put(self, key: str, path: pathlib.Path, output: Optional[Dict[str, Any]]) -> None:
+        """Store files of the artifact under the key.
+
+        Args:
+            key: Key of the artifact
+            path: Directory with files of the artifact
+            output: Output of the command which produced the artifact
+        """
+
+
+IArtifactCache = TypeVar("IArtifactCache", bound=ArtifactCache)
+
+
+class DiskArtifactCache(ArtifactCache):
+    """Stores artifacts in the local directory with the least recently used eviction.
+
+    Every artifact is stored in a separate directory named with its key:
+
+        <key>/entry.json
+        <key>/output.pkl
+        <key>/artifact/...
+
+    Entries are created in a temporary directory and renamed, so processes sharing the cache directory never
+    read partially written entries. Modification time of the entry file is updated on each hit and entries
+    with the oldest time are removed when total size of the cache exceeds the budget.
+    """
+
+    def __init__(self, cache_dir: Optional[pathlib.Path] = None, max_size: Optional[int] = None):
+        """Initialize the DiskArtifactCache class.
+
+        Args:
+            cache_dir: Directory of the cache. Defaults to NAVIGATOR_ARTIFACT_CACHE_DIR.
+            max_size: Maximal size of stored artifacts in bytes. Defaults to NAVIGATOR_ARTIFACT_CACHE_MAX_SIZE.
+        """
+        self.cache_dir = pathlib.Path(cache_dir or _default_cache_dir())
+        self.max_size = max_size if max_size is not None else artifact_cache_max_size()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str, path: pathlib.Path) -> Optional[CachedArtifact]:
+        """Copy files of the artifact to the directory and mark the artifact as recently used."""
+        entry_dir = self.cache_dir / key
+        restored_files = []
+
+        def _copy(src, dst):
+            restored_files.append(pathlib.Path(dst))
+            return shutil.copy2(src, dst)
+
+        try:
+            with open(entry_dir / OUTPUT_FILENAME, "rb") as f:
+                output = pickle.load(f)
+            shutil.copytree(entry_dir / ARTIFACT_DIRNAME, path, copy_function=_copy, dirs_exist_ok=True)
+            os.utime(entry_dir / ENTRY_FILENAME)
+        except (OSError, shutil.Error) as e:
+            # entry does not exist or was evicted by other process while restored
+            LOGGER.debug(f"Artifact `{key}` not restored from cache: {e}")
+            for file in restored_files:
+                file.unlink(missing_ok=True)
+            return None
+
+        return CachedArtifact(output=output)
+
+    def put(self, key: str, path: pathlib.Path, output: Optional[Dict[str, Any]]) -> None:
+        """Copy files of the artifact to the cache and evict least recently used artifacts above the budget."""
+        entry_dir = self.cache_dir / key
+        if entry_dir.exists():
+            return
+
+        files = [file for file in _iter_files(path) if file.suffix != ".log"]
+        size = sum(file.stat().st_size for file in files)
+        if size > self.max_size:
+            LOGGER.info(f"Artifact of size {size}B exceeds the cache budget of {self.max_size}B. Not cached.")
+            return
+
+        tmp_dir = self.cache_dir / f".tmp-{uuid.uuid4().hex}"
+        try:
+            for file in files:
+                destination = tmp_dir / ARTIFACT_DIRNAME / file.relative_to(path)
+                destination.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(file, destination)
+            with open(tmp_dir / OUTPUT_FILENAME, "wb") as f:
+                pickle.dump(output, f)
+            with open(tmp_dir / ENTRY_FILENAME, "w") as f:
+                json.dump({"key": key, "size": size, "created": time.time()}, f)
+            os.rename(tmp_dir, entry_dir)
+        except OSError as e:
+            # other process stored the same artifact in the meantime
+            LOGGER.debug(f"Artifact `{key}` not stored in cache: {e}")
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used artifacts until total size fits the budget."""
+        entries = []
+        for entry_file in self.cache_dir.glob(f"*/{ENTRY_FILENAME}"):
+            try:
+                with open(entry_file) as f:
+                    size = json.load(f)["size"]
+                entries.append((entry_file.stat().st_mtime, size, entry_file.parent))
+            except (OSError, ValueError, KeyError):
+                continue
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_dir in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self.max_size:
+                break
+            LOGGER.debug(f"Evicting artifact `{entry_dir.name}` from cache.")
+            _remove_entry(entry_dir)
+            total_size -= size
+
+
+_cache_classes: Dict[str, Type[ArtifactCache]] = {}
+"""Registered cache classes."""
+
+
+def get_artifact_cache(cache_type: Optional[str] = None) -> Optional[ArtifactCache]:
+    """Create the artifact cache of given type.
+
+    Args:
+        cache_type: See `ArtifactCacheType` or name of the registered class. Defaults to NAVIGATOR_ARTIFACT_CACHE_TYPE.
+
+    Returns:
+        Artifact cache or None when cache is disabled
+
+    Raises:
+        NotImplementedError: When cache type is not registered
+    """
+    cache_type = cache_type or artifact_cache_type()
+    if cache_type == ArtifactCacheType.NONE.value:
+        return None
+
+    if cache_class := _cache_classes.get(cache_type):
+        return cache_class()
+    else:
+        raise NotImplementedError(
+            f"Unsupported cache_class '{cache_type}'. Register a new cache class using `register_cache_class`."
+        )
+
+
+def get_artifact_key(command_name: str, model_config: ModelConfig, args: Dict[str, Any]) -> Optional[str]:
+    """Compute the key of the artifact produced by the command.
+
+    Args:
+        command_name: Name of the command producing the artifact
+        model_config: Configuration of the produced model
+        args: Arguments of the command
+
+    Returns:
+        Hex digest of the key or None when the source model or the parent model cannot be hashed
+    """
+    if "model" in args:
+        model_hash = hash_model(args["model"])
+    elif args.get("parent_path") is not None:
+        model_hash = hash_path(args["workspace"].path / args["parent_path"])
+    else:
+        model_hash = None
+
+    if model_hash is None:
+        return None
+
+    data = {
+        "command": command_name,
+        "model": model_hash,
+        "model_config": DataObject.parse_value(model_config.to_dict()),
+        "args": {name: DataObject.parse_value(value) for name, value in args.items() if name not in IGNORED_ARGS},
+        "versions": _get_versions(),
+    }
+    # unsupported values are represented by repr, which at worst results in cache miss
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=repr).encode("utf-8")).hexdigest()
+
+
+def hash_model(model: Any) -> Optional[str]:
+    """Compute hash of model parameters, buffers, attributes and source code of model classes.
+
+    For PyTorch modules the non-tensor attributes of each submodule (e.g. scales, number of heads) are hashed too.
+
+    Args:
+        model: PyTorch module or Keras model
+
+    Returns:
+        Hex digest or None when model type is not supported or any of model attributes cannot be hashed
+    """
+    try:
+        if is_torch_available():
+            import torch  # pytype: disable=import-error
+
+            if isinstance(model, torch.nn.Module):
+                named_tensors = dict(model.state_dict())
+                # non-persistent buffers are not stored in the state dict but are used in forward
+                named_tensors.update(model.named_buffers())
+                tensors = ((name, _torch_tensor_to_numpy(tensor)) for name, tensor in named_tensors.items())
+                # internal state of torch modules is covered by tensors and source code of classes
+                module_state = set(vars(torch.nn.Module()))
+                attributes = {
+                    name: _describe_value(
+                        {attr: value for attr, value in vars(module).items() if attr not in module_state}, seen=set()
+                    )
+                    for name, module in model.named_modules()
+                }
+                return _hash_tensors(
+                    tensors, classes=[type(module) for module in model.modules()], attributes=attributes
+                )
+
+        if is_tf_available():
+            import tensorflow as tf  # pytype: disable=import-error
+
+            if isinstance(model, tf.keras.Model):
+                tensors = ((weight.name, weight.numpy()) for weight in model.weights)
+                return _hash_tensors(tensors, classes=[type(layer) for layer in model.submodules] + [type(model)])
+    except Exception as e:
+        LOGGER.debug(f"Model parameters cannot be hashed: {e}")
+
+    return None
+
+
+def hash_callable(value: Callable) -> Optional[str]:
+    """Compute hash of source code of a function or class of a callable object and values referenced by it.
+
+    Defaults and variables captured by functions, objects of bound methods and attributes of callable objects
+    are hashed too.
+
+    Args:
+        value: Function, method or callable object
+
+    Returns:
+        Hex digest or None when any of the referenced values cannot be hashed
+    """
+    try:
+        description = _describe_value(value, seen=set())
+    except Exception as e:
+        LOGGER.debug(f"Callable cannot be hashed: {e}")
+        return None
+
+    return hashlib.sha256(json.dumps(description, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def hash_path(path: pathlib.Path) -> Optional[str]:
+    """Compute hash of file or files in the directory.
+
+    Args:
+        path: Path to file or directory
+
+    Returns:
+        Hex digest or None when path does not exist
+    """
+    if not path.exists():
+        return None
+
+    sha = hashlib.sha256()
+    for file in _iter_files(path):
+        sha.update(file.relative_to(path).as_posix().encode("utf-8"))
+        with open(file, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                sha.update(chunk)
+
+    return sha.hexdigest()
+
+
+def _hash_tensors(
+    tensors: Iterable[Tuple[str, Any]], classes: List[type], attributes: Optional[Dict[str, Any]] = None
+) -> str:
+    sha = hashlib.sha256()
+    for name, tensor in tensors:
+        sha.update(f"{name}:{tensor.dtype}:{tensor.shape}".encode("utf-8"))
+        sha.update(tensor.tobytes())
+
+    if attributes is not None:
+        sha.update(json.dumps(attributes, sort_keys=True).encode("utf-8"))
+
+    # source of model classes covers changes in forward methods
+    for cls in sorted(set(classes), key=lambda cls: f"{cls.__module__}.{cls.__qualname__}"):
+        sha.update(f"{cls.__module__}.{cls.__qualname__}".encode("utf-8"))
+        try:
+            sha.update(inspect.getsource(cls).encode("utf-8"))
+        except (OSError, TypeError):
+            pass
+
+    return sha.hexdigest()
+
+
+def _torch_tensor_to_numpy(tensor: Any) -> Any:
+    import torch  # pytype: disable=import-error
+
+    # tensors are viewed as bytes, which also covers dtypes not supported by numpy
+    return tensor.detach().cpu().contiguous().reshape(-1).view(torch.uint8).numpy()
+
+
+def _describe_value(value: Any, seen: Set[int]) -> Any:
+    """Describe the attribute value with JSON serializable data which changes when the value changes.
+
+    Raises:
+        TypeError: when the value cannot be described
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, bytes):
+        return value.hex()
+    if isinstance(value, weakref.ref):
+        return _describe_value(value(), seen)
+    if isinstance(value, Enum):
+        return f"{type(value).__module__}.{type(value).__qualname__}.{value.name}"
+    if isinstance(value, np.ndarray):
+        return [str(value.dtype), list(value.shape), hashlib.sha256(value.tobytes()).hexdigest()]
+    if isinstance(value, (list, tuple)):
+        return [_describe_value(item, seen) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_describe_value(item, seen) for item in value), key=json.dumps)
+    if isinstance(value, dict):
+        items = [[_describe_value(key, seen), _describe_value(item, seen)] for key, item in value.items()]
+        return sorted(items, key=json.dumps)
+    if inspect.ismethod(value):
+        return [_describe_value(value.__func__, seen), _describe_value(value.__self__, seen)]
+    if isinstance(value, partial):
+        return [_describe_value(item, seen) for item in (value.func, value.args, value.keywords)]
+    if inspect.isclass(value) or inspect.isroutine(value):
+        name = f"{getattr(value, '__module__', None)}.{getattr(value, '__qualname__', repr(value))}"
+        # functions may reference themselves through the closure
+        if id(value) in seen:
+            return f"<ref {name}>"
+        seen.add(id(value))
+        if not inspect.isfunction(value):
+            try:
+                return [name, inspect.getsource(value)]
+            except (OSError, TypeError):
+                return name
+
+        # behavior of Python functions is defined by the source code, defaults and captured variables
+        closure = [cell.cell_contents for cell in value.__closure__ or ()]
+        return [
+            name,
+            inspect.getsource(value),
+            _describe_value([value.__defaults__, value.__kwdefaults__, closure], seen),
+        ]
+
+    if is_torch_available():
+        import torch  # pytype: disable=import-error
+
+        if isinstance(value, torch.Tensor):
+            return _describe_value(_torch_tensor_to_numpy(value), seen) + [str(value.dtype), list(value.shape)]
+        if isinstance(value, (torch.dtype, torch.device)):
+            return str(value)
+
+    if hasattr(value, "__dict__"):
+        # objects referenced more than once, e.g. parent modules, are described once
+        if id(value) in seen:
+            return f"<ref {type(value).__qualname__}>"
+        seen.add(id(value))
+        return [_describe_value(type(value), seen), _describe_value(vars(value), seen)]
+
+    raise TypeError(f"Attribute of type {type(value)} cannot be hashed.")
+
+
+@lru_cache
+def _get_versions() -> Dict[str, Any]:
+    versions = {"model_navigator": __version__, "python": platform.python_version()}
+    for package in VERSIONED_PACKAGES:
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            versions[package] = None
+
+    gpu_info = get_gpu_info()
+    versions["gpu"] = [gpu_info.get("name"), gpu_info.get("driver_version"), gpu_info.get("cuda_version")]
+    return versions
+
+
+def _iter_files(path: pathlib.Path) -> List[pathlib.Path]:
+    if path.is_file():
+        return [path]
+
+    return sorted(file for file in path.rglob("*") if file.is_file())
+
+
+def _remove_entry(entry_dir: pathlib.Path) -> None:
+    # entry is renamed first so it is never visible partially removed
+    tmp_dir = entry_dir.parent / f".tmp-{uuid.uuid4().hex}"
+    try:
+        os.rename(entry_dir, tmp_dir)
+    except OSError:
+        return
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def _default_cache_dir() -> pathlib.Path:
+    from model_navigator.inplace.config import inplace_cache_dir
+
+    return pathlib.Path(artifact_cache_dir() or inplace_cache_dir() / "artifacts")
+
+
+def _register_cache_class(name: str):
+    """Class decorator to register a new cache class.
+
+    Class must implement the `ArtifactCache` abstract class.
+
+    Args:
+        name (str): Name of the class to use for identification.
+    """
+
+    def _decorate(cache_class: Type[IArtifactCache]):
+        if issubclass(cache_class, ArtifactCache):
+            _cache_classes[name] = cache_class
+        else:
+            raise ValueError("Cache class must be derived from ArtifactCache.")
+
+        return cache_class
+
+    return _decorate
+
+
+def _unregister_cache_class(name: str):
+    """Unregister a cache class by name.
+
+    Args:
+        name (str): Name of the class to unregister.
+    """
+    if name in _cache_classes:
+        del _cache_classes[name]
+
+
+_register_cache_class(ArtifactCacheType.DISK.value)(DiskArtifactCache)
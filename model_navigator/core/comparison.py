@@ -0,0 +1,198 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Chunked comparison of tensors.
+
+Tensors are processed in chunks of flattened elements. Each chunk is cast to float64 into preallocated
+scratch buffers and reduced in place, so memory used for comparison does not depend on the size of tensors.
+"""
+
+import dataclasses
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from model_navigator.utils.common import DataObject
+
+DEFAULT_CHUNK_SIZE = 2**20  # elements, three float64 scratch buffers take 24 MiB
+
+
+@dataclasses.dataclass
+class TensorComparison(DataObject):
+    """Result of comparison of the output tensor with the reference tensor.
+
+    Args:
+        max_abs_error: Maximal absolute difference between elements
+        max_rel_error: Maximal absolute difference divided by the absolute value of the output element.
+            Elements equal to zero in both tensors are skipped.
+        nan_count: Number of NaN values in the output tensor
+        inf_count: Number of infinite values in the output tensor
+        cosine_similarity: Cosine similarity of flattened tensors when requested
+        histogram: Number of elements with absolute difference in each bin when bins were provided
+    """
+
+    max_abs_error: float = 0.0
+    max_rel_error: float = 0.0
+    nan_count: int = 0
+    inf_count: int = 0
+    cosine_similarity: Optional[float] = None
+    histogram: Optional[List[int]] = None
+
+
+def count_nonfinite(tensor: np.ndarray, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[int, int]:
+    """Count NaN and infinite values in the tensor.
+
+    Args:
+        tensor: Tensor to verify
+        chunk_size: Number of elements processed at once
+
+    Returns:
+        Number of NaN values and number of infinite values
+    """
+    tensor = np.asarray(tensor)
+    if not np.issubdtype(tensor.dtype, np.inexact):
+        return 0, 0
+
+    nan_count, inf_count = 0, 0
+    scratch = np.empty(min(tensor.size, chunk_size), dtype=np.bool_)
+    for chunk in _chunks(tensor.reshape(-1), chunk_size):
+        mask = scratch[: chunk.size]
+        nan_count += int(np.count_nonzero(np.isnan(chunk, out=mask)))
+        inf_count += int(np.count_nonzero(np.isinf(chunk, out=mask)))
+
+    return nan_count, inf_count
+
+
+def compare_tensors(
+    reference: np.ndarray,
+    output: np.ndarray,
+    *,
+    cosine_similarity: bool = False,
+    histogram_bins: Optional[Sequence[float]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> TensorComparison:
+    """Compare the output tensor with the reference tensor.
+
+    Tensors are broadcast against each other. NaN differences are skipped in the maximal errors,
+    they are reported with `nan_count` of the output tensor.
+
+    Args:
+        reference: Reference tensor
+        output: Compared tensor
+        cosine_similarity: Compute cosine similarity of tensors
+        histogram_bins: Edges of bins for the histogram of absolute differences
+        chunk_size: Number of elements processed at once
+
+    Returns:
+        TensorComparison with reduced errors
+    """
+    reference, output = _flatten_pair(reference, output)
+    result = TensorComparison()
+    result.nan_count, result.inf_count = count_nonfinite(output, chunk_size=chunk_size)
+    if histogram_bins is not None:
+        result.histogram = [0] * (len(histogram_bins) - 1)
+
+    size = min(reference.size, chunk_size)
+    ref_buffer, out_buffer, diff_buffer = (np.empty(size, dtype=np.float64) for _ in range(3))
+    dot, ref_norm, out_norm = 0.0, 0.0, 0.0
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for ref_chunk, out_chunk in zip(_chunks(reference, chunk_size), _chunks(output, chunk_size)):
+            ref, out, diff = ref_buffer[: ref_chunk.size], out_buffer[: ref_chunk.size], diff_buffer[: ref_chunk.size]
+            np.copyto(ref, ref_chunk, casting="unsafe")
+            np.copyto(out, out_chunk, casting="unsafe")
+
+            if cosine_similarity:
+                dot += float(np.dot(ref, out))
+                ref_norm += float(np.dot(ref, ref))
+                out_norm += float(np.dot(out, out))
+
+            np.subtract(ref, out, out=diff)
+            np.abs(diff, out=diff)
+            result.max_abs_error = _fmax(result.max_abs_error, diff)
+            if result.histogram is not None:
+                counts, _ = np.histogram(diff, bins=histogram_bins)
+                result.histogram = [total + int(count) for total, count in zip(result.histogram, counts)]
+
+            # relative error is computed in place of the reference, 0/0 gives NaN which is skipped
+            np.abs(out, out=ref)
+            np.divide(diff, ref, out=ref)
+            result.max_rel_error = _fmax(result.max_rel_error, ref)
+
+    if cosine_similarity:
+        denominator = np.sqrt(ref_norm) * np.sqrt(out_norm)
+        result.cosine_similarity = float(dot / denominator) if denominator > 0 else float(ref_norm == out_norm)
+
+    return result
+
+
+def allclose(
+    reference: np.ndarray, output: np.ndarray, *, atol: float, rtol: float, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> bool:
+    """Verify if tensors are equal within tolerance in the same way as `numpy.allclose(output, reference)`.
+
+    Args:
+        reference: Reference tensor
+        output: Compared tensor
+        atol: Absolute tolerance
+        rtol: Relative tolerance applied to the reference tensor
+        chunk_size: Number of elements processed at once
+
+    Returns:
+        True if all elements satisfy `|output - reference| <= atol + rtol * |reference|`, False otherwise.
+        Infinite values are close only to equal values and NaN values are never close.
+    """
+    reference, output = _flatten_pair(reference, output)
+    size = min(reference.size, chunk_size)
+    ref_buffer, out_buffer = np.empty(size, dtype=np.float64), np.empty(size, dtype=np.float64)
+    nonfinite_buffer, close_buffer = np.empty(size, dtype=np.bool_), np.empty(size, dtype=np.bool_)
+    with np.errstate(invalid="ignore", over="ignore"):
+        for ref_chunk, out_chunk in zip(_chunks(reference, chunk_size), _chunks(output, chunk_size)):
+            ref, out = ref_buffer[: ref_chunk.size], out_buffer[: ref_chunk.size]
+            nonfinite, close = nonfinite_buffer[: ref_chunk.size], close_buffer[: ref_chunk.size]
+            np.copyto(ref, ref_chunk, casting="unsafe")
+            np.copyto(out, out_chunk, casting="unsafe")
+
+            np.logical_and(np.isfinite(ref, out=nonfinite), np.isfinite(out, out=close), out=nonfinite)
+            np.logical_not(nonfinite, out=nonfinite)
+            if nonfinite.any() and not np.array_equal(ref[nonfinite], out[nonfinite]):
+                return False
+
+            np.subtract(out, ref, out=out)
+            np.abs(out, out=out)
+            np.abs(ref, out=ref)
+            np.multiply(ref, rtol, out=ref)
+            np.add(ref, atol, out=ref)
+            np.less_equal(out, ref, out=close)
+            # equality of non-finite values was verified above
+            if not np.logical_or(close, nonfinite, out=close).all():
+                return False
+
+    return True
+
+
+def _flatten_pair(reference: np.ndarray, output: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    reference, output = np.asarray(reference), np.asarray(output)
+    if reference.shape != output.shape:
+        reference, output = np.broadcast_arrays(reference, output)
+    # reshape returns views of contiguous tensors
+    return reference.reshape(-1), output.reshape(-1)
+
+
+def _chunks(tensor: np.ndarray, chunk_size: int) -> Iterator[np.ndarray]:
+    for start in range(0, tensor.size, chunk_size):
+        yield tensor[start : start + chunk_size]
+
+
+def _fmax(value: float, chunk: np.ndarray) -> float:
+    # fmax skips NaN values
+    return max(value, float(np.fmax.reduce(chunk, initial=-np.inf)))
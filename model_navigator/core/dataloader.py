@@ -20,7 +20,9 @@ from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple, Unio
 import numpy as np
 
 from model_navigator.configuration import Sample, TensorType
+from model_navigator.core.comparison import count_nonfinite
 from model_navigator.core.logger import LOGGER
+from model_navigator.core.sample_store import SampleStore, SampleStoreWriter, is_sample_store
 from model_navigator.core.tensor import TensorMetadata, is_tensor
 from model_navigator.exceptions import ModelNavigatorUserInputError
 from model_navigator.frameworks import Framework
@@ -47,8 +49,12 @@ class IndiciesFilteredDataloader:
 
     def __iter__(self):
         """Iterate over samples."""
+        indicies = set(self._indicies)
+        last_index = max(indicies, default=-1)
         for idx, sample in enumerate(self._dataloader):
-            if idx in self._indicies:
+            if idx > last_index:
+                break
+            if idx in indicies:
                 yield sample
 
     def __len__(self):
@@ -108,11 +114,52 @@ class SortedSamplesLoader:
         return files
 
 
+class MemoryMappedSamplesLoader:
+    """Dataloader that loads samples from the memory mapped store in directory."""
+
+    def __init__(self, samples_dirpath: pathlib.Path, batch_dim: Optional[int] = None):
+        """Initialize MemoryMappedSamplesLoader.
+
+        Args:
+            samples_dirpath: Path to samples directory
+            batch_dim: Batch dimension
+        """
+        self._store = SampleStore(samples_dirpath)
+        self._batch_dim = batch_dim
+
+    def __getitem__(self, idx: int) -> Sample:
+        """Get sample for given index.
+
+        Tensors are views of memory mapped files, data is read from disk on first access.
+
+        Args:
+            idx: Index of sample to get
+
+        Returns:
+            Sample data
+        """
+        sample = self._store[idx]
+        if self._batch_dim is not None:
+            sample = {name: np.expand_dims(tensor, self._batch_dim) for name, tensor in sample.items()}
+        return sample
+
+    def __len__(self) -> int:
+        """Get number of samples.
+
+        Returns:
+            Number of samples
+        """
+        return len(self._store)
+
+
 def load_samples(
     samples_name: str, workspace: Union[pathlib.Path, str], batch_dim: Optional[int]
-) -> SortedSamplesLoader:
+) -> Union[MemoryMappedSamplesLoader, SortedSamplesLoader]:
     """Load samples for provided name.
 
+    Samples saved in the memory mapped store are loaded when the store exists in the samples directory,
+    otherwise samples are loaded from .npz files.
+
     Args:
         samples_name: Name of samples to load
         workspace: Working directory
@@ -127,9 +174,40 @@ def load_samples(
     samples_dirname = "model_output" if samples_name.split("_")[-1] == "output" else "model_input"
     samples_dirpath = workspace / samples_dirname / samples_type
 
+    if is_sample_store(samples_dirpath):
+        return MemoryMappedSamplesLoader(samples_dirpath, batch_dim)
+
     return SortedSamplesLoader(samples_dirpath, batch_dim)
 
 
+def samples_to_store(
+    samples: Iterable[Sample],
+    path: pathlib.Path,
+    batch_dim: Optional[int],
+    *,
+    metadata: Optional[TensorMetadata] = None,
+    framework: Optional[Framework] = None,
+    raise_on_error: bool = True,
+) -> None:
+    """Save samples to the memory mapped store in `path` directory.
+
+    Args:
+        samples: Samples to save.
+        path: Output directory.
+        batch_dim: Batch dimension
+        metadata: Metadata of the samples. Defaults to None.
+        framework: Model framework. Defaults to None.
+        raise_on_error: If True raise an error when sample is invalid. Defaults to True.
+    """
+    with SampleStoreWriter(path) as writer:
+        for sample in samples:
+            if metadata is not None:
+                assert framework is not None
+                sample = extract_sample(sample, metadata, framework)
+
+            writer.append(squeeze_sample(sample, batch_dim, raise_on_error=raise_on_error))
+
+
 def samples_to_npz(
     samples: Iterable[Sample],
     path: pathlib.Path,
@@ -160,19 +238,45 @@ def samples_to_npz(
         if metadata is not None:
             assert framework is not None
             sample = extract_sample(sample, metadata, framework)
-        sample = extract_bs1(sample, batch_dim)
-        squeezed_sample = {}
-        for name, tensor in sample.items():
-            if batch_dim is not None:
-                tensor = tensor.squeeze(batch_dim)
 
-            _validate_tensor(tensor, raise_on_error=raise_on_error)
+        filename = _sample_filename(idx=i, num_samples=num_samples)
+        sample_to_npz(sample, path / filename, batch_dim, raise_on_error=raise_on_error)
 
-            squeezed_sample[name] = tensor
 
-        filename = _sample_filename(idx=i, num_samples=num_samples)
-        file_path = path / filename
-        np.savez(file_path.as_posix(), **squeezed_sample)
+def sample_to_npz(sample: Sample, file_path: pathlib.Path, batch_dim: Optional[int], *, raise_on_error: bool = True):
+    """Save the first item of the batch from sample to .npz file.
+
+    Args:
+        sample: Sample with numpy tensors to save.
+        file_path: Path of the output file.
+        batch_dim: Batch dimension
+        raise_on_error: If True raise an error when sample is invalid. Defaults to True.
+    """
+    np.savez(file_path.as_posix(), **squeeze_sample(sample, batch_dim, raise_on_error=raise_on_error))
+
+
+def squeeze_sample(sample: Sample, batch_dim: Optional[int], *, raise_on_error: bool = True) -> Sample:
+    """Extract the first item of the batch from sample and remove the batch dimension.
+
+    Args:
+        sample: Sample with numpy tensors.
+        batch_dim: Batch dimension
+        raise_on_error: If True raise an error when sample is invalid. Defaults to True.
+
+    Returns:
+        Sample with validated tensors without the batch dimension
+    """
+    sample = extract_bs1(sample, batch_dim)
+    squeezed_sample = {}
+    for name, tensor in sample.items():
+        if batch_dim is not None:
+            tensor = tensor.squeeze(batch_dim)
+
+        _validate_tensor(tensor, raise_on_error=raise_on_error)
+
+        squeezed_sample[name] = tensor
+
+    return squeezed_sample
 
 
 def sample_to_tuple(input: Any) -> Tuple[Any, ...]:
@@ -368,14 +472,15 @@ def _sample_filename(idx: int, num_samples: int) -> str:
 
 
 def _validate_tensor(tensor: np.ndarray, *, raise_on_error: bool = True):
-    if any(np.isnan(tensor.flatten())):
+    nan_count, inf_count = count_nonfinite(tensor)
+    if nan_count > 0:
         message = "Tensor data contains `NaN` value. Please verify the dataloader and model."
         if raise_on_error:
             raise ModelNavigatorUserInputError(message)
         else:
             LOGGER.warning(message)
 
-    if any(np.isinf(tensor.flatten())):
+    if inf_count > 0:
         message = "Tensor data contains `inf` value. Please verify the dataloader and model."
         if raise_on_error:
             raise ModelNavigatorUserInputError(message)
@@ -0,0 +1,236 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Single pass ingestion of the dataloader."""
+
+import pathlib
+import tempfile
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from model_navigator.configuration import SizedDataLoader
+from model_navigator.core.dataloader import sample_to_npz, squeeze_sample, to_numpy, validate_sample_input
+from model_navigator.core.logger import LOGGER
+from model_navigator.core.sample_store import SampleStore, SampleStoreWriter
+from model_navigator.core.tensor import FRAMEWORK_TO_TENSOR_TYPE, PyTreeMetadata
+from model_navigator.exceptions import ModelNavigatorUserInputError
+from model_navigator.frameworks import Framework
+
+
+def assert_sample_has_pytree_metadata(sample, pytree_metadata: PyTreeMetadata) -> None:
+    """Verify that the sample has the structure of inputs.
+
+    Args:
+        sample: A sample from the dataloader
+        pytree_metadata: Structure of inputs
+
+    Raises:
+        ModelNavigatorUserInputError: When the sample has different structure.
+    """
+    if not pytree_metadata.is_compatible_with(sample):
+        raise ModelNavigatorUserInputError(
+            f"All inputs must have the same structure.\nInput structure: {pytree_metadata}\nSample: {sample}."
+        )
+
+
+def select_correctness_samples(num_samples: int, sample_count: int, seed: int) -> Set[int]:
+    """Select indices of correctness samples.
+
+    Args:
+        num_samples: Number of samples in the dataloader
+        sample_count: Number of correctness samples to select
+        seed: Random seed
+
+    Returns:
+        Indices of selected samples
+    """
+    if sample_count > num_samples:
+        LOGGER.warning(
+            f"Requested sample_count ({sample_count}) is larger than "
+            f"the number of available samples ({num_samples}). Using {num_samples} samples."
+        )
+        sample_count = num_samples
+
+    np.random.seed(seed)
+    return set(np.random.choice(num_samples, size=sample_count, replace=False).tolist())
+
+
+class DataloaderIngestion:
+    """Collect shapes of inputs and samples for the workspace in a single pass over the dataloader.
+
+    Each sample is validated, checked against the input structure and its axes shapes are recorded.
+    When the samples path is provided, samples are saved in the same pass:
+        1) correctness samples - `sample_count` samples selected with the seed before the pass,
+        2) conversion samples - the first samples with the minimal and maximal size of each axis,
+        3) profiling sample - the last of conversion samples reaching the maximal size of an axis.
+
+    Minimal and maximal sizes are known only after the whole pass, so current candidates for conversion
+    samples are saved to a temporary directory and removed when a sample with a smaller or larger size is found.
+    """
+
+    def __init__(
+        self,
+        pytree_metadata: PyTreeMetadata,
+        framework: Framework,
+        batch_dim: Optional[int],
+        samples_path: Optional[pathlib.Path] = None,
+        sample_count: int = 0,
+        seed: int = 0,
+        raise_on_error: bool = False,
+    ):
+        """Initialize ingestion.
+
+        Args:
+            pytree_metadata: Structure of inputs which all samples must match
+            framework: Framework of tensors returned by the dataloader
+            batch_dim: Location of batch dimension in data samples
+            samples_path: Directory where samples are saved. When None, samples are not saved.
+            sample_count: Number of correctness samples to save
+            seed: Random seed for selecting correctness samples
+            raise_on_error: If True raise an error when one of saved samples is invalid
+        """
+        self._pytree_metadata = pytree_metadata
+        self._framework = framework
+        self._batch_dim = batch_dim
+        self._samples_path = samples_path
+        self._sample_count = sample_count
+        self._seed = seed
+        self._raise_on_error = raise_on_error
+        # (input name, axis, "min" or "max") -> (axis size, sample index)
+        self._conversion_candidates: Dict[Tuple[str, int, str], Tuple[int, int]] = {}
+
+    def run(self, dataloader: SizedDataLoader) -> Dict[str, Dict[int, List[int]]]:
+        """Iterate over the dataloader once.
+
+        Args:
+            dataloader: Dataloader providing samples
+
+        Returns:
+            Sizes of each axis of each input collected from all samples
+        """
+        num_samples = len(dataloader)
+        if self._samples_path is None:
+            return self._ingest(dataloader, num_samples)
+
+        correctness_indices = select_correctness_samples(num_samples, self._sample_count, self._seed)
+        for dirname in ["profiling", "correctness", "conversion"]:
+            (self._samples_path / dirname).mkdir(parents=True, exist_ok=True)
+
+        with tempfile.TemporaryDirectory(dir=self._samples_path) as candidates_dir:
+            with SampleStoreWriter(self._samples_path / "correctness") as correctness_writer:
+                axes_shapes = self._ingest(
+                    dataloader, num_samples, correctness_indices, correctness_writer, pathlib.Path(candidates_dir)
+                )
+            self._save_conversion_and_profiling_samples(pathlib.Path(candidates_dir))
+
+        return axes_shapes
+
+    def _ingest(
+        self,
+        dataloader: SizedDataLoader,
+        num_samples: int,
+        correctness_indices: Optional[Set[int]] = None,
+        correctness_writer: Optional[SampleStoreWriter] = None,
+        candidates_dir: Optional[pathlib.Path] = None,
+    ) -> Dict[str, Dict[int, List[int]]]:
+        axes_shapes = {}
+        tensor_type = FRAMEWORK_TO_TENSOR_TYPE[self._framework]
+        count = 0
+        for index, sample in enumerate(dataloader):
+            if index >= num_samples:
+                LOGGER.warning(f"{len(dataloader)=}, but more samples found.")
+                break
+
+            count += 1
+            validate_sample_input(sample, tensor_type)
+            assert_sample_has_pytree_metadata(sample, self._pytree_metadata)
+
+            sample = {
+                name: to_numpy(tensor, self._framework)
+                for name, tensor in self._pytree_metadata.flatten_sample(sample).items()
+            }
+            if not axes_shapes:
+                axes_shapes = {name: {ax: [] for ax in range(tensor.ndim)} for name, tensor in sample.items()}
+            for name, tensor in sample.items():
+                for ax, dim in enumerate(tensor.shape):
+                    axes_shapes[name][ax].append(dim)
+
+            if self._samples_path is None:
+                continue
+
+            if index in correctness_indices:
+                correctness_writer.append(squeeze_sample(sample, self._batch_dim, raise_on_error=self._raise_on_error))
+
+            if self._update_conversion_candidates(index, sample):
+                sample_to_npz(
+                    sample, candidates_dir / f"{index}.npz", self._batch_dim, raise_on_error=self._raise_on_error
+                )
+                self._remove_outdated_candidates(candidates_dir)
+
+        assert count >= num_samples, f"{len(dataloader)=}, but only {count} samples found."
+
+        return axes_shapes
+
+    def _update_conversion_candidates(self, index: int, sample: Dict[str, np.ndarray]) -> bool:
+        updated = False
+        for name, tensor in sample.items():
+            for ax, dim in enumerate(tensor.shape):
+                min_key, max_key = (name, ax, "min"), (name, ax, "max")
+                # minimal batch size in TensorRT profile is always 1
+                if ax == self._batch_dim:
+                    is_min = dim == 1 and min_key not in self._conversion_candidates
+                else:
+                    is_min = min_key not in self._conversion_candidates or dim < self._conversion_candidates[min_key][0]
+                is_max = max_key not in self._conversion_candidates or dim > self._conversion_candidates[max_key][0]
+
+                if is_min:
+                    self._conversion_candidates[min_key] = (dim, index)
+                if is_max:
+                    self._conversion_candidates[max_key] = (dim, index)
+                updated = updated or is_min or is_max
+
+        return updated
+
+    def _remove_outdated_candidates(self, candidates_dir: pathlib.Path) -> None:
+        indices = {index for _, index in self._conversion_candidates.values()}
+        for path in candidates_dir.iterdir():
+            if int(path.stem) not in indices:
+                path.unlink()
+
+    def _save_conversion_and_profiling_samples(self, candidates_dir: pathlib.Path) -> None:
+        conversion_indices = sorted({index for _, index in self._conversion_candidates.values()})
+        max_indices = [index for (_, _, kind), (_, index) in self._conversion_candidates.items() if kind == "max"]
+
+        correctness_store = SampleStore(self._samples_path / "correctness")
+        if conversion_indices:
+            conversion_samples = [_load_npz(candidates_dir / f"{index}.npz") for index in conversion_indices]
+            profiling_sample = conversion_samples[conversion_indices.index(max(max_indices))]
+        elif len(correctness_store) > 0:
+            # inputs without axes, the first correctness sample is used for conversion and profiling
+            conversion_samples = [correctness_store[0]]
+            profiling_sample = correctness_store[0]
+        else:
+            LOGGER.warning("No samples selected for conversion and profiling.")
+            return
+
+        with SampleStoreWriter(self._samples_path / "profiling") as writer:
+            writer.append(profiling_sample)
+        with SampleStoreWriter(self._samples_path / "conversion") as writer:
+            for sample in conversion_samples:
+                writer.append(sample)
+
+
+def _load_npz(path: pathlib.Path) -> Dict[str, np.ndarray]:
+    with np.load(path.as_posix()) as data:
+        return dict(data.items())
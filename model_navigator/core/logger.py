@@ -21,6 +21,7 @@ import multiprocessing as mp
 import os
 import pathlib
 import sys
+import threading
 from functools import lru_cache
 from multiprocessing import current_process
 from typing import Dict, Optional, TextIO, Tuple, Union
@@ -123,20 +124,32 @@ def forward_polygraphy_logging_to_python_logging() -> None:
     ...
 
 
-def configure_logging_sink(sink: Union[TextIO, str, pathlib.Path]) -> Tuple[int, int]:
-    """Configures given sink for the loguru."""
+def configure_logging_sink(sink: Union[TextIO, str, pathlib.Path], thread_id: Optional[int] = None) -> Tuple[int, int]:
+    """Configures given sink for the loguru.
+
+    Args:
+        sink: Stream or path to file where logs are stored
+        thread_id: When provided, only logs emitted from the thread with given identifier are stored
+    """
+
+    def _filter(predicate):
+        if thread_id is None:
+            return predicate
+
+        return lambda record: record["thread"].id == thread_id and predicate(record)
+
     navigator_sink_id = logger.add(
         sink,
         level=get_navigator_log_level(),
         format=get_log_format(),
-        filter=navigator_record_predicate,
+        filter=_filter(navigator_record_predicate),
         enqueue=True,
     )
     third_party_sink_id = logger.add(
         sink,
         level=get_third_party_log_level(),
         format=get_log_format(),
-        filter=third_party_record_predicate,
+        filter=_filter(third_party_record_predicate),
         enqueue=True,
     )
     return navigator_sink_id, third_party_sink_id
@@ -246,15 +259,18 @@ class LoggingContext(contextlib.AbstractContextManager):
         self,
         *,
         log_dir: Optional[pathlib.Path] = None,
+        current_thread_only: bool = False,
     ):
         """Initialize the context.
 
         Args:
             log_dir: Optional path to directory where log file is stored.
+            current_thread_only: If True, store only logs emitted from the thread which created the context.
         """
         if log_dir:
             log_dir.mkdir(parents=True, exist_ok=True)
-            self.sink_ids = configure_logging_sink(log_dir / "format.log")
+            thread_id = threading.get_ident() if current_thread_only else None
+            self.sink_ids = configure_logging_sink(log_dir / "format.log", thread_id=thread_id)
         else:
             self.sink_ids = None
 
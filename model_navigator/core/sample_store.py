@@ -0,0 +1,219 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Columnar store of samples read through memory mapped files.
+
+Samples directory contains one binary file per tensor name and the index file:
+
+    index.json
+    0.bin
+    1.bin
+
+Data of consecutive samples is appended to the binary file of the tensor. The index stores for each tensor name
+the binary file name and, for each sample, the offset, dtype and shape of the tensor data in this file. Offsets are
+aligned to ALIGNMENT bytes so tensors are returned as aligned views of memory mapped files without copying data.
+"""
+
+import json
+import os
+import pathlib
+from typing import Any, BinaryIO, Dict
+
+import numpy as np
+
+from model_navigator.exceptions import ModelNavigatorUserInputError
+
+INDEX_FILENAME = "index.json"
+TENSOR_FILE_SUFFIX = ".bin"
+ALIGNMENT = 64
+FORMAT_VERSION = 1
+
+
+def is_sample_store(path: pathlib.Path) -> bool:
+    """Check if directory contains samples in the memory mapped store layout.
+
+    Args:
+        path: Path to samples directory
+
+    Returns:
+        True if index of the store exists, False otherwise
+    """
+    return (path / INDEX_FILENAME).is_file()
+
+
+class SampleStoreWriter:
+    """Append samples to the store.
+
+    Store existing in the directory is replaced. Its files are unlinked instead of truncated, so arrays mapped
+    from the previous store remain valid. The index is written when the writer is closed, so the store
+    is not readable before all samples are written.
+
+    Example:
+        with SampleStoreWriter(path) as writer:
+            for sample in samples:
+                writer.append(sample)
+    """
+
+    def __init__(self, path: pathlib.Path):
+        """Initialize writer.
+
+        Args:
+            path: Path to samples directory
+        """
+        self._path = path
+        self._path.mkdir(parents=True, exist_ok=True)
+        (self._path / INDEX_FILENAME).unlink(missing_ok=True)
+        for tensor_path in self._path.glob(f"*{TENSOR_FILE_SUFFIX}"):
+            tensor_path.unlink()
+
+        self._num_samples = 0
+        self._tensors: Dict[str, Dict[str, Any]] = {}
+        self._files: Dict[str, BinaryIO] = {}
+
+    def __enter__(self) -> "SampleStoreWriter":
+        """Return the writer."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the writer and write index if all samples were written."""
+        if exc_type is None:
+            self.close()
+        else:
+            self._close_files()
+
+    def append(self, sample: Dict[str, np.ndarray]) -> None:
+        """Append sample to the store.
+
+        Args:
+            sample: Mapping of tensor names to numpy arrays
+
+        Raises:
+            ModelNavigatorUserInputError: When tensor contains Python objects which cannot be stored as raw data.
+        """
+        for name, tensor in sample.items():
+            tensor = np.asarray(tensor, order="C")
+            if tensor.dtype.hasobject:
+                raise ModelNavigatorUserInputError(
+                    f"Tensor `{name}` has dtype `{tensor.dtype}` with Python objects which cannot be saved as sample. "
+                    "Use numpy arrays with numeric, boolean, string or bytes dtype."
+                )
+
+            if name not in self._tensors:
+                filename = f"{len(self._tensors)}{TENSOR_FILE_SUFFIX}"
+                self._tensors[name] = {"file": filename, "samples": [None] * self._num_samples}
+                self._files[name] = open(self._path / filename, "wb")
+
+            file = self._files[name]
+            offset = _align(file.tell())
+            file.seek(offset)
+            file.write(tensor.data)
+            self._tensors[name]["samples"].append([offset, tensor.dtype.str, list(tensor.shape)])
+
+        self._num_samples += 1
+        for tensor_index in self._tensors.values():
+            if len(tensor_index["samples"]) < self._num_samples:
+                tensor_index["samples"].append(None)
+
+    def close(self) -> None:
+        """Close binary files and write the index."""
+        self._close_files()
+        index = {"version": FORMAT_VERSION, "num_samples": self._num_samples, "tensors": self._tensors}
+        tmp_index_path = self._path / f"{INDEX_FILENAME}.tmp"
+        with open(tmp_index_path, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_index_path, self._path / INDEX_FILENAME)
+
+    def _close_files(self) -> None:
+        for file in self._files.values():
+            file.close()
+        self._files = {}
+
+
+class SampleStore:
+    """Read samples from the store.
+
+    Binary files are memory mapped in copy-on-write mode on the first access. Returned tensors are views of mapped
+    files, so pages are loaded on demand and shared through the page cache between processes reading the same store.
+    Modifications of tensors are private to the process and are not written to files.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        """Initialize store.
+
+        Args:
+            path: Path to samples directory
+        """
+        self._path = path
+        with open(path / INDEX_FILENAME) as f:
+            index = json.load(f)
+
+        if index["version"] > FORMAT_VERSION:
+            raise ModelNavigatorUserInputError(
+                f"Samples in `{path}` were saved in unsupported format version {index['version']}. "
+                "Update Model Navigator to load these samples."
+            )
+
+        self._num_samples = index["num_samples"]
+        self._tensors = index["tensors"]
+        self._mmaps: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        """Get number of samples."""
+        return self._num_samples
+
+    def __getitem__(self, idx: int) -> Dict[str, np.ndarray]:
+        """Get sample for given index.
+
+        Args:
+            idx: Index of sample
+
+        Returns:
+            Mapping of tensor names to arrays which are views of memory mapped files
+        """
+        if idx < 0:
+            idx += self._num_samples
+        if not 0 <= idx < self._num_samples:
+            raise IndexError(f"Sample index {idx} out of range for {self._num_samples} samples.")
+
+        sample = {}
+        for name, tensor_index in self._tensors.items():
+            entry = tensor_index["samples"][idx]
+            if entry is None:
+                continue
+
+            offset, dtype, shape = entry
+            dtype = np.dtype(dtype)
+            if dtype.itemsize * int(np.prod(shape)) == 0:
+                sample[name] = np.empty(shape, dtype=dtype)
+            else:
+                sample[name] = np.ndarray(
+                    shape, dtype=dtype, buffer=self._get_mmap(tensor_index["file"]), offset=offset
+                )
+
+        return sample
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop memory mapped files which are mapped again after unpickling."""
+        state = self.__dict__.copy()
+        state["_mmaps"] = {}
+        return state
+
+    def _get_mmap(self, filename: str) -> np.ndarray:
+        if filename not in self._mmaps:
+            self._mmaps[filename] = np.memmap(self._path / filename, dtype=np.uint8, mode="c")
+
+        return self._mmaps[filename]
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
@@ -20,7 +20,7 @@ import itertools
 # import json
 import uuid  # TODO find better solution
 from collections import defaultdict
-from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Tuple, Type, Union
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Sequence, Tuple, Type, Union
 
 import numpy as np
 
@@ -248,6 +248,9 @@ class PyTreeMetadata:
         """Create PyTreeMetadata from provided metadata."""
         self._metadata = metadata
         self.tensor_type = tensor_type
+        self._hash_value = None
+        self._flatten_fn = None
+        self._unflatten_fn = None
 
     def __str__(self) -> str:
         """Convert PyTree metadata to string."""
@@ -261,7 +264,16 @@ class PyTreeMetadata:
 
     def __hash__(self) -> int:
         """Compute hash of PyTree metadata."""
-        return self._hash(self._metadata, 0)
+        if self._hash_value is None:
+            self._hash_value = self._hash(self._metadata, 0)
+        return self._hash_value
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get state for pickling without compiled functions."""
+        state = self.__dict__.copy()
+        state["_flatten_fn"] = None
+        state["_unflatten_fn"] = None
+        return state
 
     @classmethod
     def from_sample(
@@ -303,8 +315,10 @@ class PyTreeMetadata:
 
         Returns flatten dictionary with keys corresponding to PyTree metadata.
         """
+        if self._flatten_fn is None:
+            self._flatten_fn = _compile_flatten(self._metadata)
         flattened_sample = {}
-        self._flatten_sample(sample, self._metadata, flattened_sample)
+        self._flatten_fn(sample, flattened_sample)
         return flattened_sample
 
     def unflatten_sample(self, sample: Dict[str, Any], wrap_input: bool = False) -> Any:
@@ -313,7 +327,9 @@ class PyTreeMetadata:
         Returns unflatten sample according to PyTree metadata.
         If wrap_input is True, then single tensor will be wrapped in tuple.
         """
-        unflatten_sample = self._unflatten_sample(sample, self._metadata)
+        if self._unflatten_fn is None:
+            self._unflatten_fn = _compile_unflatten(self._metadata)
+        unflatten_sample = self._unflatten_fn(sample)
         if wrap_input and isinstance(self._metadata, (str, Mapping)):
             unflatten_sample = (unflatten_sample,)
         return unflatten_sample
@@ -440,18 +456,6 @@ class PyTreeMetadata:
         else:
             raise TypeError(f"Unsupported type: {type(sample)}")
 
-    def _unflatten_sample(self, sample, struct):
-        if isinstance(struct, str):
-            return sample[struct]
-        elif isinstance(struct, PYTHON_PRIMITIVE_TYPES):
-            return struct
-        elif isinstance(struct, Mapping):
-            return {key: self._unflatten_sample(sample, item) for key, item in struct.items()}
-        elif isinstance(struct, Sequence):
-            return type(struct)(self._unflatten_sample(sample, item) for item in struct)
-        else:
-            raise TypeError(f"Unsupported struct: {struct}")
-
     def _hash(self, struct, hash_):
         if isinstance(struct, str) or isinstance(struct, PYTHON_PRIMITIVE_TYPES):
             return hash_ ^ hash(struct)
@@ -468,6 +472,57 @@ class PyTreeMetadata:
             raise TypeError(f"Unsupported struct: {struct}")
 
 
+def _compile_flatten(struct: Any) -> Callable[[Any, Dict[str, Any]], None]:
+    """Create function flattening samples matching the struct without inspecting the struct on each call."""
+    if isinstance(struct, str):
+
+        def _flatten_tensor(sample, flattened_sample):
+            flattened_sample[struct] = sample
+
+        return _flatten_tensor
+    elif isinstance(struct, PYTHON_PRIMITIVE_TYPES):
+
+        def _flatten_constant(sample, flattened_sample):
+            pass
+
+        return _flatten_constant
+    elif isinstance(struct, Mapping):
+        items_fns = {key: _compile_flatten(item) for key, item in struct.items()}
+
+        def _flatten_mapping(sample, flattened_sample):
+            for key, item in sample.items():
+                items_fns[key](item, flattened_sample)
+
+        return _flatten_mapping
+    elif isinstance(struct, Sequence):
+        items_fns = [_compile_flatten(item) for item in struct]
+
+        def _flatten_sequence(sample, flattened_sample):
+            for i, item in enumerate(sample):
+                items_fns[i](item, flattened_sample)
+
+        return _flatten_sequence
+    else:
+        raise TypeError(f"Unsupported struct: {struct}")
+
+
+def _compile_unflatten(struct: Any) -> Callable[[Dict[str, Any]], Any]:
+    """Create function rebuilding samples with the struct from flattened samples."""
+    if isinstance(struct, str):
+        return lambda sample: sample[struct]
+    elif isinstance(struct, PYTHON_PRIMITIVE_TYPES):
+        return lambda sample: struct
+    elif isinstance(struct, Mapping):
+        items_fns = {key: _compile_unflatten(item) for key, item in struct.items()}
+        return lambda sample: {key: item_fn(sample) for key, item_fn in items_fns.items()}
+    elif isinstance(struct, Sequence):
+        items_fns = [_compile_unflatten(item) for item in struct]
+        struct_type = type(struct)
+        return lambda sample: struct_type(item_fn(sample) for item_fn in items_fns)
+    else:
+        raise TypeError(f"Unsupported struct: {struct}")
+
+
 class TensorMetadata(Dict[str, TensorSpec]):
     """Metadata for inputs/outputs tensors."""
 
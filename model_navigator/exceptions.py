@@ -160,3 +160,9 @@ class ModelNavigatorModuleNotOptimizedError(ModelNavigatorError):
     """Raised when the module is not optimized and is required to be optimized."""
 
     pass
+
+
+class ModelNavigatorPackageIntegrityError(ModelNavigatorError):
+    """Raised when the file extracted from the package does not match the hash stored in the package."""
+
+    pass
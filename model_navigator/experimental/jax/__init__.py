@@ -36,6 +36,7 @@ from model_navigator.frameworks import Framework
 from model_navigator.package.package import Package
 from model_navigator.pipelines.builders import (
     correctness_builder,
+    onnx_session_options_builder,
     performance_builder,
     preprocessing_builder,
     tensorflow_conversion_builder,
@@ -151,6 +152,7 @@ def optimize(
         tensorflow_conversion_builder,
         tensorflow_tensorrt_conversion_builder,
         tensorrt_conversion_builder,
+        onnx_session_options_builder,
         correctness_builder,
         performance_builder,
         verify_builder,
@@ -34,6 +34,35 @@ ONNX_RT_TYPE_TO_NP = {
     "tensor(string)": str,
 }
 
+ONNX_RT_OPTIMIZED_MODEL_SUFFIX = ".optimized.onnx"
+ONNX_RT_OPTIMIZED_MODEL_KEY_SUFFIX = ".optimized.key"
+
+
+def get_onnxrt_optimized_model_path(model_path: pathlib.Path, provider: str) -> pathlib.Path:
+    """Get path of the model optimized by ONNX Runtime for the execution provider.
+
+    Args:
+        model_path: Path to the ONNX model
+        provider: Name of the ONNX Runtime execution provider
+
+    Returns:
+        Path to the optimized model stored next to the ONNX model
+    """
+    return model_path.with_name(f"{model_path.stem}.{provider}{ONNX_RT_OPTIMIZED_MODEL_SUFFIX}")
+
+
+def get_onnxrt_optimized_model_key_path(optimized_model_path: pathlib.Path) -> pathlib.Path:
+    """Get path of the file with the key of the source model and ONNX Runtime used for optimization.
+
+    Args:
+        optimized_model_path: Path to the model optimized by ONNX Runtime
+
+    Returns:
+        Path to the key file stored next to the optimized model
+    """
+    name = optimized_model_path.name[: -len(ONNX_RT_OPTIMIZED_MODEL_SUFFIX)]
+    return optimized_model_path.with_name(f"{name}{ONNX_RT_OPTIMIZED_MODEL_KEY_SUFFIX}")
+
 
 def get_onnx_io_names(onnx_path: pathlib.Path) -> Tuple[List, List]:
     """Get input and output metadata from ONNX model."""
@@ -17,7 +17,7 @@ import queue
 import time
 import traceback
 import uuid
-from typing import Any, Callable, Optional, Sequence, Tuple, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
 
 import model_navigator.inplace.bundle as bundle  # noqa: F401
 from model_navigator.commands.correctness.correctness import Correctness
@@ -46,7 +46,12 @@ from model_navigator.core.constants import (
     NAVIGATOR_VERSION,
 )
 from model_navigator.core.logger import LOGGER, reconfigure_logging_to_file
-from model_navigator.exceptions import ModelNavigatorModuleNotOptimizedError, ModelNavigatorRuntimeAnalyzerError
+from model_navigator.exceptions import (
+    ModelNavigatorModuleNotOptimizedError,
+    ModelNavigatorRuntimeAnalyzerError,
+    ModelNavigatorRuntimeError,
+    ModelNavigatorUserInputError,
+)
 from model_navigator.inplace.config import (
     InplaceConfig as InplaceConfig,
 )
@@ -54,7 +59,7 @@ from model_navigator.inplace.config import (
     OptimizeConfig,
     inplace_config,
 )
-from model_navigator.inplace.timer import Timer, TimerComparator  # noqa: F401
+from model_navigator.inplace.timer import ModuleTimer, Timer, TimerComparator  # noqa: F401
 from model_navigator.inplace.wrapper import Module, module  # noqa: F401
 from model_navigator.package.status import CommandStatus
 from model_navigator.runners.base import NavigatorRunner
@@ -68,19 +73,43 @@ from ..reporting.profile.events import default_event_emitter as profile_event_em
 from ..utils.environment import get_env
 from .profiling import ProfilingResults, RunnerProfilingResults, RunnerResults, run_measurement
 from .registry import module_registry
+from .runtime_search import (
+    DEFAULT_BEAM_WIDTH,
+    DEFAULT_REPEATS,
+    EAGER_RUNTIME,
+    ModuleRuntimesObjective,
+    ModuleRuntimesSearchResult,
+    beam_search,
+    format_runtime,
+    get_cost,
+    get_runtime_candidates,
+)
 from .status import InplaceOptimizeStatus, InplaceProfileStatus, ModuleStatus
 
 torch = lazy_import("torch")
 
 
-def load_optimized(device: Union[str, "torch.device"] = "cuda"):
+def load_optimized(
+    device: Union[str, "torch.device"] = "cuda",
+    module_runtimes: Optional[Union[Dict[str, Tuple[str, str]], ModuleRuntimesSearchResult]] = None,
+):
     """Load optimized modules.
 
     Args:
         device: Device on which optimized models are loaded.
+        module_runtimes: Model key and runner name for modules, e.g. the result of `search_module_runtimes`.
+            Modules which are not listed are loaded with the runtime selected by the default strategies.
     """
-    for m in module_registry.values():
-        m.load_optimized(device=device)
+    if isinstance(module_runtimes, ModuleRuntimesSearchResult):
+        module_runtimes = module_runtimes.module_runtimes
+    module_runtimes = module_runtimes or {}
+
+    for module_name, m in module_registry.items():
+        if module_name in module_runtimes:
+            model_key, runner_name = module_runtimes[module_name]
+            _load_module(module_name, m, model_key=model_key, runner_name=runner_name, device=device)
+        else:
+            m.load_optimized(device=device)
 
 
 def optimize(
@@ -259,6 +288,220 @@ def profile(
     return status
 
 
+def search_module_runtimes(
+    func: Callable,
+    dataloader: Sequence[Tuple[int, Any]],
+    target_formats: Optional[Tuple[Union[str, Format], ...]] = None,
+    runners: Optional[Tuple[Union[str, Type[NavigatorRunner]], ...]] = None,
+    objective: Union[str, ModuleRuntimesObjective] = ModuleRuntimesObjective.LATENCY,
+    beam_width: int = DEFAULT_BEAM_WIDTH,
+    max_candidates_per_module: Optional[int] = None,
+    repeats: int = DEFAULT_REPEATS,
+    device: str = "cuda",
+    initialize: bool = True,
+    verbose: bool = False,
+) -> ModuleRuntimesSearchResult:
+    """Search runtimes assigned to modules for the best latency or throughput of the whole pipeline.
+
+    Candidate runtimes of each module are runtimes which passed correctness and performance in all packages
+    of the module and the eager module. The pipeline is executed once per candidate runtime with modules which
+    have it among candidates loaded on it and the remaining modules loaded in eager mode, and the time spent
+    in each module is measured. A beam search over summed module costs selects assignments which are verified by
+    executing the whole pipeline. The fastest verified assignment is loaded, saved in the cache directory and
+    can be loaded again with `load_optimized(module_runtimes=...)`.
+
+    Args:
+        func: Function to profile.
+        dataloader: List of tuples with batch size and input.
+        target_formats: Formats which can be assigned to modules.
+        runners: Runners which can be assigned to modules.
+        objective: Latency minimizes the average time of the pipeline call, throughput minimizes the time
+            per sample.
+        beam_width: Number of assignments kept by the search and verified end-to-end.
+        max_candidates_per_module: Maximal number of optimized runtimes per module ranked by profiled latency.
+            None when not limited.
+        repeats: Number of measured passes through the dataloader after the warm-up pass.
+        device: Device on which modules are loaded.
+        initialize: Whether to initialize pipeline on device before measurements.
+        verbose: Provide verbose logging
+
+    Returns:
+        Result of the search with the selected assignment
+
+    Raises:
+        ModelNavigatorUserInputError: when beam width or number of repeats is not positive
+        ModelNavigatorRuntimeError: when the pipeline fails for all assignments selected by the search
+    """
+    objective = ModuleRuntimesObjective(objective)
+    if beam_width < 1:
+        raise ModelNavigatorUserInputError(f"Beam width must be positive, got {beam_width}.")
+    if repeats < 1:
+        raise ModelNavigatorUserInputError(f"Number of repeats must be positive, got {repeats}.")
+
+    if target_formats is None:
+        target_formats = DEFAULT_TORCH_TARGET_FORMATS_FOR_PROFILING
+    if runners is None:
+        runners = list(runner_registry.values())
+
+    validate_device_string(device)
+    modelkeys, runner_names = _get_modelkeys_and_runner_names(target_formats, runners)
+
+    modules_candidates = {}
+    for name, m in module_registry.items():
+        _load_module_packages(name, m)
+        modules_candidates[name] = get_runtime_candidates(
+            m.wrapper.packages, modelkeys, runner_names, max_candidates=max_candidates_per_module
+        )
+        LOGGER.info(f"Candidate runtimes of module `{name}`: {modules_candidates[name]}")
+
+    runtimes = [EAGER_RUNTIME] + sorted(
+        {runtime for candidates in modules_candidates.values() for runtime in candidates} - {EAGER_RUNTIME}
+    )
+
+    module_costs: Dict[str, Dict[Tuple[str, str], float]] = {name: {} for name in modules_candidates}
+    for runtime in runtimes:
+        model_key, runner_name = runtime
+        LOGGER.info(f"Measuring modules on {format_runtime(runtime)}.")
+        if initialize:
+            _initialize_pipeline(func, model_key, runner_name, device)
+
+        loaded = []
+        for name, m in module_registry.items():
+            if runtime in modules_candidates[name] and _load_module_with_fallback(
+                name, m, model_key, runner_name, device=device, verbose=verbose
+            ):
+                loaded.append(name)
+            elif runtime != EAGER_RUNTIME:
+                m.load_eager(device=device)
+
+        try:
+            _, batch_sizes, modules_times = _measure_pipeline(func, dataloader, repeats)
+        except Exception as e:
+            if runtime == EAGER_RUNTIME:
+                raise
+            LOGGER.warning(f"Pipeline failed on {format_runtime(runtime)}. Error message: {str(e)}")
+            if verbose:
+                LOGGER.warning(f"Traceback: {traceback.format_exc()}")
+            continue
+
+        for name in loaded:
+            module_costs[name][runtime] = get_cost(modules_times[name], batch_sizes, objective)
+
+    candidates = beam_search(module_costs, beam_width=beam_width)
+
+    best = None
+    for candidate in candidates:
+        _initialize_module_runtimes(func, candidate.module_runtimes, device, initialize, verbose)
+        try:
+            times, batch_sizes, _ = _measure_pipeline(func, dataloader, repeats)
+        except Exception as e:
+            LOGGER.warning(f"Pipeline failed for module runtimes {candidate.module_runtimes}. Error message: {str(e)}")
+            if verbose:
+                LOGGER.warning(f"Traceback: {traceback.format_exc()}")
+            continue
+
+        candidate.measured_cost = get_cost(times, batch_sizes, objective)
+        LOGGER.info(
+            f"Module runtimes {candidate.module_runtimes}: estimated cost {candidate.estimated_cost:.4f}, "
+            f"measured cost {candidate.measured_cost:.4f}."
+        )
+        if best is None or candidate.measured_cost < best[0].measured_cost:
+            best = (candidate, times, batch_sizes)
+
+    if best is None:
+        raise ModelNavigatorRuntimeError("Pipeline failed for all module runtimes selected by the search.")
+
+    candidate, times, batch_sizes = best
+    _initialize_module_runtimes(func, candidate.module_runtimes, device, initialize, verbose)
+
+    result = ModuleRuntimesSearchResult(
+        objective=objective,
+        module_runtimes=candidate.module_runtimes,
+        latency=get_cost(times, batch_sizes, ModuleRuntimesObjective.LATENCY),
+        throughput=1000.0 / get_cost(times, batch_sizes, ModuleRuntimesObjective.THROUGHPUT),
+        module_costs={
+            name: {format_runtime(runtime): cost for runtime, cost in costs.items()}
+            for name, costs in module_costs.items()
+        },
+        candidates=candidates,
+    )
+    result.save()
+    LOGGER.info(
+        f"Selected module runtimes {result.module_runtimes}: latency {result.latency:.4f} [ms], "
+        f"throughput {result.throughput:.2f} [infer/sec]."
+    )
+
+    return result
+
+
+def _initialize_module_runtimes(
+    func: Callable, module_runtimes: Dict[str, Tuple[str, str]], device: str, initialize: bool, verbose: bool
+):
+    optimized_runtimes = [runtime for runtime in module_runtimes.values() if runtime != EAGER_RUNTIME]
+    if initialize and optimized_runtimes:
+        _initialize_pipeline(func, *optimized_runtimes[0], device)
+
+    for name, m in module_registry.items():
+        model_key, runner_name = module_runtimes.get(name, EAGER_RUNTIME)
+        _load_module_with_fallback(name, m, model_key, runner_name, device=device, verbose=verbose)
+
+
+def _measure_pipeline(
+    func: Callable, dataloader: Sequence[Tuple[int, Any]], repeats: int
+) -> Tuple[List[float], List[int], Dict[str, List[float]]]:
+    """Measure time of pipeline calls and time spent in each module during the call.
+
+    The first pass through the dataloader is a warm-up and is not measured. Timers of modules are replaced
+    for the measurement and restored afterwards.
+
+    Returns:
+        Times of pipeline calls, batch sizes of calls and times of modules for each call
+    """
+    if is_torch2_available():
+        inference_context = torch.inference_mode
+    else:
+        inference_context = torch.no_grad
+
+    module_timers = {}
+    for name, m in module_registry.items():
+        module_timers[name] = (m._module_timer, ModuleTimer(name))
+        m._module_timer = module_timers[name][1]
+
+    times, batch_sizes = [], []
+    modules_times = {name: [] for name in module_timers}
+    try:
+        with inference_context():
+            for repeat in range(repeats + 1):
+                for batch_size, sample in dataloader:
+                    if not isinstance(sample, (list, tuple)):
+                        sample = (sample,)
+                    if not isinstance(sample[-1], dict):
+                        sample = (*sample, {})
+                    *args, kwargs = sample
+
+                    for _, timer in module_timers.values():
+                        timer.reset()
+                        timer.enable()
+                    start = time.monotonic()
+                    func(*args, **kwargs)
+                    end = time.monotonic()
+                    for _, timer in module_timers.values():
+                        timer.disable()
+
+                    if repeat == 0:
+                        continue
+                    times.append((end - start) * 1000.0)  # ms
+                    batch_sizes.append(batch_size)
+                    for name, (_, timer) in module_timers.items():
+                        modules_times[name].append(sum(timer.times))
+    finally:
+        for name, m in module_registry.items():
+            if name in module_timers:
+                m._module_timer = module_timers[name][0]
+
+    return times, batch_sizes, modules_times
+
+
 def _initialize_modules(func: Callable, model_key: str, runner_name: str, device: str, initialize: bool, verbose: bool):
     if initialize:
         _initialize_pipeline(func, model_key, runner_name, device)
@@ -368,32 +611,47 @@ def _build_profile_status(profiling_results: ProfilingResults) -> InplaceProfile
 
 def _load_modules(model_key: str, runner_name: str, device: str, verbose: bool = False):
     for module_name, m in module_registry.items():
-        try:
-            if model_key == "python" and runner_name == "eager":
-                LOGGER.info(f"Loading eager module `{module_name}` on device: `{device}`.")
-                m.load_eager(device=device)
-            elif model_key == "navigator" and runner_name == "optimized":
-                LOGGER.info(f"Loading optimized module `{module_name}` on device: `{device}`.")
-                m.load_optimized(device=device)
-            else:
-                LOGGER.info(
-                    f"Loading optimized module `{module_name}` ({model_key}, {runner_name}) on device: `{device}`."
-                )
-                m.load_optimized(
-                    strategies=[SelectedRuntimeStrategy(model_key=model_key, runner_name=runner_name)], device=device
-                )
+        _load_module_with_fallback(module_name, m, model_key, runner_name, device=device, verbose=verbose)
 
-        except (ModelNavigatorModuleNotOptimizedError, ModelNavigatorRuntimeAnalyzerError) as e:
-            LOGGER.info(f"{str(e)}" f"Loading eager module for `{module_name}` on device: `{device}`.")
-            m.load_eager(device=device)
-        except Exception as e:
-            LOGGER.warning(f"Failed to load module {module_name} for model key {model_key} and runner {runner_name}.")
-            LOGGER.warning(f"Eager module will be used on device {device}. Error message: {str(e)}")
-            if verbose:
-                LOGGER.warning(f"Traceback: {traceback.format_exc()}")
 
-            LOGGER.info(f"Loading eager module `{module_name}` on device: `{device}`.")
-            m.load_eager(device=device)
+def _load_module_with_fallback(
+    module_name: str, m: Module, model_key: str, runner_name: str, device: str, verbose: bool = False
+) -> bool:
+    """Load module with the runtime or the eager module when loading fails.
+
+    Returns:
+        True when the module was loaded with the requested runtime
+    """
+    try:
+        _load_module(module_name, m, model_key=model_key, runner_name=runner_name, device=device)
+        return True
+    except (ModelNavigatorModuleNotOptimizedError, ModelNavigatorRuntimeAnalyzerError) as e:
+        LOGGER.info(f"{str(e)}" f"Loading eager module for `{module_name}` on device: `{device}`.")
+        m.load_eager(device=device)
+    except Exception as e:
+        LOGGER.warning(f"Failed to load module {module_name} for model key {model_key} and runner {runner_name}.")
+        LOGGER.warning(f"Eager module will be used on device {device}. Error message: {str(e)}")
+        if verbose:
+            LOGGER.warning(f"Traceback: {traceback.format_exc()}")
+
+        LOGGER.info(f"Loading eager module `{module_name}` on device: `{device}`.")
+        m.load_eager(device=device)
+
+    return False
+
+
+def _load_module(module_name: str, m: Module, model_key: str, runner_name: str, device: str):
+    if model_key == "python" and runner_name == "eager":
+        LOGGER.info(f"Loading eager module `{module_name}` on device: `{device}`.")
+        m.load_eager(device=device)
+    elif model_key == "navigator" and runner_name == "optimized":
+        LOGGER.info(f"Loading optimized module `{module_name}` on device: `{device}`.")
+        m.load_optimized(device=device)
+    else:
+        LOGGER.info(f"Loading optimized module `{module_name}` ({model_key}, {runner_name}) on device: `{device}`.")
+        m.load_optimized(
+            strategies=[SelectedRuntimeStrategy(model_key=model_key, runner_name=runner_name)], device=device
+        )
 
 
 def _initialize_pipeline(func: Callable, model_key: str, runner_name: str, device: str) -> bool:
@@ -420,7 +678,7 @@ def _format_to_modelkey(format: Union[str, Format]):
     return (format,)
 
 
-def _get_modelkeys_runners(formats, runners):
+def _get_modelkeys_and_runner_names(formats, runners):
     if runners and isinstance(runners[0], Type):
         runners = [runner.name() for runner in runners]
     if formats and isinstance(formats[0], Format):
@@ -430,14 +688,24 @@ def _get_modelkeys_runners(formats, runners):
     for format in formats:
         modelkeys.update(_format_to_modelkey(format))
 
+    return modelkeys, runners
+
+
+def _load_module_packages(name: str, m: Module):
+    try:
+        m.load_optimized(activate_runners=False)
+    except ModelNavigatorModuleNotOptimizedError as e:
+        raise ModelNavigatorModuleNotOptimizedError(
+            f"Module {name} not optimized. Please optimize the nav.optimize command first."
+        ) from e
+
+
+def _get_modelkeys_runners(formats, runners):
+    modelkeys, runners = _get_modelkeys_and_runner_names(formats, runners)
+
     modelkeys_runners = set()
     for name, m in module_registry.items():
-        try:
-            m.load_optimized(activate_runners=False)
-        except ModelNavigatorModuleNotOptimizedError as e:
-            raise ModelNavigatorModuleNotOptimizedError(
-                f"Module {name} not optimized. Please optimize the nav.optimize command first."
-            ) from e
+        _load_module_packages(name, m)
 
         for package in m.wrapper.packages:
             for modelkey, model_status in package.status.models_status.items():
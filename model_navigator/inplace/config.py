@@ -35,6 +35,7 @@ from model_navigator.runners.base import NavigatorRunner
 DEFAULT_CACHE_DIR = pathlib.Path.home() / ".cache" / "model_navigator"
 DEFAULT_MIN_NUM_SAMPLES = 100
 DEFAULT_MAX_NUM_SAMPLES_STORED = 1
+DEFAULT_RECORDING_QUEUE_SIZE = 4
 
 
 def inplace_cache_dir() -> pathlib.Path:
@@ -55,6 +56,7 @@ class InplaceConfig:
         self._cache_dir: pathlib.Path = inplace_cache_dir()
         self._min_num_samples: int = DEFAULT_MIN_NUM_SAMPLES
         self._max_num_samples_stored: int = DEFAULT_MAX_NUM_SAMPLES_STORED
+        self._recording_queue_size: int = DEFAULT_RECORDING_QUEUE_SIZE
         self.strategies: List[RuntimeSearchStrategy] = [MaxThroughputAndMinLatencyStrategy(), MinLatencyStrategy()]
 
     @property
@@ -79,6 +81,18 @@ class InplaceConfig:
         """Set the minimum number of samples to collect before optimizing."""
         self._max_num_samples_stored = max_num_samples_stored
 
+    @property
+    def recording_queue_size(self) -> int:
+        """Get the maximal number of recorded samples waiting to be saved in the background."""
+        return self._recording_queue_size
+
+    @recording_queue_size.setter
+    def recording_queue_size(self, recording_queue_size: int) -> None:
+        """Set the maximal number of recorded samples waiting to be saved. 0 saves samples synchronously."""
+        if recording_queue_size < 0:
+            raise ValueError(f"recording_queue_size must be greater or equal 0, got {recording_queue_size}")
+        self._recording_queue_size = recording_queue_size
+
     @property
     def cache_dir(self) -> pathlib.Path:
         """Get the cache directory."""
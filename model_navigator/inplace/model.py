@@ -20,30 +20,30 @@ import gc
 import inspect
 import pathlib
 import tempfile
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from model_navigator.configuration import (
-    Framework,
     OnnxConfig,
     RuntimeSearchStrategy,
     TensorType,
 )
-from model_navigator.core.dataloader import to_numpy
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import PyTreeMetadata
 from model_navigator.frameworks import is_torch2_available
 from model_navigator.package import Package, load_from_workspace
+from model_navigator.runners.base import NavigatorRunner
 from model_navigator.utils.module import lazy_import
 
 from ..core import context as ctx
 from ..exceptions import ModelNavigatorRuntimeError, ModelNavigatorUserInputError
 from ..utils.format_helpers import is_source_format
 from .config import OptimizeConfig, inplace_config
-from .utils import TorchDataloader, get_dynamic_axes_from_shapes
+from .utils import SampleWriter, TorchDataloader, get_dynamic_axes_from_shapes, get_structure_fingerprint
 
 torch = lazy_import("torch")
 
 PYTREE_METADATA_PREFIX = "input"
+MAX_DISPATCH_CACHE_SIZE = 1024
 
 
 class BaseModule(abc.ABC):
@@ -154,6 +154,7 @@ class RecordingModule(BaseModule):
         self._optimized = False
         self._temp_dir = tempfile.TemporaryDirectory(prefix=f"{self._name}_")
         self._samples_dir = pathlib.Path(self._temp_dir.name)
+        self._sample_writer = SampleWriter(max_queue_size=inplace_config.recording_queue_size)
         self._min_batch_sizes = {}
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
@@ -171,7 +172,7 @@ class RecordingModule(BaseModule):
 
     def deactivate(self):
         """Deactivate module."""
-        return
+        self._sample_writer.close()
 
     def optimize(self) -> None:
         """Optimize the module using the recorded samples."""
@@ -187,6 +188,8 @@ class RecordingModule(BaseModule):
         if not self.optimize_config:
             raise ModelNavigatorRuntimeError(f"The module `{self.name}` has no optimize configuration")
 
+        self._sample_writer.flush()
+
         batch_dim = 0 if self.optimize_config.batching else None
         if self.optimize_config.batching:
             self._update_max_batch_size()
@@ -213,10 +216,11 @@ class RecordingModule(BaseModule):
         if len(self._samples[pytree_metadata]) < inplace_config.max_num_samples_stored:
             ind = self.get_total_num_samples()
             sample_path = self._samples_dir / f"{ind}.pt"
-            torch.save(sample, sample_path)
+            self._sample_writer.write(sample, sample_path)
             self._samples[pytree_metadata].append(sample_path)
 
-        shapes = {n: to_numpy(t, Framework.TORCH).shape for n, t in pytree_metadata.flatten_sample(sample).items()}
+        # shapes are read from tensors metadata to avoid copying tensors from device
+        shapes = {n: tuple(t.shape) for n, t in pytree_metadata.flatten_sample(sample).items()}
 
         if self.optimize_config.batching:
             recording_batch = ctx.global_context.get(ctx.INPLACE_OPTIMIZE_BATCH_CONTEXT_KEY)
@@ -358,6 +362,10 @@ class OptimizedModule(BaseModule):
         if not all(is_source_format(runner.format()) for runner in self._runners.values()):
             self._offload_module()
 
+        # Runners selected for fingerprints of the input structure
+        self._dispatch_cache = {}
+        self._single_runner = self._get_single_native_runner(self._runners)
+
         if activate_runners:
             self._activate_runners()
 
@@ -366,11 +374,7 @@ class OptimizedModule(BaseModule):
         LOGGER.debug(f"Calling optimized `{self.name}` module on device `{self._device}`.")
         sample = (*args, kwargs)
         sample = self._input_mapping(sample)
-        # TODO when only one runner is present, we can avoid the PyTreeMetadata
-        pytree_metadata = PyTreeMetadata.from_sample(sample, TensorType.TORCH, prefix=PYTREE_METADATA_PREFIX)
-        if pytree_metadata not in self._runners:
-            raise ValueError(f"No runner found for {pytree_metadata}")
-        runner = self._runners[pytree_metadata]
+        runner = self._single_runner or self._get_runner(sample)
 
         if runner.is_native:
             output = runner.infer_native(*args, **kwargs)
@@ -395,6 +399,34 @@ class OptimizedModule(BaseModule):
         """Get the list of packages."""
         return self._packages
 
+    @staticmethod
+    def _get_single_native_runner(runners: Dict[PyTreeMetadata, NavigatorRunner]) -> Optional[NavigatorRunner]:
+        """Get the runner used for all inputs without validation of the input structure.
+
+        Only native runners accept any input. Other runners are compiled for the input structure
+        and constants, so the sample is always validated against their metadata.
+        """
+        unique_runners = {id(runner): runner for runner in runners.values()}
+        if len(unique_runners) != 1:
+            return None
+
+        runner = next(iter(unique_runners.values()))
+        return runner if runner.is_native else None
+
+    def _get_runner(self, sample: Any):
+        """Get runner for the sample using the cached fingerprint of the sample structure."""
+        fingerprint = get_structure_fingerprint(sample)
+        runner = self._dispatch_cache.get(fingerprint)
+        if runner is None:
+            pytree_metadata = PyTreeMetadata.from_sample(sample, TensorType.TORCH, prefix=PYTREE_METADATA_PREFIX)
+            if pytree_metadata not in self._runners:
+                raise ValueError(f"No runner found for {pytree_metadata}")
+            runner = self._runners[pytree_metadata]
+            if len(self._dispatch_cache) < MAX_DISPATCH_CACHE_SIZE:
+                self._dispatch_cache[fingerprint] = runner
+
+        return runner
+
     def _activate_runners(self):
         """Activate all runners."""
         LOGGER.info("Activating runners for optimized module.")
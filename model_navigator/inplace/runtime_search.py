@@ -0,0 +1,251 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Search of runtimes assigned to modules of an inplace pipeline.
+
+Modules of a pipeline often perform best on different runtimes. Each module gets candidate runtimes which passed
+correctness and performance in all its packages, ranked by the profiled latency, and the eager module.
+The time spent in each module with every candidate is measured in the pipeline, the cost of the pipeline is
+estimated as a sum of costs of modules and a beam search keeps the best assignments. Assignments from the beam
+are verified end-to-end and the fastest one is selected.
+"""
+
+import dataclasses
+import pathlib
+from enum import Enum
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import yaml
+
+from model_navigator.commands.correctness.correctness import Correctness
+from model_navigator.commands.performance.performance import Performance
+from model_navigator.exceptions import ModelNavigatorUserInputError
+from model_navigator.inplace.config import inplace_config
+from model_navigator.package.package import Package
+from model_navigator.package.status import CommandStatus
+from model_navigator.utils.common import DataObject
+
+# model key and runner name used for modules executed without optimization
+EAGER_RUNTIME = ("python", "eager")
+DEFAULT_BEAM_WIDTH = 3
+DEFAULT_REPEATS = 3
+
+
+class ModuleRuntimesObjective(Enum):
+    """Objective of the pipeline optimized by the search.
+
+    Args:
+        LATENCY: Minimize average time of the pipeline call
+        THROUGHPUT: Maximize number of samples processed by the pipeline per second
+    """
+
+    LATENCY = "latency"
+    THROUGHPUT = "throughput"
+
+
+@dataclasses.dataclass
+class ModuleRuntimesCandidate(DataObject):
+    """Assignment of runtimes to modules kept in the beam.
+
+    Args:
+        module_runtimes: Model key and runner name for each module
+        estimated_cost: Sum of costs of modules measured with their runtimes
+        measured_cost: Cost of the pipeline verified end-to-end, None when not verified
+    """
+
+    module_runtimes: Dict[str, Tuple[str, str]]
+    estimated_cost: float
+    measured_cost: Optional[float] = None
+
+
+@dataclasses.dataclass
+class ModuleRuntimesSearchResult(DataObject):
+    """Assignment of runtimes to modules selected by the search.
+
+    Costs are milliseconds per pipeline call for the latency objective and milliseconds per sample
+    for the throughput objective.
+
+    Args:
+        objective: Objective of the search
+        module_runtimes: Model key and runner name selected for each module
+        latency: Average time of the pipeline call in milliseconds with the selected runtimes
+        throughput: Number of samples per second processed by the pipeline with the selected runtimes
+        module_costs: Cost of each module for each measured runtime, keyed with `<model_key> on <runner_name>`
+        candidates: Assignments verified end-to-end ordered by the estimated cost
+    """
+
+    objective: ModuleRuntimesObjective
+    module_runtimes: Dict[str, Tuple[str, str]]
+    latency: float
+    throughput: float
+    module_costs: Dict[str, Dict[str, float]]
+    candidates: List[ModuleRuntimesCandidate]
+
+    @classmethod
+    def get_save_path(cls) -> pathlib.Path:
+        """Get save path."""
+        return pathlib.Path(inplace_config.cache_dir) / "module_runtimes.yaml"
+
+    def save(self) -> None:
+        """Save to yaml."""
+        self.get_save_path().parent.mkdir(parents=True, exist_ok=True)
+        with open(self.get_save_path(), "w") as fp:
+            yaml.safe_dump(self.to_dict(parse=True), fp, sort_keys=False)
+
+    @classmethod
+    def load(cls) -> "ModuleRuntimesSearchResult":
+        """Load from yaml."""
+        with open(cls.get_save_path()) as fp:
+            data = yaml.safe_load(fp)
+
+        return cls(
+            objective=ModuleRuntimesObjective(data["objective"]),
+            module_runtimes=_parse_module_runtimes(data["module_runtimes"]),
+            latency=data["latency"],
+            throughput=data["throughput"],
+            module_costs=data["module_costs"],
+            candidates=[
+                ModuleRuntimesCandidate(
+                    module_runtimes=_parse_module_runtimes(candidate["module_runtimes"]),
+                    estimated_cost=candidate["estimated_cost"],
+                    measured_cost=candidate["measured_cost"],
+                )
+                for candidate in data["candidates"]
+            ],
+        )
+
+
+def get_runtime_candidates(
+    packages: Sequence[Package],
+    model_keys: Sequence[str],
+    runner_names: Sequence[str],
+    max_candidates: Optional[int] = None,
+) -> List[Tuple[str, str]]:
+    """Select runtimes of a module which passed correctness and performance in all its packages.
+
+    Runtimes are ranked by the median latency averaged over profiling results at the lowest concurrency.
+    The eager runtime is always the last candidate.
+
+    Args:
+        packages: Packages of the module
+        model_keys: Model keys which may be used
+        runner_names: Names of runners which may be used
+        max_candidates: Maximal number of optimized runtimes, None when not limited
+
+    Returns:
+        List of model keys and runner names
+    """
+    latencies: Dict[Tuple[str, str], List[float]] = {}
+    for idx, package in enumerate(packages):
+        package_latencies = {}
+        for model_key, model_status in package.status.models_status.items():
+            if model_key not in model_keys:
+                continue
+            for runner_name, runner_status in model_status.runners_status.items():
+                if (
+                    runner_name in runner_names
+                    and runner_status.status.get(Correctness.__name__)
+                    == runner_status.status.get(Performance.__name__)
+                    == CommandStatus.OK
+                ):
+                    profiling_results = runner_status.result.get(Performance.name, {}).get("profiling_results") or []
+                    package_latencies[(model_key, runner_name)] = _profiled_latency(profiling_results)
+
+        if idx == 0:
+            latencies = {runtime: [latency] for runtime, latency in package_latencies.items()}
+        else:
+            latencies = {
+                runtime: values + [package_latencies[runtime]]
+                for runtime, values in latencies.items()
+                if runtime in package_latencies
+            }
+
+    candidates = sorted(latencies, key=lambda runtime: (float(np.mean(latencies[runtime])), runtime))
+    if max_candidates is not None:
+        candidates = candidates[:max_candidates]
+
+    return candidates + [EAGER_RUNTIME]
+
+
+def get_cost(times: Sequence[float], batch_sizes: Sequence[int], objective: ModuleRuntimesObjective) -> float:
+    """Compute cost of a module or the pipeline from times of pipeline calls.
+
+    Args:
+        times: Time in milliseconds spent in each pipeline call
+        batch_sizes: Batch size of each pipeline call
+        objective: Objective of the search
+
+    Returns:
+        Average milliseconds per call for latency or milliseconds per sample for throughput
+    """
+    if not times:
+        return 0.0
+    if ModuleRuntimesObjective(objective) == ModuleRuntimesObjective.THROUGHPUT:
+        return float(np.sum(times) / np.sum(batch_sizes))
+
+    return float(np.mean(times))
+
+
+def beam_search(
+    module_costs: Dict[str, Dict[Tuple[str, str], float]],
+    beam_width: int = DEFAULT_BEAM_WIDTH,
+) -> List[ModuleRuntimesCandidate]:
+    """Find assignments of runtimes to modules with the lowest estimated cost.
+
+    Modules are assigned one after another and only `beam_width` partial assignments with the lowest cost
+    are extended, so the search evaluates at most `beam_width` times the number of candidates per module.
+
+    Args:
+        module_costs: Cost of each module for each of its runtimes
+        beam_width: Number of assignments kept after assigning each module
+
+    Returns:
+        Up to `beam_width` assignments ordered by the estimated cost
+
+    Raises:
+        ModelNavigatorUserInputError: when the beam width is not positive or a module has no runtime
+    """
+    if beam_width < 1:
+        raise ModelNavigatorUserInputError(f"Beam width must be positive, got {beam_width}.")
+
+    beam: List[Tuple[float, Dict[str, Tuple[str, str]]]] = [(0.0, {})]
+    for module_name, costs in module_costs.items():
+        if not costs:
+            raise ModelNavigatorUserInputError(f"No runtime available for module {module_name}.")
+        expanded = [
+            (cost + runtime_cost, {**assignment, module_name: runtime})
+            for cost, assignment in beam
+            for runtime, runtime_cost in costs.items()
+        ]
+        # stable sort keeps the order of candidates for equal costs
+        beam = sorted(expanded, key=lambda item: item[0])[:beam_width]
+
+    return [ModuleRuntimesCandidate(module_runtimes=assignment, estimated_cost=cost) for cost, assignment in beam]
+
+
+def format_runtime(runtime: Tuple[str, str]) -> str:
+    """Format model key and runner name of the runtime."""
+    model_key, runner_name = runtime
+    return f"{model_key} on {runner_name}"
+
+
+def _profiled_latency(profiling_results: Sequence) -> float:
+    if not profiling_results:
+        return np.inf
+    concurrency = min(result.concurrency for result in profiling_results)
+    return float(np.mean([result.p50_latency for result in profiling_results if result.concurrency == concurrency]))
+
+
+def _parse_module_runtimes(data: Dict[str, Sequence[str]]) -> Dict[str, Tuple[str, str]]:
+    return {module_name: tuple(runtime) for module_name, runtime in data.items()}
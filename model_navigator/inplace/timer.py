@@ -221,6 +221,11 @@ class ModuleTimer(contextlib.AbstractContextManager):
         """Module name."""
         return self._module_name
 
+    @property
+    def times(self) -> List[float]:
+        """Times in milliseconds spent in the __call__ method."""
+        return list(self._times)
+
     @property
     def module_formats(self):
         """Get module formats."""
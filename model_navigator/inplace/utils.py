@@ -14,16 +14,47 @@
 """Inplace Optimize utility functions."""
 
 import pathlib
+import queue
+import threading
 from collections import defaultdict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence
 
 from model_navigator.commands.infer_metadata import _get_trt_profile_from_axes_shapes
+from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import PyTreeMetadata
+from model_navigator.utils.common import PYTHON_PRIMITIVE_TYPES
 from model_navigator.utils.module import lazy_import
 
 torch = lazy_import("torch")
 
 
+def get_structure_fingerprint(sample: Any) -> Hashable:
+    """Get cheap fingerprint of the sample structure.
+
+    Samples with equal fingerprints have equal PyTree metadata. Tensors are represented by their types,
+    so fingerprint can be computed without inspecting the tensors.
+
+    Args:
+        sample: A sample to compute fingerprint for
+
+    Returns:
+        Hashable fingerprint of the sample structure and its constant values
+    """
+    sample_type = type(sample)
+    if sample_type is tuple or sample_type is list:
+        return (sample_type, *map(get_structure_fingerprint, sample))
+    elif sample_type is dict:
+        return (sample_type, *((key, get_structure_fingerprint(item)) for key, item in sample.items()))
+    elif sample is None or sample_type in PYTHON_PRIMITIVE_TYPES:
+        return sample
+    elif isinstance(sample, Mapping):
+        return (sample_type, *((key, get_structure_fingerprint(item)) for key, item in sample.items()))
+    elif isinstance(sample, Sequence) and not isinstance(sample, str):
+        return (sample_type, *map(get_structure_fingerprint, sample))
+    else:
+        return sample_type
+
+
 def get_object_name(obj: Any) -> str:
     """Get the name of an object from its module and class."""
     return f"{obj.__class__.__module__}.{obj.__class__.__qualname__}"
@@ -53,6 +84,110 @@ class TorchDataloader:
         return len(self._samples_paths)
 
 
+class SampleWriter:
+    """Writes recorded samples to disk.
+
+    When the queue size is greater than 0, tensors are snapshotted to host memory (pinned for CUDA tensors)
+    with non-blocking copies and samples are saved from a background thread. Recording blocks only when
+    the queue of pending samples is full. Queue size 0 saves samples synchronously.
+    """
+
+    def __init__(self, max_queue_size: int) -> None:
+        """Initialize SampleWriter.
+
+        Args:
+            max_queue_size: Maximal number of samples waiting to be saved.
+        """
+        self._max_queue_size = max_queue_size
+        self._queue = queue.Queue(maxsize=max(max_queue_size, 1))
+        self._thread = None
+        self._error = None
+
+    def write(self, sample: Any, sample_path: pathlib.Path) -> None:
+        """Save the sample in the background.
+
+        Args:
+            sample: Sample to save.
+            sample_path: Path where sample is saved.
+        """
+        if self._max_queue_size == 0:
+            torch.save(sample, sample_path)
+            return
+
+        self._raise_error()
+        snapshot = _snapshot_sample(sample)
+        copy_event = None
+        if torch.cuda.is_available() and torch.cuda.is_initialized():
+            # device to host copies are asynchronous and have to finish before the sample is saved
+            copy_event = torch.cuda.Event()
+            copy_event.record()
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, name="SampleWriter", daemon=True)
+            self._thread.start()
+
+        self._queue.put((snapshot, copy_event, sample_path))
+
+    def flush(self) -> None:
+        """Wait until all samples are saved.
+
+        Raises:
+            Exception: Error raised while saving any of the samples.
+        """
+        if self._thread is not None:
+            self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Save pending samples and stop the background thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        self._raise_error()
+
+    def _worker(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+
+                snapshot, copy_event, sample_path = item
+                if copy_event is not None:
+                    copy_event.synchronize()
+                torch.save(snapshot, sample_path)
+            except Exception as e:
+                LOGGER.error(f"Saving recorded sample failed: {e}")
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+
+def _snapshot_sample(sample: Any) -> Any:
+    """Copy tensors in the sample to host memory, so they are not affected by later modifications."""
+    if torch.is_tensor(sample):
+        sample = sample.detach()
+        if sample.is_cuda:
+            host_tensor = torch.empty(sample.shape, dtype=sample.dtype, device="cpu", pin_memory=True)
+            return host_tensor.copy_(sample, non_blocking=True)
+        return sample.clone()
+    elif isinstance(sample, Mapping):
+        items = ((key, _snapshot_sample(item)) for key, item in sample.items())
+        return type(sample)(items) if isinstance(sample, dict) else dict(items)
+    elif isinstance(sample, tuple) and hasattr(sample, "_fields"):
+        return type(sample)(*(_snapshot_sample(item) for item in sample))
+    elif isinstance(sample, (list, tuple)):
+        return type(sample)(_snapshot_sample(item) for item in sample)
+    else:
+        return sample
+
+
 def _extract_axes_shapes(
     shapes: List[Dict[str, List[int]]],
     pytree_metadata: PyTreeMetadata,
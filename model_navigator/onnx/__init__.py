@@ -33,6 +33,7 @@ from model_navigator.frameworks import Framework
 from model_navigator.package.package import Package
 from model_navigator.pipelines.builders import (
     correctness_builder,
+    onnx_session_options_builder,
     performance_builder,
     preprocessing_builder,
     tensorrt_conversion_builder,
@@ -128,6 +129,7 @@ def optimize(
         preprocessing_builder,
         find_device_max_batch_size_builder,
         tensorrt_conversion_builder,
+        onnx_session_options_builder,
         correctness_builder,
         performance_builder,
     ]
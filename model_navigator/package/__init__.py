@@ -24,6 +24,7 @@ from model_navigator.configuration import (
     DeviceKind,
     Format,
     OptimizationProfile,
+    PackageCompression,
     RuntimeSearchStrategy,
     SizedDataLoader,
     VerifyFunction,
@@ -74,12 +75,15 @@ from model_navigator.utils.format_helpers import FRAMEWORK2BASE_FORMAT, get_targ
 def load(
     path: Union[str, pathlib.Path],
     workspace: Optional[Union[str, pathlib.Path]] = None,
+    lazy: bool = False,
 ) -> Package:
     """Load package from provided path.
 
     Args:
         path: The location of package to load
         workspace: Workspace where packages will be extracted
+        lazy: Extract files of the model selected by `package.get_runner` when it is called instead of extracting
+            the whole package upfront. Optimizing, profiling or saving the package extracts all remaining files.
 
     Returns:
         Package.
@@ -89,7 +93,7 @@ def load(
     workspace.initialize()
 
     loader = PackageLoader()
-    package = loader.from_file(path=path, workspace=workspace)
+    package = loader.from_file(path=path, workspace=workspace, lazy=lazy)
     LOGGER.info(f"Package loaded and unpacked {workspace}.")
 
     return package
@@ -120,14 +124,22 @@ def save(
     path: Union[str, pathlib.Path],
     override: bool = False,
     save_data: bool = True,
+    models_compression: Union[str, PackageCompression] = PackageCompression.STORED,
+    data_compression: Union[str, PackageCompression] = PackageCompression.STORED,
 ) -> None:
     """Save export results into the .nav package at given path.
 
+    Files are compressed in parallel by `NAVIGATOR_PACKAGE_WORKERS` threads. SHA-256 hashes of files are stored
+    in the package and verified when the package is loaded.
+
     Args:
         package: A package object to prepare the package
         path: A path to file where the package has to be saved
         override: flag to override existing package in provided path
         save_data: disable saving samples from the dataloader
+        models_compression: compression of model files
+        data_compression: compression of samples from the dataloader, logs and status files.
+            Samples compress well with `PackageCompression.DEFLATED` at the cost of longer saving.
     """
     builder = PackageBuilder()
     builder.save(
@@ -135,6 +147,8 @@ def save(
         path=path,
         override=override,
         save_data=save_data,
+        models_compression=PackageCompression(models_compression),
+        data_compression=PackageCompression(data_compression),
     )
 
 
@@ -196,6 +210,7 @@ def optimize(
         raise ModelNavigatorEmptyPackageError(
             "Package is empty and source model is not loaded. Unable to run optimize."
         )
+    package.extract()
     config = package.config
 
     is_source_available = package.model is not None
@@ -292,6 +307,7 @@ def profile(
             "Package is empty and source model is not loaded. Unable to run optimize."
         )
 
+    package.extract()
     config = package.config
     is_source_available = package.model is not None
 
@@ -387,9 +403,9 @@ def _get_builders(framework: Framework) -> List[PipelineBuilder]:
 
         conversion_builders = [tensorflow_conversion_builder, tensorflow_tensorrt_conversion_builder]
 
-    from model_navigator.pipelines.builders import tensorrt_conversion_builder
+    from model_navigator.pipelines.builders import onnx_session_options_builder, tensorrt_conversion_builder
 
-    conversion_builders.append(tensorrt_conversion_builder)
+    conversion_builders.extend([tensorrt_conversion_builder, onnx_session_options_builder])
 
     builders: List[PipelineBuilder] = [
         preprocessing_builder,
@@ -0,0 +1,248 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Writing and reading files of the .nav package archive."""
+
+import collections
+import concurrent.futures
+import hashlib
+import os
+import pathlib
+import struct
+import tempfile
+import zipfile
+from typing import Deque, Dict, Generator, Iterable, List, Optional, Set, Tuple, Union
+
+from model_navigator.configuration import PackageCompression
+from model_navigator.core.logger import LOGGER
+from model_navigator.exceptions import ModelNavigatorPackageIntegrityError
+
+CHUNK_SIZE = 2**22  # 4 MiB
+HASH_COMMENT_PREFIX = b"sha256:"
+
+# positions of lengths of the file name and extra field in the local file header
+_FILE_HEADER_NAME_LENGTH = 10
+_FILE_HEADER_EXTRA_LENGTH = 11
+
+COMPRESSION2ZIP_TYPE = {
+    PackageCompression.STORED: zipfile.ZIP_STORED,
+    PackageCompression.DEFLATED: zipfile.ZIP_DEFLATED,
+    PackageCompression.BZIP2: zipfile.ZIP_BZIP2,
+    PackageCompression.LZMA: zipfile.ZIP_LZMA,
+}
+
+
+def write_archive(
+    path: pathlib.Path,
+    workspace: pathlib.Path,
+    members: Dict[pathlib.Path, PackageCompression],
+    workers: int,
+) -> None:
+    """Write files to the zip archive.
+
+    Files are compressed with the selected compression concurrently by a pool of threads, each file into
+    a temporary single-member archive, as zlib, bz2 and lzma release the GIL while compressing. Compressed data
+    is then copied to the archive in the order of members without compressing it again. SHA-256 hash of each file
+    is stored in the comment of the archive member and verified on extraction.
+
+    Args:
+        path: Path of the archive
+        workspace: Directory to which names of archive members are relative
+        members: Files and directories to save mapped to compression of the file
+        workers: Number of threads compressing files
+    """
+    files = {
+        filepath: (os.path.relpath(filepath, workspace / "."), compression)
+        for filepath, compression in members.items()
+        if filepath.is_file()
+    }
+    with tempfile.TemporaryDirectory(dir=path.parent, prefix=f".{path.name}.") as tmp_dir:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            compressed_members = _compress_members(executor, files, pathlib.Path(tmp_dir), max_pending=2 * workers)
+            try:
+                with zipfile.ZipFile(path.as_posix(), "w") as zf:
+                    for filepath in members:
+                        if filepath.is_dir():
+                            zf.write(filepath, os.path.relpath(filepath, workspace / "."))
+                        else:
+                            _copy_compressed_member(zf, *next(compressed_members))
+            finally:
+                compressed_members.close()
+
+
+def _compress_members(
+    executor: concurrent.futures.Executor,
+    files: Dict[pathlib.Path, Tuple[str, PackageCompression]],
+    tmp_dir: pathlib.Path,
+    max_pending: int,
+) -> Generator[Tuple[zipfile.ZipInfo, pathlib.Path], None, None]:
+    # members are returned in order of files, compression of at most `max_pending` next files is scheduled ahead
+    pending: Deque[concurrent.futures.Future] = collections.deque()
+    try:
+        for index, (filepath, (arcname, compression)) in enumerate(files.items()):
+            member_path = tmp_dir / f"{index}.zip"
+            pending.append(executor.submit(_compress_member, filepath, arcname, compression, member_path))
+            if len(pending) > max_pending:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _compress_member(
+    filepath: pathlib.Path, arcname: str, compression: PackageCompression, member_path: pathlib.Path
+) -> Tuple[zipfile.ZipInfo, pathlib.Path]:
+    zinfo = zipfile.ZipInfo.from_file(filepath, arcname)
+    zinfo.compress_type = COMPRESSION2ZIP_TYPE[compression]
+    digest = hashlib.sha256()
+    with zipfile.ZipFile(member_path, "w") as member_zf, member_zf.open(zinfo, "w") as dst, open(filepath, "rb") as src:
+        for chunk in iter(lambda: src.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+            dst.write(chunk)
+
+    # central directory with comments is written when the archive is closed
+    zinfo.comment = HASH_COMMENT_PREFIX + digest.hexdigest().encode()
+    return zinfo, member_path
+
+
+def _copy_compressed_member(zf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, member_path: pathlib.Path) -> None:
+    with open(member_path, "rb") as src:
+        # compressed data follows the local header, its file name and extra field
+        header = struct.unpack(zipfile.structFileHeader, src.read(zipfile.sizeFileHeader))
+        src.seek(header[_FILE_HEADER_NAME_LENGTH] + header[_FILE_HEADER_EXTRA_LENGTH], os.SEEK_CUR)
+
+        zf.fp.seek(zf.start_dir)
+        zinfo.header_offset = zf.start_dir
+        zf.fp.write(zinfo.FileHeader())
+        remaining = zinfo.compress_size
+        while remaining:
+            chunk = src.read(min(CHUNK_SIZE, remaining))
+            assert chunk, f"Compressed data of `{zinfo.filename}` is truncated."
+            zf.fp.write(chunk)
+            remaining -= len(chunk)
+
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+    zf.start_dir = zf.fp.tell()
+    member_path.unlink()
+
+
+class PackageArchive:
+    """Archive of the .nav package extracted on demand.
+
+    Extracted files are verified against SHA-256 hashes stored in the archive. Archives saved without hashes
+    are verified only with CRC-32 checksums of the zip format.
+    """
+
+    def __init__(self, path: Union[str, pathlib.Path], excluded_suffixes: Iterable[str] = ()):
+        """Initialize archive.
+
+        Args:
+            path: Path of the archive
+            excluded_suffixes: Suffixes of archive members which are never extracted
+        """
+        self.path = pathlib.Path(path)
+        excluded_suffixes = tuple(excluded_suffixes)
+        with zipfile.ZipFile(self.path, "r") as zf:
+            self._names = [name for name in zf.namelist() if not name.endswith(excluded_suffixes)]
+        self._extracted: Set[str] = set()
+
+    def read(self, name: str) -> bytes:
+        """Read content of the archive member.
+
+        Args:
+            name: Name of the archive member
+
+        Returns:
+            Content of the member
+        """
+        with zipfile.ZipFile(self.path, "r") as zf:
+            return zf.read(name)
+
+    def contains(self, prefix: str) -> bool:
+        """Check if archive has members which names start with the prefix.
+
+        Args:
+            prefix: Prefix of member names
+
+        Returns:
+            True if at least one member matches the prefix, False otherwise
+        """
+        return any(name.startswith(prefix) for name in self._names)
+
+    def extract(self, path: pathlib.Path, prefix: str = "", workers: int = 1) -> None:
+        """Extract members which were not extracted yet.
+
+        Args:
+            path: Directory to which members are extracted
+            prefix: Extract only members which names start with the prefix
+            workers: Number of threads extracting members
+
+        Raises:
+            ModelNavigatorPackageIntegrityError: When extracted file does not match the hash stored in the archive.
+        """
+        names = [name for name in self._names if name.startswith(prefix) and name not in self._extracted]
+        if not names:
+            return
+
+        LOGGER.debug(f"Extracting {len(names)} files from {self.path}.")
+        with zipfile.ZipFile(self.path, "r") as zf:
+            infos = sorted((zf.getinfo(name) for name in names), key=lambda info: info.file_size, reverse=True)
+
+        # each thread reads the archive through separate file object, largest members are distributed first
+        workers = max(min(workers, len(infos)), 1)
+        groups = [infos[index::workers] for index in range(workers)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            for _ in executor.map(lambda group: self._extract_members(group, path), groups):
+                pass
+
+        self._extracted.update(names)
+
+    def _extract_members(self, infos: List[zipfile.ZipInfo], path: pathlib.Path) -> None:
+        with zipfile.ZipFile(self.path, "r") as zf:
+            for info in infos:
+                _extract_member(zf, info, path)
+
+
+def _extract_member(zf: zipfile.ZipFile, info: zipfile.ZipInfo, path: pathlib.Path) -> None:
+    # the same sanitization of member names as in ZipFile.extract
+    parts = [part for part in info.filename.split("/") if part not in ("", ".", "..")]
+    target_path = path.joinpath(*parts)
+    if info.is_dir():
+        target_path.mkdir(parents=True, exist_ok=True)
+        return
+
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    with zf.open(info) as src, open(target_path, "wb") as dst:
+        for chunk in iter(lambda: src.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+            dst.write(chunk)
+
+    expected_digest = _get_expected_digest(info)
+    if expected_digest is not None and digest.hexdigest() != expected_digest:
+        target_path.unlink()
+        raise ModelNavigatorPackageIntegrityError(
+            f"File `{info.filename}` extracted from package `{zf.filename}` does not match the hash stored "
+            "in the package. The package is corrupted."
+        )
+
+
+def _get_expected_digest(info: zipfile.ZipInfo) -> Optional[str]:
+    if not info.comment.startswith(HASH_COMMENT_PREFIX):
+        return None
+
+    return info.comment[len(HASH_COMMENT_PREFIX) :].decode()
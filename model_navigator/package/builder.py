@@ -13,10 +13,8 @@
 # limitations under the License.
 """Build package from pipeline context."""
 
-import os
 import pathlib
 import uuid
-import zipfile
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from model_navigator.commands.base import CommandStatus
@@ -26,6 +24,7 @@ from model_navigator.commands.verification.verify import VerifyModel
 from model_navigator.configuration import (
     DEFAULT_RUNTIME_STRATEGIES,
     Format,
+    PackageCompression,
     TensorRTProfile,
 )
 from model_navigator.configuration.common_config import CommonConfig
@@ -34,8 +33,10 @@ from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata
 from model_navigator.exceptions import ModelNavigatorRuntimeAnalyzerError, ModelNavigatorRuntimeError
 from model_navigator.pipelines.pipeline_context import PipelineCommands, PipelineContext
+from model_navigator.utils.environment import package_workers
 from model_navigator.utils.format_helpers import FORMAT2SUFFIX, get_framework_export_formats
 
+from .archive import write_archive
 from .package import Package
 from .status import ModelStatus, RunnerStatus, Status
 
@@ -76,7 +77,15 @@ class PackageBuilder:
 
         return package
 
-    def save(self, package: Package, path: pathlib.Path, override: bool = False, save_data: bool = True):
+    def save(
+        self,
+        package: Package,
+        path: pathlib.Path,
+        override: bool = False,
+        save_data: bool = True,
+        models_compression: PackageCompression = PackageCompression.STORED,
+        data_compression: PackageCompression = PackageCompression.STORED,
+    ):
         """Save export results into the .nav package at given path.
 
         Args:
@@ -84,6 +93,8 @@ class PackageBuilder:
             path: A path to file where the package has to be saved
             override: flag to override existing package in provided path
             save_data: disable saving samples from the dataloader
+            models_compression: compression of model files
+            data_compression: compression of samples, logs and status files
         """
         path = pathlib.Path(path)
         if path.exists():
@@ -95,17 +106,17 @@ class PackageBuilder:
         if not package.workspace.exists():
             raise FileNotFoundError("Workspace has been removed. Save() no longer available.")
 
+        package.extract()
         if package.is_empty():
             LOGGER.warning("No successful exports, .nav package will be empty.")
 
         package.save_status_file()
         models_files_to_save = self._get_models_paths_to_save(package)
         reproduction_files_to_save = self._get_reproduction_paths_to_save(package)
-        files_to_save = (
-            [package.workspace.path / "status.yaml", package.workspace.path / "navigator.log"]
-            + models_files_to_save
-            + reproduction_files_to_save
-        )
+        files_to_save = [
+            package.workspace.path / "status.yaml",
+            package.workspace.path / "navigator.log",
+        ] + reproduction_files_to_save
         dirs_to_save = []
         if save_data:
             dirs_to_save.extend([package.workspace.path / "model_output", package.workspace.path / "model_input"])
@@ -115,18 +126,34 @@ class PackageBuilder:
             workspace=package.workspace.path,
             dirs_to_save=dirs_to_save,
             files_to_save=files_to_save,
+            models_files_to_save=models_files_to_save,
+            models_compression=models_compression,
+            data_compression=data_compression,
         )
 
-    def _make_zip(self, zip_path, workspace, dirs_to_save, files_to_save) -> None:
-        with zipfile.ZipFile(zip_path.as_posix(), "w") as zf:
-            for dir_to_save in dirs_to_save:
-                for root, _, files in os.walk(dir_to_save.as_posix()):
-                    for filename in files:
-                        zf.write(
-                            os.path.join(root, filename), os.path.relpath(os.path.join(root, filename), workspace / ".")
-                        )  # noqa: E203
-            for filepath in files_to_save:
-                zf.write(filepath, os.path.relpath(filepath, workspace / "."))  # noqa: E203
+    def _make_zip(
+        self,
+        zip_path: pathlib.Path,
+        workspace: pathlib.Path,
+        dirs_to_save: List[pathlib.Path],
+        files_to_save: List[pathlib.Path],
+        models_files_to_save: Optional[List[pathlib.Path]] = None,
+        models_compression: PackageCompression = PackageCompression.STORED,
+        data_compression: PackageCompression = PackageCompression.STORED,
+    ) -> None:
+        members = {}
+        for dir_to_save in dirs_to_save:
+            for filepath in sorted(dir_to_save.rglob("*")):
+                if filepath.is_file():
+                    members[filepath] = data_compression
+
+        for filepath in files_to_save:
+            members[filepath] = data_compression
+
+        for filepath in sorted(models_files_to_save or []):
+            members[filepath] = models_compression
+
+        write_archive(path=zip_path, workspace=workspace, members=members, workers=package_workers())
 
     def _get_onnx_external_weights_filepaths(self, package: Package, model_path: pathlib.Path) -> Set[pathlib.Path]:
         """Returns external weights paths for ONNX model."""
@@ -14,8 +14,7 @@
 """Load package from file."""
 
 import pathlib
-import zipfile
-from typing import List, Union
+from typing import Union
 
 import yaml
 from packaging import version
@@ -27,10 +26,14 @@ from model_navigator.core.tensor import TensorMetadata
 from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import ModelNavigatorBackwardCompatibilityError
 from model_navigator.frameworks import Framework
+from model_navigator.utils.environment import package_workers
 
+from .archive import PackageArchive
 from .package import Package
 from .status import Status
 
+GENERATED_FILES_SUFFIXES = (".log", ".sh", ".py")
+
 
 class PackageLoader:
     """Create package from file."""
@@ -39,29 +42,29 @@ class PackageLoader:
         """Initialize loader."""
         self._updater = PackageUpdater()
 
-    def from_file(self, path: Union[str, pathlib.Path], workspace: Workspace) -> Package:
+    def from_file(self, path: Union[str, pathlib.Path], workspace: Workspace, lazy: bool = False) -> Package:
         """Load package from provided path.
 
         Args:
             path: The location of package to load
             workspace: Workspace where packages will be extracted
+            lazy: Extract model files when the model is used instead of extracting the whole package
 
         Returns:
             Package.
         """
-        path = pathlib.Path(path)
-
-        with zipfile.ZipFile(path, "r") as zf:
-            with zf.open(Package.status_filename) as status_file:
-                status_dict = yaml.safe_load(status_file)
+        archive = PackageArchive(path, excluded_suffixes=GENERATED_FILES_SUFFIXES)
+        status_dict = yaml.safe_load(archive.read(Package.status_filename))
 
-            package_version = self._extract_package_version(status_dict)
-            status = Status.from_dict(status_dict)
+        package_version = self._extract_package_version(status_dict)
+        status = Status.from_dict(status_dict)
 
+        if lazy:
+            archive.extract(workspace.path, prefix=Package.status_filename)
+            package = Package(status=status, workspace=workspace, archive=archive)
+        else:
+            archive.extract(workspace.path, workers=package_workers())
             package = Package(status=status, workspace=workspace)
-            all_members = zf.namelist()
-            filtered_members = self._filter_out_generated_files(all_members)
-            zf.extractall(workspace.path, members=filtered_members)
 
         self._updater.run(package, package_version)
 
@@ -92,10 +95,6 @@ class PackageLoader:
 
         return package
 
-    def _filter_out_generated_files(self, paths: List[str]):
-        generated_files_extensions = [".log", ".sh", ".py"]
-        return [p for p in paths if not any(p.endswith(suffix) for suffix in generated_files_extensions)]
-
     def _extract_package_version(self, status_dict):
         return version.parse(status_dict.get("model_navigator_version", "0.3.0"))
 
@@ -132,6 +131,7 @@ def _update_from_v0_3_3(package):
             "Cannot load TensorFlow2 .nav packages generated by Model Navigator "
             "version < 0.3.4 and with multiple inputs."
         )
+    package.extract(Format.TF_SAVEDMODEL.value)
     model_config = package.status.models_status[Format.TF_SAVEDMODEL.value].model_config
     _update_savedmodel_signature(
         model_config=model_config,
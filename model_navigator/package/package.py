@@ -14,8 +14,9 @@
 """Package module - structure to snapshot optimization result."""
 
 import copy
+import functools
 import pathlib
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import yaml
 
@@ -31,24 +32,33 @@ from model_navigator.configuration import (
     Format,
     OptimizationProfile,
     RuntimeSearchStrategy,
+    TensorRTProfile,
     TensorType,
 )
 from model_navigator.configuration.common_config import CommonConfig
 from model_navigator.configuration.device import get_device_kind_from_device_string
+from model_navigator.configuration.model.model_config import ModelConfig
+from model_navigator.configuration.runner.runner_config import OnnxRunnerConfig
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import (
     ModelNavigatorMissingSourceModelError,
     ModelNavigatorNotFoundError,
     ModelNavigatorRuntimeAnalyzerError,
+    ModelNavigatorWrongParameterError,
 )
 from model_navigator.frameworks import Framework
 from model_navigator.runners.base import NavigatorRunner
+from model_navigator.runners.batcher import DynamicBatcher
+from model_navigator.runners.pool import RunnerPool
 from model_navigator.runners.registry import get_runner, runner_registry
+from model_navigator.runners.routing import RouteCandidate, RoutingRunner, get_routing_table
 from model_navigator.runtime_analyzer.analyzer import RuntimeAnalyzer
 from model_navigator.utils.common import DataObject, get_default_status_filename
+from model_navigator.utils.environment import package_workers
 from model_navigator.utils.format_helpers import is_source_format
 
+from .archive import PackageArchive
 from .status import ModelStatus, Status
 
 
@@ -57,17 +67,25 @@ class Package:
 
     status_filename = get_default_status_filename()
 
-    def __init__(self, status: Status, workspace: Workspace, model: Optional[object] = None):
+    def __init__(
+        self,
+        status: Status,
+        workspace: Workspace,
+        model: Optional[object] = None,
+        archive: Optional[PackageArchive] = None,
+    ):
         """Initialize object.
 
         Args:
             status: A navigator execution status
             workspace: Workspace for package files
             model: An optional model
+            archive: Archive from which files are extracted to the workspace on demand
         """
         self.status = status
         self.workspace = workspace
         self._model = model
+        self._archive = archive
 
     @property
     def framework(self) -> Framework:
@@ -143,8 +161,38 @@ class Package:
             model_config = self.status.models_status[model_key].model_config
         except KeyError:
             raise ModelNavigatorNotFoundError(f"Model {model_key} not found.") from None
+        self.extract(model_key)
         return self.workspace.path / model_config.path
 
+    def extract(self, model_key: Optional[str] = None) -> None:
+        """Extract files of the lazily loaded package to the workspace.
+
+        Files already present in the workspace are not extracted again.
+
+        Args:
+            model_key: Unique key of the model which files are extracted. When not provided, all files are extracted.
+
+        Raises:
+            ModelNavigatorNotFoundError: When model not found.
+        """
+        if self._archive is None:
+            return
+
+        if model_key is None:
+            self._archive.extract(self.workspace.path, workers=package_workers())
+            self._archive = None
+            return
+
+        try:
+            model_config = self.status.models_status[model_key].model_config
+        except KeyError:
+            raise ModelNavigatorNotFoundError(f"Model {model_key} not found.") from None
+
+        if not is_source_format(model_config.format):
+            self._archive.extract(
+                self.workspace.path, prefix=self._get_model_dir_prefix(model_config), workers=package_workers()
+            )
+
     def load_source_model(self, model: object) -> None:
         """Load model defined in Python code.
 
@@ -179,11 +227,231 @@ class Package:
         Returns:
             The optimal runner for the optimized model.
         """
+        model_key, runner_name = self._get_best_runner(
+            strategies=strategies, include_source=include_source, inplace=inplace
+        )
+
+        return self._get_runner(model_key, runner_name, return_type=return_type, device=device, inplace=inplace)
+
+    def get_runner_pool(
+        self,
+        num_instances: int,
+        strategies: Optional[List[RuntimeSearchStrategy]] = None,
+        include_source: bool = True,
+        return_type: TensorType = TensorType.NUMPY,
+        device: str = "cuda",
+        use_processes: bool = False,
+    ) -> RunnerPool:
+        """Get the pool of instances of the runner selected according to the strategy.
+
+        The pool dispatches concurrent requests to free instances and reports queueing and utilization metrics.
+        Instances are created when the pool is activated.
+
+        Args:
+            num_instances: Number of runner instances in the pool
+            strategies: List of strategies for finding the best model. Strategies are selected in provided order. When
+                        first fails, next strategy from the list is used. When no strategies have been provided it
+                        defaults to [`MaxThroughputAndMinLatencyStrategy`, `MinLatencyStrategy`]
+            include_source: Flag if Python based model has to be included in analysis
+            return_type: The type of the output tensor. Defaults to `TensorType.NUMPY`.
+            device: Device where model is going to be executed. Defaults to `"cuda"`.
+            use_processes: Run each instance in a dedicated worker process. The source model has to be picklable.
+
+        Returns:
+            The pool of optimal runners for the optimized model.
+        """
+        model_key, runner_name = self._get_best_runner(strategies=strategies, include_source=include_source)
+        runner_factory = self._get_runner_factory(model_key, runner_name, return_type=return_type, device=device)
+
+        return RunnerPool(
+            runner_factory=runner_factory,
+            num_instances=num_instances,
+            use_processes=use_processes,
+            name=f"{runner_name}Pool",
+        )
+
+    def get_dynamic_batcher(
+        self,
+        max_batch_size: Optional[int] = None,
+        max_queue_delay: Optional[float] = None,
+        strategies: Optional[List[RuntimeSearchStrategy]] = None,
+        include_source: bool = True,
+        return_type: TensorType = TensorType.NUMPY,
+        device: str = "cuda",
+    ) -> DynamicBatcher:
+        """Get the dynamic batcher of requests sent to the runner selected according to the strategy.
+
+        The maximal batch size and the maximal queue delay are selected from profiling results of the runner
+        with `DynamicBatcher.from_profiling_results`.
+
+        Args:
+            max_batch_size: Upper limit of the maximal batch size selected from profiling results
+            max_queue_delay: Maximal time in milliseconds the oldest request waits for other requests.
+                When None, the latency of the smallest profiled batch is used.
+            strategies: List of strategies for finding the best model. Strategies are selected in provided order. When
+                        first fails, next strategy from the list is used. When no strategies have been provided it
+                        defaults to [`MaxThroughputAndMinLatencyStrategy`, `MinLatencyStrategy`]
+            include_source: Flag if Python based model has to be included in analysis
+            return_type: The type of the output tensor. Defaults to `TensorType.NUMPY`.
+            device: Device where model is going to be executed. Defaults to `"cuda"`.
+
+        Returns:
+            The dynamic batcher of the optimal runner for the optimized model.
+
+        Raises:
+            ModelNavigatorWrongParameterError: when the model was optimized without batching
+        """
+        batch_dim = self.status.config.get("batch_dim")
+        if batch_dim is None:
+            raise ModelNavigatorWrongParameterError("Model was optimized without batching. Batching is not possible.")
+
+        model_key, runner_name = self._get_best_runner(strategies=strategies, include_source=include_source)
+        runner = self._get_runner(model_key, runner_name, return_type=return_type, device=device)
+        runner_status = self.status.models_status[model_key].runners_status[runner_name]
+        profiling_results = runner_status.result.get(Performance.name, {}).get("profiling_results", [])
+
+        return DynamicBatcher.from_profiling_results(
+            runner=runner,
+            profiling_results=profiling_results,
+            batch_dim=batch_dim,
+            max_batch_size=max_batch_size,
+            max_queue_delay=max_queue_delay,
+        )
+
+    def get_routing_runner(
+        self,
+        runners: Optional[Sequence[str]] = None,
+        include_source: bool = True,
+        return_type: TensorType = TensorType.NUMPY,
+        device: str = "cuda",
+    ) -> RoutingRunner:
+        """Get the runner routing each request to the runtime with the lowest latency for its batch size.
+
+        The routing table is derived from profiling results of runtimes which passed correctness and performance
+        evaluation. Batch sizes outside of TensorRT profiles of the model are not routed to it. TensorRT models
+        converted without explicit profiles serve batch sizes up to the largest profiled one.
+
+        Args:
+            runners: Names of runners which may serve requests. When None, all evaluated runners are used.
+            include_source: Flag if Python based model has to be included in analysis
+            return_type: The type of the output tensor. Defaults to `TensorType.NUMPY`.
+            device: Device where model is going to be executed. Defaults to `"cuda"`.
+
+        Returns:
+            The routing runner with runners selected for ranges of batch sizes.
+
+        Raises:
+            ModelNavigatorWrongParameterError: when the model was optimized without batching
+            ModelNavigatorRuntimeAnalyzerError: when no runtime was profiled with batch sizes
+        """
+        batch_dim = self.status.config.get("batch_dim")
+        if batch_dim is None:
+            raise ModelNavigatorWrongParameterError("Model was optimized without batching. Routing is not possible.")
+
+        device_kind = get_device_kind_from_device_string(device)
+        candidates = []
+        for model_key, model_status in self.status.models_status.items():
+            model_config = model_status.model_config
+            if is_source_format(model_config.format):
+                if not include_source or self._model is None:
+                    continue
+            elif not self._model_dir_exists(model_config):
+                continue
+
+            for runner_name, runner_status in model_status.runners_status.items():
+                if runners is not None and runner_name not in runners:
+                    continue
+                if runner_name not in runner_registry or device_kind not in runner_registry[runner_name].devices_kind():
+                    continue
+                if not (
+                    runner_status.status.get(Correctness.name)
+                    == runner_status.status.get(Performance.name)
+                    == CommandStatus.OK
+                ):
+                    continue
+
+                profiling_results = runner_status.result.get(Performance.name, {}).get("profiling_results") or []
+                if profiling_results:
+                    concurrency = min(result.concurrency for result in profiling_results)
+                    profiling_results = [result for result in profiling_results if result.concurrency == concurrency]
+
+                min_batch_size, max_batch_size = self._get_batch_size_range(
+                    model_config,
+                    batch_dim,
+                    profiling_results=profiling_results,
+                    dataloader_trt_profile=self.status.dataloader_trt_profile,
+                )
+                candidates.append(
+                    RouteCandidate(
+                        model_key=model_key,
+                        runner_name=runner_name,
+                        profiling_results=profiling_results,
+                        min_batch_size=min_batch_size,
+                        max_batch_size=max_batch_size,
+                    )
+                )
+
+        routing_table = get_routing_table(candidates)
+        if not routing_table:
+            raise ModelNavigatorRuntimeAnalyzerError("No runtime was profiled with batch sizes.")
+
+        routed_runners = {}
+        for bucket in routing_table:
+            key = (bucket.model_key, bucket.runner_name)
+            if key not in routed_runners:
+                routed_runners[key] = self._get_runner(
+                    bucket.model_key, bucket.runner_name, return_type=return_type, device=device
+                )
+
+        return RoutingRunner(
+            runners=routed_runners,
+            routing_table=routing_table,
+            batch_dim=batch_dim,
+            return_type=return_type,
+        )
+
+    @staticmethod
+    def _get_batch_size_range(
+        model_config: ModelConfig,
+        batch_dim: int,
+        profiling_results: Sequence = (),
+        dataloader_trt_profile: Optional[TensorRTProfile] = None,
+    ) -> Tuple[int, Optional[int]]:
+        trt_profiles = getattr(model_config, "trt_profiles", None)
+        if not trt_profiles:
+            if model_config.format not in (Format.TENSORRT, Format.TORCH_TRT):
+                return 1, None
+
+            # engine is built from the dataloader profile and its max batch size is not stored in the status,
+            # the largest profiled batch size is known to be supported by the engine
+            min_batch_size = 1
+            if dataloader_trt_profile:
+                min_batch_size = max(shapes.min[batch_dim] for shapes in dataloader_trt_profile.values())
+            batch_sizes = [result.batch_size for result in profiling_results if result.batch_size is not None]
+            return max(min_batch_size, 1), max(batch_sizes) if batch_sizes else None
+
+        # batch sizes supported by a profile are limited by all inputs, any of the profiles may be selected
+        min_batch_size, max_batch_size = None, None
+        for trt_profile in trt_profiles:
+            profile_min = max(shapes.min[batch_dim] for shapes in trt_profile.values())
+            profile_max = min(shapes.max[batch_dim] for shapes in trt_profile.values())
+            min_batch_size = profile_min if min_batch_size is None else min(min_batch_size, profile_min)
+            max_batch_size = profile_max if max_batch_size is None else max(max_batch_size, profile_max)
+
+        return max(min_batch_size, 1), max_batch_size
+
+    def _get_best_runner(
+        self,
+        strategies: Optional[List[RuntimeSearchStrategy]],
+        include_source: bool,
+        inplace: bool = False,
+    ) -> Tuple[str, str]:
         runtime_result = self.get_best_runtime(strategies=strategies, include_source=include_source, inplace=inplace)
 
         model_config = runtime_result.model_status.model_config
         runner_status = runtime_result.runner_status
 
+        self.extract(model_config.key)
         if not is_source_format(model_config.format) and not (self.workspace.path / model_config.path).exists():
             raise ModelNavigatorNotFoundError(
                 f"The best runner expects {model_config.format.value!r} "
@@ -198,9 +466,7 @@ class Package:
                 "with `package.get_runner(include_source=False)`."
             )
 
-        return self._get_runner(
-            model_config.key, runner_status.runner_name, return_type=return_type, device=device, inplace=inplace
-        )
+        return model_config.key, runner_status.runner_name
 
     def get_best_model_status(
         self,
@@ -233,7 +499,7 @@ class Package:
                     if (
                         runner_status.status.get(Correctness.__name__) == CommandStatus.OK
                         and runner_status.status.get(Performance.__name__) != CommandStatus.FAIL
-                        and (self.workspace.path / model_status.model_config.path.parent).exists()
+                        and self._model_dir_exists(model_status.model_config)
                     ):
                         return False
         return True
@@ -256,6 +522,15 @@ class Package:
         Returns:
             NavigatorRunner object
         """
+        runner_factory = self._get_runner_factory(
+            model_key, runner_name, device=device, return_type=return_type, inplace=inplace
+        )
+        LOGGER.info(f"Creating model `{model_key}` on runner `{runner_name}` and device `{device}`")
+        return runner_factory()
+
+    def _get_runner_factory(
+        self, model_key: str, runner_name: str, device: str, return_type: TensorType, inplace: bool = False
+    ) -> Callable[[], NavigatorRunner]:
         try:
             model_config = self.status.models_status[model_key].model_config
         except KeyError:
@@ -264,18 +539,28 @@ class Package:
         if is_source_format(model_config.format):
             model = self._model
         else:
+            self.extract(model_key)
             model = self.workspace.path / model_config.path
 
+        runner_kwargs = {}
+        runner_config = getattr(model_config, "runner_config", None)
+        if isinstance(runner_config, OnnxRunnerConfig):
+            runner_kwargs = {
+                "session_options": runner_config.session_options,
+                "cache_optimized_model": runner_config.cache_optimized_model,
+            }
+
         device_kind = get_device_kind_from_device_string(device)
-        LOGGER.info(f"Creating model `{model_key}` on runner `{runner_name}` and device `{device}`")
-        return get_runner(runner_name, device_kind)(
+        return functools.partial(
+            get_runner(runner_name, device_kind),
             model=model,
             input_metadata=self.status.input_metadata,
             output_metadata=self.status.output_metadata,
             return_type=return_type,
             device=device,
             inplace=inplace,
-        )  # pytype: disable=not-instantiable
+            **runner_kwargs,
+        )
 
     def get_best_runtime(
         self,
@@ -327,6 +612,16 @@ class Package:
 
         return runtime_result
 
+    def _model_dir_exists(self, model_config: ModelConfig) -> bool:
+        if (self.workspace.path / model_config.path.parent).exists():
+            return True
+
+        return self._archive is not None and self._archive.contains(self._get_model_dir_prefix(model_config))
+
+    @staticmethod
+    def _get_model_dir_prefix(model_config: ModelConfig) -> str:
+        return f"{model_config.path.parent.as_posix()}/"
+
     def _status_serializable_dict(self) -> Dict:
         """Convert status to serializable dict."""
         config = DataObject.filter_data(
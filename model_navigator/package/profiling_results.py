@@ -37,6 +37,7 @@ class ProfilingResult:
         p99_latency: 99th percentile of measured latency
         throughput: Inferences per second
         request_count: Number of inference requests
+        concurrency: Number of requests in flight during profiling
     """
 
     batch_size: int
@@ -49,6 +50,7 @@ class ProfilingResult:
     throughput: float  # infer / sec
     avg_gpu_clock: float  # MHz
     request_count: int
+    concurrency: int = 1
 
 
 @dataclasses.dataclass
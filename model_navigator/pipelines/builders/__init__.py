@@ -20,6 +20,7 @@ from model_navigator.configuration.model.model_config import ModelConfig
 from model_navigator.frameworks import is_jax_available as is_jax_available
 from model_navigator.frameworks import is_tf_available, is_torch_available
 from model_navigator.pipelines.builders.correctness import correctness_builder  # noqa: F401
+from model_navigator.pipelines.builders.onnx import onnx_session_options_builder  # noqa: F401
 from model_navigator.pipelines.builders.performance import performance_builder  # noqa: F401
 from model_navigator.pipelines.builders.preprocessing import preprocessing_builder  # noqa: F401
 from model_navigator.pipelines.builders.verify import verify_builder  # noqa: F401
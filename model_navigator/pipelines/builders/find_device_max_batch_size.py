@@ -94,6 +94,9 @@ def _find_max_batch_size_config_for_torch(config: CommonConfig, models_config: D
         )
         configurations.append(mbs_config)
     for model_cfg in models_config.get(Format.ONNX, []):
+        if model_cfg.is_session_options_variant:  # pytype: disable=attribute-error
+            continue
+
         runner_cls = {
             DeviceKind.CUDA: OnnxrtCUDARunner,
             DeviceKind.CPU: OnnxrtCPURunner,
@@ -134,6 +137,9 @@ def _find_max_batch_size_config_for_tensorflow(config: CommonConfig, models_conf
         )
         configurations.append(mbs_config)
     for model_cfg in models_config.get(Format.ONNX, []):
+        if model_cfg.is_session_options_variant:  # pytype: disable=attribute-error
+            continue
+
         runner_cls = {
             DeviceKind.CUDA: OnnxrtCUDARunner,
             DeviceKind.CPU: OnnxrtCPURunner,
@@ -157,6 +163,9 @@ def _find_max_batch_size_config_for_tensorflow(config: CommonConfig, models_conf
 def _find_max_batch_size_config_for_onnx(config: CommonConfig, models_config: Dict[Format, List[ModelConfig]]):
     configurations = []
     for model_cfg in models_config.get(Format.ONNX, []):
+        if model_cfg.is_session_options_variant:  # pytype: disable=attribute-error
+            continue
+
         runner_cls = {
             DeviceKind.CUDA: OnnxrtCUDARunner,
             DeviceKind.CPU: OnnxrtCPURunner,
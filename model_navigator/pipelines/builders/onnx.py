@@ -0,0 +1,43 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Pipeline builders for ONNX models."""
+
+from typing import Dict, List
+
+from model_navigator.commands.base import ExecutionUnit
+from model_navigator.commands.copy.copy_model import CopyParentModel
+from model_navigator.configuration import Format
+from model_navigator.configuration.common_config import CommonConfig
+from model_navigator.configuration.model.model_config import ModelConfig, ONNXModelConfig
+from model_navigator.pipelines.constants import PIPELINE_ONNX_SESSION_OPTIONS
+from model_navigator.pipelines.pipeline import Pipeline
+
+
+def onnx_session_options_builder(config: CommonConfig, models_config: Dict[Format, List[ModelConfig]]) -> Pipeline:
+    """Prepare copies of ONNX models profiled with additional session options.
+
+    Args:
+        config: A configuration for pipelines
+        models_config: List of model configs per format
+
+    Returns:
+        Pipeline with steps copying ONNX models
+    """
+    execution_units: List[ExecutionUnit] = []
+    for model_cfg in models_config.get(Format.ONNX, []):
+        assert isinstance(model_cfg, ONNXModelConfig)
+        if model_cfg.is_session_options_variant:
+            execution_units.append(ExecutionUnit(command=CopyParentModel, model_config=model_cfg))
+
+    return Pipeline(name=PIPELINE_ONNX_SESSION_OPTIONS, execution_units=execution_units)
@@ -55,8 +55,11 @@ def tensorflow_conversion_builder(config: CommonConfig, models_config: Dict[Form
     """
     execution_units: List[ExecutionUnit] = []
     for model_cfg in models_config.get(Format.ONNX, []):
-        execution_units.append(ExecutionUnit(command=ConvertSavedModel2ONNX, model_config=model_cfg))
         assert isinstance(model_cfg, ONNXModelConfig)
+        if model_cfg.is_session_options_variant:
+            continue
+
+        execution_units.append(ExecutionUnit(command=ConvertSavedModel2ONNX, model_config=model_cfg))
         if model_cfg.graph_surgeon_optimization:
             execution_units.append(ExecutionUnit(command=GraphSurgeonOptimize, model_config=model_cfg))
 
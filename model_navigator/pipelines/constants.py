@@ -16,6 +16,7 @@
 # Pipeline names
 PIPELINE_CORRECTNESS = "Correctness"
 PIPELINE_FIND_MAX_BATCH_SIZE = "Finding max batch size for fixed shapes based pipelines"
+PIPELINE_ONNX_SESSION_OPTIONS = "ONNX Runtime Session Options"
 PIPELINE_PERFORMANCE = "Performance"
 PIPELINE_PREPROCESSING = "Preprocessing"
 PIPELINE_PROFILING = "Profiling"
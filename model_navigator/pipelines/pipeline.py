@@ -14,12 +14,16 @@
 """Definition of Pipeline module - Direct Acyclic Graph (DAG) of commands execution."""
 
 import contextlib
+import pathlib
+import threading
 import time
 import traceback
-from typing import List
+from concurrent import futures
+from typing import Any, Dict, List, Optional
 
 from model_navigator.commands.base import CommandOutput, CommandStatus, ExecutionUnit
 from model_navigator.configuration.common_config import CommonConfig
+from model_navigator.core.artifact_cache import get_artifact_cache, get_artifact_key
 from model_navigator.core.logger import LOGGER, LoggingContext, StdoutLogger, pad_string
 from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import (
@@ -28,10 +32,13 @@ from model_navigator.exceptions import (
     ModelNavigatorUserInputError,
 )
 from model_navigator.pipelines.pipeline_context import PipelineContext
+from model_navigator.pipelines.scheduler import DeviceSlots, can_run_concurrently, get_dependencies
 from model_navigator.reporting.optimize.events import (
     OptimizeEvent,
     default_event_emitter,
 )
+from model_navigator.utils.devices import assigned_device
+from model_navigator.utils.environment import device_slots, max_parallel_units, parallel_devices, use_multiprocessing
 
 
 class Pipeline:
@@ -56,6 +63,8 @@ class Pipeline:
     def run(self, workspace: Workspace, config: CommonConfig, context: PipelineContext) -> None:
         """Execute pipeline.
 
+        Independent units are run concurrently when `NAVIGATOR_MAX_PARALLEL_UNITS` is greater than 1.
+
         Args:
             workspace: Workspace where unit is executed
             config: A global config provided by user
@@ -64,21 +73,167 @@ class Pipeline:
         LOGGER.info(pad_string(f"Pipeline {self.name!r} started"))
         self.event_emitter.emit(OptimizeEvent.PIPELINE_STARTED, name=self.name)
 
-        for execution_unit in self.execution_units:
-            command_output = self._execute_unit(
-                workspace=workspace,
-                execution_unit=execution_unit,
-                config=config,
-                context=context,
-            )
-            context.update(
-                execution_unit=execution_unit,
-                command_output=command_output,
-            )
-            context.save()
+        max_units = max_parallel_units()
+        if max_units > 1 and use_multiprocessing():
+            self._run_concurrently(workspace=workspace, config=config, context=context, max_units=max_units)
+        else:
+            for execution_unit in self.execution_units:
+                self._run_unit(
+                    workspace=workspace,
+                    execution_unit=execution_unit,
+                    config=config,
+                    context=context,
+                )
 
         self.event_emitter.emit(OptimizeEvent.PIPELINE_FINISHED)
 
+    def _run_unit(
+        self,
+        workspace: Workspace,
+        execution_unit: ExecutionUnit,
+        config: CommonConfig,
+        context: PipelineContext,
+    ) -> None:
+        command_output = self._execute_unit(
+            workspace=workspace,
+            execution_unit=execution_unit,
+            config=config,
+            context=context,
+        )
+        context.update(
+            execution_unit=execution_unit,
+            command_output=command_output,
+        )
+        context.save()
+
+    def _run_concurrently(
+        self,
+        workspace: Workspace,
+        config: CommonConfig,
+        context: PipelineContext,
+        max_units: int,
+    ) -> None:
+        """Execute units in threads following dependencies between them.
+
+        Units are executed in threads, while the workload of concurrent commands is run in child processes.
+        Context is updated and saved only in the main thread once the unit is finished.
+
+        Args:
+            workspace: Workspace where unit is executed
+            config: A global config provided by user
+            context: Context of pipeline execution
+            max_units: Maximal number of units run at once
+        """
+        dependencies = get_dependencies(self.execution_units)
+        slots = DeviceSlots(devices=parallel_devices(), slots_per_device=device_slots(), max_slots=max_units)
+        context_lock = threading.Lock()
+        pending = list(range(len(self.execution_units)))
+        finished = set()
+        running = {}
+
+        if config.debug:
+            redirect_stdout_context = StdoutLogger(LOGGER)
+        else:
+            redirect_stdout_context = contextlib.nullcontext()
+
+        with futures.ThreadPoolExecutor(max_workers=max_units) as executor, redirect_stdout_context:
+            while pending or running:
+                for index in [index for index in pending if dependencies[index] <= finished]:
+                    execution_unit = self.execution_units[index]
+                    if not can_run_concurrently(execution_unit):
+                        # all other pending units depend on this one, so it is run alone in the main thread
+                        pending.remove(index)
+                        self._run_unit(
+                            workspace=workspace, execution_unit=execution_unit, config=config, context=context
+                        )
+                        finished.add(index)
+                        break
+
+                    exclusive = execution_unit.command.is_device_exclusive()
+                    if len(running) >= max_units or not slots.available(exclusive=exclusive):
+                        break
+
+                    pending.remove(index)
+                    device = slots.acquire(exclusive=exclusive)
+                    future = executor.submit(
+                        self._execute_unit_in_thread,
+                        workspace=workspace,
+                        execution_unit=execution_unit,
+                        config=config,
+                        context=context,
+                        context_lock=context_lock,
+                        device=device,
+                    )
+                    running[future] = (index, device)
+
+                if not running:
+                    continue
+
+                done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    index, device = running.pop(future)
+                    slots.release(device)
+                    execution_unit = self.execution_units[index]
+                    command_output = future.result()
+
+                    self._emit_command_started_event(execution_unit)
+                    self._finish_unit(execution_unit=execution_unit, command_output=command_output)
+                    with context_lock:
+                        context.update(
+                            execution_unit=execution_unit,
+                            command_output=command_output,
+                        )
+                        context.save()
+                    finished.add(index)
+
+    def _execute_unit_in_thread(
+        self,
+        workspace: Workspace,
+        execution_unit: ExecutionUnit,
+        config: CommonConfig,
+        context: PipelineContext,
+        context_lock: threading.Lock,
+        device: Optional[str],
+    ) -> CommandOutput:
+        """Execute a single unit in a worker thread.
+
+        Events are not emitted in the thread; they are emitted in the main thread after the unit is finished.
+
+        Args:
+            workspace: Workspace where unit is executed
+            execution_unit: A unit to execute
+            config: Common configuration parameters
+            context: Pipeline execution context
+            context_lock: Lock guarding context reads from concurrent updates
+            device: Device assigned to child processes started by the unit
+
+        Returns:
+            Command execution result
+        """
+        with LoggingContext(log_dir=self._get_log_dir(workspace, execution_unit), current_thread_only=True):
+            start_time = time.perf_counter()
+            try:
+                with context_lock:
+                    context.validate_execution(execution_unit=execution_unit)
+                with assigned_device(device):
+                    command_output = self._run_command(
+                        workspace=workspace,
+                        execution_unit=execution_unit,
+                        config=config,
+                        context=context,
+                        context_lock=context_lock,
+                    )
+            except ModelNavigatorCommandNotExecutable:
+                command_output = CommandOutput(status=CommandStatus.SKIPPED)
+
+            end_time = time.perf_counter()
+            # outputs reused from the previous run keep their execution time
+            if command_output.execution_time is None:
+                command_output.execution_time = end_time - start_time
+            LOGGER.info(f"Execution time: {command_output.execution_time:.2f}[s]")
+
+            return command_output
+
     def _execute_unit(
         self,
         workspace: Workspace,
@@ -97,65 +252,139 @@ class Pipeline:
         Returns:
             Command execution result
         """
-        log_dir = None
-        if execution_unit.model_config:
-            log_dir = workspace.path / execution_unit.model_config.path.parent
-
         if config.debug:
             redirect_stdout_context = StdoutLogger(LOGGER)
         else:
             redirect_stdout_context = contextlib.nullcontext()
 
-        with LoggingContext(log_dir=log_dir), redirect_stdout_context:
+        with LoggingContext(log_dir=self._get_log_dir(workspace, execution_unit)), redirect_stdout_context:
             start_time = time.perf_counter()
             self._emit_command_started_event(execution_unit)
             try:
                 context.validate_execution(execution_unit=execution_unit)
-                try:
-                    LOGGER.info(pad_string(f"Command {execution_unit.command.name!r} started"))
-                    input_parameters = context.command_args(
-                        workspace=workspace,
-                        config=config,
-                        execution_unit=execution_unit,
-                    )
-                    command_output = execution_unit.command().run(
-                        **input_parameters
-                    )  # pytype: disable=not-instantiable
-                except ModelNavigatorUserInputError as e:
-                    command_output = CommandOutput(status=CommandStatus.FAIL)
-
-                    if config.verbose and e.__context__:
-                        LOGGER.info(e.__context__)
-
-                    error = traceback.format_exc()
-                    LOGGER.warning(
-                        "Command finished with ModelNavigatorUserInputError. "
-                        "The error is considered as external error. Usually caused by "
-                        "incompatibilities between the model and the target formats and/or runtimes. "
-                        "Please review the command output.\n"
-                        f"{error}"
-                    )
-
-                except Exception:
-                    command_output = CommandOutput(status=CommandStatus.FAIL)
-                    error = traceback.format_exc()
-                    LOGGER.error(f"Command finished with unexpected error: {error}")
+                command_output = self._run_command(
+                    workspace=workspace,
+                    execution_unit=execution_unit,
+                    config=config,
+                    context=context,
+                )
             except ModelNavigatorCommandNotExecutable:
                 command_output = CommandOutput(status=CommandStatus.SKIPPED)
 
             end_time = time.perf_counter()
-            command_output.execution_time = end_time - start_time
+            # outputs reused from the previous run keep their execution time
+            if command_output.execution_time is None:
+                command_output.execution_time = end_time - start_time
             LOGGER.info(f"Execution time: {command_output.execution_time:.2f}[s]")
 
-            self.emit_command_finished_event(command_output)
-            if command_output.status != CommandStatus.OK and execution_unit.command.is_required():
-                raise ModelNavigatorRuntimeError(
-                    "The required command has failed. Please, review the log and verify the reported problems: \n"
-                    f"{command_output.output}."
-                )
+            self._finish_unit(execution_unit=execution_unit, command_output=command_output)
 
             return command_output
 
+    def _run_command(
+        self,
+        workspace: Workspace,
+        execution_unit: ExecutionUnit,
+        config: CommonConfig,
+        context: PipelineContext,
+        context_lock: Optional[threading.Lock] = None,
+    ) -> CommandOutput:
+        """Run the command of the unit and convert errors to failed command output."""
+        try:
+            LOGGER.info(pad_string(f"Command {execution_unit.command.name!r} started"))
+            with context_lock or contextlib.nullcontext():
+                input_parameters = context.command_args(
+                    workspace=workspace,
+                    config=config,
+                    execution_unit=execution_unit,
+                )
+                previous_output = context.get_previous_output(execution_unit=execution_unit, args=input_parameters)
+            if previous_output is not None:
+                LOGGER.info("Command succeeded in the previous run with the same inputs. Reusing its output.")
+                return previous_output
+
+            command_output = self._run_cacheable_command(
+                workspace=workspace, execution_unit=execution_unit, input_parameters=input_parameters
+            )
+        except ModelNavigatorUserInputError as e:
+            command_output = CommandOutput(status=CommandStatus.FAIL)
+
+            if config.verbose and e.__context__:
+                LOGGER.info(e.__context__)
+
+            error = traceback.format_exc()
+            LOGGER.warning(
+                "Command finished with ModelNavigatorUserInputError. "
+                "The error is considered as external error. Usually caused by "
+                "incompatibilities between the model and the target formats and/or runtimes. "
+                "Please review the command output.\n"
+                f"{error}"
+            )
+
+        except Exception:
+            command_output = CommandOutput(status=CommandStatus.FAIL)
+            error = traceback.format_exc()
+            LOGGER.error(f"Command finished with unexpected error: {error}")
+
+        return command_output
+
+    def _run_cacheable_command(
+        self,
+        workspace: Workspace,
+        execution_unit: ExecutionUnit,
+        input_parameters: Dict[str, Any],
+    ) -> CommandOutput:
+        """Run the command or restore the model it produces from the artifact cache.
+
+        Models already present in the workspace are never overridden, the command decides how to handle them.
+
+        Args:
+            workspace: Workspace where unit is executed
+            execution_unit: A unit to execute
+            input_parameters: Arguments of the command
+
+        Returns:
+            Command execution result
+        """
+        command = execution_unit.command()  # pytype: disable=not-instantiable
+        model_config = execution_unit.model_config
+        cache = get_artifact_cache() if command.is_cacheable() and model_config is not None else None
+        if cache is None or (workspace.path / model_config.path).exists():
+            return command.run(**input_parameters)
+
+        command_args = command.get_run_args(input_parameters)
+        key = get_artifact_key(execution_unit.command.name, model_config, command_args)
+        if key is None:
+            LOGGER.info("Model cannot be hashed. Artifact cache is not used.")
+            return command.run(**input_parameters)
+
+        model_dir = workspace.path / model_config.path.parent
+        cached_artifact = cache.get(key, model_dir)
+        if cached_artifact is not None:
+            LOGGER.info(f"Model restored from artifact cache `{key}`.")
+            return CommandOutput(status=CommandStatus.OK, output=cached_artifact.output)
+
+        command_output = command.run(**input_parameters)
+        if command_output.status == CommandStatus.OK and (workspace.path / model_config.path).exists():
+            cache.put(key, model_dir, command_output.output)
+            LOGGER.info(f"Model stored in artifact cache `{key}`.")
+
+        return command_output
+
+    def _finish_unit(self, execution_unit: ExecutionUnit, command_output: CommandOutput) -> None:
+        self.emit_command_finished_event(command_output)
+        if command_output.status != CommandStatus.OK and execution_unit.command.is_required():
+            raise ModelNavigatorRuntimeError(
+                "The required command has failed. Please, review the log and verify the reported problems: \n"
+                f"{command_output.output}."
+            )
+
+    def _get_log_dir(self, workspace: Workspace, execution_unit: ExecutionUnit) -> Optional[pathlib.Path]:
+        if execution_unit.model_config:
+            return workspace.path / execution_unit.model_config.path.parent
+
+        return None
+
     def _emit_command_started_event(self, execution_unit: ExecutionUnit):
         """Emit command started event with execution unit properties."""
         kwargs = {
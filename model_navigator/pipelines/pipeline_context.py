@@ -15,8 +15,13 @@
 
 import collections
 import dataclasses
+import hashlib
+import json
+import pathlib
+import pickle
+import shutil
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import yaml
 from tabulate import tabulate
@@ -25,12 +30,14 @@ from model_navigator.commands.base import CommandOutput, CommandStatus, Executio
 from model_navigator.configuration import Format
 from model_navigator.configuration.common_config import CommonConfig
 from model_navigator.configuration.model.model_config import ModelConfig
+from model_navigator.core.artifact_cache import hash_callable, hash_model, hash_path
 from model_navigator.core.constants import NAVIGATOR_VERSION
 from model_navigator.core.logger import LOGGER, pad_string
 from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import ModelNavigatorCommandNotExecutable, ModelNavigatorRuntimeError
 from model_navigator.utils.common import DataObject
 from model_navigator.utils.environment import get_env
+from model_navigator.utils.format_helpers import is_source_format
 
 
 @dataclasses.dataclass
@@ -155,19 +162,45 @@ class PipelineMetadata(DataObject):
         )
 
 
+# arguments not compared when results of the previous run are reused
+RESUME_IGNORED_ARGS = {"workspace", "model", "dataloader", "verbose", "debug"}
+# samples saved during preprocessing, profiler samples are written later by the performance command
+SAMPLES_DIRS = ["model_input/profiling", "model_input/correctness", "model_input/conversion"]
+
+
 class PipelineContext:
-    """PipelineContext class."""
+    """PipelineContext class.
+
+    In the resume mode the context additionally stores outputs of executed units together with fingerprints
+    of their inputs. When pipelines are run again in the same workspace, units which succeeded with the same
+    fingerprint reuse their previous output instead of being executed. A unit is executed when:
+    - it failed, was skipped or was not run before,
+    - any of its arguments, the source model or the saved samples changed,
+    - it reads the dataloader, which cannot be compared without reading it,
+    - the model it uses, or any of parents of this model, was produced again in the current run,
+    - the source model or any of its arguments cannot be hashed, e.g. a function without available source code.
+    """
 
     def __init__(self, workspace: Workspace):
         """Initialize context."""
         self._workspace = workspace
         self._file = workspace.path / "context.yaml"
+        self._resume_file = workspace.path / "context.pkl"
         self._metadata = PipelineMetadata(
             model_navigator_version=NAVIGATOR_VERSION,
             environment=get_env(),
         )
         self._commands = PipelineCommands(models_commands={}, commands={})
 
+        self._resume = False
+        self._previous_units: Dict[str, Tuple[str, CommandOutput]] = {}
+        self._units: Dict[str, Tuple[str, CommandOutput]] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._produced_models: Set[str] = set()
+        self._reused_models: Set[str] = set()
+        self._model_digest: Optional[str] = None
+        self._samples_digest: Optional[str] = None
+
     @property
     def workspace(self) -> Workspace:
         """Workspace of context."""
@@ -194,6 +227,10 @@ class PipelineContext:
             execution_unit: Executed command
             command_output: command output
         """
+        unit_id = _get_unit_id(execution_unit)
+        if unit_id in self._fingerprints:
+            self._units[unit_id] = (self._fingerprints.pop(unit_id), command_output)
+
         if execution_unit.model_config is not None:
             # If not models_commands with given model_config then add new ModelCommand.
             if execution_unit.model_config.key not in self._commands.models_commands:
@@ -218,6 +255,129 @@ class PipelineContext:
         self._file.unlink(missing_ok=True)
         self._file.touch()
 
+    def resume(self):
+        """Enable the resume mode and load outputs of units from the previous run in the workspace."""
+        self._resume = True
+        if not self._resume_file.exists():
+            LOGGER.info("No previous run found in the workspace. Running all units.")
+            return
+
+        with self._resume_file.open("rb") as fp:
+            data = pickle.load(fp)
+
+        if data.get("model_navigator_version") != NAVIGATOR_VERSION:
+            LOGGER.info("Previous run was executed with other Model Navigator version. Running all units.")
+            return
+
+        for unit_id, (fingerprint, output) in data["units"].items():
+            try:
+                self._previous_units[unit_id] = (fingerprint, pickle.loads(output))
+            except Exception as e:
+                LOGGER.debug(f"Output of `{unit_id}` cannot be loaded: {e}")
+
+        LOGGER.info(f"Loaded {len(self._previous_units)} units from the previous run.")
+
+    def get_previous_output(self, execution_unit: ExecutionUnit, args: Dict[str, Any]) -> Optional[CommandOutput]:
+        """Get output of the unit from the previous run if it can be reused.
+
+        Called before the unit is executed. When None is returned, the unit is considered as executed again.
+
+        Args:
+            execution_unit: An execution unit to run
+            args: Arguments of the unit command
+
+        Returns:
+            Output of the previous execution or None when unit has to be executed
+        """
+        if not self._resume:
+            return None
+
+        unit_id = _get_unit_id(execution_unit)
+        command = execution_unit.command()  # pytype: disable=not-instantiable
+        run_args = command.get_run_args(args)
+        fingerprint = self._get_fingerprint(execution_unit, model=args.get("model"), run_args=run_args)
+        if fingerprint is not None:
+            self._fingerprints[unit_id] = fingerprint
+
+        previous_output = self._get_reusable_output(execution_unit, unit_id, fingerprint, run_args)
+        if previous_output is None:
+            self._on_execute(execution_unit)
+        elif execution_unit.model_config is not None and execution_unit.runner_cls is None:
+            self._reused_models.add(execution_unit.model_config.key)
+
+        return previous_output
+
+    def _get_reusable_output(
+        self,
+        execution_unit: ExecutionUnit,
+        unit_id: str,
+        fingerprint: Optional[str],
+        run_args: Dict[str, Any],
+    ) -> Optional[CommandOutput]:
+        previous_unit = self._previous_units.get(unit_id)
+        if fingerprint is None or previous_unit is None or "dataloader" in run_args:
+            return None
+
+        previous_fingerprint, previous_output = previous_unit
+        if previous_fingerprint != fingerprint or previous_output.status != CommandStatus.OK:
+            return None
+
+        model_config = execution_unit.model_config
+        if model_config is None:
+            # units without model use models produced before them
+            return None if self._produced_models else previous_output
+
+        config = model_config
+        while config is not None:
+            if config.key in self._produced_models:
+                return None
+            config = config.parent
+
+        model_path = self._workspace.path / model_config.path
+        if not is_source_format(model_config.format) and not model_path.exists():
+            return None
+
+        return previous_output
+
+    def _on_execute(self, execution_unit: ExecutionUnit) -> None:
+        model_config = execution_unit.model_config
+        if model_config is None:
+            # samples are saved by units without model
+            self._samples_digest = None
+        elif execution_unit.runner_cls is None:
+            if model_config.key not in self._produced_models | self._reused_models:
+                # model of the previous run is removed, so it is produced again instead of skipped as existing
+                _remove_model(self._workspace.path / model_config.path)
+            self._produced_models.add(model_config.key)
+
+    def _get_fingerprint(self, execution_unit: ExecutionUnit, model: Any, run_args: Dict[str, Any]) -> Optional[str]:
+        if self._model_digest is None:
+            self._model_digest = _get_model_digest(model)
+        if self._model_digest is None:
+            return None
+
+        if self._samples_digest is None:
+            self._samples_digest = hashlib.sha256(
+                "".join(hash_path(self._workspace.path / name) or "" for name in SAMPLES_DIRS).encode("utf-8")
+            ).hexdigest()
+
+        data = {
+            "model": self._model_digest,
+            "samples": self._samples_digest,
+            "unit": repr(execution_unit),
+            "model_config": None if execution_unit.model_config is None else execution_unit.model_config.to_dict(),
+            "runner_config": execution_unit.runner_config,
+            "args": {name: value for name, value in run_args.items() if name not in RESUME_IGNORED_ARGS},
+        }
+        data = DataObject.parse_value(data)
+        try:
+            data = json.dumps(data, sort_keys=True, default=_get_value_id)
+        except TypeError as e:
+            LOGGER.debug(f"Unit `{_get_unit_id(execution_unit)}` cannot be resumed: {e}")
+            return None
+
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
     def load(self):
         """Load context from file."""
         with self._file.open("r") as fp:
@@ -235,6 +395,22 @@ class PipelineContext:
         with self._file.open("w") as fp:
             yaml.safe_dump(data=data, stream=fp, sort_keys=False)
 
+        if self._resume:
+            self._save_resume_file()
+
+    def _save_resume_file(self):
+        units = {}
+        for unit_id, (fingerprint, output) in self._units.items():
+            try:
+                units[unit_id] = (fingerprint, pickle.dumps(output))
+            except Exception as e:
+                LOGGER.debug(f"Output of `{unit_id}` cannot be saved for resume: {e}")
+
+        tmp_file = self._resume_file.with_suffix(".tmp")
+        with tmp_file.open("wb") as fp:
+            pickle.dump({"model_navigator_version": NAVIGATOR_VERSION, "units": units}, fp)
+        tmp_file.replace(self._resume_file)
+
     def command_args(self, workspace: Workspace, config: CommonConfig, execution_unit: ExecutionUnit) -> Dict[str, Any]:
         """Prepare command arguments from config and current context.
 
@@ -372,3 +548,38 @@ class PipelineContext:
         table = tabulate(summary, headers, "grid")
         title = pad_string("Model Navigator Summary", width=table.find("\n"))
         LOGGER.info(f"\n{title}\n{table}")
+
+
+def _get_unit_id(execution_unit: ExecutionUnit) -> str:
+    model_key = execution_unit.model_config.key if execution_unit.model_config else ""
+    runner_name = execution_unit.runner_cls.name() if execution_unit.runner_cls else ""
+    return f"{model_key}/{runner_name}/{execution_unit.command.name}"
+
+
+def _get_model_digest(model: Any) -> Optional[str]:
+    if isinstance(model, (str, pathlib.Path)):
+        return hash_path(pathlib.Path(model))
+    if model_hash := hash_model(model):
+        return model_hash
+    if callable(model):
+        return hash_callable(model)
+
+    return None
+
+
+def _get_value_id(value: Any) -> str:
+    # functions and classes are compared by source code and referenced values, other values by representation
+    if callable(value) and hasattr(value, "__qualname__"):
+        digest = hash_callable(value)
+        if digest is None:
+            raise TypeError(f"Callable `{value.__module__}.{value.__qualname__}` cannot be hashed.")
+        return f"{value.__module__}.{value.__qualname__}:{digest}"
+
+    return repr(value)
+
+
+def _remove_model(model_path: pathlib.Path) -> None:
+    if model_path.is_dir():
+        shutil.rmtree(model_path)
+    elif model_path.is_file():
+        model_path.unlink()
@@ -15,6 +15,7 @@
 
 from typing import Dict, List, Optional, Sequence
 
+from model_navigator.commands.warm_worker import WARM_WORKERS
 from model_navigator.configuration import Format
 from model_navigator.configuration.common_config import CommonConfig
 from model_navigator.configuration.model.model_config import ModelConfig
@@ -25,6 +26,7 @@ from model_navigator.pipelines.builders import PipelineBuilder
 from model_navigator.pipelines.pipeline import Pipeline
 from model_navigator.pipelines.pipeline_context import PipelineContext
 from model_navigator.pipelines.validation import PipelineManagerConfigurationValidator
+from model_navigator.utils.environment import resume_pipelines
 
 
 class PipelineManager:
@@ -76,6 +78,8 @@ class PipelineManager:
         PipelineManagerConfigurationValidator.run(config, package)
 
         context = PipelineContext(workspace=self._workspace)
+        if resume_pipelines():
+            context.resume()
         context.initialize()
 
         pipelines = self._build_pipelines(
@@ -84,8 +88,12 @@ class PipelineManager:
             config=config,
         )
 
-        for pipeline in pipelines:
-            pipeline.run(workspace=workspace, config=config, context=context)
+        try:
+            for pipeline in pipelines:
+                pipeline.run(workspace=workspace, config=config, context=context)
+        finally:
+            # release models kept loaded by warm workers between isolated commands
+            WARM_WORKERS.shutdown()
 
         LOGGER.warning(
             "Initially models are not verified. Validate exported models and use "
@@ -0,0 +1,159 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Scheduling of pipeline execution units run concurrently."""
+
+from typing import Dict, List, Optional, Sequence, Set
+
+from model_navigator.commands.base import ExecutionUnit
+from model_navigator.configuration.model.model_config import ModelConfig
+from model_navigator.utils.format_helpers import is_source_format
+
+
+def can_run_concurrently(execution_unit: ExecutionUnit) -> bool:
+    """Check if execution unit can be run concurrently with other units.
+
+    Only concurrent commands executed for serialized models are run concurrently. Commands working on
+    the source model, without model configuration or measuring performance are run alone.
+
+    Args:
+        execution_unit: Unit to check
+
+    Returns:
+        True if unit can be run concurrently, False otherwise
+    """
+    return (
+        execution_unit.model_config is not None
+        and execution_unit.command.is_concurrent()
+        and not is_source_format(execution_unit.model_config.format)
+    )
+
+
+def get_dependencies(execution_units: Sequence[ExecutionUnit]) -> List[Set[int]]:
+    """Collect indices of units that has to be finished before each unit starts.
+
+    A unit depends on the previous units executed for the same model and runner, units producing
+    any of its parent models and on all units which cannot be run concurrently.
+
+    Args:
+        execution_units: Units in the order of sequential execution
+
+    Returns:
+        List of dependencies for each unit
+    """
+    dependencies = []
+    for index, execution_unit in enumerate(execution_units):
+        unit_dependencies = set()
+        for previous_index, previous_unit in enumerate(execution_units[:index]):
+            if _depends_on(execution_unit, previous_unit):
+                unit_dependencies.add(previous_index)
+
+        dependencies.append(unit_dependencies)
+
+    return dependencies
+
+
+def _depends_on(execution_unit: ExecutionUnit, previous_unit: ExecutionUnit) -> bool:
+    if not can_run_concurrently(execution_unit) or not can_run_concurrently(previous_unit):
+        return True
+
+    runner_cls = execution_unit.runner_cls or execution_unit.results_lookup_runner_cls
+    previous_runner_cls = previous_unit.runner_cls or previous_unit.results_lookup_runner_cls
+
+    model_key, previous_model_key = execution_unit.model_config.key, previous_unit.model_config.key
+    if previous_model_key in _parents_keys(execution_unit.model_config):
+        # model produced from the parent requires the parent model, but not its evaluation
+        return previous_runner_cls is None
+
+    if model_key != previous_model_key:
+        return False
+
+    return runner_cls is None or previous_runner_cls is None or runner_cls.name() == previous_runner_cls.name()
+
+
+def _parents_keys(model_config: ModelConfig) -> Set[str]:
+    keys = set()
+    parent = model_config.parent
+    while parent is not None:
+        keys.add(parent.key)
+        parent = parent.parent
+
+    return keys
+
+
+class DeviceSlots:
+    """Slots limiting the number of units run concurrently on each device.
+
+    Units are assigned to the least used device. Exclusive units, e.g. TensorRT conversions searching for
+    the maximal batch size, are started only on an idle device and no other unit is started on it until they finish.
+    When no devices are provided, all units share the default device.
+    """
+
+    def __init__(self, devices: Sequence[str], slots_per_device: int, max_slots: int):
+        """Initialize slots.
+
+        Args:
+            devices: Devices across which units are distributed. When empty, units are not assigned to devices.
+            slots_per_device: Maximal number of units run concurrently on a single device
+            max_slots: Number of slots used when no devices are provided
+        """
+        if devices:
+            self._slots: Dict[Optional[str], int] = {device: slots_per_device for device in devices}
+        else:
+            self._slots = {None: max_slots}
+        self._used = {device: 0 for device in self._slots}
+        self._exclusive: Set[Optional[str]] = set()
+
+    def available(self, exclusive: bool = False) -> bool:
+        """Check if a slot is free.
+
+        Args:
+            exclusive: If True, check for the device without any running unit
+
+        Returns:
+            True if the slot can be acquired, False otherwise
+        """
+        return bool(self._free_devices(exclusive))
+
+    def acquire(self, exclusive: bool = False) -> Optional[str]:
+        """Take the free slot.
+
+        Args:
+            exclusive: If True, take the device for a unit which has to run alone on it
+
+        Returns:
+            Device assigned to the slot or None when units are not assigned to devices
+        """
+        device = min(self._free_devices(exclusive), key=lambda device: self._used[device])
+        self._used[device] += 1
+        if exclusive:
+            self._exclusive.add(device)
+
+        return device
+
+    def release(self, device: Optional[str]) -> None:
+        """Return the slot taken for the device.
+
+        Args:
+            device: Device returned by `acquire`
+        """
+        self._used[device] -= 1
+        if self._used[device] == 0:
+            self._exclusive.discard(device)
+
+    def _free_devices(self, exclusive: bool) -> List[Optional[str]]:
+        return [
+            device
+            for device, slots in self._slots.items()
+            if device not in self._exclusive and self._used[device] < slots and not (exclusive and self._used[device])
+        ]
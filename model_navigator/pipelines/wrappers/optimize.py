@@ -22,6 +22,7 @@ from model_navigator.configuration import DEFAULT_RUNTIME_STRATEGIES, Format
 from model_navigator.configuration.common_config import CommonConfig
 from model_navigator.configuration.model import model_config
 from model_navigator.core.context import INPLACE_OPTIMIZE_STRATEGIES_CONTEXT_KEY, global_context
+from model_navigator.core.logger import LOGGER
 from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import ModelNavigatorRuntimeAnalyzerError, ModelNavigatorRuntimeError
 from model_navigator.package.builder import PackageBuilder
@@ -29,6 +30,7 @@ from model_navigator.package.package import Package
 from model_navigator.pipelines.builders import PipelineBuilder
 from model_navigator.pipelines.pipeline_manager import PipelineManager
 from model_navigator.reporting.optimize.events import OptimizeEvent, default_event_emitter
+from model_navigator.utils.environment import resume_pipelines
 
 
 def optimize_pipeline(
@@ -62,7 +64,12 @@ def optimize_pipeline(
 
     workspace = Workspace(workspace)
     if not package or workspace.path != package.workspace.path:
-        workspace.initialize()
+        if resume_pipelines() and workspace.exists():
+            # models and samples of the previous run are kept to resume from them
+            LOGGER.info(f"Resuming from workspace at {workspace.path}")
+            workspace.configure_logging()
+        else:
+            workspace.initialize()
         event_emitter.emit(OptimizeEvent.WORKSPACE_INITIALIZED, path=workspace.path)
 
     if package:
@@ -113,6 +113,7 @@ class ProfilingResultsBuilder:
                         throughput=result.throughput,
                         avg_gpu_clock=result.avg_gpu_clock,
                         request_count=result.request_count,
+                        concurrency=result.concurrency,
                     )
                     res = detailed.get(result.sample_id, [])
                     res.append(profiling_result)
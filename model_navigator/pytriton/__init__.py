@@ -19,6 +19,7 @@ from typing import Dict, List, Optional, Type, Union
 
 import numpy as np
 
+from model_navigator.commands.performance.results import ProfilingResults
 from model_navigator.configuration import (
     DEFAULT_RUNTIME_STRATEGIES,
     RuntimeSearchStrategy,
@@ -27,6 +28,7 @@ from model_navigator.configuration import (
 from model_navigator.exceptions import ModelNavigatorNotFoundError
 from model_navigator.package.package import Package
 from model_navigator.runners.base import NavigatorRunner
+from model_navigator.triton.batching_tuning import BatchingTuningResult, record_tuning, tune_batching
 
 
 class TimeoutAction(enum.Enum):
@@ -134,6 +136,8 @@ class PyTritonAdapter:
         package: Package,
         strategies: Optional[List[RuntimeSearchStrategy]] = None,
         runner_return_type: TensorType = TensorType.NUMPY,
+        tune_batching: bool = False,
+        latency_budget: Optional[float] = None,
     ):
         """Initialize PyTritonAdapter.
 
@@ -145,11 +149,17 @@ class PyTritonAdapter:
             runner_return_type: The type of the output tensor. Defaults to `TensorType.NUMPY`.
                 If the return_type supports CUDA tensors (e.g. TensorType.TORCH) and the input tensors are on CUDA,
                 there will be no additional data transfer between CPU and GPU.
+            tune_batching: Derive preferred batch sizes and maximal queue delay of the dynamic batcher and number
+                of model instances from profiling results of the runner. The reasoning is stored in the package status.
+            latency_budget: Maximal p99 latency in milliseconds of a request used by `tune_batching`
         """
         self._package = package
         self._strategies = strategies or DEFAULT_RUNTIME_STRATEGIES
         self._runner = self._package.get_runner(strategies=strategies, return_type=runner_return_type)
         self._batching = self._package.status.config.get("batch_dim", None) == 0
+        self._tune_batching = tune_batching
+        self._latency_budget = latency_budget
+        self._batching_tuning = None
 
     @property
     def batching(self) -> bool:
@@ -213,17 +223,50 @@ class PyTritonAdapter:
     def config(self) -> ModelConfig:
         """Returns config for pytriton.
 
+        When batching tuning is enabled, the dynamic batcher uses tuned preferred batch sizes and queue delay.
+
         Returns:
             ModelConfig with configuration for PyTrtion bind method.
 
         """
+        profiling_results = self._get_profiling_results()
+        bs_from_profiling = max(r.batch_size for r in profiling_results)
+
+        batching_tuning = self.batching_tuning
+        if batching_tuning is None:
+            return ModelConfig(max_batch_size=bs_from_profiling)
+
+        return ModelConfig(
+            max_batch_size=batching_tuning.max_batch_size,
+            batcher=DynamicBatcher(
+                max_queue_delay_microseconds=batching_tuning.max_queue_delay_microseconds,
+                preferred_batch_size=batching_tuning.preferred_batch_sizes,
+            ),
+        )
+
+    @property
+    def batching_tuning(self) -> Optional[BatchingTuningResult]:
+        """Returns dynamic batching and instances configuration tuned from profiling results.
+
+        The `instance_count` is the number of runner instances to bind, e.g. a list of inference callables
+        each using its own runner.
+
+        Returns:
+            BatchingTuningResult or None when tuning is disabled or the model does not support batching.
+        """
+        if not self._tune_batching or not self._batching:
+            return None
+
+        if self._batching_tuning is None:
+            self._batching_tuning = tune_batching(self._get_profiling_results(), latency_budget=self._latency_budget)
+            if self._batching_tuning is not None:
+                record_tuning(self._package, self._batching_tuning)
+
+        return self._batching_tuning
+
+    def _get_profiling_results(self) -> List[ProfilingResults]:
         model_status = self._package.get_best_model_status(strategies=self._strategies)
-        if model_status:
-            bs_from_profiling = max(
-                r.batch_size
-                for r in model_status.runners_status[self._runner.name()].result["Performance"]["profiling_results"]
-            )
-        else:
+        if not model_status:
             raise ModelNavigatorNotFoundError(f"Cannot find model status for strategies: {self._strategies}")
 
-        return ModelConfig(max_batch_size=bs_from_profiling)
+        return model_status.runners_status[self._runner.name()].result["Performance"]["profiling_results"]
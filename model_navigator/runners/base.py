@@ -15,10 +15,10 @@
 
 import abc
 import collections
-import contextlib
+import threading
 import time
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 import numpy as np
 from slugify import slugify
@@ -28,6 +28,9 @@ from model_navigator.core.dataloader import validate_sample_output
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata, TensorSpec, get_tensor_type
 
+if TYPE_CHECKING:
+    from model_navigator.runners.telemetry import InferenceTelemetry
+
 
 class InferenceStep(Enum):
     """Inference step enum."""
@@ -50,35 +53,79 @@ class InferenceTime(collections.defaultdict):
         self.default_factory = float
 
 
+class _StepMeasurement:
+    """Reusable context manager measuring a single step of the timer.
+
+    Start times are kept per thread, so the step may be measured in concurrent inferences.
+    """
+
+    __slots__ = ("_timer", "_step_name", "_start_times")
+
+    def __init__(self, timer: "InferenceStepTimer", step_name: str):
+        self._timer = timer
+        self._step_name = step_name
+        self._start_times: Dict[int, float] = {}
+
+    def __enter__(self):
+        if self._timer.enabled or self._timer.recording:
+            self._start_times[threading.get_ident()] = time.monotonic()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        timer = self._timer
+        start_time = self._start_times.pop(threading.get_ident(), None)
+        if exc_type is not None or start_time is None:
+            return
+        if timer.enabled:
+            for callback in timer._callbacks:
+                callback()
+            runtime = (time.monotonic() - start_time) * 1000
+            timer.inference_time[self._step_name] += runtime
+            if timer.recording:
+                timer.telemetry.record(self._step_name, runtime)
+        elif timer.recording:
+            timer.telemetry.record(self._step_name, (time.monotonic() - start_time) * 1000)
+
+
 class InferenceStepTimer:
-    """Context manager for measuring inference step time."""
+    """Context manager for measuring inference step time.
 
-    def __init__(self, inference_time: InferenceTime, enabled: bool = False, callbacks: Optional[List] = None):
+    Measurements of the enabled timer run the callbacks after each step, e.g. to synchronize CUDA streams,
+    and are stored in `inference_time`. Independently, steps of inferences sampled by the telemetry are recorded
+    without running the callbacks.
+    """
+
+    def __init__(
+        self,
+        inference_time: InferenceTime,
+        enabled: bool = False,
+        callbacks: Optional[List] = None,
+        telemetry: Optional["InferenceTelemetry"] = None,
+    ):
         """Initialize object.
 
         Args:
             inference_time: InferenceTime object to store measured time.
             enabled: Flag indicating if timer is enabled.
             callbacks: List of callbacks to call after each step. E.g. to synchronize CUDA streams.
+            telemetry: Telemetry recording steps of sampled inferences.
         """
         self.inference_time = inference_time
         self.enabled = enabled
+        self.telemetry = telemetry
+        self.recording = False
         self._callbacks = callbacks or []
+        self._steps: Dict[str, _StepMeasurement] = {}
+
+    def measure_step(self, step_name: Union[str, InferenceStep]) -> _StepMeasurement:
+        """Context manager for measuring nested inference step time.
 
-    @contextlib.contextmanager
-    def measure_step(self, step_name: Union[str, InferenceStep]):
-        """Context manager for measuring nested inference step time."""
+        Context managers are created once per step and reused, so the same step must not be nested in itself.
+        """
         step_name = step_name.value if isinstance(step_name, InferenceStep) else step_name
-        if self.enabled:
-            start_time = time.monotonic()
-            yield
-            for callback in self._callbacks:
-                callback()
-            end_time = time.monotonic()
-            runtime = (end_time - start_time) * 1000
-            self.inference_time[step_name] += runtime
-        else:
-            yield
+        measurement = self._steps.get(step_name)
+        if measurement is None:
+            measurement = self._steps[step_name] = _StepMeasurement(self, step_name)
+        return measurement
 
 
 class NavigatorRunner(abc.ABC):
@@ -126,6 +173,7 @@ class NavigatorRunner(abc.ABC):
         self._enable_timer = enable_timer
         self._inference_time = InferenceTime()
         self.is_active = False
+        self.is_persistent = False
 
         self._inference_step_timer = InferenceStepTimer(self._inference_time, enabled=self._enable_timer)
 
@@ -136,6 +184,15 @@ class NavigatorRunner(abc.ABC):
         """Property for obtaining model object."""
         return self._model
 
+    def set_call_options(self, enable_timer: bool = False, **_kwargs) -> None:
+        """Set options which may change between uses of the same runner without loading the model again.
+
+        Args:
+            enable_timer: Flag indicating if timer should be enabled
+        """
+        self._enable_timer = enable_timer
+        self._inference_step_timer.enabled = enable_timer
+
     @property
     def input_metadata(self) -> TensorMetadata:
         """Property for obtaining model input metadata object."""
@@ -218,6 +275,15 @@ class NavigatorRunner(abc.ABC):
         """
         return False
 
+    @classmethod
+    def is_thread_safe(cls) -> bool:
+        """Flag indicating if runner may be called from multiple threads at once.
+
+        Returns:
+            True if runner serves concurrent callers, False otherwise
+        """
+        return False
+
     def __enter__(self):
         """Activate the runner on entering runner context."""
         self.activate()
@@ -319,11 +385,19 @@ class NavigatorRunner(abc.ABC):
                         f"Note: Expected a shape compatible with: {meta.shape}"
                     )
 
-        self._inference_time = InferenceTime()
-        self._inference_step_timer.inference_time = self._inference_time
-        with self._inference_step_timer.measure_step(InferenceStep.TOTAL):
+        timer = self._inference_step_timer
+        if timer.enabled:
+            self._inference_time = InferenceTime()
+            timer.inference_time = self._inference_time
+        timer.recording = timer.telemetry is not None and timer.telemetry.start()
+
+        with timer.measure_step(InferenceStep.TOTAL):
             output = self.infer_impl(feed_dict, *args, **kwargs)
 
+        if timer.recording:
+            timer.recording = False
+            timer.telemetry.commit()
+
         if check_inputs:
             validate_sample_output(output, self.return_type)
 
@@ -345,6 +419,38 @@ class NavigatorRunner(abc.ABC):
             )
         return self._inference_time
 
+    @property
+    def telemetry(self) -> Optional["InferenceTelemetry"]:
+        """Telemetry of inference steps or None when it is not enabled."""
+        return self._inference_step_timer.telemetry
+
+    def enable_telemetry(self, capacity: Optional[int] = None, sampling_interval: int = 1) -> "InferenceTelemetry":
+        """Record step times of inferences in a ring buffer for monitoring of the runner in production.
+
+        Recording does not synchronize devices and does not allocate memory per inference. Statistics are
+        computed on demand with `telemetry.snapshot()` or exported with `telemetry.to_prometheus()`.
+
+        Args:
+            capacity: Number of the last sampled inferences used for statistics. Defaults to 1024.
+            sampling_interval: Record every n-th inference
+
+        Returns:
+            InferenceTelemetry of the runner
+        """
+        from model_navigator.runners.telemetry import DEFAULT_CAPACITY, InferenceTelemetry
+
+        self._inference_step_timer.telemetry = InferenceTelemetry(
+            runner_name=self.name(),
+            capacity=capacity or DEFAULT_CAPACITY,
+            sampling_interval=sampling_interval,
+        )
+        return self._inference_step_timer.telemetry
+
+    def disable_telemetry(self) -> None:
+        """Stop recording step times of inferences."""
+        self._inference_step_timer.telemetry = None
+        self._inference_step_timer.recording = False
+
     def deactivate(self):
         """Deactivate the runner. For example, this may involve freeing CPU or GPU memory."""
         if not self.is_active:
@@ -355,6 +461,13 @@ class NavigatorRunner(abc.ABC):
             )
             return
 
+        if self.is_persistent:
+            LOGGER.debug(
+                f"{self.name()} | Persistent; will not deactivate. "
+                "If you really want to deactivate this runner, set `is_persistent` to False first"
+            )
+            return
+
         self.is_active = None
 
         self.deactivate_impl()
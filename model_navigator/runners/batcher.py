@@ -0,0 +1,364 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Dynamic batching of requests sent to a runner.
+
+Requests are queued and a worker thread concatenates requests with the same input shapes along the batch dimension.
+A batch is inferred once it reaches the maximal batch size or the oldest request waited for the maximal queue delay.
+Outputs are split along the batch dimension and returned to the callers.
+"""
+
+import asyncio
+import collections
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Deque, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from model_navigator.commands.performance.results import ProfilingResults
+from model_navigator.configuration import TensorType
+from model_navigator.core.logger import LOGGER
+from model_navigator.core.tensor import get_tensor_type
+from model_navigator.exceptions import ModelNavigatorRuntimeError, ModelNavigatorWrongParameterError
+from model_navigator.runners.base import NavigatorRunner
+from model_navigator.utils import module
+
+torch = module.lazy_import("torch")
+
+
+class _Request:
+    def __init__(self, feed_dict: Dict[str, Any], batch_dim: int):
+        self.feed_dict = feed_dict
+        self.future = Future()
+        self.arrival_time = time.perf_counter()
+        first_tensor = next(iter(feed_dict.values()))
+        self.batch_size = first_tensor.shape[batch_dim]
+        self.signature = tuple(
+            (name, _get_shape_without_batch_dim(tensor, batch_dim), str(tensor.dtype))
+            for name, tensor in sorted(feed_dict.items())
+        )
+
+
+_STOP = object()
+
+
+class DynamicBatcher:
+    """Dynamic batcher of requests sent to a runner.
+
+    The batcher is safe for concurrent callers and provides blocking and asyncio interfaces. The runner is activated
+    and used only in the worker thread of the batcher.
+
+    Example usage:
+
+        with DynamicBatcher(runner, max_batch_size=16, max_queue_delay=2.0) as batcher:
+            output = batcher.infer(feed_dict)
+            output = await batcher.infer_async(feed_dict)
+    """
+
+    def __init__(
+        self,
+        runner: NavigatorRunner,
+        max_batch_size: int,
+        max_queue_delay: float = 0.0,
+        batch_dim: int = 0,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            runner: Runner used for inference of batches. Inputs have to be NumPy arrays or Torch tensors.
+            max_batch_size: Maximal number of samples in the batch. Larger requests are inferred alone.
+            max_queue_delay: Maximal time in milliseconds the oldest request waits for other requests
+            batch_dim: Batch dimension of inputs and outputs
+
+        Raises:
+            ModelNavigatorWrongParameterError: when the batch size or the delay is not valid
+        """
+        if max_batch_size < 1:
+            raise ModelNavigatorWrongParameterError(f"Maximal batch size must be at least 1, got {max_batch_size}.")
+        if max_queue_delay < 0:
+            raise ModelNavigatorWrongParameterError(f"Maximal queue delay must not be negative, got {max_queue_delay}.")
+
+        self._runner = runner
+        self._max_batch_size = max_batch_size
+        self._max_queue_delay = max_queue_delay
+        self._batch_dim = batch_dim
+
+        self._queue: Deque = collections.deque()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._activation_error = None
+        self.is_active = False
+
+    @classmethod
+    def from_profiling_results(
+        cls,
+        runner: NavigatorRunner,
+        profiling_results: Sequence[ProfilingResults],
+        batch_dim: int = 0,
+        max_batch_size: Optional[int] = None,
+        max_queue_delay: Optional[float] = None,
+    ) -> "DynamicBatcher":
+        """Create batcher with parameters selected from results of runner profiling.
+
+        The maximal batch size is the profiled batch size with the highest throughput. The maximal queue delay
+        is the latency of the smallest profiled batch, so waiting for other requests adds at most the time
+        of a single inference.
+
+        Args:
+            runner: Runner used for inference of batches
+            profiling_results: Results of runner profiling with batch sizes
+            batch_dim: Batch dimension of inputs and outputs
+            max_batch_size: Upper limit of the maximal batch size
+            max_queue_delay: Maximal queue delay in milliseconds used instead of the profiled latency
+
+        Returns:
+            DynamicBatcher
+
+        Raises:
+            ModelNavigatorWrongParameterError: when results were not profiled with batch sizes
+        """
+        results = [result for result in profiling_results if result.batch_size is not None and result.concurrency == 1]
+        if max_batch_size is not None:
+            results = [result for result in results if result.batch_size <= max_batch_size]
+        if not results:
+            raise ModelNavigatorWrongParameterError(
+                "Runner was not profiled with batch sizes. Batching is not possible."
+            )
+
+        best_result = max(results, key=lambda result: result.throughput)
+        if max_queue_delay is None:
+            max_queue_delay = min(results, key=lambda result: result.batch_size).avg_latency
+
+        LOGGER.info(
+            f"Dynamic batcher uses maximal batch size {best_result.batch_size} "
+            f"and maximal queue delay {max_queue_delay:.2f}[ms]."
+        )
+
+        return cls(
+            runner=runner,
+            max_batch_size=best_result.batch_size,
+            max_queue_delay=max_queue_delay,
+            batch_dim=batch_dim,
+        )
+
+    @property
+    def max_batch_size(self) -> int:
+        """Maximal number of samples in the batch."""
+        return self._max_batch_size
+
+    @property
+    def max_queue_delay(self) -> float:
+        """Maximal time in milliseconds the oldest request waits for other requests."""
+        return self._max_queue_delay
+
+    def __enter__(self):
+        """Start the batcher on entering batcher context."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop the batcher on exiting batcher context."""
+        self.stop()
+
+    def start(self) -> None:
+        """Start the worker thread and activate the runner in it."""
+        if self.is_active:
+            LOGGER.debug("Dynamic batcher already started.")
+            return
+
+        ready = threading.Event()
+        self._activation_error = None
+        self._thread = threading.Thread(target=self._worker, args=(ready,), name="DynamicBatcher", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if self._activation_error is not None:
+            self._thread.join()
+            raise self._activation_error
+
+        self.is_active = True
+
+    def stop(self) -> None:
+        """Infer requests already queued, deactivate the runner and stop the worker thread."""
+        if not self.is_active:
+            LOGGER.debug("Dynamic batcher not started.")
+            return
+
+        self.is_active = False
+        with self._condition:
+            self._queue.append(_STOP)
+            self._condition.notify()
+
+        self._thread.join()
+
+    def submit(self, feed_dict: Dict[str, Any]) -> Future:
+        """Queue the request.
+
+        Args:
+            feed_dict: A mapping of input tensor names to tensors with the batch dimension
+
+        Returns:
+            Future with the outputs of the request
+        """
+        if not self.is_active:
+            raise ModelNavigatorRuntimeError("Dynamic batcher must be started prior to sending requests.")
+
+        request = _Request(feed_dict, self._batch_dim)
+        with self._condition:
+            self._queue.append(request)
+            self._condition.notify()
+
+        return request.future
+
+    def infer(self, feed_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue the request and wait for its outputs.
+
+        Args:
+            feed_dict: A mapping of input tensor names to tensors with the batch dimension
+
+        Returns:
+            A dictionary with mapping of output tensor names to tensors of the request
+        """
+        return self.submit(feed_dict).result()
+
+    async def infer_async(self, feed_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue the request and await its outputs without blocking the event loop.
+
+        Args:
+            feed_dict: A mapping of input tensor names to tensors with the batch dimension
+
+        Returns:
+            A dictionary with mapping of output tensor names to tensors of the request
+        """
+        return await asyncio.wrap_future(self.submit(feed_dict))
+
+    def _worker(self, ready: threading.Event) -> None:
+        try:
+            self._runner.activate()
+        except Exception as e:
+            self._activation_error = e
+            ready.set()
+            return
+
+        ready.set()
+        pending: List[_Request] = []
+        stopped = False
+        try:
+            while not stopped or pending:
+                stopped = self._collect(pending, stopped)
+                if pending:
+                    self._infer(self._take_batch(pending))
+        finally:
+            self._runner.deactivate()
+
+    def _collect(self, pending: List[_Request], stopped: bool) -> bool:
+        """Move requests from the queue to pending until the batch is full or the delay of the oldest one passes."""
+        with self._condition:
+            while not stopped:
+                if pending:
+                    if self._compatible_size(pending) >= self._max_batch_size:
+                        break
+                    timeout = pending[0].arrival_time + self._max_queue_delay / 1000 - time.perf_counter()
+                    if timeout <= 0 and not self._queue:
+                        break
+                else:
+                    timeout = None
+
+                if not self._queue:
+                    self._condition.wait(timeout)
+                    continue
+
+                item = self._queue.popleft()
+                if item is _STOP:
+                    stopped = True
+                else:
+                    pending.append(item)
+
+        return stopped
+
+    def _compatible_size(self, pending: List[_Request]) -> int:
+        return sum(request.batch_size for request in pending if request.signature == pending[0].signature)
+
+    def _take_batch(self, pending: List[_Request]) -> List[_Request]:
+        batch = [pending[0]]
+        batch_size = pending[0].batch_size
+        for request in pending[1:]:
+            if request.signature == batch[0].signature and batch_size + request.batch_size <= self._max_batch_size:
+                batch.append(request)
+                batch_size += request.batch_size
+
+        pending[:] = [request for request in pending if request not in batch]
+        return batch
+
+    def _infer(self, batch: List[_Request]) -> None:
+        try:
+            if len(batch) == 1:
+                outputs = [self._infer_request(batch[0])]
+            else:
+                outputs = self._infer_batch(batch)
+
+            for request, output in zip(batch, outputs):
+                request.future.set_result(output)
+        except Exception as e:
+            LOGGER.debug(f"Inference of the batch failed: {e}")
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+
+    def _infer_batch(self, batch: List[_Request]) -> List[Dict[str, Any]]:
+        feed_dict = {
+            name: _concatenate([request.feed_dict[name] for request in batch], self._batch_dim)
+            for name in batch[0].feed_dict
+        }
+        batch_size = sum(request.batch_size for request in batch)
+        outputs = self._runner.infer(feed_dict)
+        if not all(
+            len(tensor.shape) > self._batch_dim and tensor.shape[self._batch_dim] == batch_size
+            for tensor in outputs.values()
+        ):
+            LOGGER.debug("Outputs of the batch cannot be split by batch dimension. Inferring requests one by one.")
+            return [self._infer_request(request) for request in batch]
+
+        requests_outputs = []
+        start = 0
+        for request in batch:
+            item = (slice(None),) * self._batch_dim + (slice(start, start + request.batch_size),)
+            requests_outputs.append({name: _copy(tensor[item]) for name, tensor in outputs.items()})
+            start += request.batch_size
+
+        return requests_outputs
+
+    def _infer_request(self, request: _Request) -> Dict[str, Any]:
+        outputs = self._runner.infer(request.feed_dict)
+        # runners may reuse output buffers in the next inference
+        return {name: _copy(tensor) for name, tensor in outputs.items()}
+
+
+def _get_shape_without_batch_dim(tensor: Any, batch_dim: int) -> tuple:
+    shape = tuple(tensor.shape)
+    return shape[:batch_dim] + shape[batch_dim + 1 :]
+
+
+def _concatenate(tensors: List[Any], batch_dim: int) -> Any:
+    if get_tensor_type(tensors[0]) == TensorType.TORCH:
+        return torch.cat(tensors, dim=batch_dim)
+
+    return np.concatenate(tensors, axis=batch_dim)
+
+
+def _copy(tensor: Any) -> Any:
+    if get_tensor_type(tensor) == TensorType.TORCH:
+        return tensor.clone()
+
+    return np.array(tensor, copy=True)
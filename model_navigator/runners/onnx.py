@@ -13,17 +13,30 @@
 # limitations under the License.
 """ONNX runners."""
 
-from collections import OrderedDict
+import hashlib
+import json
+import os
+import pathlib
 from typing import Any, Dict, List, Optional, Sequence, Union
 
 import model_navigator.utils.common as utils
-from model_navigator.configuration import Format, TensorType
+from model_navigator.configuration import (
+    Format,
+    OnnxExecutionMode,
+    OnnxGraphOptimizationLevel,
+    OnnxSessionOptions,
+    TensorType,
+)
 from model_navigator.configuration.device import get_id_from_device_string, validate_device_string
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata, get_tensor_type
 from model_navigator.exceptions import ModelNavigatorConfigurationError, ModelNavigatorNotFoundError
 from model_navigator.frameworks import is_torch_available
-from model_navigator.frameworks.onnx.utils import ONNX_RT_TYPE_TO_NP
+from model_navigator.frameworks.onnx.utils import (
+    ONNX_RT_TYPE_TO_NP,
+    get_onnxrt_optimized_model_key_path,
+    get_onnxrt_optimized_model_path,
+)
 from model_navigator.frameworks.tensorrt.cuda import DeviceView
 from model_navigator.runners.base import DeviceKind, InferenceStep, NavigatorRunner
 from model_navigator.runners.registry import register_runner
@@ -33,6 +46,9 @@ onnxrt = module.lazy_import("onnxruntime")
 np = module.lazy_import("numpy")
 torch = module.lazy_import("torch")
 
+MAX_OUTPUTS_SHAPES_CACHE_SIZE = 64
+MODEL_HASH_CHUNK_SIZE = 1024 * 1024
+
 provider2device = {
     "CPUExecutionProvider": DeviceKind.CPU,
     "CUDAExecutionProvider": DeviceKind.CUDA,
@@ -51,6 +67,8 @@ class SessionFromOnnx:
         model_bytes: Union[bytes, str],
         providers: Optional[Sequence[str]] = None,
         provider_options: Optional[Sequence[Dict[Any, Any]]] = None,
+        session_options: Optional[OnnxSessionOptions] = None,
+        optimized_model_path: Optional[pathlib.Path] = None,
     ):
         """Builds an ONNX-Runtime inference session.
 
@@ -63,10 +81,16 @@ class SessionFromOnnx:
                     match the "CPUExecutionProvider".
                     Defaults to ``["CUDA"]``.
             provider_options: A dictionary of options to pass to the execution provider.
+            session_options: Options of the inference session. Defaults of ONNX-Runtime are used when not provided.
+            optimized_model_path: Path where the model optimized by ONNX-Runtime is stored. When the key stored
+                    next to the optimized model matches the hash of the model, the ONNX-Runtime version, providers
+                    and session options, it is loaded without repeating graph optimizations.
         """
         self._model_bytes_or_path = model_bytes
         self.providers = utils.default(providers, ["cuda"])
         self.provider_options = provider_options
+        self.session_options = session_options
+        self.optimized_model_path = optimized_model_path
 
     def __call__(self, *args, **kwargs):
         """Invokes ``call_impl``.
@@ -95,14 +119,107 @@ class SessionFromOnnx:
                 )
             providers.append(matched_prov)
 
+        sess_options = self._get_session_options()
+        optimized_model_key = self._get_optimized_model_key(model_bytes, providers)
+        if self._is_optimized_model_cached(optimized_model_key):
+            LOGGER.info(f"Loading model optimized by ONNX-Runtime from {self.optimized_model_path}")
+            model_bytes = self.optimized_model_path.as_posix()
+            sess_options.graph_optimization_level = onnxrt.GraphOptimizationLevel.ORT_DISABLE_ALL
+            temp_optimized_model_path = None
+        elif self.optimized_model_path is not None:
+            # the optimized model is moved to the final path only after session creation finished
+            temp_optimized_model_path = self.optimized_model_path.with_name(
+                f".{self.optimized_model_path.name}.{os.getpid()}.tmp"
+            )
+            sess_options.optimized_model_filepath = temp_optimized_model_path.as_posix()
+        else:
+            temp_optimized_model_path = None
+
         LOGGER.info(f"Creating ONNX-Runtime Inference Session with providers: {providers}")
-        return onnxrt.InferenceSession(model_bytes, providers=providers, provider_options=self.provider_options)
+        session = onnxrt.InferenceSession(
+            model_bytes, sess_options=sess_options, providers=providers, provider_options=self.provider_options
+        )
+
+        if temp_optimized_model_path is not None and temp_optimized_model_path.exists():
+            os.replace(temp_optimized_model_path, self.optimized_model_path)
+            temp_optimized_model_path.write_text(optimized_model_key)
+            os.replace(temp_optimized_model_path, get_onnxrt_optimized_model_key_path(self.optimized_model_path))
+            LOGGER.info(f"Model optimized by ONNX-Runtime stored in {self.optimized_model_path}")
+
+        return session
+
+    def _get_optimized_model_key(self, model_bytes: Union[bytes, str], providers: List[str]) -> Optional[str]:
+        if self.optimized_model_path is None:
+            return None
+
+        # modification times are not preserved when the package is extracted, so the model content is compared
+        model_hash = hashlib.sha256()
+        if isinstance(model_bytes, str):
+            with open(model_bytes, "rb") as model_file:
+                while chunk := model_file.read(MODEL_HASH_CHUNK_SIZE):
+                    model_hash.update(chunk)
+        else:
+            model_hash.update(model_bytes)
+
+        return json.dumps(
+            {
+                "model_sha256": model_hash.hexdigest(),
+                "onnxruntime_version": onnxrt.__version__,
+                "providers": providers,
+                "session_options": self.session_options.to_dict(parse=True) if self.session_options else None,
+            },
+            sort_keys=True,
+        )
+
+    def _is_optimized_model_cached(self, optimized_model_key: Optional[str]) -> bool:
+        if optimized_model_key is None or not self.optimized_model_path.exists():
+            return False
+
+        key_path = get_onnxrt_optimized_model_key_path(self.optimized_model_path)
+        return key_path.exists() and key_path.read_text() == optimized_model_key
+
+    def _get_session_options(self):
+        sess_options = onnxrt.SessionOptions()
+        if self.session_options is None:
+            return sess_options
+
+        if self.session_options.intra_op_num_threads is not None:
+            sess_options.intra_op_num_threads = self.session_options.intra_op_num_threads
+        if self.session_options.inter_op_num_threads is not None:
+            sess_options.inter_op_num_threads = self.session_options.inter_op_num_threads
+        if self.session_options.execution_mode is not None:
+            sess_options.execution_mode = {
+                OnnxExecutionMode.SEQUENTIAL: onnxrt.ExecutionMode.ORT_SEQUENTIAL,
+                OnnxExecutionMode.PARALLEL: onnxrt.ExecutionMode.ORT_PARALLEL,
+            }[self.session_options.execution_mode]
+        if self.session_options.graph_optimization_level is not None:
+            sess_options.graph_optimization_level = {
+                OnnxGraphOptimizationLevel.DISABLE: onnxrt.GraphOptimizationLevel.ORT_DISABLE_ALL,
+                OnnxGraphOptimizationLevel.BASIC: onnxrt.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+                OnnxGraphOptimizationLevel.EXTENDED: onnxrt.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+                OnnxGraphOptimizationLevel.ALL: onnxrt.GraphOptimizationLevel.ORT_ENABLE_ALL,
+            }[self.session_options.graph_optimization_level]
+        if self.session_options.enable_cpu_mem_arena is not None:
+            sess_options.enable_cpu_mem_arena = self.session_options.enable_cpu_mem_arena
+        if self.session_options.enable_mem_pattern is not None:
+            sess_options.enable_mem_pattern = self.session_options.enable_mem_pattern
+
+        return sess_options
 
 
 class _BaseOnnxrtRunner(NavigatorRunner):
     _provider: str
+    _supports_optimized_model_cache: bool = True
 
-    def __init__(self, disable_fallback=True, device: Optional[str] = None, *args, **kwargs) -> None:
+    def __init__(
+        self,
+        disable_fallback=True,
+        device: Optional[str] = None,
+        session_options: Optional[Union[OnnxSessionOptions, Dict]] = None,
+        cache_optimized_model: Optional[bool] = False,
+        *args,
+        **kwargs,
+    ) -> None:
         super().__init__(*args, **kwargs)
         self._disable_fallback = disable_fallback
 
@@ -119,8 +236,20 @@ class _BaseOnnxrtRunner(NavigatorRunner):
         else:
             provider_options = None
 
+        if isinstance(session_options, dict):
+            session_options = OnnxSessionOptions.from_dict(session_options)
+
+        if cache_optimized_model and self._supports_optimized_model_cache:
+            optimized_model_path = get_onnxrt_optimized_model_path(self._model, self._provider)
+        else:
+            optimized_model_path = None
+
         self._sess = SessionFromOnnx(
-            self._model.as_posix(), providers=[self._provider], provider_options=provider_options
+            self._model.as_posix(),
+            providers=[self._provider],
+            provider_options=provider_options,
+            session_options=session_options,
+            optimized_model_path=optimized_model_path,
         )
 
     @classmethod
@@ -162,6 +291,16 @@ class _BaseOnnxrtRunner(NavigatorRunner):
 
     def activate_impl(self):
         self.sess, _ = utils.invoke_if_callable(self._sess)
+        self._check_fallback()
+
+    def set_call_options(self, enable_timer: bool = False, disable_fallback: bool = True, **kwargs) -> None:
+        """Set timer and provider fallback of the runner which may be already activated."""
+        super().set_call_options(enable_timer=enable_timer, **kwargs)
+        self._disable_fallback = disable_fallback
+        if self.is_active:
+            self._check_fallback()
+
+    def _check_fallback(self):
         if self._disable_fallback:
             LOGGER.info("Disable fallback for ONNX execution provider.")
             active_providers = self.sess.get_providers()
@@ -179,10 +318,27 @@ class _BaseOnnxrtRunner(NavigatorRunner):
 
 
 class OnnxrtCPURunner(_BaseOnnxrtRunner):
-    """ONNX runner for CPU runtime provider."""
+    """ONNX runner for CPU runtime provider.
+
+    Inference binds inputs and preallocated outputs with IOBinding. Shapes of outputs are remembered for shapes
+    of inputs, so after the first inference for given input shapes outputs are written directly to arrays
+    allocated upfront instead of being copied from buffers allocated by ONNX Runtime.
+    """
 
     _provider = "CPUExecutionProvider"
 
+    def __init__(self, *args, reuse_output_buffers: bool = False, **kwargs) -> None:
+        """Initialize runner.
+
+        Args:
+            reuse_output_buffers: Return the same output arrays from inferences on inputs with the same shapes,
+                so steady-state inference does not allocate memory. Outputs are valid only until the next inference.
+            args: Additional runner arguments
+            kwargs: Additional runner keyword arguments
+        """
+        super().__init__(*args, **kwargs)
+        self._reuse_output_buffers = reuse_output_buffers
+
     @classmethod
     def name(cls) -> str:
         """Get runner name."""
@@ -193,25 +349,118 @@ class OnnxrtCPURunner(_BaseOnnxrtRunner):
         """Return supported devices for runner."""
         return [DeviceKind.CPU]
 
+    def activate_impl(self):
+        """Activate runner and prepare bindings."""
+        super().activate_impl()
+        self._input_names = [node.name for node in self.sess.get_inputs()]
+        self._output_names = [
+            node.name
+            for node in self.sess.get_outputs()
+            if not self.output_metadata or node.name in self.output_metadata  # filter outputs if output_metadata is set
+        ]
+        # IOBinding is used only for tensors of numeric types
+        self._io_binding = (
+            self.sess.io_binding()
+            if all(
+                ONNX_RT_TYPE_TO_NP.get(node.type) not in (None, str)
+                for node in [*self.sess.get_inputs(), *self.sess.get_outputs()]
+            )
+            else None
+        )
+        self._bound_inputs = {}
+        self._bound_outputs = None
+        self._preallocate_outputs = True
+        self._outputs_shapes = {}
+        self._outputs_buffers = {}
+
+    def deactivate_impl(self):
+        """Deactivate runner and release bindings."""
+        self._io_binding = None
+        self._bound_inputs = {}
+        self._bound_outputs = None
+        self._outputs_buffers = {}
+        super().deactivate_impl()
+
     def infer_impl(self, feed_dict, *args, **kwargs):
         """Run inference."""
         assert self.is_active and hasattr(self, "sess"), "Runner must be activated."
 
-        input_metadata = self.get_onnx_input_metadata()
-        feed_dict = {name: self._to_numpy(tensor) for name, tensor in feed_dict.items() if name in input_metadata}
-
-        inference_outputs = self.sess.run(None, feed_dict)
-        out_dict = OrderedDict()
-        for node, out in zip(self.sess.get_outputs(), inference_outputs):
-            out_dict[node.name] = out
-
-        if self.output_metadata is None:
-            return out_dict
-
-        if self.output_metadata:  # filter outputs if output_metadata is set
-            out_dict = {k: v for k, v in out_dict.items() if k in self.output_metadata}
+        feed_dict = {name: self._to_numpy(feed_dict[name]) for name in self._input_names if name in feed_dict}
+        if self._io_binding is None:
+            inference_outputs = self.sess.run(self._output_names, feed_dict)
+        else:
+            inference_outputs = self._infer_with_io_binding(feed_dict)
+
+        return dict(zip(self._output_names, inference_outputs))
+
+    def _infer_with_io_binding(self, feed_dict):
+        # feed_dict holds only model inputs, array of a missing input would be reused from the previous inference
+        if len(feed_dict) != len(self._input_names):
+            missing_names = [name for name in self._input_names if name not in feed_dict]
+            raise ValueError(f"{self.name()} | Required inputs {missing_names} are missing in `feed_dict`.")
+
+        io_binding = self._io_binding
+        inputs_shapes = tuple((tensor.shape, tensor.dtype) for tensor in feed_dict.values())
+        for (name, tensor), tensor_spec in zip(feed_dict.items(), inputs_shapes):
+            # inputs are bound without copy, so the binding stays valid as long as the same array is passed;
+            # bound arrays are kept alive until they are replaced
+            bound_tensor, bound_spec = self._bound_inputs.get(name, (None, None))
+            if bound_tensor is not tensor or bound_spec != tensor_spec:
+                if tensor.flags.c_contiguous:
+                    self._bound_inputs[name] = (tensor, tensor_spec)
+                else:
+                    tensor = np.ascontiguousarray(tensor)
+                    self._bound_inputs[name] = (tensor, None)
+                io_binding.bind_cpu_input(name, tensor)
 
-        return out_dict
+        outputs = self._get_outputs_buffers(inputs_shapes)
+        if outputs is not None:
+            if outputs is not self._bound_outputs:
+                for name, output in zip(self._output_names, outputs):
+                    io_binding.bind_output(name, "cpu", 0, output.dtype, output.shape, output.ctypes.data)
+                self._bound_outputs = outputs
+            try:
+                self.sess.run_with_iobinding(io_binding)
+                return outputs
+            except Exception as e:
+                # shapes of outputs depend on values of inputs
+                LOGGER.debug(f"Disabling preallocation of outputs after inference failed: {e}")
+                self._preallocate_outputs = False
+                self._outputs_buffers = {}
+
+        for name in self._output_names:
+            io_binding.bind_output(name, "cpu")
+        self._bound_outputs = None
+        self.sess.run_with_iobinding(io_binding)
+        outputs = io_binding.copy_outputs_to_cpu()
+
+        if self._preallocate_outputs:
+            if len(self._outputs_shapes) >= MAX_OUTPUTS_SHAPES_CACHE_SIZE:
+                self._outputs_shapes.clear()
+                self._outputs_buffers.clear()
+            self._outputs_shapes[inputs_shapes] = [(output.shape, output.dtype) for output in outputs]
+            if self._reuse_output_buffers:
+                self._outputs_buffers[inputs_shapes] = outputs
+
+        return outputs
+
+    def _get_outputs_buffers(self, inputs_shapes):
+        if not self._preallocate_outputs:
+            return None
+
+        outputs = self._outputs_buffers.get(inputs_shapes)
+        if outputs is not None:
+            return outputs
+
+        outputs_shapes = self._outputs_shapes.get(inputs_shapes)
+        if outputs_shapes is None:
+            return None
+
+        outputs = [np.empty(shape, dtype=dtype) for shape, dtype in outputs_shapes]
+        if self._reuse_output_buffers:
+            self._outputs_buffers[inputs_shapes] = outputs
+
+        return outputs
 
     @staticmethod
     def _to_numpy(tensor):
@@ -338,6 +587,8 @@ class OnnxrtTensorRTRunner(OnnxrtCUDARunner):
     """ONNX runner for TensorRT runtime provider."""
 
     _provider = "TensorrtExecutionProvider"
+    # TensorRT provider builds engines from the original graph
+    _supports_optimized_model_cache = False
 
     @classmethod
     def name(cls) -> str:
@@ -0,0 +1,382 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Pool of runner instances serving concurrent requests.
+
+A single runner holds one session or context and is not safe for concurrent callers. The pool keeps several
+activated instances of the same runner, in the current process or in worker processes, and dispatches each
+request to a free instance. Free instances are taken in the order they were released, so under a constant load
+requests are distributed in a round-robin manner.
+
+The pool provides the `infer` and `last_inference_time` methods of `NavigatorRunner`, so its throughput for
+growing number of requests in flight can be profiled with `Profiler` and the `concurrency` of `OptimizationProfile`.
+"""
+
+import dataclasses
+import multiprocessing as mp
+import queue
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
+
+from model_navigator.core.logger import LOGGER
+from model_navigator.exceptions import ModelNavigatorRuntimeError, ModelNavigatorWrongParameterError
+from model_navigator.runners.base import InferenceStep, InferenceTime, NavigatorRunner
+from model_navigator.utils.common import DataObject
+
+
+@dataclasses.dataclass
+class RunnerPoolMetrics(DataObject):
+    """Metrics of requests served by the runner pool.
+
+    Args:
+        num_instances: Number of runner instances in the pool
+        request_count: Number of served requests
+        avg_queue_time: Average time in milliseconds requests waited for a free instance
+        max_queue_time: Maximal time in milliseconds a request waited for a free instance
+        max_queue_length: Maximal number of requests waiting for a free instance at once
+        utilization: Fraction of time each instance was busy with inference
+    """
+
+    num_instances: int
+    request_count: int
+    avg_queue_time: float
+    max_queue_time: float
+    max_queue_length: int
+    utilization: List[float]
+
+    @property
+    def avg_utilization(self) -> float:
+        """Average utilization of instances."""
+        return sum(self.utilization) / len(self.utilization)
+
+
+def _get_inference_time(runner: NavigatorRunner) -> InferenceTime:
+    try:
+        return InferenceTime(**runner.last_inference_time())
+    except RuntimeError:
+        # timer of the runner is disabled
+        return InferenceTime()
+
+
+class _LocalInstance:
+    """Runner instance in the current process."""
+
+    def __init__(self, runner_factory: Callable[[], NavigatorRunner]):
+        self._runner_factory = runner_factory
+        self._runner = None
+
+    def activate(self) -> None:
+        self._runner = self._runner_factory()
+        self._runner.activate()
+
+    def infer(self, feed_dict: Dict[str, Any], kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], InferenceTime]:
+        output = self._runner.infer(feed_dict, **kwargs)
+        return output, _get_inference_time(self._runner)
+
+    def deactivate(self) -> None:
+        if self._runner is not None:
+            self._runner.deactivate()
+            self._runner = None
+
+
+def _worker_loop(connection, runner_factory: Callable[[], NavigatorRunner]) -> None:
+    try:
+        runner = runner_factory()
+        runner.activate()
+    except Exception:
+        connection.send((False, traceback.format_exc()))
+        connection.close()
+        return
+
+    connection.send((True, None))
+    try:
+        while True:
+            request = connection.recv()
+            if request is None:
+                break
+
+            feed_dict, kwargs = request
+            try:
+                output = runner.infer(feed_dict, **kwargs)
+                connection.send((True, (output, dict(_get_inference_time(runner)))))
+            except Exception:
+                connection.send((False, traceback.format_exc()))
+    finally:
+        runner.deactivate()
+        connection.close()
+
+
+class _ProcessInstance:
+    """Runner instance in the worker process.
+
+    Inputs and outputs are sent through a pipe, so the factory, inputs and outputs must be picklable.
+    """
+
+    def __init__(self, runner_factory: Callable[[], NavigatorRunner], name: str):
+        self._runner_factory = runner_factory
+        self._name = name
+        self._connection = None
+        self._process = None
+
+    def activate(self) -> None:
+        self._connection, child_connection = mp.Pipe()
+        self._process = mp.Process(target=_worker_loop, args=(child_connection, self._runner_factory), name=self._name)
+        self._process.start()
+        child_connection.close()
+        self._receive(f"Runner activation in worker {self._name} failed")
+
+    def infer(self, feed_dict: Dict[str, Any], kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], InferenceTime]:
+        self._connection.send((feed_dict, kwargs))
+        output, inference_time = self._receive(f"Inference in worker {self._name} failed")
+        return output, InferenceTime(**inference_time)
+
+    def deactivate(self) -> None:
+        if self._process is None:
+            return
+
+        if self._process.is_alive():
+            try:
+                self._connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self._process.join()
+
+        self._connection.close()
+        self._process = None
+
+    def _receive(self, message: str) -> Any:
+        try:
+            success, result = self._connection.recv()
+        except (EOFError, OSError):
+            self._process.join()
+            raise ModelNavigatorRuntimeError(
+                f"{message}. Worker exited unexpectedly with {self._process.exitcode}."
+            ) from None
+
+        if not success:
+            raise ModelNavigatorRuntimeError(f"{message}:\n{result}")
+
+        return result
+
+
+class RunnerPool:
+    """Pool of activated runner instances safe for concurrent callers.
+
+    Example usage:
+
+        with RunnerPool(runner_factory=lambda: RunnerType(...), num_instances=4) as pool:
+            pool.infer(...)
+    """
+
+    def __init__(
+        self,
+        runner_factory: Callable[[], NavigatorRunner],
+        num_instances: int,
+        use_processes: bool = False,
+        name: str = "RunnerPool",
+    ) -> None:
+        """Initialize the pool. Runner instances are created on activation.
+
+        Args:
+            runner_factory: Callable creating a new runner instance. When `use_processes` is set, it is sent
+                to worker processes and must be picklable.
+            num_instances: Number of runner instances
+            use_processes: Run each instance in a dedicated worker process instead of the current process.
+                Requests and outputs are then sent between processes, which is worth it when inference holds the GIL.
+            name: Name of the pool
+
+        Raises:
+            ModelNavigatorWrongParameterError: when number of instances is lower than 1
+        """
+        if num_instances < 1:
+            raise ModelNavigatorWrongParameterError(f"Number of instances must be at least 1, got {num_instances}.")
+
+        self._runner_factory = runner_factory
+        self._num_instances = num_instances
+        self._use_processes = use_processes
+        self._name = name
+        self.is_active = False
+
+        self._instances = []
+        self._free_instances = queue.Queue()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.reset_metrics()
+
+    def name(self) -> str:
+        """Name of the pool."""
+        return self._name
+
+    @property
+    def num_instances(self) -> int:
+        """Number of runner instances in the pool."""
+        return self._num_instances
+
+    @classmethod
+    def is_stabilized(cls) -> bool:
+        """Pool does not stabilize measurements on its own."""
+        return False
+
+    @classmethod
+    def is_thread_safe(cls) -> bool:
+        """Pool dispatches concurrent requests to free instances."""
+        return True
+
+    def __enter__(self):
+        """Activate the pool on entering pool context."""
+        self.activate()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Deactivate the pool on exiting pool context."""
+        self.deactivate()
+
+    def activate(self) -> None:
+        """Create and activate all runner instances.
+
+        Instances are activated concurrently. When any of them fails, already activated instances are deactivated.
+        """
+        if self.is_active:
+            LOGGER.debug(f"{self.name()} | Already active; will not activate again.")
+            return
+
+        LOGGER.info(f"Activating {self._num_instances} instances of {self.name()}.")
+        if self._use_processes:
+            self._instances = [
+                _ProcessInstance(self._runner_factory, name=f"{self.name()}-{instance_id}")
+                for instance_id in range(self._num_instances)
+            ]
+        else:
+            self._instances = [_LocalInstance(self._runner_factory) for _ in range(self._num_instances)]
+
+        with ThreadPoolExecutor(max_workers=self._num_instances) as executor:
+            futures = [executor.submit(instance.activate) for instance in self._instances]
+        try:
+            for future in futures:
+                future.result()
+        except Exception:
+            self._deactivate_instances()
+            raise
+
+        for instance_id in range(self._num_instances):
+            self._free_instances.put(instance_id)
+
+        self.reset_metrics()
+        self.is_active = True
+
+    def infer(self, feed_dict: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+        """Run inference on the first free instance.
+
+        Blocks until any instance is free. Must be called only after `activate()` and before `deactivate()`.
+
+        Args:
+            feed_dict: A mapping of input tensor names to corresponding input tensors.
+            kwargs: Additional arguments passed to `infer` of the runner
+
+        Returns:
+            A dictionary with mapping of output tensor names to their corresponding tensors.
+        """
+        if not self.is_active:
+            raise ModelNavigatorRuntimeError(f"{self.name()} | Must be activated prior to calling infer()")
+
+        start = time.perf_counter()
+        with self._lock:
+            self._queue_length += 1
+            self._max_queue_length = max(self._max_queue_length, self._queue_length)
+
+        instance_id = self._free_instances.get()
+        dispatch = time.perf_counter()
+        with self._lock:
+            self._queue_length -= 1
+
+        try:
+            output, inference_time = self._instances[instance_id].infer(feed_dict, kwargs)
+        finally:
+            end = time.perf_counter()
+            self._free_instances.put(instance_id)
+            with self._lock:
+                self._request_count += 1
+                self._total_queue_time += dispatch - start
+                self._max_queue_time = max(self._max_queue_time, dispatch - start)
+                self._busy_time[instance_id] += end - dispatch
+
+        # total time of the request includes waiting for a free instance
+        inference_time[InferenceStep.TOTAL.value] = (end - start) * 1000
+        self._local.inference_time = inference_time
+
+        return output
+
+    def last_inference_time(self) -> InferenceTime:
+        """Returns the inference time in milliseconds of the last request sent from the current thread.
+
+        Returns:
+            Inference time of the runner instance with total time including the time in the queue.
+        """
+        inference_time = getattr(self._local, "inference_time", None)
+        if inference_time is None:
+            raise RuntimeError(
+                f"{self.name()} | Inference time not available. "
+                "Make sure to call `infer()` before calling `last_inference_time()`."
+            )
+
+        return inference_time
+
+    def metrics(self) -> RunnerPoolMetrics:
+        """Collect metrics of requests served since activation or the last `reset_metrics`.
+
+        Returns:
+            RunnerPoolMetrics with queueing and utilization of instances
+        """
+        with self._lock:
+            elapsed = time.perf_counter() - self._metrics_start
+            return RunnerPoolMetrics(
+                num_instances=self._num_instances,
+                request_count=self._request_count,
+                avg_queue_time=self._total_queue_time * 1000 / self._request_count if self._request_count else 0.0,
+                max_queue_time=self._max_queue_time * 1000,
+                max_queue_length=self._max_queue_length,
+                utilization=[min(busy_time / elapsed, 1.0) if elapsed > 0 else 0.0 for busy_time in self._busy_time],
+            )
+
+    def reset_metrics(self) -> None:
+        """Reset collected metrics."""
+        with self._lock:
+            self._metrics_start = time.perf_counter()
+            self._request_count = 0
+            self._total_queue_time = 0.0
+            self._max_queue_time = 0.0
+            self._queue_length = 0
+            self._max_queue_length = 0
+            self._busy_time = [0.0] * self._num_instances
+
+    def deactivate(self) -> None:
+        """Deactivate all runner instances."""
+        if not self.is_active:
+            LOGGER.debug(f"{self.name()} | Not active; will not deactivate.")
+            return
+
+        self.is_active = False
+        self._deactivate_instances()
+
+    def _deactivate_instances(self) -> None:
+        for instance in self._instances:
+            try:
+                instance.deactivate()
+            except Exception as e:
+                LOGGER.warning(f"{self.name()} | Instance deactivation failed: {e}")
+
+        self._instances = []
+        self._free_instances = queue.Queue()
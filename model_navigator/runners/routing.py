@@ -0,0 +1,274 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Routing of requests to runners selected per batch size.
+
+Profiling often shows that different runtimes win at different batch sizes. The routing table assigns ranges
+of batch sizes to the runner with the lowest median latency at the profiled batch sizes, and the routing runner
+keeps all runners from the table activated and sends each request to the runner of its range.
+"""
+
+import bisect
+import dataclasses
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from model_navigator.commands.performance.results import ProfilingResults
+from model_navigator.configuration import DeviceKind, Format, TensorType
+from model_navigator.core.logger import LOGGER
+from model_navigator.exceptions import ModelNavigatorRuntimeError, ModelNavigatorWrongParameterError
+from model_navigator.runners.base import NavigatorRunner
+from model_navigator.utils.common import DataObject
+
+
+@dataclasses.dataclass
+class RouteCandidate:
+    """Runtime which may serve a range of batch sizes.
+
+    Args:
+        model_key: Key of the model in the package status
+        runner_name: Name of the runner
+        profiling_results: Profiling results of the runner with batch sizes
+        min_batch_size: Minimal batch size supported by the model
+        max_batch_size: Maximal batch size supported by the model, None when not limited
+    """
+
+    model_key: str
+    runner_name: str
+    profiling_results: Sequence[ProfilingResults]
+    min_batch_size: int = 1
+    max_batch_size: Optional[int] = None
+
+
+@dataclasses.dataclass
+class RouteBucket(DataObject):
+    """Range of batch sizes served by a single runtime.
+
+    Args:
+        min_batch_size: Minimal batch size of requests in the bucket
+        max_batch_size: Maximal batch size of requests in the bucket, None when not limited
+        model_key: Key of the model in the package status
+        runner_name: Name of the runner
+        latency: Median latency in milliseconds at the largest profiled batch size of the bucket
+    """
+
+    min_batch_size: int
+    max_batch_size: Optional[int]
+    model_key: str
+    runner_name: str
+    latency: float
+
+    def __str__(self) -> str:
+        """Return range of the bucket with the runtime."""
+        max_batch_size = "inf" if self.max_batch_size is None else self.max_batch_size
+        return (
+            f"[{self.min_batch_size}, {max_batch_size}] -> {self.model_key} on {self.runner_name} "
+            f"({self.latency:.4f} [ms])"
+        )
+
+
+def get_routing_table(candidates: Sequence[RouteCandidate]) -> List[RouteBucket]:
+    """Assign ranges of batch sizes to runtimes with the lowest median latency.
+
+    Each profiled batch size closes a range starting after the previous profiled batch size. The range is
+    served by the runtime with the lowest latency at the closing batch size among runtimes which support the whole
+    range and were profiled up to it. Latency between batch sizes profiled for the runtime is interpolated.
+    Requests larger than the largest profiled batch size are served by the runtime of the last range.
+
+    Args:
+        candidates: Runtimes which may serve requests
+
+    Returns:
+        Ordered list of buckets. Buckets do not overlap, but may not cover batch sizes no runtime supports.
+    """
+    curves = {}
+    for candidate in candidates:
+        latencies: Dict[int, List[float]] = {}
+        for result in candidate.profiling_results:
+            if result.batch_size is not None:
+                latencies.setdefault(result.batch_size, []).append(result.p50_latency)
+        if latencies:
+            batch_sizes = sorted(latencies)
+            curves[(candidate.model_key, candidate.runner_name)] = (
+                candidate,
+                batch_sizes,
+                [float(np.mean(latencies[batch_size])) for batch_size in batch_sizes],
+            )
+
+    profiled_batch_sizes = sorted({batch_size for _, batch_sizes, _ in curves.values() for batch_size in batch_sizes})
+
+    buckets: List[RouteBucket] = []
+    min_batch_size = 1
+    for batch_size in profiled_batch_sizes:
+        best = None
+        for candidate, batch_sizes, latencies in curves.values():
+            if not _supports(candidate, min_batch_size, batch_size) or batch_size > batch_sizes[-1]:
+                continue
+            latency = float(np.interp(batch_size, batch_sizes, latencies))
+            if best is None or latency < best[1]:
+                best = (candidate, latency)
+
+        if best is None:
+            LOGGER.debug(f"No runtime supports batch sizes from {min_batch_size} to {batch_size}.")
+            continue
+
+        candidate, latency = best
+        if buckets and (buckets[-1].model_key, buckets[-1].runner_name) == (candidate.model_key, candidate.runner_name):
+            buckets[-1].max_batch_size = batch_size
+            buckets[-1].latency = latency
+        else:
+            buckets.append(
+                RouteBucket(
+                    min_batch_size=min_batch_size,
+                    max_batch_size=batch_size,
+                    model_key=candidate.model_key,
+                    runner_name=candidate.runner_name,
+                    latency=latency,
+                )
+            )
+        min_batch_size = batch_size + 1
+
+    if buckets:
+        last_candidate = curves[(buckets[-1].model_key, buckets[-1].runner_name)][0]
+        buckets[-1].max_batch_size = last_candidate.max_batch_size
+
+    return buckets
+
+
+def _supports(candidate: RouteCandidate, min_batch_size: int, max_batch_size: int) -> bool:
+    return candidate.min_batch_size <= min_batch_size and (
+        candidate.max_batch_size is None or max_batch_size <= candidate.max_batch_size
+    )
+
+
+class RoutingRunner(NavigatorRunner):
+    """Runner sending each request to the runner selected for its batch size.
+
+    Runners are activated and deactivated together with the routing runner.
+
+    Example usage:
+
+        with package.get_routing_runner() as runner:
+            output = runner.infer(feed_dict)
+    """
+
+    def __init__(
+        self,
+        runners: Dict[Tuple[str, str], NavigatorRunner],
+        routing_table: Sequence[RouteBucket],
+        batch_dim: int = 0,
+        return_type: TensorType = TensorType.NUMPY,
+        enable_timer: bool = False,
+    ) -> None:
+        """Initialize the runner.
+
+        Args:
+            runners: Runners used in the routing table, keyed with the model key and the runner name
+            routing_table: Ranges of batch sizes with the runtime serving them, as returned by `get_routing_table`
+            batch_dim: Batch dimension of inputs
+            return_type: A type of return value
+            enable_timer: Flag indicating if timer should be enabled
+
+        Raises:
+            ModelNavigatorWrongParameterError: when the routing table is empty or refers to a missing runner
+        """
+        if not routing_table:
+            raise ModelNavigatorWrongParameterError("Routing table must contain at least one bucket.")
+        for bucket in routing_table:
+            if (bucket.model_key, bucket.runner_name) not in runners:
+                raise ModelNavigatorWrongParameterError(
+                    f"Runner {bucket.runner_name} for model {bucket.model_key} is not provided."
+                )
+
+        self._runners = runners
+        self._routing_table = sorted(routing_table, key=lambda bucket: bucket.min_batch_size)
+        self._min_batch_sizes = [bucket.min_batch_size for bucket in self._routing_table]
+        self._batch_dim = batch_dim
+        self.route_counts = {key: 0 for key in runners}
+
+        first_runner = next(iter(runners.values()))
+        super().__init__(
+            model=None,
+            input_metadata=first_runner.input_metadata,
+            output_metadata=first_runner.output_metadata,
+            return_type=return_type,
+            enable_timer=enable_timer,
+        )
+
+    @property
+    def routing_table(self) -> List[RouteBucket]:
+        """Ranges of batch sizes with the runtime serving them."""
+        return list(self._routing_table)
+
+    @classmethod
+    def format(cls) -> Format:
+        """Runners of any format are called from Python."""
+        return Format.PYTHON
+
+    @classmethod
+    def devices_kind(cls) -> List[DeviceKind]:
+        """Devices are defined by the routed runners."""
+        return [DeviceKind.CPU, DeviceKind.CUDA]
+
+    def get_route(self, batch_size: int) -> Tuple[str, str]:
+        """Return the model key and the runner name serving requests of the batch size.
+
+        Args:
+            batch_size: Batch size of the request
+
+        Returns:
+            Key of the model and name of the runner
+
+        Raises:
+            ModelNavigatorRuntimeError: when no runner in the routing table supports the batch size
+        """
+        idx = bisect.bisect_right(self._min_batch_sizes, batch_size) - 1
+        if idx >= 0:
+            bucket = self._routing_table[idx]
+            if bucket.max_batch_size is None or batch_size <= bucket.max_batch_size:
+                return bucket.model_key, bucket.runner_name
+
+        raise ModelNavigatorRuntimeError(f"No runner in the routing table supports batch size {batch_size}.")
+
+    def activate_impl(self):
+        """Activate all routed runners."""
+        for bucket in self._routing_table:
+            LOGGER.info(f"Routing batch sizes {bucket}")
+        for runner in self._runners.values():
+            runner.activate()
+
+    def infer_impl(self, feed_dict: Dict[str, Any], *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Run inference on the runner selected for the batch size of the request."""
+        first_tensor = next(iter(feed_dict.values()))
+        route = self.get_route(first_tensor.shape[self._batch_dim])
+        self.route_counts[route] += 1
+
+        return self._runners[route].infer(feed_dict, *args, **kwargs)
+
+    def deactivate_impl(self):
+        """Deactivate all routed runners."""
+        for runner in self._runners.values():
+            runner.deactivate()
+
+    def get_available_input_types_impl(self) -> List[TensorType]:
+        """Input types supported by all routed runners."""
+        return self._common_types([runner.get_available_input_types() for runner in self._runners.values()])
+
+    def get_available_return_types_impl(self) -> List[TensorType]:
+        """Return types supported by all routed runners."""
+        return self._common_types([runner.get_available_return_types() for runner in self._runners.values()])
+
+    @staticmethod
+    def _common_types(types: List[List[TensorType]]) -> List[TensorType]:
+        return [tensor_type for tensor_type in types[0] if all(tensor_type in other for other in types[1:])]
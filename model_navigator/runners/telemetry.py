@@ -0,0 +1,273 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Always-on telemetry of runner inference steps.
+
+Step times of sampled inferences are written to a ring buffer preallocated on creation, so recording does not
+allocate containers and does not synchronize devices. Statistics are computed only when a snapshot is requested.
+
+Without device synchronization the time of steps executed asynchronously on a device is the time of launching
+them on the host. Steps which wait for the device, like device to host copies, absorb the remaining device time,
+so the total time of inference stays accurate.
+"""
+
+import dataclasses
+import threading
+import time
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from model_navigator.exceptions import ModelNavigatorWrongParameterError
+from model_navigator.runners.base import InferenceStep
+from model_navigator.utils.common import DataObject
+
+DEFAULT_CAPACITY = 1024
+PERCENTILES = (50, 90, 95, 99)
+
+_STEPS = [step.value for step in InferenceStep]
+
+
+@dataclasses.dataclass
+class StepStatistics(DataObject):
+    """Statistics of an inference step over the recorded window.
+
+    Args:
+        avg_time: Average time of the step in milliseconds
+        p50_time: Median time of the step in milliseconds
+        p90_time: 90th percentile of the step time in milliseconds
+        p95_time: 95th percentile of the step time in milliseconds
+        p99_time: 99th percentile of the step time in milliseconds
+        total_time: Sum of the step times in milliseconds
+    """
+
+    avg_time: float
+    p50_time: float
+    p90_time: float
+    p95_time: float
+    p99_time: float
+    total_time: float
+
+
+@dataclasses.dataclass
+class TelemetrySnapshot(DataObject):
+    """Rolling statistics of inferences recorded by the telemetry.
+
+    Args:
+        runner_name: Name of the runner
+        inference_count: Number of inferences since creation or the last reset, including not sampled ones
+        sample_count: Number of sampled inferences in the window
+        throughput: Number of inferences per second over the window
+        steps: Statistics of inference steps observed in the window
+    """
+
+    runner_name: str
+    inference_count: int
+    sample_count: int
+    throughput: float
+    steps: Dict[str, StepStatistics]
+
+    def to_prometheus(self) -> str:
+        """Export the snapshot in the Prometheus text format."""
+        return to_prometheus([self])
+
+
+class InferenceTelemetry:
+    """Ring buffer of step times of the last sampled inferences of a runner.
+
+    Recording is expected from a single thread using the runner, while snapshots may be taken from any thread.
+
+    Example usage:
+
+        telemetry = runner.enable_telemetry(capacity=1024, sampling_interval=10)
+        ...
+        snapshot = telemetry.snapshot()
+        text = telemetry.to_prometheus()
+    """
+
+    def __init__(self, runner_name: str, capacity: int = DEFAULT_CAPACITY, sampling_interval: int = 1) -> None:
+        """Initialize telemetry and allocate the buffer.
+
+        Args:
+            runner_name: Name of the runner used as the label of exported metrics
+            capacity: Number of the last sampled inferences kept in the buffer
+            sampling_interval: Record every n-th inference. Not sampled inferences are only counted.
+
+        Raises:
+            ModelNavigatorWrongParameterError: when the capacity or the sampling interval is lower than 1
+        """
+        if capacity < 1:
+            raise ModelNavigatorWrongParameterError(f"Telemetry capacity must be at least 1, got {capacity}.")
+        if sampling_interval < 1:
+            raise ModelNavigatorWrongParameterError(
+                f"Telemetry sampling interval must be at least 1, got {sampling_interval}."
+            )
+
+        self.runner_name = runner_name
+        self.capacity = capacity
+        self.sampling_interval = sampling_interval
+
+        self._step_ids = {step: step_id for step_id, step in enumerate(_STEPS)}
+        self._times = np.zeros((capacity, len(_STEPS)), dtype=np.float64)
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._counts = np.zeros(capacity, dtype=np.int64)
+        self._current = [0.0] * len(_STEPS)
+        self._zeros = [0.0] * len(_STEPS)
+        self._observed = [False] * len(_STEPS)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Remove recorded inferences."""
+        with self._lock:
+            self._position = 0
+            self._size = 0
+            self._inference_count = 0
+            self._observed[:] = [False] * len(_STEPS)
+
+    def start(self) -> bool:
+        """Count a new inference and decide if its steps are recorded.
+
+        Returns:
+            True when the inference is sampled
+        """
+        self._inference_count += 1
+        if self._inference_count % self.sampling_interval:
+            return False
+
+        self._current[:] = self._zeros
+        return True
+
+    def record(self, step_name: str, duration: float) -> None:
+        """Add the time of the step to the current inference.
+
+        Args:
+            step_name: Name of the inference step. Steps not defined in `InferenceStep` are ignored.
+            duration: Time of the step in milliseconds
+        """
+        step_id = self._step_ids.get(step_name)
+        if step_id is not None:
+            self._current[step_id] += duration
+
+    def commit(self) -> None:
+        """Write the current inference to the buffer."""
+        with self._lock:
+            self._times[self._position] = self._current
+            self._timestamps[self._position] = time.perf_counter()
+            self._counts[self._position] = self._inference_count
+            for step_id, duration in enumerate(self._current):
+                if duration:
+                    self._observed[step_id] = True
+
+            self._position = (self._position + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+    def snapshot(self) -> TelemetrySnapshot:
+        """Compute statistics of inferences in the buffer.
+
+        Returns:
+            TelemetrySnapshot with percentiles of steps and throughput
+        """
+        with self._lock:
+            times = self._times[: self._size].copy()
+            timestamps = self._timestamps[: self._size].copy()
+            counts = self._counts[: self._size].copy()
+            observed = list(self._observed)
+            inference_count = self._inference_count
+
+        throughput = 0.0
+        if len(timestamps) > 1:
+            first, last = int(np.argmin(timestamps)), int(np.argmax(timestamps))
+            elapsed = timestamps[last] - timestamps[first]
+            if elapsed > 0:
+                throughput = float(counts[last] - counts[first]) / elapsed
+
+        steps = {}
+        if len(times):
+            percentiles = np.percentile(times, PERCENTILES, axis=0)
+            averages = times.mean(axis=0)
+            totals = times.sum(axis=0)
+            for step_id, step in enumerate(_STEPS):
+                if not observed[step_id]:
+                    continue
+                steps[step] = StepStatistics(
+                    avg_time=float(averages[step_id]),
+                    p50_time=float(percentiles[0, step_id]),
+                    p90_time=float(percentiles[1, step_id]),
+                    p95_time=float(percentiles[2, step_id]),
+                    p99_time=float(percentiles[3, step_id]),
+                    total_time=float(totals[step_id]),
+                )
+
+        return TelemetrySnapshot(
+            runner_name=self.runner_name,
+            inference_count=inference_count,
+            sample_count=len(times),
+            throughput=throughput,
+            steps=steps,
+        )
+
+    def to_prometheus(self) -> str:
+        """Export the current snapshot in the Prometheus text format."""
+        return self.snapshot().to_prometheus()
+
+
+def to_prometheus(snapshots: Sequence[TelemetrySnapshot], prefix: str = "model_navigator") -> str:
+    """Export snapshots of one or more runners in the Prometheus text format.
+
+    Step times are exported as a summary with quantiles, throughput as a gauge and the number of inferences
+    as a counter. Runners are distinguished with the `runner` label.
+
+    Args:
+        snapshots: Snapshots of runners telemetry
+        prefix: Prefix of metric names
+
+    Returns:
+        Metrics in the Prometheus text exposition format
+    """
+    step_metric = f"{prefix}_inference_step_time_ms"
+    throughput_metric = f"{prefix}_inference_throughput"
+    count_metric = f"{prefix}_inference_total"
+
+    lines = [
+        f"# HELP {step_metric} Time of inference steps in milliseconds over the recent sampled inferences.",
+        f"# TYPE {step_metric} summary",
+    ]
+    for snapshot in snapshots:
+        for step, statistics in snapshot.steps.items():
+            labels = f'runner="{_escape(snapshot.runner_name)}",step="{step}"'
+            for percentile in PERCENTILES:
+                value = getattr(statistics, f"p{percentile}_time")
+                lines.append(f'{step_metric}{{{labels},quantile="{percentile / 100}"}} {value}')
+            lines.append(f"{step_metric}_sum{{{labels}}} {statistics.total_time}")
+            lines.append(f"{step_metric}_count{{{labels}}} {snapshot.sample_count}")
+
+    lines.extend([
+        f"# HELP {throughput_metric} Inferences per second over the recent sampled inferences.",
+        f"# TYPE {throughput_metric} gauge",
+    ])
+    for snapshot in snapshots:
+        lines.append(f'{throughput_metric}{{runner="{_escape(snapshot.runner_name)}"}} {snapshot.throughput}')
+
+    lines.extend([
+        f"# HELP {count_metric} Number of inferences.",
+        f"# TYPE {count_metric} counter",
+    ])
+    for snapshot in snapshots:
+        lines.append(f'{count_metric}{{runner="{_escape(snapshot.runner_name)}"}} {snapshot.inference_count}')
+
+    return "\n".join(lines) + "\n"
+
+
+def _escape(value: Optional[str]) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -15,21 +15,32 @@
 
 import dataclasses
 from math import inf
-from typing import Dict, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from model_navigator.commands.correctness.correctness import Correctness
 from model_navigator.commands.performance.performance import Performance
+from model_navigator.commands.performance.results import ProfilingResults, combine_by_batch_size
+from model_navigator.commands.performance.sketch import LatencySketch, mixture_percentile
 from model_navigator.configuration import (
+    DEFAULT_PARETO_OBJECTIVES,
     MaxThroughputAndMinLatencyStrategy,
     MaxThroughputStrategy,
+    MaxThroughputWithConstraintsStrategy,
     MaxThroughputWithLatencyBudgetStrategy,
     MinLatencyStrategy,
+    ParetoObjective,
     RuntimeSearchStrategy,
     SelectedRuntimeStrategy,
+    WorkloadAwareStrategy,
+    WorkloadObjective,
 )
 from model_navigator.core.logger import LOGGER
 from model_navigator.exceptions import ModelNavigatorRuntimeAnalyzerError, ModelNavigatorUserInputError
 from model_navigator.package.status import CommandStatus, ModelStatus, RunnerStatus
+from model_navigator.runners.base import InferenceStep
+from model_navigator.runtime_analyzer.pareto import RuntimePoint, get_pareto_front
 
 
 @dataclasses.dataclass
@@ -49,6 +60,27 @@ class RuntimeAnalyzerResult:
     runner_status: RunnerStatus
 
 
+@dataclasses.dataclass
+class WorkloadScore:
+    """Performance of a runtime expected under the workload of the `WorkloadAwareStrategy`.
+
+    Args:
+        model_key: key of the model in models status
+        runner_name: name of the runner
+        expected_latency: average latency of a request in milliseconds weighted with the traffic histogram
+        expected_p99_latency: 99th percentile of latency in milliseconds of requests in the traffic
+        qps: number of requests per second sustained at the profiled concurrency
+        throughput: number of samples per second sustained at the profiled concurrency
+    """
+
+    model_key: str
+    runner_name: str
+    expected_latency: float
+    expected_p99_latency: float
+    qps: float
+    throughput: float
+
+
 class RuntimeAnalyzer:
     """RuntimeAnalyzer class.
 
@@ -96,6 +128,7 @@ class RuntimeAnalyzer:
                 models_status=models_status,
                 formats=formats,
                 runners=runners,
+                concurrency=strategy.concurrency,
             )
         elif isinstance(strategy, MaxThroughputAndMinLatencyStrategy):
             result = cls._get_max_throughput_runtime_min_latency_runtime(
@@ -109,6 +142,21 @@ class RuntimeAnalyzer:
                 formats=formats,
                 runners=runners,
                 latency_budget=strategy.latency_budget,
+                concurrency=strategy.concurrency,
+            )
+        elif isinstance(strategy, MaxThroughputWithConstraintsStrategy):
+            result = cls._get_max_throughput_with_constraints_runtime(
+                models_status=models_status,
+                strategy=strategy,
+                formats=formats,
+                runners=runners,
+            )
+        elif isinstance(strategy, WorkloadAwareStrategy):
+            result = cls._get_workload_aware_runtime(
+                models_status=models_status,
+                strategy=strategy,
+                formats=formats,
+                runners=runners,
             )
         elif isinstance(strategy, SelectedRuntimeStrategy):
             result = cls._get_selected_runtime(
@@ -133,6 +181,320 @@ class RuntimeAnalyzer:
 
         return result
 
+    @classmethod
+    def get_runtime_points(
+        cls,
+        models_status: Dict[str, ModelStatus],
+        formats: Optional[Sequence[str]] = None,
+        runners: Optional[Sequence[str]] = None,
+        concurrency: Optional[int] = None,
+    ) -> List[RuntimePoint]:
+        """Collect performance, memory and accuracy of runtimes at each profiled batch size.
+
+        Results of samples profiled with the same batch size are combined into a single point
+        with percentiles of latency sketches merged across samples.
+
+        Args:
+            models_status: A statuses of generated and profiled models
+            formats: A list of formats that selection should be done from
+            runners: A list of runners that selection should be done from
+            concurrency: Number of requests in flight of profiling results.
+                When None, results for the lowest profiled concurrency are used.
+
+        Returns:
+            List of points for runtimes which passed correctness and performance evaluation
+        """
+        points = []
+        for model_key, model_status in models_status.items():
+            if formats is not None and model_status.model_config.format.value not in formats:
+                continue
+
+            for runner_status in model_status.runners_status.values():
+                if runners is not None and runner_status.runner_name not in runners:
+                    continue
+
+                if not (
+                    runner_status.status.get(Correctness.__name__)
+                    == runner_status.status.get(Performance.__name__)
+                    == CommandStatus.OK
+                ):
+                    continue
+
+                atol, rtol = cls._get_tolerance(runner_status)
+                profiling_results = cls._filter_profiling_results(
+                    runner_status.result[Performance.__name__]["profiling_results"], concurrency
+                )
+                for batch_size, perf in combine_by_batch_size(profiling_results).items():
+                    points.append(
+                        RuntimePoint(
+                            model_key=model_key,
+                            format=model_status.model_config.format.value,
+                            runner_name=runner_status.runner_name,
+                            batch_size=batch_size,
+                            concurrency=perf.concurrency,
+                            throughput=perf.throughput,
+                            p50_latency=perf.p50_latency,
+                            p99_latency=perf.p99_latency,
+                            std_latency=perf.std_latency,
+                            host_memory=perf.host_memory,
+                            device_memory=perf.device_memory,
+                            atol=atol,
+                            rtol=rtol,
+                        )
+                    )
+
+        return points
+
+    @classmethod
+    def get_pareto_front(
+        cls,
+        models_status: Dict[str, ModelStatus],
+        objectives: Sequence[ParetoObjective] = DEFAULT_PARETO_OBJECTIVES,
+        formats: Optional[Sequence[str]] = None,
+        runners: Optional[Sequence[str]] = None,
+        concurrency: Optional[int] = None,
+    ) -> List[RuntimePoint]:
+        """Obtain runtimes and batch sizes which are Pareto optimal on the objectives.
+
+        Example of use:
+
+            front = RuntimeAnalyzer.get_pareto_front(
+                models_status=package.status.models_status,
+                objectives=[ParetoObjective.THROUGHPUT, ParetoObjective.P99_LATENCY, ParetoObjective.ATOL],
+            )
+            print(format_pareto_front(front))
+
+        Args:
+            models_status: A statuses of generated and profiled models
+            objectives: Objectives on which runtimes are compared
+            formats: A list of formats that selection should be done from
+            runners: A list of runners that selection should be done from
+            concurrency: Number of requests in flight of profiling results.
+                When None, results for the lowest profiled concurrency are used.
+
+        Returns:
+            Points of the Pareto front ordered by decreasing throughput
+        """
+        points = cls.get_runtime_points(
+            models_status=models_status, formats=formats, runners=runners, concurrency=concurrency
+        )
+        return get_pareto_front(points, objectives)
+
+    @classmethod
+    def _get_max_throughput_with_constraints_runtime(
+        cls,
+        *,
+        models_status: Dict[str, ModelStatus],
+        strategy: MaxThroughputWithConstraintsStrategy,
+        formats: Optional[Sequence[str]] = None,
+        runners: Optional[Sequence[str]] = None,
+    ) -> Optional[RuntimeAnalyzerResult]:
+        limits = {
+            "p99_latency": strategy.p99_latency_budget,
+            "host_memory": strategy.max_host_memory,
+            "device_memory": strategy.max_device_memory,
+            "atol": strategy.max_atol,
+            "rtol": strategy.max_rtol,
+        }
+        points = cls.get_runtime_points(
+            models_status=models_status, formats=formats, runners=runners, concurrency=strategy.concurrency
+        )
+        # not measured values do not satisfy constraints
+        points = [
+            point
+            for point in points
+            if all(
+                limit is None or (getattr(point, name) is not None and getattr(point, name) <= limit)
+                for name, limit in limits.items()
+            )
+        ]
+        if not points:
+            return None
+
+        best_point = max(points, key=lambda point: point.throughput)
+        model_status = models_status[best_point.model_key]
+        return RuntimeAnalyzerResult(
+            latency=best_point.p50_latency,
+            throughput=best_point.throughput,
+            model_status=model_status,
+            runner_status=model_status.runners_status[best_point.runner_name],
+        )
+
+    @staticmethod
+    def _get_tolerance(runner_status: RunnerStatus) -> Tuple[Optional[float], Optional[float]]:
+        per_output_tolerance = runner_status.result.get(Correctness.__name__, {}).get("per_output_tolerance")
+        if not per_output_tolerance:
+            return None, None
+
+        return (
+            max(tolerance.atol for tolerance in per_output_tolerance.values()),
+            max(tolerance.rtol for tolerance in per_output_tolerance.values()),
+        )
+
+    @classmethod
+    def get_workload_scores(
+        cls,
+        models_status: Dict[str, ModelStatus],
+        strategy: WorkloadAwareStrategy,
+        formats: Optional[Sequence[str]] = None,
+        runners: Optional[Sequence[str]] = None,
+    ) -> List[WorkloadScore]:
+        """Score runtimes under the traffic histogram of the strategy.
+
+        Latency of each percentile is linearly interpolated between profiled batch sizes. Requests larger than
+        the maximal profiled batch size are executed as consecutive inferences of the maximal batch size.
+        Percentiles of the traffic are read from the mixture of per batch size latency distributions.
+
+        Args:
+            models_status: A statuses of generated and profiled models
+            strategy: A workload aware strategy with the traffic histogram
+            formats: A list of formats that selection should be done from
+            runners: A list of runners that selection should be done from
+
+        Returns:
+            List of scores for runtimes which passed correctness and performance evaluation
+        """
+        scores = []
+        for model_key, model_status in models_status.items():
+            if formats is not None and model_status.model_config.format.value not in formats:
+                continue
+
+            for runner_status in model_status.runners_status.values():
+                if runners is not None and runner_status.runner_name not in runners:
+                    continue
+
+                if not (
+                    runner_status.status.get(Correctness.__name__)
+                    == runner_status.status.get(Performance.__name__)
+                    == CommandStatus.OK
+                ):
+                    continue
+
+                profiling_results = cls._filter_profiling_results(
+                    runner_status.result[Performance.__name__]["profiling_results"], strategy.concurrency
+                )
+                if not profiling_results:
+                    continue
+
+                score = cls._score_workload(profiling_results, strategy.traffic)
+                scores.append(WorkloadScore(model_key=model_key, runner_name=runner_status.runner_name, **score))
+
+        return scores
+
+    @classmethod
+    def _get_workload_aware_runtime(
+        cls,
+        *,
+        models_status: Dict[str, ModelStatus],
+        strategy: WorkloadAwareStrategy,
+        formats: Optional[Sequence[str]] = None,
+        runners: Optional[Sequence[str]] = None,
+    ) -> Optional[RuntimeAnalyzerResult]:
+        scores = cls.get_workload_scores(
+            models_status=models_status, strategy=strategy, formats=formats, runners=runners
+        )
+
+        LOGGER.info(f"Workload scores for traffic {strategy.traffic}:")
+        for score in scores:
+            LOGGER.info(
+                f"  {score.model_key} on {score.runner_name}: latency {score.expected_latency:.4f} [ms], "
+                f"p99 latency {score.expected_p99_latency:.4f} [ms], {score.qps:.2f} [requests/sec]"
+            )
+
+        if strategy.latency_budget is not None:
+            scores = [score for score in scores if score.expected_p99_latency <= strategy.latency_budget]
+        if not scores:
+            return None
+
+        if strategy.objective == WorkloadObjective.THROUGHPUT:
+            best_score = max(scores, key=lambda score: score.qps)
+        elif strategy.objective == WorkloadObjective.P99_LATENCY:
+            best_score = min(scores, key=lambda score: score.expected_p99_latency)
+        else:
+            best_score = min(scores, key=lambda score: score.expected_latency)
+
+        model_status = models_status[best_score.model_key]
+        return RuntimeAnalyzerResult(
+            latency=best_score.expected_latency,
+            throughput=best_score.throughput,
+            model_status=model_status,
+            runner_status=model_status.runners_status[best_score.runner_name],
+        )
+
+    @classmethod
+    def _score_workload(cls, profiling_results: List[ProfilingResults], traffic: Dict[int, float]) -> Dict[str, float]:
+        # results without batch size come from models without batching which process one sample per inference
+        results_by_batch_size = {
+            batch_size or 1: perf for batch_size, perf in combine_by_batch_size(profiling_results).items()
+        }
+
+        batch_sizes = np.array(sorted(results_by_batch_size), dtype=np.float64)
+        max_batch_size = int(batch_sizes[-1])
+        curves = np.array([
+            cls._latency_points(results_by_batch_size[batch_size]) for batch_size in sorted(results_by_batch_size)
+        ])
+        # percentiles of results combined without sketches have to remain ordered
+        curves[:, 1:] = np.maximum.accumulate(curves[:, 1:], axis=1)
+
+        def _interpolate(batch_size: int) -> np.ndarray:
+            return np.array([np.interp(batch_size, batch_sizes, curves[:, idx]) for idx in range(curves.shape[1])])
+
+        weights, latencies = [], []
+        for batch_size, weight in traffic.items():
+            full_batches, remainder = divmod(batch_size, max_batch_size)
+            latency = full_batches * _interpolate(max_batch_size)
+            if remainder:
+                latency = latency + _interpolate(remainder)
+            weights.append(weight)
+            latencies.append(latency)
+
+        weights = np.array(weights)
+        latencies = np.array(latencies)
+        expected_latency = float(np.dot(weights, latencies[:, 0]))
+        expected_batch_size = float(np.dot(weights, list(traffic.keys())))
+        concurrency = profiling_results[0].concurrency
+        qps = 1000 * concurrency / expected_latency if expected_latency > 0 else inf
+
+        sketches = [
+            cls._latency_sketch(results_by_batch_size[batch_size]) if batch_size in results_by_batch_size else None
+            for batch_size in traffic
+        ]
+        if all(sketch is not None for sketch in sketches):
+            # all requests are served in single profiled batches, so their latencies are mixed from sketches
+            expected_p99_latency = mixture_percentile(sketches, weights, 99)
+        else:
+            expected_p99_latency = cls._mixture_percentile(weights, latencies[:, 1:], 0.99)
+
+        return {
+            "expected_latency": expected_latency,
+            "expected_p99_latency": expected_p99_latency,
+            "qps": qps,
+            "throughput": qps * expected_batch_size,
+        }
+
+    @staticmethod
+    def _latency_sketch(perf: ProfilingResults) -> Optional[LatencySketch]:
+        total = perf.detailed_results.get(InferenceStep.TOTAL.value)
+        return total.sketch if total is not None else None
+
+    @staticmethod
+    def _latency_points(perf: ProfilingResults) -> Tuple[float, ...]:
+        return perf.avg_latency, perf.p50_latency, perf.p90_latency, perf.p95_latency, perf.p99_latency
+
+    @staticmethod
+    def _mixture_percentile(weights: np.ndarray, percentiles: np.ndarray, quantile: float) -> float:
+        # latency distribution of each batch size is piecewise linear between its percentiles,
+        # the tail above p99 continues with the slope between p95 and p99
+        quantiles = np.array([0.0, 0.5, 0.9, 0.95, 0.99, 1.0])
+        maximums = percentiles[:, -1] + (percentiles[:, -1] - percentiles[:, -2]) / 4
+        points = np.column_stack([np.zeros(len(percentiles)), percentiles, maximums])
+        candidates = np.unique(points)
+        cdf = np.zeros_like(candidates)
+        for weight, bucket_points in zip(weights, points):
+            cdf += weight * np.interp(candidates, bucket_points, quantiles)
+
+        return float(np.interp(quantile, cdf, candidates))
+
     @classmethod
     def _get_min_latency_runtime(
         cls,
@@ -167,7 +529,9 @@ class RuntimeAnalyzer:
                     assert runner_status.result[Performance.__name__]["profiling_results"] is not None
                     latency = inf
                     throughput = None
-                    for perf in runner_status.result[Performance.__name__]["profiling_results"]:
+                    for perf in cls._filter_profiling_results(
+                        runner_status.result[Performance.__name__]["profiling_results"]
+                    ):
                         if perf.p50_latency < latency:
                             latency = perf.p50_latency
                             throughput = perf.throughput
@@ -191,6 +555,7 @@ class RuntimeAnalyzer:
         latency_budget: Optional[float] = None,
         formats: Optional[Sequence[str]] = None,
         runners: Optional[Sequence[str]] = None,
+        concurrency: Optional[int] = None,
     ) -> Optional[RuntimeAnalyzerResult]:
         best_throughput, best_runtime = -inf, None
         if formats is not None:
@@ -218,7 +583,9 @@ class RuntimeAnalyzer:
                     assert runner_status.result[Performance.__name__]["profiling_results"] is not None
                     latency = None
                     throughput = -inf
-                    for perf in runner_status.result[Performance.__name__]["profiling_results"]:
+                    for perf in cls._filter_profiling_results(
+                        runner_status.result[Performance.__name__]["profiling_results"], concurrency
+                    ):
                         if perf.throughput > throughput and (
                             latency_budget is None or perf.p50_latency <= latency_budget
                         ):
@@ -291,7 +658,9 @@ class RuntimeAnalyzer:
                 f"Model {model_key} has not evaluated successfully on runner {runner_name}"
             )
 
-        profiling_results = runner_status.result[Performance.__name__]["profiling_results"]
+        profiling_results = cls._filter_profiling_results(
+            runner_status.result[Performance.__name__]["profiling_results"]
+        )
         if len(profiling_results) == 0:
             raise ModelNavigatorRuntimeAnalyzerError(
                 f"No profiling results for model {model_key} and runner {runner_name} not found"
@@ -306,3 +675,18 @@ class RuntimeAnalyzer:
             runner_status=runner_status,
         )
         return result
+
+    @classmethod
+    def _filter_profiling_results(
+        cls,
+        profiling_results: List[ProfilingResults],
+        concurrency: Optional[int] = None,
+    ) -> List[ProfilingResults]:
+        # Without requested concurrency use the lowest profiled one which match results collected before concurrency
+        if not profiling_results:
+            return []
+
+        if concurrency is None:
+            concurrency = min(perf.concurrency for perf in profiling_results)
+
+        return [perf for perf in profiling_results if perf.concurrency == concurrency]
@@ -0,0 +1,172 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Pareto front of runtimes over latency, throughput, memory and accuracy objectives.
+
+Each point of the front is a model format, a runner and a profiled batch size. A point belongs to the front
+when no other point is at least as good on all objectives and better on one of them.
+"""
+
+import dataclasses
+import json
+import pathlib
+from math import inf
+from typing import List, Optional, Sequence, Union
+
+from tabulate import tabulate
+
+from model_navigator.configuration import DEFAULT_PARETO_OBJECTIVES, ParetoObjective
+from model_navigator.utils.common import DataObject
+
+_MAXIMIZED_OBJECTIVES = (ParetoObjective.THROUGHPUT,)
+_MEMORY_OBJECTIVES = (ParetoObjective.HOST_MEMORY, ParetoObjective.DEVICE_MEMORY)
+
+
+@dataclasses.dataclass
+class RuntimePoint(DataObject):
+    """Performance, memory and accuracy of a runtime at a profiled batch size.
+
+    Args:
+        model_key: Key of the model in the package status
+        format: Format of the model
+        runner_name: Name of the runner
+        batch_size: Profiled batch size, None when the model was profiled without batching
+        concurrency: Number of requests in flight during profiling
+        throughput: Number of samples per second
+        p50_latency: Median latency in milliseconds
+        p99_latency: 99th percentile of latency in milliseconds
+        std_latency: Standard deviation of latency in milliseconds
+        host_memory: Host memory in bytes used by the process of the runtime, None when not measured
+        device_memory: Device memory in bytes used by the process of the runtime, None when not measured
+        atol: Maximal absolute tolerance of outputs, None when not measured
+        rtol: Maximal relative tolerance of outputs, None when not measured
+    """
+
+    model_key: str
+    format: str
+    runner_name: str
+    batch_size: Optional[int]
+    concurrency: int
+    throughput: float
+    p50_latency: float
+    p99_latency: float
+    std_latency: float
+    host_memory: Optional[int] = None
+    device_memory: Optional[int] = None
+    atol: Optional[float] = None
+    rtol: Optional[float] = None
+
+
+def get_pareto_front(
+    points: Sequence[RuntimePoint],
+    objectives: Sequence[ParetoObjective] = DEFAULT_PARETO_OBJECTIVES,
+) -> List[RuntimePoint]:
+    """Select points which are not dominated by any other point.
+
+    Values which were not measured are worse than any measured value.
+
+    Args:
+        points: Points of runtimes
+        objectives: Objectives on which points are compared
+
+    Returns:
+        Points of the Pareto front ordered by decreasing throughput
+    """
+    costs = [[_cost(point, ParetoObjective(objective)) for objective in objectives] for point in points]
+
+    front = []
+    for idx, point_costs in enumerate(costs):
+        dominated = any(
+            all(other <= value for other, value in zip(other_costs, point_costs)) and other_costs != point_costs
+            for other_idx, other_costs in enumerate(costs)
+            if other_idx != idx
+        )
+        if not dominated:
+            front.append(points[idx])
+
+    return sorted(front, key=lambda point: -point.throughput)
+
+
+def format_pareto_front(
+    points: Sequence[RuntimePoint],
+    objectives: Sequence[ParetoObjective] = DEFAULT_PARETO_OBJECTIVES,
+) -> str:
+    """Format points as a table with columns of objectives.
+
+    Args:
+        points: Points of runtimes, usually the Pareto front
+        objectives: Objectives presented in the table
+
+    Returns:
+        Table in the grid format
+    """
+    objectives = [ParetoObjective(objective) for objective in objectives]
+    headers = ["Format", "Runner", "Batch size", "Concurrency"] + [_header(objective) for objective in objectives]
+    rows = [
+        [point.format, point.runner_name, point.batch_size or "-", point.concurrency]
+        + [_format_value(point, objective) for objective in objectives]
+        for point in points
+    ]
+
+    return tabulate(rows, headers, "grid", disable_numparse=True)
+
+
+def save_pareto_front(
+    points: Sequence[RuntimePoint],
+    path: Union[str, pathlib.Path],
+    objectives: Sequence[ParetoObjective] = DEFAULT_PARETO_OBJECTIVES,
+) -> None:
+    """Save points with objectives of the front to a JSON file.
+
+    Args:
+        points: Points of runtimes, usually the Pareto front
+        path: Path of the JSON file
+        objectives: Objectives of the front
+    """
+    data = {
+        "objectives": [ParetoObjective(objective).value for objective in objectives],
+        "points": [point.to_dict(parse=True) for point in points],
+    }
+    with pathlib.Path(path).open("w") as fp:
+        json.dump(data, fp, indent=2)
+
+
+def _cost(point: RuntimePoint, objective: ParetoObjective) -> float:
+    value = getattr(point, objective.value)
+    if value is None:
+        return inf
+
+    return -value if objective in _MAXIMIZED_OBJECTIVES else value
+
+
+def _header(objective: ParetoObjective) -> str:
+    if objective == ParetoObjective.THROUGHPUT:
+        return "Throughput [infer/sec]"
+    if objective in _MEMORY_OBJECTIVES:
+        return f"{objective.value} [MiB]"
+    if objective in (ParetoObjective.ATOL, ParetoObjective.RTOL):
+        return objective.value
+
+    return f"{objective.value} [ms]"
+
+
+def _format_value(point: RuntimePoint, objective: ParetoObjective) -> str:
+    value = getattr(point, objective.value)
+    if value is None:
+        return "-"
+    if objective in _MEMORY_OBJECTIVES:
+        return f"{value / 2**20:.1f}"
+    if objective in (ParetoObjective.ATOL, ParetoObjective.RTOL):
+        return f"{value:.3e}"
+
+    return f"{value:.4f}"
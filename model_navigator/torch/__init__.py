@@ -36,6 +36,7 @@ from model_navigator.frameworks import Framework
 from model_navigator.package import Package
 from model_navigator.pipelines.builders import (
     correctness_builder,
+    onnx_session_options_builder,
     performance_builder,
     preprocessing_builder,
     tensorrt_conversion_builder,
@@ -143,6 +144,7 @@ def optimize(
         torch_conversion_builder,
         torch_tensorrt_conversion_builder,
         tensorrt_conversion_builder,
+        onnx_session_options_builder,
         correctness_builder,
         performance_builder,
     ]
@@ -0,0 +1,214 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tuning of dynamic batching and model instances from profiling results.
+
+Profiling results contain throughput and latency for each profiled batch size and, when profiled with
+`concurrency`, for growing number of requests in flight. The tuning selects:
+- preferred batch sizes starting at the knee of the throughput curve, where doubling the batch size
+  no longer increases throughput significantly,
+- maximal queue delay which fits the latency budget after the inference of the preferred batch,
+- number of model instances at which throughput stops scaling with concurrency.
+"""
+
+import dataclasses
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from model_navigator.commands.performance.results import ProfilingResults, combine_by_batch_size
+from model_navigator.core.logger import LOGGER
+from model_navigator.package.package import Package
+from model_navigator.utils.common import DataObject
+
+# minimal relative throughput gain for which a larger batch size or an additional instance is worth it
+DEFAULT_SCALING_THRESHOLD = 0.1
+# key of the tuning result in the `result` of the package status
+BATCHING_TUNING_RESULT_KEY = "batching_tuning"
+
+
+@dataclasses.dataclass
+class BatchingTuningResult(DataObject):
+    """Dynamic batching and instances configuration derived from profiling results.
+
+    Args:
+        max_batch_size: Maximal profiled batch size
+        preferred_batch_sizes: Batch sizes the dynamic batcher should form
+        max_queue_delay_microseconds: Maximal time a request waits in the queue for other requests
+        instance_count: Number of model instances, None when the model was not profiled with concurrency
+        latency_budget: Latency budget in milliseconds used for tuning
+        reasoning: Explanation of selected values
+    """
+
+    max_batch_size: int
+    preferred_batch_sizes: List[int]
+    max_queue_delay_microseconds: int
+    instance_count: Optional[int]
+    latency_budget: Optional[float]
+    reasoning: List[str]
+
+
+def tune_batching(
+    profiling_results: Sequence[ProfilingResults],
+    latency_budget: Optional[float] = None,
+    scaling_threshold: float = DEFAULT_SCALING_THRESHOLD,
+) -> Optional[BatchingTuningResult]:
+    """Derive dynamic batching and instances configuration from profiling results of the runner.
+
+    Args:
+        profiling_results: Profiling results of the selected runner
+        latency_budget: Maximal p99 latency in milliseconds of a request including the time in the queue.
+            When not provided, the queue delay is the average latency of the smallest profiled batch.
+        scaling_threshold: Minimal relative throughput gain for which a larger batch size
+            or an additional model instance is used
+
+    Returns:
+        BatchingTuningResult or None when results were not profiled with batch sizes
+    """
+    results = _combine_by_batch_size([result for result in profiling_results if result.concurrency == 1])
+    if not results:
+        LOGGER.info("Runner was not profiled with batch sizes. Dynamic batching is not tuned.")
+        return None
+
+    reasoning = []
+    batch_sizes = sorted(results)
+    max_batch_size = batch_sizes[-1]
+
+    knee = batch_sizes[-1]
+    for batch_size, next_batch_size in zip(batch_sizes, batch_sizes[1:]):
+        gain = results[next_batch_size]["throughput"] / results[batch_size]["throughput"] - 1
+        if gain < scaling_threshold:
+            knee = batch_size
+            reasoning.append(
+                f"Throughput knee at batch size {batch_size}: batch size {next_batch_size} increases throughput "
+                f"by {gain:.1%}, below {scaling_threshold:.0%}."
+            )
+            break
+    else:
+        reasoning.append(f"Throughput grows up to the maximal profiled batch size {knee}.")
+
+    if latency_budget is not None:
+        within_budget = [size for size in batch_sizes if results[size]["p99_latency"] <= latency_budget]
+        if not within_budget:
+            knee = batch_sizes[0]
+            reasoning.append(
+                f"No batch size fits the latency budget {latency_budget:.2f}[ms]; "
+                f"the smallest batch size {knee} is preferred."
+            )
+        elif knee > within_budget[-1]:
+            knee = within_budget[-1]
+            reasoning.append(
+                f"Preferred batch size limited to {knee} with p99 latency "
+                f"{results[knee]['p99_latency']:.2f}[ms] within the latency budget {latency_budget:.2f}[ms]."
+            )
+
+    preferred_batch_sizes = [
+        size
+        for size in batch_sizes
+        if size >= knee
+        and results[size]["throughput"] >= results[knee]["throughput"]
+        and (latency_budget is None or results[size]["p99_latency"] <= latency_budget or size == knee)
+    ]
+    reasoning.append(f"Preferred batch sizes: {preferred_batch_sizes}.")
+
+    if latency_budget is not None:
+        max_queue_delay = max(latency_budget - results[knee]["p99_latency"], 0.0)
+        reasoning.append(
+            f"Queue delay {max_queue_delay:.2f}[ms] is the latency budget {latency_budget:.2f}[ms] "
+            f"reduced by p99 latency {results[knee]['p99_latency']:.2f}[ms] of batch size {knee}."
+        )
+    else:
+        max_queue_delay = results[batch_sizes[0]]["avg_latency"]
+        reasoning.append(
+            f"Queue delay {max_queue_delay:.2f}[ms] is the average latency of the smallest batch size "
+            f"{batch_sizes[0]}, so waiting for other requests at most doubles the latency."
+        )
+
+    instance_count = _tune_instance_count(profiling_results, knee, scaling_threshold, reasoning)
+
+    return BatchingTuningResult(
+        max_batch_size=max_batch_size,
+        preferred_batch_sizes=preferred_batch_sizes,
+        max_queue_delay_microseconds=int(max_queue_delay * 1000),
+        instance_count=instance_count,
+        latency_budget=latency_budget,
+        reasoning=reasoning,
+    )
+
+
+def _tune_instance_count(
+    profiling_results: Sequence[ProfilingResults],
+    batch_size: int,
+    scaling_threshold: float,
+    reasoning: List[str],
+) -> Optional[int]:
+    results = [result for result in profiling_results if result.batch_size is not None]
+    if all(result.concurrency == 1 for result in results):
+        reasoning.append("Runner was not profiled with concurrency; the number of instances is not tuned.")
+        return None
+
+    # concurrency is measured on the batch size closest to the preferred one
+    closest_batch_size = min({result.batch_size for result in results}, key=lambda size: abs(size - batch_size))
+    results_by_concurrency: Dict[int, List[float]] = {}
+    for result in results:
+        if result.batch_size == closest_batch_size:
+            results_by_concurrency.setdefault(result.concurrency, []).append(result.throughput)
+
+    throughput = {concurrency: float(np.mean(values)) for concurrency, values in results_by_concurrency.items()}
+    levels = sorted(throughput)
+
+    instance_count = levels[-1]
+    for concurrency, next_concurrency in zip(levels, levels[1:]):
+        gain = throughput[next_concurrency] / throughput[concurrency] - 1
+        if gain < scaling_threshold:
+            instance_count = concurrency
+            reasoning.append(
+                f"{instance_count} instances: concurrency {next_concurrency} increases throughput of batch size "
+                f"{closest_batch_size} by {gain:.1%}, below {scaling_threshold:.0%}."
+            )
+            break
+    else:
+        reasoning.append(
+            f"{instance_count} instances: throughput of batch size {closest_batch_size} grows up to "
+            "the maximal profiled concurrency."
+        )
+
+    return instance_count
+
+
+def _combine_by_batch_size(profiling_results: Sequence[ProfilingResults]) -> Dict[int, Dict[str, float]]:
+    # percentiles are read from sketches merged across samples instead of the worst percentile of samples
+    return {
+        batch_size: {
+            "throughput": result.throughput,
+            "avg_latency": result.avg_latency,
+            "p99_latency": result.p99_latency,
+        }
+        for batch_size, result in combine_by_batch_size(profiling_results).items()
+        if batch_size is not None
+    }
+
+
+def record_tuning(package: Package, tuning: BatchingTuningResult) -> None:
+    """Store the tuning result with its reasoning in the status of the package.
+
+    Args:
+        package: Package for which the batching was tuned
+        tuning: Result of the tuning
+    """
+    for line in tuning.reasoning:
+        LOGGER.info(f"Batching tuning: {line}")
+
+    package.status.result[BATCHING_TUNING_RESULT_KEY] = tuning.to_dict(parse=True)
+    if package.workspace.path.exists():
+        package.save_status_file()
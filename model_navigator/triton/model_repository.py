@@ -25,6 +25,7 @@ Example of use:
     )
 """
 
+import dataclasses
 import pathlib
 import shutil
 from typing import Dict, List, Optional, Union
@@ -63,12 +64,15 @@ from model_navigator.runners.tensorrt import TensorRTRunner
 from model_navigator.runners.torch import TorchScriptCPURunner, TorchScriptCUDARunner, TorchTensorRTRunner
 from model_navigator.runtime_analyzer import RuntimeAnalyzer
 from model_navigator.runtime_analyzer.analyzer import RuntimeAnalyzerResult
+from model_navigator.triton import batching_tuning
 from model_navigator.triton.model_config import ModelConfig
 from model_navigator.triton.model_config_builder import ModelConfigBuilder
 from model_navigator.triton.model_config_generator import ModelConfigGenerator
 from model_navigator.triton.specialized_configs import (
     Backend,
+    BaseSpecializedModelConfig,
     DeviceKind,
+    DynamicBatcher,
     InputTensorSpec,
     InstanceGroup,
     ModelWarmup,
@@ -240,6 +244,8 @@ def add_model_from_package(
     strategies: Optional[List[RuntimeSearchStrategy]] = None,
     response_cache: bool = False,
     warmup: bool = False,
+    tune_batching: bool = False,
+    latency_budget: Optional[float] = None,
 ):
     """Create the Triton Model Store with optimized model and save it to `model_repository_path`.
 
@@ -253,6 +259,10 @@ def add_model_from_package(
                     defaults to [`MaxThroughputAndMinLatencyStrategy`, `MinLatencyStrategy`]
         response_cache: Enable response cache for model
         warmup: Enable warmup for min and max batch size
+        tune_batching: Derive preferred batch sizes, maximal queue delay of the dynamic batcher and number of model
+                       instances from profiling results of the selected runner. The reasoning is stored
+                       in the package status.
+        latency_budget: Maximal p99 latency in milliseconds of a request used by `tune_batching`
 
     Returns:
         Path to created model store
@@ -286,10 +296,14 @@ def add_model_from_package(
     if not runtime_result:
         raise ModelNavigatorError("No optimized model found in package.")
 
-    max_batch_size = max(
-        profiling_results.batch_size if profiling_results.batch_size is not None else 0
-        for profiling_results in runtime_result.runner_status.result[Performance.name]["profiling_results"]
-    )
+    profiling_results = runtime_result.runner_status.result[Performance.name]["profiling_results"]
+    max_batch_size = max(result.batch_size if result.batch_size is not None else 0 for result in profiling_results)
+
+    tuning = None
+    if tune_batching and batching:
+        tuning = batching_tuning.tune_batching(profiling_results, latency_budget=latency_budget)
+        if tuning is not None:
+            batching_tuning.record_tuning(package, tuning)
 
     model_warmup = {}
     if warmup:
@@ -361,11 +375,14 @@ def add_model_from_package(
             f"Unsupported model format selected: {runtime_result.model_status.model_config.format}"
         )
 
+    if tuning is not None:
+        _apply_batching_tuning(config, tuning)
+
     return add_model(
         model_repository_path=model_repository_path,
         model_name=model_name,
         model_version=model_version,
-        model_path=package.workspace.path / runtime_result.model_status.model_config.path,
+        model_path=package.get_model_path(runtime_result.model_status.model_config.key),
         config=config,
     )
 
@@ -634,6 +651,16 @@ def _tensorrt_config_from_runtime_result(
     return config
 
 
+def _apply_batching_tuning(config: BaseSpecializedModelConfig, tuning: batching_tuning.BatchingTuningResult) -> None:
+    config.batcher = DynamicBatcher(
+        max_queue_delay_microseconds=tuning.max_queue_delay_microseconds,
+        preferred_batch_size=tuning.preferred_batch_sizes,
+    )
+    if tuning.instance_count is not None:
+        instance_groups = config.instance_groups or [InstanceGroup()]
+        config.instance_groups = [dataclasses.replace(group, count=tuning.instance_count) for group in instance_groups]
+
+
 def _prepare_model_warmup(max_batch_size: int, batching: bool, package: Package):
     if not batching:
         batch_sizes = [1]
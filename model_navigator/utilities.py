@@ -17,10 +17,11 @@
 import json
 import pathlib
 import tempfile
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Optional
 
 from model_navigator.commands.performance import Profiler
-from model_navigator.configuration import Framework, OptimizationProfile, SizedDataLoader
+from model_navigator.configuration import Framework, OptimizationProfile, Sample, SizedDataLoader, VerifyFunction
+from model_navigator.core.comparison import allclose
 from model_navigator.core.dataloader import to_numpy
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import FRAMEWORK_TO_TENSOR_TYPE, PyTreeMetadata, TensorMetadata
@@ -28,6 +29,35 @@ from model_navigator.exceptions import ModelNavigatorError, ModelNavigatorProfil
 from model_navigator.runners.registry import get_runner
 
 
+def get_allclose_verify_func(atol: float = 1.0e-5, rtol: float = 1.0e-5) -> VerifyFunction:
+    """Get verify function which checks if outputs of the runner are close to outputs of the source model.
+
+    Outputs are compared in chunks with bounded temporary memory, so the function can be used for large outputs
+    like logits of language models.
+
+    Args:
+        atol: Absolute tolerance
+        rtol: Relative tolerance applied to outputs of the source model
+
+    Returns:
+        Function to pass as `verify_func` to `optimize`
+
+    Example:
+        >>> nav.torch.optimize(model, dataloader, verify_func=nav.utilities.get_allclose_verify_func(1e-3, 1e-3))
+    """
+
+    def verify_func(ys_runner: Iterable[Sample], ys_expected: Iterable[Sample]) -> bool:
+        for y_runner, y_expected in zip(ys_runner, ys_expected):
+            if y_runner.keys() != y_expected.keys():
+                return False
+            for name, output in y_runner.items():
+                if not allclose(y_expected[name], output, atol=atol, rtol=rtol):
+                    return False
+        return True
+
+    return verify_func
+
+
 # deprecated since used only in tests - will be moved to test package
 class UnpackedDataloader:
     """A wrapper around a SizedDataLoader that applies a function to each sample.
@@ -13,7 +13,9 @@
 # limitations under the License.
 """Device utils."""
 
+import contextlib
 import ctypes
+import threading
 import uuid
 from ctypes import c_uint8
 from typing import List, Optional, Sequence, Union
@@ -32,6 +34,8 @@ except OSError as e:
     logger.warning(f"CUDA not available: {e}")
     cuda = None
 
+_ASSIGNED_DEVICE = threading.local()
+
 
 def _check_ret(err):
     if err != CUDA_SUCCESS:
@@ -125,3 +129,23 @@ def get_environment_info(gpus: Optional[Sequence[str]] = None):
 def is_cuda_available():
     """Return True if CUDA available, False otherwise."""
     return bool(get_gpus(["all"]))
+
+
+@contextlib.contextmanager
+def assigned_device(device: Optional[str]):
+    """Assign CUDA device to subcommands executed in child processes started from the current thread.
+
+    Args:
+        device: CUDA device index or UUID. When None, child processes inherit visible devices.
+    """
+    previous_device = get_assigned_device()
+    _ASSIGNED_DEVICE.device = device
+    try:
+        yield
+    finally:
+        _ASSIGNED_DEVICE.device = previous_device
+
+
+def get_assigned_device() -> Optional[str]:
+    """Return CUDA device assigned to the current thread or None when not assigned."""
+    return getattr(_ASSIGNED_DEVICE, "device", None)
@@ -26,7 +26,22 @@ import psutil
 from loguru import logger
 
 from model_navigator.configuration.constants import (
+    DEFAULT_ARTIFACT_CACHE_MAX_SIZE,
+    DEFAULT_ARTIFACT_CACHE_TYPE,
+    DEFAULT_DEVICE_SLOTS,
+    DEFAULT_MAX_PACKAGE_WORKERS,
+    DEFAULT_MAX_PARALLEL_UNITS,
+    DEFAULT_MAX_WARM_WORKERS,
+    NAVIGATOR_ARTIFACT_CACHE_DIR,
+    NAVIGATOR_ARTIFACT_CACHE_MAX_SIZE,
+    NAVIGATOR_ARTIFACT_CACHE_TYPE,
     NAVIGATOR_CONSOLE_OUTPUT_ENV,
+    NAVIGATOR_DEVICE_SLOTS,
+    NAVIGATOR_MAX_PARALLEL_UNITS,
+    NAVIGATOR_MAX_WARM_WORKERS,
+    NAVIGATOR_PACKAGE_WORKERS,
+    NAVIGATOR_PARALLEL_DEVICES,
+    NAVIGATOR_RESUME,
     NAVIGATOR_USE_MULTIPROCESSING,
     OUTPUT_SIMPLE_REPORT,
 )
@@ -234,6 +249,62 @@ def use_multiprocessing() -> bool:
     return os.environ.get(NAVIGATOR_USE_MULTIPROCESSING, "True").upper() == "TRUE"
 
 
+@lru_cache
+def max_warm_workers() -> int:
+    """Return maximal number of warm worker processes kept alive between isolated subcommands."""
+    return int(os.environ.get(NAVIGATOR_MAX_WARM_WORKERS, DEFAULT_MAX_WARM_WORKERS))
+
+
+@lru_cache
+def max_parallel_units() -> int:
+    """Return maximal number of pipeline execution units run concurrently."""
+    return int(os.environ.get(NAVIGATOR_MAX_PARALLEL_UNITS, DEFAULT_MAX_PARALLEL_UNITS))
+
+
+@lru_cache
+def parallel_devices() -> List[str]:
+    """Return CUDA devices across which concurrently run execution units are distributed."""
+    devices = os.environ.get(NAVIGATOR_PARALLEL_DEVICES, "")
+    return [device.strip() for device in devices.split(",") if device.strip()]
+
+
+@lru_cache
+def device_slots() -> int:
+    """Return maximal number of execution units run concurrently on a single device."""
+    return int(os.environ.get(NAVIGATOR_DEVICE_SLOTS, DEFAULT_DEVICE_SLOTS))
+
+
+@lru_cache
+def package_workers() -> int:
+    """Return number of threads compressing and extracting files of the .nav package."""
+    default_workers = min(DEFAULT_MAX_PACKAGE_WORKERS, os.cpu_count() or 1)
+    return int(os.environ.get(NAVIGATOR_PACKAGE_WORKERS, default_workers))
+
+
+@lru_cache
+def resume_pipelines() -> bool:
+    """Return flag whether to reuse results of units which succeeded in the previous run in the workspace."""
+    return os.environ.get(NAVIGATOR_RESUME, "False").upper() == "TRUE"
+
+
+@lru_cache
+def artifact_cache_type() -> str:
+    """Return type of the cache of exported and converted models, `none` disables the cache."""
+    return os.environ.get(NAVIGATOR_ARTIFACT_CACHE_TYPE, DEFAULT_ARTIFACT_CACHE_TYPE).lower()
+
+
+@lru_cache
+def artifact_cache_dir() -> Optional[str]:
+    """Return directory of the disk cache of exported and converted models."""
+    return os.environ.get(NAVIGATOR_ARTIFACT_CACHE_DIR)
+
+
+@lru_cache
+def artifact_cache_max_size() -> int:
+    """Return maximal size in bytes of models stored in the disk cache."""
+    return int(os.environ.get(NAVIGATOR_ARTIFACT_CACHE_MAX_SIZE, DEFAULT_ARTIFACT_CACHE_MAX_SIZE))
+
+
 @lru_cache
 def get_console_output() -> str:
     """Returns what should be put on the console."""
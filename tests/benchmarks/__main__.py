@@ -0,0 +1,86 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Run benchmarks of runner and pipeline hot paths.
+
+Example usage:
+
+    python -m tests.benchmarks --output baseline.json
+    python -m tests.benchmarks --output current.json --baseline baseline.json --threshold 0.25
+
+The command exits with code 1 when any benchmark regressed compared to the baseline.
+"""
+
+import argparse
+import pathlib
+import sys
+import tempfile
+
+from tabulate import tabulate
+
+import tests.benchmarks.suite  # noqa: F401
+from tests.benchmarks.harness import DEFAULT_THRESHOLD, find_regressions, load_results, run_benchmarks, save_results
+
+
+def main() -> int:
+    """Run benchmarks, save results and compare them with the baseline."""
+    parser = argparse.ArgumentParser(description="Benchmarks of Model Navigator hot paths.")
+    parser.add_argument("--output", type=pathlib.Path, help="Path of JSON file with results.")
+    parser.add_argument("--baseline", type=pathlib.Path, help="Path of JSON file with results of the baseline run.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed relative increase of time and peak memory per call compared to the baseline.",
+    )
+    parser.add_argument("--filter", dest="pattern", help="Regular expression selecting benchmarks by name.")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Minimal time in seconds of each benchmark.")
+    parser.add_argument("--repeats", type=int, default=5, help="Number of timed repeats of each benchmark.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results = run_benchmarks(
+            pathlib.Path(workdir), pattern=args.pattern, min_time=args.min_time, repeats=args.repeats
+        )
+
+    baseline = load_results(args.baseline) if args.baseline else {}
+    rows = []
+    for result in results:
+        reference = baseline.get(result.name)
+        rows.append([
+            result.name,
+            f"{result.time_per_call:.2f}",
+            f"{result.time_per_call / reference.time_per_call:.2f}x" if reference else "-",
+            f"{result.throughput:.0f}",
+            result.peak_memory,
+            result.retained_memory,
+        ])
+    print(  # noqa: T201
+        tabulate(
+            rows,
+            headers=["Benchmark", "Time per call [us]", "vs baseline", "Calls per second", "Peak [B]", "Retained [B]"],
+        )
+    )
+
+    if args.output:
+        save_results(results, args.output)
+
+    regressions = find_regressions(results, baseline, threshold=args.threshold)
+    for regression in regressions:
+        print(f"Regression: {regression}", file=sys.stderr)  # noqa: T201
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Harness measuring time and memory of a single call of benchmarked function.
+
+Each benchmark is a generator function which prepares the state, yields a callable and cleans up after measurements:
+
+    @register("runner/python/infer")
+    def _python_runner_infer(workdir):
+        with runner:
+            yield lambda: runner.infer(feed_dict)
+"""
+
+import dataclasses
+import json
+import pathlib
+import platform
+import re
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from model_navigator.__version__ import __version__
+
+BenchmarkFactory = Callable[[pathlib.Path], Iterator[Callable[[], None]]]
+
+BENCHMARKS: Dict[str, BenchmarkFactory] = {}
+
+DEFAULT_THRESHOLD = 0.25
+# absolute tolerance of peak memory in bytes, small allocations vary between Python builds
+MEMORY_TOLERANCE = 1024
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    """Result of a benchmark.
+
+    Args:
+        name: Name of the benchmark
+        calls: Number of calls in a single timed repeat
+        time_per_call: Median time of a single call in microseconds
+        throughput: Number of calls per second
+        peak_memory: Peak of memory allocated by Python during a single call in bytes
+        retained_memory: Memory allocated by a single call and not released after it in bytes
+    """
+
+    name: str
+    calls: int
+    time_per_call: float
+    throughput: float
+    peak_memory: int
+    retained_memory: int
+
+
+def register(name: str) -> Callable[[BenchmarkFactory], BenchmarkFactory]:
+    """Register benchmark under the name.
+
+    Args:
+        name: Unique name of the benchmark
+
+    Returns:
+        Decorator registering the benchmark factory
+    """
+
+    def _register(factory: BenchmarkFactory) -> BenchmarkFactory:
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark {name} is already registered.")
+        BENCHMARKS[name] = factory
+        return factory
+
+    return _register
+
+
+def measure(name: str, func: Callable[[], None], min_time: float = 0.5, repeats: int = 5) -> BenchmarkResult:
+    """Measure time and memory of a single call of the function.
+
+    The number of calls is doubled until a repeat lasts at least `min_time / repeats`. The median of repeats
+    is reported to reduce noise of other processes. Memory is measured with `tracemalloc` in a separate call,
+    because tracing slows the execution down.
+
+    Args:
+        name: Name of the benchmark
+        func: Function to benchmark
+        min_time: Minimal total time of timed repeats in seconds
+        repeats: Number of timed repeats
+
+    Returns:
+        BenchmarkResult
+    """
+    for _ in range(3):
+        func()
+
+    calls = 1
+    while _time_calls(func, calls) < min_time / repeats and calls < 2**20:
+        calls *= 2
+
+    time_per_call = statistics.median(_time_calls(func, calls) / calls for _ in range(repeats)) * 1e6
+
+    tracemalloc.start()
+    try:
+        func()
+        tracemalloc.reset_peak()
+        start_memory, _ = tracemalloc.get_traced_memory()
+        func()
+        end_memory, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        name=name,
+        calls=calls,
+        time_per_call=time_per_call,
+        throughput=1e6 / time_per_call,
+        peak_memory=peak_memory - start_memory,
+        retained_memory=end_memory - start_memory,
+    )
+
+
+def run_benchmarks(
+    workdir: pathlib.Path, pattern: Optional[str] = None, min_time: float = 0.5, repeats: int = 5
+) -> List[BenchmarkResult]:
+    """Run registered benchmarks.
+
+    Args:
+        workdir: Directory for files created by benchmarks
+        pattern: Regular expression selecting names of benchmarks to run
+        min_time: Minimal total time of timed repeats of each benchmark in seconds
+        repeats: Number of timed repeats
+
+    Returns:
+        Results of benchmarks in the order of registration
+    """
+    results = []
+    np.random.seed(0)
+    for name, factory in BENCHMARKS.items():
+        if pattern is not None and not re.search(pattern, name):
+            continue
+
+        benchmark_dir = workdir / name.replace("/", "_")
+        benchmark_dir.mkdir(parents=True, exist_ok=True)
+        generator = factory(benchmark_dir)
+        func = next(generator, None)
+        if func is None:
+            # requirements of the benchmark are not available
+            continue
+
+        try:
+            results.append(measure(name, func, min_time=min_time, repeats=repeats))
+        finally:
+            next(generator, None)
+
+    return results
+
+
+def find_regressions(
+    results: List[BenchmarkResult], baseline: Dict[str, BenchmarkResult], threshold: float = DEFAULT_THRESHOLD
+) -> List[str]:
+    """Compare results with the baseline.
+
+    Args:
+        results: Results of benchmarks
+        baseline: Results of the baseline run by names
+        threshold: Allowed relative increase of the time and the peak memory of a call
+
+    Returns:
+        Descriptions of regressions, empty when no regression was found
+    """
+    regressions = []
+    for result in results:
+        reference = baseline.get(result.name)
+        if reference is None:
+            continue
+
+        if result.time_per_call > reference.time_per_call * (1 + threshold):
+            regressions.append(
+                f"{result.name}: time per call {result.time_per_call:.2f}us "
+                f"exceeds baseline {reference.time_per_call:.2f}us by more than {threshold:.0%}"
+            )
+
+        if result.peak_memory > reference.peak_memory * (1 + threshold) + MEMORY_TOLERANCE:
+            regressions.append(
+                f"{result.name}: peak memory {result.peak_memory}B "
+                f"exceeds baseline {reference.peak_memory}B by more than {threshold:.0%}"
+            )
+
+    return regressions
+
+
+def save_results(results: List[BenchmarkResult], path: pathlib.Path) -> None:
+    """Save results with description of the environment to JSON file.
+
+    Args:
+        results: Results of benchmarks
+        path: Path of the JSON file
+    """
+    data = {
+        "metadata": {
+            "model_navigator_version": __version__,
+            "python_version": platform.python_version(),
+            "numpy_version": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": {result.name: dataclasses.asdict(result) for result in results},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as fp:
+        json.dump(data, fp, indent=2)
+
+
+def load_results(path: pathlib.Path) -> Dict[str, BenchmarkResult]:
+    """Load results saved with `save_results`.
+
+    Args:
+        path: Path of the JSON file
+
+    Returns:
+        Results of benchmarks by names
+    """
+    with path.open("r") as fp:
+        data = json.load(fp)
+
+    return {name: BenchmarkResult(**result) for name, result in data["results"].items()}
+
+
+def _time_calls(func: Callable[[], None], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return time.perf_counter() - start
@@ -0,0 +1,250 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Synthetic benchmarks of runner and pipeline hot paths.
+
+Models and samples are tiny and run on CPU, so results show the overhead of Model Navigator rather than
+the compute time of frameworks.
+"""
+
+import pathlib
+
+import numpy as np
+
+from model_navigator.commands.base import CommandOutput, CommandStatus, ExecutionUnit
+from model_navigator.commands.correctness.correctness import Correctness
+from model_navigator.commands.performance.performance import Performance
+from model_navigator.commands.performance.results import ProfilingResults
+from model_navigator.configuration import TensorType
+from model_navigator.configuration.model.model_config import ONNXModelConfig
+from model_navigator.core.dataloader import load_samples, samples_to_npz, samples_to_store
+from model_navigator.core.tensor import PyTreeMetadata, TensorMetadata
+from model_navigator.core.workspace import Workspace
+from model_navigator.frameworks import is_torch_available
+from model_navigator.pipelines.pipeline_context import PipelineContext
+from model_navigator.runners.base import InferenceStep, InferenceStepTimer, InferenceTime
+from model_navigator.runners.onnx import OnnxrtCPURunner
+from model_navigator.runners.python import PythonRunner
+from tests.benchmarks.harness import register
+
+BATCH_SIZE = 4
+NUM_FEATURES = 16
+
+
+def _input_metadata() -> TensorMetadata:
+    metadata = TensorMetadata(pytree_metadata=PyTreeMetadata("input__0", TensorType.NUMPY))
+    metadata.add("input__0", shape=(-1, NUM_FEATURES), dtype=np.float32)
+    return metadata
+
+
+def _output_metadata() -> TensorMetadata:
+    metadata = TensorMetadata(pytree_metadata=PyTreeMetadata("output__0", TensorType.NUMPY))
+    metadata.add("output__0", shape=(-1, NUM_FEATURES), dtype=np.float32)
+    return metadata
+
+
+def _feed_dict():
+    return {"input__0": np.random.rand(BATCH_SIZE, NUM_FEATURES).astype(np.float32)}
+
+
+def _nested_sample():
+    return (
+        np.random.rand(BATCH_SIZE, NUM_FEATURES).astype(np.float32),
+        {
+            "mask": np.ones((BATCH_SIZE, NUM_FEATURES), dtype=np.int64),
+            "features": [np.random.rand(BATCH_SIZE, 2).astype(np.float32) for _ in range(4)],
+        },
+    )
+
+
+def _python_runner_infer(check_inputs):
+    runner = PythonRunner(
+        model=lambda x: x,
+        input_metadata=_input_metadata(),
+        output_metadata=_output_metadata(),
+        enable_timer=True,
+    )
+    feed_dict = _feed_dict()
+    with runner:
+        yield lambda: runner.infer(feed_dict, check_inputs=check_inputs)
+
+
+@register("runner/python/infer")
+def _python_runner(workdir: pathlib.Path):
+    yield from _python_runner_infer(check_inputs=False)
+
+
+@register("runner/python/infer_check_inputs")
+def _python_runner_check_inputs(workdir: pathlib.Path):
+    yield from _python_runner_infer(check_inputs=True)
+
+
+def _save_onnx_model(path: pathlib.Path) -> None:
+    import onnx
+
+    node = onnx.helper.make_node("Relu", inputs=["input__0"], outputs=["output__0"])
+    graph = onnx.helper.make_graph(
+        [node],
+        "relu",
+        [onnx.helper.make_tensor_value_info("input__0", onnx.TensorProto.FLOAT, [None, NUM_FEATURES])],
+        [onnx.helper.make_tensor_value_info("output__0", onnx.TensorProto.FLOAT, [None, NUM_FEATURES])],
+    )
+    model = onnx.helper.make_model(graph, opset_imports=[onnx.helper.make_opsetid("", 17)])
+    model.ir_version = 8
+    onnx.save(model, path.as_posix())
+
+
+@register("runner/python/infer_telemetry")
+def _python_runner_telemetry(workdir: pathlib.Path):
+    runner = PythonRunner(model=lambda x: x, input_metadata=_input_metadata(), output_metadata=_output_metadata())
+    runner.enable_telemetry()
+    feed_dict = _feed_dict()
+    with runner:
+        yield lambda: runner.infer(feed_dict)
+
+
+@register("runner/onnxruntime_cpu/infer")
+def _onnxrt_cpu_runner(workdir: pathlib.Path):
+    model_path = workdir / "model.onnx"
+    _save_onnx_model(model_path)
+    runner = OnnxrtCPURunner(
+        model=model_path,
+        input_metadata=_input_metadata(),
+        output_metadata=_output_metadata(),
+        enable_timer=True,
+    )
+    feed_dict = _feed_dict()
+    with runner:
+        yield lambda: runner.infer(feed_dict)
+
+
+@register("runner/torch_cpu/infer")
+def _torch_cpu_runner(workdir: pathlib.Path):
+    if not is_torch_available():
+        return
+
+    import torch
+
+    from model_navigator.runners.torch import TorchCPURunner
+
+    num_threads = torch.get_num_threads()
+    torch.set_num_threads(1)
+    runner = TorchCPURunner(
+        model=torch.nn.ReLU(),
+        input_metadata=_input_metadata(),
+        output_metadata=_output_metadata(),
+    )
+    feed_dict = _feed_dict()
+    try:
+        with runner:
+            yield lambda: runner.infer(feed_dict)
+    finally:
+        torch.set_num_threads(num_threads)
+
+
+@register("runner/inference_step_timer")
+def _inference_step_timer(workdir: pathlib.Path):
+    timer = InferenceStepTimer(InferenceTime(), enabled=True)
+
+    def _measure():
+        timer.inference_time = InferenceTime()
+        with timer.measure_step(InferenceStep.TOTAL):
+            with timer.measure_step(InferenceStep.COMPUTE):
+                pass
+
+    yield _measure
+
+
+@register("tensor/flatten_sample")
+def _flatten_sample(workdir: pathlib.Path):
+    sample = _nested_sample()
+    metadata = PyTreeMetadata.from_sample(sample, TensorType.NUMPY, prefix="input")
+    yield lambda: metadata.flatten_sample(sample)
+
+
+@register("tensor/unflatten_sample")
+def _unflatten_sample(workdir: pathlib.Path):
+    sample = _nested_sample()
+    metadata = PyTreeMetadata.from_sample(sample, TensorType.NUMPY, prefix="input")
+    flattened_sample = metadata.flatten_sample(sample)
+    yield lambda: metadata.unflatten_sample(flattened_sample)
+
+
+def _samples():
+    return [_feed_dict() for _ in range(16)]
+
+
+@register("dataloader/samples_to_npz")
+def _samples_to_npz(workdir: pathlib.Path):
+    samples = _samples()
+    yield lambda: samples_to_npz(samples, workdir / "model_input" / "profiling", batch_dim=0)
+
+
+@register("dataloader/load_samples_npz")
+def _load_samples_npz(workdir: pathlib.Path):
+    samples_to_npz(_samples(), workdir / "model_input" / "profiling", batch_dim=0)
+    yield lambda: list(load_samples("profiling_data", workdir, batch_dim=0))
+
+
+@register("dataloader/samples_to_store")
+def _samples_to_store(workdir: pathlib.Path):
+    samples = _samples()
+    yield lambda: samples_to_store(samples, workdir / "model_input" / "profiling", batch_dim=0)
+
+
+@register("dataloader/load_samples_store")
+def _load_samples_store(workdir: pathlib.Path):
+    samples_to_store(_samples(), workdir / "model_input" / "profiling", batch_dim=0)
+    yield lambda: list(load_samples("profiling_data", workdir, batch_dim=0))
+
+
+def _measurements(count: int):
+    return [
+        InferenceTime(**{InferenceStep.TOTAL.value: float(value), InferenceStep.COMPUTE.value: float(value) / 2})
+        for value in np.random.rand(count)
+    ]
+
+
+def _profiling_results(batch_size: int) -> ProfilingResults:
+    return ProfilingResults.from_measurements(_measurements(50), [None], batch_size=batch_size, sample_id=0)
+
+
+@register("pipeline/pipeline_context_save")
+def _pipeline_context_save(workdir: pathlib.Path):
+    workspace = Workspace(workdir / "workspace")
+    workspace.initialize()
+    context = PipelineContext(workspace)
+    context.initialize()
+    for opset in range(13, 18):
+        model_config = ONNXModelConfig(
+            opset=opset, dynamo_export=False, graph_surgeon_optimization=True, dynamic_axes=None
+        )
+        context.update(
+            ExecutionUnit(command=Correctness, model_config=model_config, runner_cls=OnnxrtCPURunner),
+            CommandOutput(status=CommandStatus.OK),
+        )
+        context.update(
+            ExecutionUnit(command=Performance, model_config=model_config, runner_cls=OnnxrtCPURunner),
+            CommandOutput(
+                status=CommandStatus.OK,
+                output={"profiling_results": [_profiling_results(batch_size) for batch_size in (1, 2, 4, 8, 16, 32)]},
+            ),
+        )
+
+    yield context.save
+
+
+@register("performance/profiling_results_from_measurements")
+def _profiling_results_from_measurements(workdir: pathlib.Path):
+    measurements = _measurements(100)
+    yield lambda: ProfilingResults.from_measurements(measurements, [None] * 100, batch_size=BATCH_SIZE, sample_id=0)
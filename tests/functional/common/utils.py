@@ -41,10 +41,10 @@ EVALUATION_FILES = [
 COMMON_FILES = [
     r"navigator\.log",
     r"status\.yaml",
-    r"model\_input/correctness/0*\.npz",
-    r"model\_input/profiling/0*\.npz",
-    r"model\_output/correctness/0*\.npz",
-    r"model\_output/profiling/0*\.npz",
+    r"model\_input/correctness/index\.json",
+    r"model\_input/profiling/index\.json",
+    r"model\_output/correctness/index\.json",
+    r"model\_output/profiling/index\.json",
 ]
 
 
@@ -945,7 +945,11 @@ def tensorflow_package_with_optimal_model_tensorflow_tensorrt_and_dummy_navigato
                                 "VerifyModel": CommandStatus.OK,
                             },
                             result={
-                                "Correctness": {"per_output_tolerance": {"output__0": Tolerance(atol=0.0, rtol=0.0)}},
+                                "Correctness": {
+                                    "per_output_tolerance": TolerancePerOutputName({
+                                        "output__0": Tolerance(atol=0.0, rtol=0.0)
+                                    })
+                                },
                                 "Performance": {
                                     "profiling_results": [
                                         ProfilingResults(
@@ -978,7 +982,11 @@ def tensorflow_package_with_optimal_model_tensorflow_tensorrt_and_dummy_navigato
                                 "VerifyModel": CommandStatus.OK,
                             },
                             result={
-                                "Correctness": {"per_output_tolerance": {"output__0": Tolerance(atol=0.0, rtol=0.0)}},
+                                "Correctness": {
+                                    "per_output_tolerance": TolerancePerOutputName({
+                                        "output__0": Tolerance(atol=0.0, rtol=0.0)
+                                    })
+                                },
                                 "Performance": {
                                     "profiling_results": [
                                         ProfilingResults(
@@ -0,0 +1,67 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from model_navigator.commands.correctness.correctness import Tolerance, TolerancePerOutputName
+from model_navigator.commands.performance.results import ProfilingResults
+from model_navigator.package.status import CommandStatus, RunnerStatus
+
+
+def profiling_result(
+    batch_size,
+    latency,
+    concurrency=1,
+    sample_id=0,
+    p90_factor=1.0,
+    p95_factor=1.0,
+    p99_factor=1.0,
+    **kwargs,
+):
+    """Profiling result with percentiles of latency scaled by factors and throughput matching the latency.
+
+    Remaining fields of `ProfilingResults` can be overridden with `kwargs`.
+    """
+    fields = {
+        "sample_id": sample_id,
+        "batch_size": batch_size,
+        "avg_latency": latency,
+        "std_latency": 0.0,
+        "p50_latency": latency,
+        "p90_latency": latency * p90_factor,
+        "p95_latency": latency * p95_factor,
+        "p99_latency": latency * p99_factor,
+        "throughput": 1000 * (batch_size or 1) * concurrency / latency,
+        "request_count": 50,
+        "concurrency": concurrency,
+    }
+    fields.update(kwargs)
+    return ProfilingResults(**fields)
+
+
+def runner_status(runner_name, profiling_results, atol=0.0, rtol=0.0, status=CommandStatus.OK):
+    """Status of runner with profiling results and tolerance of the first output, the second output is exact.
+
+    `status` is the status of the performance evaluation.
+    """
+    return RunnerStatus(
+        runner_name=runner_name,
+        status={"Correctness": CommandStatus.OK, "Performance": status},
+        result={
+            "Correctness": {
+                "per_output_tolerance": TolerancePerOutputName({
+                    "output__0": Tolerance(atol=atol, rtol=rtol),
+                    "output__1": Tolerance(atol=0.0, rtol=0.0),
+                })
+            },
+            "Performance": {"profiling_results": profiling_results},
+        },
+    )
@@ -18,10 +18,14 @@ import pytest
 from model_navigator.configuration import (
     DEFAULT_TENSORRT_PRECISION,
     DEFAULT_TENSORRT_PRECISION_MODE,
+    BatchSizeSearch,
     CustomConfigForFormat,
     Format,
     JitType,
     OnnxConfig,
+    OnnxExecutionMode,
+    OnnxGraphOptimizationLevel,
+    OnnxSessionOptions,
     OptimizationProfile,
     TensorFlowConfig,
     TensorFlowTensorRTConfig,
@@ -172,6 +176,38 @@ def test_onnx_config_has_valid_name_and_format():
     assert config.format == Format.ONNX
 
 
+def test_onnx_config_parse_session_options_when_dictionaries_provided():
+    config = OnnxConfig.from_dict({
+        "session_options": [
+            {"intra_op_num_threads": 4, "graph_optimization_level": "basic"},
+            {"execution_mode": "parallel"},
+        ]
+    })
+
+    assert config.session_options == (
+        OnnxSessionOptions(intra_op_num_threads=4, graph_optimization_level=OnnxGraphOptimizationLevel.BASIC),
+        OnnxSessionOptions(execution_mode=OnnxExecutionMode.PARALLEL),
+    )
+
+
+def test_onnx_config_wrap_session_options_in_tuple_when_single_options_provided():
+    session_options = OnnxSessionOptions(enable_cpu_mem_arena=False)
+
+    config = OnnxConfig(session_options=session_options)
+
+    assert config.session_options == (session_options,)
+
+
+def test_onnx_config_raise_error_when_session_options_duplicated():
+    with pytest.raises(ModelNavigatorConfigurationError):
+        OnnxConfig(session_options=[OnnxSessionOptions(intra_op_num_threads=1), {"intra_op_num_threads": 1}])
+
+
+def test_onnx_session_options_raise_error_when_number_of_threads_less_than_0():
+    with pytest.raises(ModelNavigatorConfigurationError):
+        OnnxSessionOptions(intra_op_num_threads=-1)
+
+
 def test_tensorrt_config_has_valid_name_and_format():
     config = TensorRTConfig()
     assert config.name() == "TensorRT"
@@ -410,3 +446,33 @@ def test_optimization_config_is_cloning_correctly():
     assert len(opt_config.runners) == 5
     assert opt_config.optimization_profile.max_batch_size == 64
     assert opt_config.custom_configs[0].autocast is False
+
+
+def test_optimization_profile_raise_error_when_concurrency_is_empty():
+    with pytest.raises(ModelNavigatorConfigurationError, match="`concurrency` must contain at least one value."):
+        OptimizationProfile(concurrency=[])
+
+
+def test_optimization_profile_raise_error_when_concurrency_less_than_1():
+    with pytest.raises(ModelNavigatorConfigurationError, match="`concurrency` values must be greater or equal 1."):
+        OptimizationProfile(concurrency=[1, 0])
+
+
+def test_optimization_profile_from_dict_return_concurrency_when_provided():
+    optimization_profile = OptimizationProfile.from_dict(OptimizationProfile(concurrency=[1, 4]).to_dict())
+
+    assert optimization_profile.concurrency == [1, 4]
+
+
+def test_optimization_profile_from_dict_return_adaptive_search_when_serialized_to_dict():
+    optimization_profile = OptimizationProfile(batch_size_search=BatchSizeSearch.ADAPTIVE, latency_budget=5.0)
+
+    data = optimization_profile.to_dict(parse=True)
+
+    assert data["batch_size_search"] == "adaptive"
+    assert OptimizationProfile.from_dict(data) == optimization_profile
+
+
+def test_optimization_profile_raise_error_when_latency_budget_is_not_positive():
+    with pytest.raises(ModelNavigatorConfigurationError, match="`latency_budget` must be greater than 0.0."):
+        OptimizationProfile(latency_budget=0.0)
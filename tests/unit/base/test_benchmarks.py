@@ -0,0 +1,71 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+import tempfile
+
+from tests.benchmarks.harness import BenchmarkResult, find_regressions, load_results, measure, save_results
+
+
+def _result(name, time_per_call, peak_memory=0):
+    return BenchmarkResult(
+        name=name,
+        calls=1,
+        time_per_call=time_per_call,
+        throughput=1e6 / time_per_call,
+        peak_memory=peak_memory,
+        retained_memory=0,
+    )
+
+
+def test_measure_return_time_and_memory_per_call():
+    buffers = []
+
+    result = measure("append", lambda: buffers.append(bytearray(100_000)), min_time=0.01, repeats=2)
+
+    assert result.calls >= 1
+    assert result.time_per_call > 0
+    assert result.throughput == 1e6 / result.time_per_call
+    assert result.peak_memory >= 100_000
+    assert result.retained_memory >= 100_000
+
+
+def test_find_regressions_return_results_slower_or_allocating_more_than_threshold():
+    baseline = {
+        "fast": _result("fast", 10.0, peak_memory=10_000),
+        "slow": _result("slow", 10.0),
+        "memory": _result("memory", 10.0, peak_memory=10_000),
+    }
+    results = [
+        _result("fast", 11.0, peak_memory=11_000),
+        _result("slow", 13.0),
+        _result("memory", 10.0, peak_memory=20_000),
+        _result("new", 100.0),
+    ]
+
+    regressions = find_regressions(results, baseline, threshold=0.25)
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith("slow: time per call")
+    assert regressions[1].startswith("memory: peak memory")
+
+
+def test_save_results_can_be_loaded_as_baseline():
+    results = [_result("fast", 10.0), _result("slow", 20.0)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = pathlib.Path(tmp_dir) / "results.json"
+        save_results(results, path)
+        baseline = load_results(path)
+
+    assert baseline == {result.name: result for result in results}
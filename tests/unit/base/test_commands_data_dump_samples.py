@@ -0,0 +1,119 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+
+from model_navigator.commands.base import CommandStatus
+from model_navigator.commands.data_dump.samples import FetchOutputModelData, _infer_batched
+from model_navigator.core.dataloader import load_samples, samples_to_store
+from model_navigator.core.tensor import TensorMetadata
+from model_navigator.core.workspace import Workspace
+
+
+class _Runner:
+    activations = 0
+    batch_sizes = []
+
+    def __init__(self, model, input_metadata, output_metadata, **kwargs):
+        self._model = model
+
+    def __enter__(self):
+        _Runner.activations += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def infer(self, feed_dict):
+        _Runner.batch_sizes.append(feed_dict["x"].shape[0])
+        return self._model(feed_dict)
+
+
+def _run(workspace, model, correctness_samples, dataloader_max_batch_size, input_shape=(-1, 2)):
+    _Runner.activations, _Runner.batch_sizes = 0, []
+    model_input = workspace / "model_input"
+    samples_to_store(correctness_samples[:1], model_input / "profiling", batch_dim=0)
+    samples_to_store(correctness_samples, model_input / "correctness", batch_dim=0)
+    samples_to_store(correctness_samples[:2], model_input / "conversion", batch_dim=0)
+
+    output = FetchOutputModelData().run(
+        workspace=Workspace(workspace),
+        model=model,
+        runner_cls=_Runner,
+        input_metadata=TensorMetadata().add("x", input_shape, np.float32),
+        output_metadata=TensorMetadata().add("y", input_shape, np.float32),
+        batch_dim=0,
+        dataloader_max_batch_size=dataloader_max_batch_size,
+    )
+    assert output.status == CommandStatus.OK
+
+    return [sample["y"] for sample in load_samples("correctness_samples_output", workspace, batch_dim=0)]
+
+
+def _get_samples():
+    shapes = [2, 2, 2, 3, 3, 2, 2, 2, 2, 2]
+    return [{"x": np.full((1, width), index, dtype=np.float32)} for index, width in enumerate(shapes)]
+
+
+def test_fetch_output_model_data_batch_consecutive_samples_with_same_shapes(tmp_path):
+    samples = _get_samples()
+
+    outputs = _run(tmp_path, lambda feed_dict: {"y": feed_dict["x"] * 2}, samples, dataloader_max_batch_size=4)
+
+    assert _Runner.activations == 1
+    # profiling, correctness grouped by shapes and limited to 4 samples, conversion
+    assert _Runner.batch_sizes == [1, 3, 2, 4, 1, 2]
+    assert len(outputs) == len(samples)
+    for output, sample in zip(outputs, samples):
+        assert np.array_equal(output, sample["x"] * 2)
+
+
+def test_fetch_output_model_data_infer_samples_one_by_one_when_outputs_cannot_be_split(tmp_path):
+    samples = _get_samples()
+
+    outputs = _run(tmp_path, lambda feed_dict: {"y": np.ones((1, 5))}, samples, dataloader_max_batch_size=4)
+
+    # batch is inferred first and then each of its samples
+    assert _Runner.batch_sizes == [1, 3, 1, 1, 1, 2, 1, 1, 4, 1, 1, 1, 1, 1, 2, 1, 1]
+    for output in outputs:
+        assert np.array_equal(output, np.ones((1, 5)))
+
+
+def test_fetch_output_model_data_infer_samples_one_by_one_when_batch_size_is_static(tmp_path):
+    samples = _get_samples()
+
+    _run(
+        tmp_path,
+        lambda feed_dict: {"y": feed_dict["x"] * 2},
+        samples,
+        dataloader_max_batch_size=4,
+        input_shape=(1, 2),
+    )
+
+    assert _Runner.activations == 1
+    assert _Runner.batch_sizes == [1] * 13
+
+
+def test_infer_batched_limit_batches_by_rows_of_batched_samples():
+    batch_sizes = [2, 2, 2, 2, 3, 3, 8, 1]
+    samples = [{"x": np.full((batch_size, 2), index, dtype=np.float32)} for index, batch_size in enumerate(batch_sizes)]
+    _Runner.batch_sizes = []
+    runner = _Runner(lambda feed_dict: {"y": feed_dict["x"] * 2}, None, None)
+
+    outputs = list(_infer_batched(runner, samples, batch_dim=0, max_batch_size=8))
+
+    # batches never exceed 8 rows and larger samples are inferred alone
+    assert _Runner.batch_sizes == [8, 6, 8, 1]
+    assert len(outputs) == len(samples)
+    for output, sample in zip(outputs, samples):
+        assert np.array_equal(output["y"], sample["x"] * 2)
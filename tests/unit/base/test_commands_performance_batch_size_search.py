@@ -0,0 +1,79 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from model_navigator.commands.performance.batch_size_search import AdaptiveBatchSizeSearch
+from model_navigator.commands.performance.results import ProfilingResults
+from model_navigator.runners.base import InferenceTime
+
+
+class LinearLatencyModel:
+    def __init__(self, overhead, cost):
+        self.overhead = overhead
+        self.cost = cost
+        self.measured = []
+
+    def __call__(self, batch_size):
+        self.measured.append(batch_size)
+        latency = self.overhead + self.cost * batch_size
+        return ProfilingResults.from_measurements(
+            [InferenceTime(total=latency)] * 3, [1500.0], batch_size=batch_size, sample_id=0
+        )
+
+
+def test_adaptive_batch_size_search_return_batch_sizes_upto_knee_when_throughput_saturates():
+    measure = LinearLatencyModel(overhead=2.0, cost=0.1)
+
+    batch_sizes = AdaptiveBatchSizeSearch(measure=measure, max_batch_size=2**30, throughput_cutoff_threshold=0.05).run()
+
+    # knee for throughput at least 95% of throughput for batch size 1024
+    throughput_1024 = 1024 / (2.0 + 0.1 * 1024)
+    knee = min(b for b in range(1, 1025) if b / (2.0 + 0.1 * b) >= 0.95 * throughput_1024)
+    assert batch_sizes[-1] == knee
+    assert knee not in (2**i for i in range(31))
+    assert len(measure.measured) < 11
+
+
+def test_adaptive_batch_size_search_return_largest_batch_size_within_latency_budget_when_budget_provided():
+    measure = LinearLatencyModel(overhead=2.0, cost=0.1)
+
+    search = AdaptiveBatchSizeSearch(
+        measure=measure, max_batch_size=2**30, throughput_cutoff_threshold=0.05, latency_budget=10.05
+    )
+    search.run()
+
+    assert search._refine_latency_budget(model=None) == 80
+    assert 80 in measure.measured
+    assert 81 in measure.measured
+
+
+def test_adaptive_batch_size_search_return_probes_upto_max_batch_size_when_threshold_is_none():
+    measure = LinearLatencyModel(overhead=2.0, cost=0.1)
+
+    batch_sizes = AdaptiveBatchSizeSearch(measure=measure, max_batch_size=100, throughput_cutoff_threshold=None).run()
+
+    assert batch_sizes == [1, 4, 16, 64, 100]
+    assert measure.measured == [1, 4, 16, 64, 100]
+
+
+def test_adaptive_batch_size_search_return_knee_when_latency_budget_is_exceeded_for_batch_size_1():
+    measure = LinearLatencyModel(overhead=2.0, cost=0.1)
+
+    search = AdaptiveBatchSizeSearch(
+        measure=measure, max_batch_size=64, throughput_cutoff_threshold=0.05, latency_budget=1.0
+    )
+    batch_sizes = search.run()
+
+    throughput_64 = 64 / (2.0 + 0.1 * 64)
+    knee = min(b for b in range(1, 65) if b / (2.0 + 0.1 * b) >= 0.95 * throughput_64)
+    assert search._refine_latency_budget(model=None) is None
+    assert batch_sizes[-1] == knee
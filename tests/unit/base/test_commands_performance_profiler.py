@@ -16,10 +16,26 @@ import tempfile
 from unittest.mock import MagicMock
 
 import numpy as np
+import pytest
+from jsonlines import jsonlines
 
 from model_navigator.commands.performance.profiler import OptimizationProfile, Profiler, ProfilingResults
 from model_navigator.commands.performance.utils import is_measurement_stable
-from model_navigator.runners.base import InferenceTime
+from model_navigator.configuration import BatchSizeSearch, DeviceKind, Format
+from model_navigator.runners.base import InferenceTime, NavigatorRunner
+
+
+class IdentityRunner(NavigatorRunner):
+    @classmethod
+    def format(cls):
+        return Format.PYTHON
+
+    @classmethod
+    def devices_kind(cls):
+        return [DeviceKind.CPU]
+
+    def infer_impl(self, feed_dict, *args, **kwargs):
+        return feed_dict
 
 
 def test_batch_size_is_set_correctly_when_no_max_or_batch_sizes_passed():
@@ -330,3 +346,202 @@ def test_profiler_run_return_batch_sizes_upto_16_when_batch_size_16_saturates_th
 
     assert len(results) == 5
     assert results[-1].batch_size == 16
+
+
+def test_profiler_run_return_results_for_each_concurrency_when_concurrency_passed(mocker):
+    mocker.patch("model_navigator.commands.performance.profiler.expand_sample", side_effect=lambda sample, *_: sample)
+    runner_factory = MagicMock(
+        side_effect=lambda: IdentityRunner(
+            model=None, input_metadata=MagicMock(), output_metadata=None, enable_timer=True
+        )
+    )
+    optimization_profile = OptimizationProfile(
+        batch_sizes=[1, 2],
+        concurrency=[4, 1],
+        window_size=2,
+        stabilization_windows=1,
+        min_trials=1,
+        max_trials=1,
+        throughput_cutoff_threshold=None,
+    )
+    with tempfile.NamedTemporaryFile() as temp:
+        profiler = Profiler(
+            profile=optimization_profile,
+            input_metadata=MagicMock(),
+            results_path=pathlib.Path(temp.name),
+        )
+
+        results = profiler.run(
+            runner=IdentityRunner(model=None, input_metadata=MagicMock(), output_metadata=None, enable_timer=True),
+            profiling_sample={"input__0": np.ones((1, 2))},
+            sample_id=0,
+            runner_factory=runner_factory,
+        )
+
+    assert runner_factory.call_count == 3
+    assert [(result.batch_size, result.concurrency) for result in results] == [(1, 1), (1, 4), (2, 1), (2, 4)]
+    assert results[1].request_count == 8
+
+
+def test_profiler_run_return_memory_used_above_process_memory_before_runner_activation(mocker):
+    mocker.patch("model_navigator.commands.performance.profiler.expand_sample", side_effect=lambda sample, *_: sample)
+    process = mocker.patch("model_navigator.commands.performance.profiler.psutil.Process").return_value
+    process.memory_info.side_effect = [MagicMock(rss=1000), MagicMock(rss=1500), MagicMock(rss=1700)]
+    optimization_profile = OptimizationProfile(
+        batch_sizes=[1, 2],
+        window_size=2,
+        stabilization_windows=1,
+        min_trials=1,
+        max_trials=1,
+        throughput_cutoff_threshold=None,
+    )
+    with tempfile.NamedTemporaryFile() as temp:
+        profiler = Profiler(
+            profile=optimization_profile,
+            input_metadata=MagicMock(),
+            results_path=pathlib.Path(temp.name),
+        )
+
+        results = profiler.run(
+            runner=IdentityRunner(model=None, input_metadata=MagicMock(), output_metadata=None, enable_timer=True),
+            profiling_sample={"input__0": np.ones((1, 2))},
+            sample_id=0,
+        )
+
+    assert [result.host_memory for result in results] == [500, 700]
+
+
+def test_profiler_run_profile_only_concurrency_1_when_runner_factory_not_passed(mocker):
+    mocker.patch("model_navigator.commands.performance.profiler.expand_sample", side_effect=lambda sample, *_: sample)
+    optimization_profile = OptimizationProfile(
+        batch_sizes=[1],
+        concurrency=[1, 2],
+        window_size=3,
+        stabilization_windows=1,
+        min_trials=1,
+        max_trials=1,
+        throughput_cutoff_threshold=None,
+    )
+    with tempfile.NamedTemporaryFile() as temp:
+        profiler = Profiler(
+            profile=optimization_profile,
+            input_metadata=MagicMock(),
+            results_path=pathlib.Path(temp.name),
+        )
+
+        results = profiler.run(
+            runner=IdentityRunner(model=None, input_metadata=MagicMock(), output_metadata=None, enable_timer=True),
+            profiling_sample={"input__0": np.ones((1, 2))},
+            sample_id=0,
+        )
+
+    assert len(results) == 1
+    assert results[0].concurrency == 1
+    assert results[0].request_count == 3
+
+
+def test_profiler_run_limit_concurrency_and_number_of_runner_instances(mocker):
+    mocker.patch("model_navigator.commands.performance.profiler.expand_sample", side_effect=lambda sample, *_: sample)
+    mocker.patch("model_navigator.commands.performance.profiler.MAX_CONCURRENCY", 2)
+    runner_factory = MagicMock(
+        side_effect=lambda: IdentityRunner(
+            model=None, input_metadata=MagicMock(), output_metadata=None, enable_timer=True
+        )
+    )
+    optimization_profile = OptimizationProfile(
+        batch_sizes=[1],
+        concurrency=[2, 64],
+        window_size=3,
+        stabilization_windows=1,
+        min_trials=1,
+        max_trials=1,
+        throughput_cutoff_threshold=None,
+    )
+    with tempfile.NamedTemporaryFile() as temp:
+        profiler = Profiler(
+            profile=optimization_profile,
+            input_metadata=MagicMock(),
+            results_path=pathlib.Path(temp.name),
+        )
+
+        results = profiler.run(
+            runner=IdentityRunner(model=None, input_metadata=MagicMock(), output_metadata=None, enable_timer=True),
+            profiling_sample={"input__0": np.ones((1, 2))},
+            sample_id=0,
+            runner_factory=runner_factory,
+        )
+
+    assert runner_factory.call_count == 1
+    assert [result.concurrency for result in results] == [2]
+
+
+def test_profiling_results_from_measurements_return_throughput_scaled_by_concurrency():
+    result = ProfilingResults.from_measurements(
+        [InferenceTime(total=10), InferenceTime(total=10)], [1500, None], batch_size=2, sample_id=0, concurrency=4
+    )
+
+    assert result.concurrency == 4
+    assert result.throughput == 800.0
+    assert ProfilingResults.from_dict(result.to_dict(parse=True)).concurrency == 4
+
+
+def test_profiler_run_return_results_sorted_by_batch_size_when_adaptive_search_is_used(mocker):
+    mocker.patch("model_navigator.commands.performance.profiler.expand_sample", side_effect=lambda sample, *_: sample)
+    mocker.patch(
+        "model_navigator.commands.performance.Profiler._run_measurement",
+        side_effect=lambda runner, nvml_handler, sample, batch_size, *_: ProfilingResults.from_measurements(
+            [InferenceTime(total=2.0 + 0.1 * batch_size)] * 3, [1500, None], batch_size, 0
+        ),
+    )
+
+    optimization_profile = OptimizationProfile(
+        max_batch_size=512, batch_size_search=BatchSizeSearch.ADAPTIVE, latency_budget=10.0
+    )
+    with tempfile.NamedTemporaryFile() as temp:
+        profiler = Profiler(
+            profile=optimization_profile,
+            input_metadata=MagicMock(),
+            results_path=pathlib.Path(temp.name),
+        )
+
+        results = profiler.run(runner=MagicMock(), profiling_sample=MagicMock(), sample_id=0)
+
+        with jsonlines.open(temp.name) as f:
+            saved_batch_sizes = [result["batch_size"] for result in f]
+
+    batch_sizes = [result.batch_size for result in results]
+    assert batch_sizes == sorted(batch_sizes)
+    assert saved_batch_sizes == batch_sizes
+    assert 80 in batch_sizes
+    assert 256 not in batch_sizes
+
+
+def test_profiler_run_save_results_collected_before_adaptive_search_was_interrupted(mocker):
+    mocker.patch("model_navigator.commands.performance.profiler.expand_sample", side_effect=lambda sample, *_: sample)
+
+    def _run_measurement(runner, nvml_handler, sample, batch_size, *_):
+        if batch_size > 4:
+            raise KeyboardInterrupt()
+        return ProfilingResults.from_measurements([InferenceTime(total=2.0)] * 3, [1500, None], batch_size, 0)
+
+    mocker.patch("model_navigator.commands.performance.Profiler._run_measurement", side_effect=_run_measurement)
+
+    optimization_profile = OptimizationProfile(
+        max_batch_size=512, batch_size_search=BatchSizeSearch.ADAPTIVE, latency_budget=10.0
+    )
+    with tempfile.NamedTemporaryFile() as temp:
+        profiler = Profiler(
+            profile=optimization_profile,
+            input_metadata=MagicMock(),
+            results_path=pathlib.Path(temp.name),
+        )
+
+        with pytest.raises(KeyboardInterrupt):
+            profiler.run(runner=MagicMock(), profiling_sample=MagicMock(), sample_id=0)
+
+        with jsonlines.open(temp.name) as f:
+            saved_batch_sizes = [result["batch_size"] for result in f]
+
+    assert saved_batch_sizes
+    assert saved_batch_sizes == sorted(saved_batch_sizes)
+    assert all(batch_size <= 4 for batch_size in saved_batch_sizes)
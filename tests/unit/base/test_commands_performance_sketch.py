@@ -0,0 +1,107 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+
+import numpy as np
+import pytest
+
+from model_navigator.commands.performance.results import ProfilingResults, ProfilingStepResults
+from model_navigator.commands.performance.sketch import LatencySketch
+from model_navigator.runners.base import InferenceTime
+
+
+def test_latency_sketch_percentile_return_values_within_relative_accuracy():
+    values = np.random.default_rng(0).lognormal(mean=1.0, sigma=0.5, size=10000)
+
+    sketch = LatencySketch.from_values(values, relative_accuracy=0.01)
+
+    for q in [0, 50, 90, 95, 99, 100]:
+        assert sketch.percentile(q) == pytest.approx(np.percentile(values, q), rel=0.02)
+    assert sketch.mean() == pytest.approx(np.mean(values))
+    assert sketch.std() == pytest.approx(np.std(values))
+    assert sketch.count == 10000
+
+
+def test_latency_sketch_merge_return_same_sketch_as_for_all_values():
+    values = np.random.default_rng(0).exponential(scale=5.0, size=3000)
+
+    sketch = LatencySketch()
+    for window in np.split(values, 3):
+        sketch.merge(LatencySketch.from_values(window))
+
+    expected_sketch = LatencySketch.from_values(values)
+    assert sketch.buckets == expected_sketch.buckets
+    assert sketch.count == expected_sketch.count
+    assert sketch.min_value == expected_sketch.min_value
+    assert sketch.max_value == expected_sketch.max_value
+
+
+def test_latency_sketch_merge_raise_error_when_relative_accuracy_differs():
+    with pytest.raises(ValueError):
+        LatencySketch(relative_accuracy=0.01).merge(LatencySketch(relative_accuracy=0.02))
+
+
+def test_latency_sketch_from_dict_return_same_sketch_when_serialized_to_json():
+    sketch = LatencySketch.from_values([0.0, 1.5, 2.0, 2.0, 40.0])
+
+    data = json.loads(json.dumps(sketch.to_dict(parse=True)))
+
+    assert LatencySketch.from_dict(data) == sketch
+
+
+def test_profiling_results_from_profiling_results_return_tail_latency_of_all_windows():
+    windows = [[1.0] * 99 + [1.0], [1.0] * 99 + [1.0], [1.0] * 90 + [100.0] * 10]
+    results = [
+        ProfilingResults.from_measurements(
+            [InferenceTime(total=value) for value in window], gpu_clocks=[None], batch_size=1, sample_id=0
+        )
+        for window in windows
+    ]
+
+    result = ProfilingResults.from_profiling_results(results)
+
+    all_values = np.concatenate(windows)
+    assert result.avg_latency == pytest.approx(np.mean(all_values))
+    assert result.std_latency == pytest.approx(np.std(all_values))
+    assert result.p50_latency == pytest.approx(1.0, rel=0.01)
+    assert result.p99_latency == pytest.approx(100.0, rel=0.01)
+    assert result.detailed_results["total"].sketch.count == 300
+
+
+def test_profiling_results_from_profiling_results_average_statistics_when_sketches_missing():
+    step_result = ProfilingStepResults(
+        avg_time=1.0, std_time=0.1, p50_time=1.0, p90_time=2.0, p95_time=3.0, p99_time=4.0
+    )
+    results = [
+        ProfilingResults(
+            sample_id=0,
+            batch_size=1,
+            avg_latency=1.0,
+            std_latency=0.1,
+            p50_latency=1.0,
+            p90_latency=2.0,
+            p95_latency=3.0,
+            p99_latency=4.0,
+            throughput=1000.0,
+            request_count=10,
+            avg_gpu_clock=1500.0,
+            detailed_results={"total": step_result},
+        )
+        for _ in range(3)
+    ]
+
+    result = ProfilingResults.from_profiling_results(results)
+
+    assert result.p99_latency == 4.0
+    assert result.detailed_results["total"].sketch is None
@@ -0,0 +1,165 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import functools
+import os
+
+import pytest
+
+from model_navigator.configuration.model.model_config import ONNXModelConfig
+from model_navigator.core.artifact_cache import (
+    ENTRY_FILENAME,
+    ArtifactCache,
+    DiskArtifactCache,
+    _register_cache_class,
+    _unregister_cache_class,
+    get_artifact_cache,
+    get_artifact_key,
+    hash_callable,
+    hash_path,
+)
+from model_navigator.core.workspace import Workspace
+
+
+def _create_artifact(path, size=100):
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "model.onnx").write_bytes(b"m" * size)
+    (path / "format.log").write_text("log")
+    return path
+
+
+def test_disk_artifact_cache_restore_files_and_output_when_artifact_stored(tmp_path):
+    cache = DiskArtifactCache(cache_dir=tmp_path / "cache", max_size=1024)
+    artifact_path = _create_artifact(tmp_path / "workspace" / "onnx")
+    (artifact_path / "weights").mkdir()
+    (artifact_path / "weights" / "data.bin").write_bytes(b"w" * 10)
+
+    cache.put("key", artifact_path, {"conversion_max_batch_size": 8})
+    cached_artifact = cache.get("key", tmp_path / "restored")
+
+    assert cached_artifact.output == {"conversion_max_batch_size": 8}
+    assert (tmp_path / "restored" / "model.onnx").read_bytes() == b"m" * 100
+    assert (tmp_path / "restored" / "weights" / "data.bin").read_bytes() == b"w" * 10
+    assert not (tmp_path / "restored" / "format.log").exists()
+
+
+def test_disk_artifact_cache_return_none_when_artifact_not_stored(tmp_path):
+    cache = DiskArtifactCache(cache_dir=tmp_path / "cache", max_size=1024)
+
+    assert cache.get("key", tmp_path / "restored") is None
+    assert not (tmp_path / "restored").exists()
+
+
+def test_disk_artifact_cache_evict_least_recently_used_artifacts_when_budget_exceeded(tmp_path):
+    cache = DiskArtifactCache(cache_dir=tmp_path / "cache", max_size=250)
+    for index, key in enumerate(["a", "b"]):
+        cache.put(key, _create_artifact(tmp_path / key), None)
+        os.utime(tmp_path / "cache" / key / ENTRY_FILENAME, (index, index))
+
+    assert cache.get("a", tmp_path / "restored") is not None
+    cache.put("c", _create_artifact(tmp_path / "c"), None)
+
+    assert sorted(path.name for path in (tmp_path / "cache").iterdir()) == ["a", "c"]
+
+
+def test_disk_artifact_cache_not_store_artifact_when_larger_than_budget(tmp_path):
+    cache = DiskArtifactCache(cache_dir=tmp_path / "cache", max_size=50)
+
+    cache.put("key", _create_artifact(tmp_path / "onnx"), None)
+
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+def test_get_artifact_cache_return_registered_cache_when_type_provided(tmp_path):
+    @_register_cache_class("test")
+    class TestCache(ArtifactCache):
+        def get(self, key, path):
+            return None
+
+        def put(self, key, path, output):
+            pass
+
+    try:
+        assert isinstance(get_artifact_cache("test"), TestCache)
+    finally:
+        _unregister_cache_class("test")
+
+    assert get_artifact_cache("none") is None
+    with pytest.raises(NotImplementedError):
+        get_artifact_cache("test")
+    with pytest.raises(ValueError):
+        _register_cache_class("test")(object)
+
+
+def test_hash_path_return_different_hash_when_content_or_name_changed(tmp_path):
+    path = _create_artifact(tmp_path / "onnx")
+    expected_hash = hash_path(path)
+
+    assert hash_path(_create_artifact(tmp_path / "copy")) == expected_hash
+    (path / "model.onnx").write_bytes(b"n" * 100)
+    assert hash_path(path) != expected_hash
+    assert hash_path(tmp_path / "not_existing") is None
+
+
+def _scale(x, scale=2.0):
+    return x * scale
+
+
+class _Scale:
+    def __init__(self, scale):
+        self.scale = scale
+
+    def __call__(self, x):
+        return x * self.scale
+
+
+def test_hash_callable_return_different_hash_when_defaults_closure_or_attributes_changed():
+    def _closure(offset):
+        return lambda x: x + offset
+
+    expected_hash = hash_callable(_scale)
+
+    assert hash_callable(_scale) == expected_hash
+    assert hash_callable(functools.partial(_scale, scale=3.0)) != expected_hash
+    assert hash_callable(_closure(1)) == hash_callable(_closure(1))
+    assert hash_callable(_closure(1)) != hash_callable(_closure(2))
+    assert hash_callable(_Scale(2.0)) == hash_callable(_Scale(2.0))
+    assert hash_callable(_Scale(2.0)) != hash_callable(_Scale(3.0))
+
+
+def test_hash_callable_return_none_when_source_or_referenced_value_not_available():
+    namespace = {}
+    exec("def model(x):\n    return x", namespace)
+
+    assert hash_callable(namespace["model"]) is None
+    assert hash_callable(_Scale(object())) is None
+
+
+def test_get_artifact_key_return_same_key_only_when_parent_model_and_args_unchanged(tmp_path):
+    workspace = Workspace(tmp_path)
+    model_config = ONNXModelConfig(opset=17, dynamo_export=False, graph_surgeon_optimization=True, dynamic_axes=None)
+    _create_artifact(tmp_path / "torchscript")
+    args = {"workspace": workspace, "parent_path": "torchscript", "batch_dim": 0, "verbose": False}
+
+    key = get_artifact_key("ConvertTorchScript2ONNX", model_config, args)
+
+    assert get_artifact_key("ConvertTorchScript2ONNX", model_config, {**args, "verbose": True}) == key
+    assert get_artifact_key("ConvertTorchScript2ONNX", model_config, {**args, "batch_dim": None}) != key
+    assert get_artifact_key("ConvertSavedModel2ONNX", model_config, args) != key
+    other_model_config = ONNXModelConfig(
+        opset=13, dynamo_export=False, graph_surgeon_optimization=True, dynamic_axes=None
+    )
+    assert get_artifact_key("ConvertTorchScript2ONNX", other_model_config, args) != key
+    assert get_artifact_key("ConvertTorchScript2ONNX", model_config, {**args, "model": object()}) is None
+    (tmp_path / "torchscript" / "model.onnx").write_bytes(b"changed")
+    assert get_artifact_key("ConvertTorchScript2ONNX", model_config, args) != key
@@ -0,0 +1,117 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from model_navigator.core.comparison import allclose, compare_tensors, count_nonfinite
+from model_navigator.utilities import get_allclose_verify_func
+
+
+def _get_tensors(shape=(4, 1000)):
+    rng = np.random.default_rng(0)
+    reference = rng.standard_normal(shape).astype(np.float32)
+    output = reference + rng.standard_normal(shape).astype(np.float32) * 1e-3
+    return reference, output
+
+
+def test_compare_tensors_return_same_errors_as_numpy_when_tensor_split_into_chunks():
+    reference, output = _get_tensors()
+    bins = [0.0, 1e-4, 1e-3, 1e-2, np.inf]
+
+    result = compare_tensors(reference, output, cosine_similarity=True, histogram_bins=bins, chunk_size=333)
+
+    absdiff = np.abs(reference.astype(np.float64) - output)
+    assert result.max_abs_error == pytest.approx(absdiff.max())
+    assert result.max_rel_error == pytest.approx((absdiff / np.abs(output.astype(np.float64))).max())
+    assert result.histogram == np.histogram(absdiff, bins=bins)[0].tolist()
+    expected_cosine_similarity = np.dot(reference.ravel(), output.ravel()) / (
+        np.linalg.norm(reference) * np.linalg.norm(output)
+    )
+    assert result.cosine_similarity == pytest.approx(expected_cosine_similarity)
+    assert result.nan_count == 0
+    assert result.inf_count == 0
+
+
+def test_compare_tensors_skip_relative_error_when_both_elements_are_zero():
+    result = compare_tensors(np.array([0.0, 1.0, 2.0]), np.array([0.0, 1.0, 2.5]))
+
+    assert result.max_abs_error == 0.5
+    assert result.max_rel_error == 0.2
+
+
+def test_compare_tensors_return_infinite_relative_error_when_output_element_is_zero():
+    result = compare_tensors(np.array([1.0, 1.0]), np.array([0.0, 1.0]))
+
+    assert result.max_rel_error == np.inf
+
+
+def test_compare_tensors_count_nonfinite_values_of_output():
+    result = compare_tensors(np.zeros(5), np.array([np.nan, np.inf, -np.inf, 1.0, 0.0]))
+
+    assert result.nan_count == 1
+    assert result.inf_count == 2
+    assert result.max_abs_error == np.inf
+
+
+def test_compare_tensors_return_errors_when_tensors_have_integer_and_boolean_dtypes():
+    assert compare_tensors(np.array([0, 255], dtype=np.uint8), np.array([1, 0], dtype=np.uint8)).max_abs_error == 255
+    assert compare_tensors(np.array([True, False]), np.array([True, True])).max_abs_error == 1.0
+
+
+def test_compare_tensors_allocate_bounded_memory_when_tensors_are_large():
+    reference, output = _get_tensors(shape=(64, 2**16))
+
+    tracemalloc.start()
+    compare_tensors(reference, output, cosine_similarity=True, chunk_size=2**14)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert peak < reference.nbytes // 8
+
+
+@pytest.mark.parametrize(
+    "reference,output",
+    [
+        (np.array([1.0, 2.0, 3.0]), np.array([1.0005, 2.0, 3.003])),
+        (np.array([1.0, 2.0, 3.0]), np.array([1.0, 2.1, 3.0])),
+        (np.array([1.0, np.inf, -np.inf]), np.array([1.0, np.inf, -np.inf])),
+        (np.array([1.0, np.inf]), np.array([1.0, -np.inf])),
+        (np.array([np.nan]), np.array([np.nan])),
+        (np.zeros((2, 1)), np.zeros((2, 3))),
+    ],
+)
+def test_allclose_return_same_result_as_numpy(reference, output):
+    expected = np.allclose(output, reference, atol=1e-3, rtol=1e-3)
+
+    assert allclose(reference, output, atol=1e-3, rtol=1e-3, chunk_size=2) == expected
+
+
+def test_count_nonfinite_return_zeros_when_tensor_has_no_floating_point_dtype():
+    assert count_nonfinite(np.array([np.nan, np.inf, 1.0, -np.inf], dtype=np.float16), chunk_size=3) == (1, 2)
+    assert count_nonfinite(np.arange(3)) == (0, 0)
+    assert count_nonfinite(np.array(["a", "b"])) == (0, 0)
+
+
+def test_get_allclose_verify_func_return_false_when_any_output_not_close():
+    verify_func = get_allclose_verify_func(atol=1e-3, rtol=1e-3)
+    y_expected = [{"a": np.ones(3), "b": np.zeros(2)}, {"a": np.ones(3), "b": np.zeros(2)}]
+
+    assert verify_func(iter([{"a": np.ones(3), "b": np.full(2, 1e-4)}] * 2), iter(y_expected)) is True
+    assert (
+        verify_func(iter([{"a": np.ones(3), "b": np.zeros(2)}, {"a": np.ones(3), "b": np.ones(2)}]), y_expected)
+        is False
+    )
+    assert verify_func(iter([{"a": np.ones(3)}] * 2), iter(y_expected)) is False
@@ -0,0 +1,110 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pytest
+
+from model_navigator.core.dataloader import load_samples
+from model_navigator.core.ingestion import DataloaderIngestion, select_correctness_samples
+from model_navigator.core.tensor import PyTreeMetadata
+from model_navigator.exceptions import ModelNavigatorUserInputError
+from model_navigator.frameworks import Framework
+
+SHAPES = [(2, 4), (1, 3), (3, 5), (1, 3), (3, 2), (2, 5)]
+
+
+class _CountingDataloader:
+    def __init__(self, samples):
+        self.samples = samples
+        self.iterations = 0
+
+    def __len__(self):
+        return len(self.samples)
+
+    def __iter__(self):
+        self.iterations += 1
+        return iter(self.samples)
+
+
+def _get_dataloader():
+    # value of each sample is its index in the dataloader
+    return _CountingDataloader([{"x": np.full(shape, index, dtype=np.float32)} for index, shape in enumerate(SHAPES)])
+
+
+def _get_ingestion(samples_path=None, sample_count=0):
+    return DataloaderIngestion(
+        pytree_metadata=PyTreeMetadata.from_sample({"x": np.zeros((1, 1))}, tensor_type=np.ndarray, names=["x"]),
+        framework=Framework.NONE,
+        batch_dim=0,
+        samples_path=samples_path,
+        sample_count=sample_count,
+        seed=0,
+    )
+
+
+def _get_saved_indices(samples_path, samples_type):
+    return [int(sample["x"].flat[0]) for sample in load_samples(samples_type, samples_path, batch_dim=0)]
+
+
+def test_run_return_axes_shapes_when_samples_path_not_provided():
+    dataloader = _get_dataloader()
+
+    axes_shapes = _get_ingestion().run(dataloader)
+
+    assert axes_shapes == {"x": {0: [2, 1, 3, 1, 3, 2], 1: [4, 3, 5, 3, 2, 5]}}
+    assert dataloader.iterations == 1
+
+
+def test_run_save_all_samples_in_single_pass_when_samples_path_provided(tmp_path):
+    dataloader = _get_dataloader()
+
+    axes_shapes = _get_ingestion(samples_path=tmp_path / "model_input", sample_count=3).run(dataloader)
+
+    assert dataloader.iterations == 1
+    assert axes_shapes == {"x": {0: [2, 1, 3, 1, 3, 2], 1: [4, 3, 5, 3, 2, 5]}}
+    assert _get_saved_indices(tmp_path, "correctness") == sorted(select_correctness_samples(len(SHAPES), 3, 0))
+    # minimal batch size 1, maximal batch size and size of the second axis first reached by sample 2,
+    # minimal size of the second axis reached by sample 4
+    assert _get_saved_indices(tmp_path, "conversion") == [1, 2, 4]
+    assert _get_saved_indices(tmp_path, "profiling") == [2]
+    assert sorted(path.name for path in (tmp_path / "model_input").iterdir()) == [
+        "conversion",
+        "correctness",
+        "profiling",
+    ]
+
+
+def test_run_save_correctness_sample_for_conversion_and_profiling_when_inputs_have_no_axes(tmp_path):
+    dataloader = _CountingDataloader([{"x": np.array(index, dtype=np.float32)} for index in range(3)])
+    ingestion = DataloaderIngestion(
+        pytree_metadata=PyTreeMetadata.from_sample({"x": np.zeros(())}, tensor_type=np.ndarray, names=["x"]),
+        framework=Framework.NONE,
+        batch_dim=None,
+        samples_path=tmp_path / "model_input",
+        sample_count=2,
+        seed=0,
+    )
+
+    ingestion.run(dataloader)
+
+    correctness = [int(sample["x"]) for sample in load_samples("correctness", tmp_path, batch_dim=None)]
+    conversion = [int(sample["x"]) for sample in load_samples("conversion", tmp_path, batch_dim=None)]
+    profiling = [int(sample["x"]) for sample in load_samples("profiling", tmp_path, batch_dim=None)]
+    assert conversion == profiling == correctness[:1]
+
+
+def test_run_raise_error_when_sample_structure_differs():
+    dataloader = _CountingDataloader([{"x": np.zeros((1, 2))}, {"y": np.zeros((1, 2))}])
+
+    with pytest.raises(ModelNavigatorUserInputError):
+        _get_ingestion().run(dataloader)
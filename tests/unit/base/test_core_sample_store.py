@@ -0,0 +1,129 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pickle
+
+import numpy as np
+import pytest
+
+from model_navigator.core.dataloader import (
+    MemoryMappedSamplesLoader,
+    SortedSamplesLoader,
+    load_samples,
+    samples_to_npz,
+    samples_to_store,
+)
+from model_navigator.core.sample_store import ALIGNMENT, SampleStore, SampleStoreWriter
+from model_navigator.exceptions import ModelNavigatorUserInputError
+
+
+def _write(path, samples):
+    with SampleStoreWriter(path) as writer:
+        for sample in samples:
+            writer.append(sample)
+
+
+def test_sample_store_return_views_of_mapped_files_when_sample_loaded(tmp_path):
+    samples = [{"x": np.full((3, 5), index, dtype=np.float32), "y": np.arange(index + 1)} for index in range(10)]
+    _write(tmp_path, samples)
+
+    store = SampleStore(tmp_path)
+
+    for index, sample in enumerate(samples):
+        loaded_sample = store[index]
+        for name, tensor in sample.items():
+            assert np.array_equal(loaded_sample[name], tensor)
+            assert not loaded_sample[name].flags.owndata
+            assert loaded_sample[name].ctypes.data % ALIGNMENT == 0
+    assert np.array_equal(store[-1]["x"], samples[-1]["x"])
+    with pytest.raises(IndexError):
+        store[10]
+
+
+def test_sample_store_return_dtypes_and_shapes_when_samples_differ(tmp_path):
+    samples = [
+        {"float": np.arange(6, dtype=np.float32).reshape(2, 3), "str": np.array(["a", "bcd"])},
+        {"float": np.ones((5,), dtype=np.float64), "str": np.array(["x"]), "scalar": np.array(3, dtype=np.int8)},
+        {"float": np.zeros((0, 4), dtype=np.float32), "bool": np.array([True, False])},
+    ]
+    _write(tmp_path, samples)
+
+    store = SampleStore(tmp_path)
+
+    for index, sample in enumerate(samples):
+        loaded_sample = store[index]
+        assert sorted(loaded_sample) == sorted(sample)
+        for name, tensor in sample.items():
+            assert loaded_sample[name].dtype == tensor.dtype
+            assert np.array_equal(loaded_sample[name], tensor)
+
+
+def test_sample_store_not_modify_files_when_loaded_tensor_modified(tmp_path):
+    _write(tmp_path, [{"x": np.zeros(4, dtype=np.float32)}])
+
+    tensor = SampleStore(tmp_path)[0]["x"]
+    tensor[:] = 1.0
+
+    assert np.array_equal(SampleStore(tmp_path)[0]["x"], np.zeros(4, dtype=np.float32))
+
+
+def test_sample_store_writer_keep_loaded_tensors_valid_when_store_replaced(tmp_path):
+    _write(tmp_path, [{"x": np.full(1024, 1.0, dtype=np.float32)}])
+    tensor = SampleStore(tmp_path)[0]["x"]
+
+    _write(tmp_path, [{"y": np.full(2, 2.0, dtype=np.float32)}])
+
+    assert np.array_equal(tensor, np.full(1024, 1.0, dtype=np.float32))
+    assert list(SampleStore(tmp_path)[0]) == ["y"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["0.bin", "index.json"]
+
+
+def test_sample_store_writer_raise_error_when_tensor_has_object_dtype(tmp_path):
+    with pytest.raises(ModelNavigatorUserInputError), SampleStoreWriter(tmp_path) as writer:
+        writer.append({"x": np.array([b"a", None], dtype=object)})
+
+    assert not (tmp_path / "index.json").exists()
+
+
+def test_load_samples_return_samples_from_store_when_store_and_npz_files_exist(tmp_path):
+    samples_path = tmp_path / "model_input" / "correctness"
+    samples_to_npz([{"x": np.zeros((1, 2))}], samples_path, batch_dim=0)
+    samples_to_store([{"x": np.ones((4, 2))}, {"x": np.full((1, 3), 2.0)}], samples_path, batch_dim=0)
+
+    samples = load_samples("correctness_samples", tmp_path, batch_dim=0)
+
+    assert isinstance(samples, MemoryMappedSamplesLoader)
+    assert len(samples) == 2
+    assert np.array_equal(samples[0]["x"], np.ones((1, 2)))
+    assert np.array_equal(samples[1]["x"], np.full((1, 3), 2.0))
+
+
+def test_load_samples_return_samples_from_npz_files_when_store_not_exist(tmp_path):
+    samples_path = tmp_path / "model_input" / "correctness"
+    samples_to_npz([{"x": np.zeros((1, 2))}], samples_path, batch_dim=0)
+
+    samples = load_samples("correctness_samples", tmp_path, batch_dim=0)
+
+    assert isinstance(samples, SortedSamplesLoader)
+    assert np.array_equal(samples[0]["x"], np.zeros((1, 2)))
+
+
+def test_memory_mapped_samples_loader_return_same_samples_when_unpickled(tmp_path):
+    samples_path = tmp_path / "model_output" / "profiling"
+    samples_to_store([{"x": np.arange(3, dtype=np.float32)}], samples_path, batch_dim=None)
+    samples = load_samples("profiling_sample_output", tmp_path, batch_dim=None)
+    samples[0]
+
+    unpickled_samples = pickle.loads(pickle.dumps(samples))
+
+    assert np.array_equal(unpickled_samples[0]["x"], np.arange(3, dtype=np.float32))
@@ -12,12 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import pathlib
 
 import pytest
 
+from model_navigator.commands import warm_worker
 from model_navigator.commands.execution_context import ExecutionContext
+from model_navigator.commands.warm_worker import WarmWorkersPool, get_warm_runner, get_warm_runner_memory_baseline
+from model_navigator.configuration import DeviceKind, Format
 from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import ModelNavigatorUserInputError
+from model_navigator.runners.base import NavigatorRunner
 
 
 @pytest.mark.parametrize("verbose", [False, True])
@@ -54,3 +60,124 @@ def test_execute_context_external_cmd_not_allowed_error(tmp_path, mocker):
         with pytest.raises(ModelNavigatorUserInputError):
             exec_ctx.execute_cmd(["---"], allow_failure=False)
     assert mock_logger.info.call_count == 2  # bake_cmd + log output
+
+
+def _append_pid(path):
+    with pathlib.Path(path).open("a") as f:
+        f.write(f"{os.getpid()}\n")
+
+
+def _fail(path):
+    _append_pid(path)
+    raise RuntimeError("Failure in warm worker.")
+
+
+def _read_pids(path):
+    return pathlib.Path(path).read_text().split()
+
+
+def test_warm_workers_pool_reuse_process_when_same_key_executed(tmp_path):
+    pids_path = tmp_path / "pids.txt"
+    pool = WarmWorkersPool(max_workers=1)
+    try:
+        assert pool.execute("model", _append_pid, (pids_path,)) == 0
+        assert pool.execute("model", _append_pid, (pids_path,)) == 0
+    finally:
+        pool.shutdown()
+
+    pids = _read_pids(pids_path)
+    assert len(pids) == 2
+    assert pids[0] == pids[1]
+    assert pids[0] != str(os.getpid())
+
+
+def test_warm_workers_pool_evict_least_recently_used_worker_when_limit_reached(tmp_path):
+    pids_path = tmp_path / "pids.txt"
+    pool = WarmWorkersPool(max_workers=1)
+    try:
+        assert pool.execute("model_a", _append_pid, (pids_path,)) == 0
+        assert pool.execute("model_b", _append_pid, (pids_path,)) == 0
+        assert pool.execute("model_a", _append_pid, (pids_path,)) == 0
+    finally:
+        pool.shutdown()
+
+    assert len(set(_read_pids(pids_path))) == 3
+
+
+def test_warm_workers_pool_restart_worker_when_execution_failed(tmp_path):
+    pids_path = tmp_path / "pids.txt"
+    pool = WarmWorkersPool(max_workers=1)
+    try:
+        assert pool.execute("model", _fail, (pids_path,)) == 1
+        assert pool.execute("model", _append_pid, (pids_path,)) == 0
+    finally:
+        pool.shutdown()
+
+    pids = _read_pids(pids_path)
+    assert pids[0] != pids[1]
+
+
+class CountingRunner(NavigatorRunner):
+    activations = 0
+
+    @classmethod
+    def format(cls):
+        return Format.PYTHON
+
+    @classmethod
+    def devices_kind(cls):
+        return [DeviceKind.CPU]
+
+    def activate_impl(self):
+        CountingRunner.activations += 1
+
+    def infer_impl(self, feed_dict, *args, **kwargs):
+        return feed_dict
+
+
+def test_get_warm_runner_share_runner_between_commands_and_set_timer_on_each_use(tmp_path, mocker, monkeypatch):
+    mocker.patch("model_navigator.commands.warm_worker.get_runner", return_value=CountingRunner)
+    monkeypatch.setattr(warm_worker, "_IN_WARM_WORKER", True)
+    monkeypatch.setattr(warm_worker, "_WARM_RUNNERS", {})
+    monkeypatch.setattr(warm_worker, "_MEMORY_BASELINES", {})
+    monkeypatch.setattr(CountingRunner, "activations", 0)
+    model_path = tmp_path / "model.onnx"
+
+    correctness_runner = get_warm_runner(
+        "CountingRunner", model=model_path, input_metadata=None, output_metadata=None, batch_dim=0
+    )
+    assert correctness_runner._inference_step_timer.enabled is False
+
+    profiling_runner = get_warm_runner(
+        "CountingRunner", model=model_path, input_metadata=None, output_metadata=None, enable_timer=True
+    )
+    assert profiling_runner is correctness_runner
+    assert profiling_runner._inference_step_timer.enabled is True
+
+    other_device_runner = get_warm_runner(
+        "CountingRunner", model=model_path, input_metadata=None, output_metadata=None, device="cuda:1"
+    )
+    assert other_device_runner is not correctness_runner
+    assert other_device_runner._inference_step_timer.enabled is False
+    assert CountingRunner.activations == 2
+
+
+def test_get_warm_runner_memory_baseline_return_memory_before_runner_activation(tmp_path, mocker, monkeypatch):
+    mocker.patch("model_navigator.commands.warm_worker.get_runner", return_value=CountingRunner)
+    get_process_memory = mocker.patch(
+        "model_navigator.commands.performance.nvml_handler.get_process_memory",
+        side_effect=lambda: (CountingRunner.activations, None),
+    )
+    monkeypatch.setattr(warm_worker, "_IN_WARM_WORKER", True)
+    monkeypatch.setattr(warm_worker, "_WARM_RUNNERS", {})
+    monkeypatch.setattr(warm_worker, "_MEMORY_BASELINES", {})
+    monkeypatch.setattr(CountingRunner, "activations", 0)
+
+    runner = get_warm_runner("CountingRunner", model=tmp_path / "model.onnx", input_metadata=None, output_metadata=None)
+    get_warm_runner("CountingRunner", model=tmp_path / "model.onnx", input_metadata=None, output_metadata=None)
+
+    assert get_process_memory.call_count == 1
+    assert get_warm_runner_memory_baseline(runner) == (0, None)
+    assert (
+        get_warm_runner_memory_baseline(CountingRunner(model=None, input_metadata=None, output_metadata=None)) is None
+    )
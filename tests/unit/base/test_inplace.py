@@ -37,7 +37,7 @@ from model_navigator.inplace import _initialize_pipeline
 from model_navigator.inplace.config import DEFAULT_CACHE_DIR, OptimizeConfig, inplace_cache_dir
 from model_navigator.inplace.model import EagerModule, OptimizedModule, RecordingModule
 from model_navigator.inplace.registry import ModuleRegistry, module_registry
-from model_navigator.inplace.utils import get_object_name
+from model_navigator.inplace.utils import SampleWriter, get_object_name, get_structure_fingerprint
 from model_navigator.inplace.wrapper import Module, module
 from model_navigator.reporting.optimize.events import OptimizeEvent
 from tests.unit.base.mocks.fixtures import mock_event_emitter  # noqa: F401
@@ -50,6 +50,18 @@ def clean_up_registry():
     module_registry.clear()
 
 
+def get_optimized_module(runners):
+    module = OptimizedModule.__new__(OptimizedModule)
+    module._name = "model_name"
+    module._device = "cpu"
+    module._input_mapping = lambda x: x
+    module._output_mapping = lambda x: x
+    module._runners = runners
+    module._dispatch_cache = {}
+    module._single_runner = OptimizedModule._get_single_native_runner(runners)
+    return module
+
+
 def get_test_module():
     import torch  # pytype: disable=import-error
 
@@ -540,3 +552,158 @@ def test_initialize_pipeline_called_when_more_then_one_module_wrapped_and_pipe_h
 
     assert result is True
     assert spy_to_method.call_count == 1
+
+
+def test_get_structure_fingerprint_return_equal_fingerprints_when_only_tensors_values_differ():
+    import numpy as np
+
+    sample = (np.ones(1), {"a": 1, "b": [np.ones(2)]})
+    other_sample = (np.zeros(3), {"a": 1, "b": [np.zeros(2)]})
+
+    assert get_structure_fingerprint(sample) == get_structure_fingerprint(other_sample)
+    assert get_structure_fingerprint((np.ones(1), {"a": 1})) != get_structure_fingerprint((np.ones(1), {"a": 2}))
+    assert get_structure_fingerprint((np.ones(1),)) != get_structure_fingerprint([np.ones(1)])
+    assert get_structure_fingerprint((np.ones(1),)) != get_structure_fingerprint((np.ones(1), np.ones(1)))
+
+
+@pytest.mark.skipif(not find_spec("torch"), reason="PyTorch is not installed.")
+def test_optimized_module_call_build_pytree_metadata_once_when_called_with_same_structure(mocker):
+    import torch  # pytype: disable=import-error
+
+    from model_navigator.core.tensor import PyTreeMetadata, TensorType
+
+    runners = {}
+    for sample in [(torch.ones(1), {}), (torch.ones(1), torch.ones(1), {})]:
+        pytree_metadata = PyTreeMetadata.from_sample(sample, TensorType.TORCH, prefix="input")
+        runners[pytree_metadata] = MagicMock(is_native=True, infer_native=MagicMock(return_value=len(sample)))
+    module = get_optimized_module(runners)
+    from_sample_spy = mocker.spy(PyTreeMetadata, "from_sample")
+
+    outputs = [module(torch.ones(2)) for _ in range(3)] + [module(torch.ones(2), torch.ones(2)) for _ in range(3)]
+
+    assert outputs == [2, 2, 2, 3, 3, 3]
+    assert from_sample_spy.call_count == 2
+
+
+@pytest.mark.skipif(not find_spec("torch"), reason="PyTorch is not installed.")
+def test_optimized_module_call_raise_error_when_no_runner_for_structure():
+    import torch  # pytype: disable=import-error
+
+    from model_navigator.core.tensor import PyTreeMetadata, TensorType
+
+    runners = {
+        PyTreeMetadata.from_sample(sample, TensorType.TORCH, prefix="input"): MagicMock(is_native=True)
+        for sample in [(torch.ones(1), {}), (torch.ones(1), torch.ones(1), {})]
+    }
+    module = get_optimized_module(runners)
+
+    with pytest.raises(ValueError, match="No runner found"):
+        module(torch.ones(2), x=torch.ones(2))
+    assert module._dispatch_cache == {}
+
+
+@pytest.mark.skipif(not find_spec("torch"), reason="PyTorch is not installed.")
+def test_optimized_module_call_skip_pytree_metadata_when_single_native_runner(mocker):
+    import torch  # pytype: disable=import-error
+
+    from model_navigator.core.tensor import PyTreeMetadata, TensorType
+
+    pytree_metadata = PyTreeMetadata.from_sample((torch.ones(1), {}), TensorType.TORCH, prefix="input")
+    runner = MagicMock(is_native=True, infer_native=MagicMock(side_effect=lambda *args, **kwargs: len(args)))
+    module = get_optimized_module({pytree_metadata: runner})
+    from_sample_spy = mocker.spy(PyTreeMetadata, "from_sample")
+
+    outputs = [module(torch.ones(2)), module(torch.ones(2), torch.ones(2))]
+
+    assert outputs == [1, 2]
+    assert from_sample_spy.call_count == 0
+
+
+@pytest.mark.skipif(not find_spec("torch"), reason="PyTorch is not installed.")
+def test_optimized_module_call_validate_structure_when_single_compiled_runner(mocker):
+    import torch  # pytype: disable=import-error
+
+    from model_navigator.core.tensor import PyTreeMetadata, TensorMetadata, TensorType
+
+    pytree_metadata = PyTreeMetadata.from_sample((torch.ones(1), {}), TensorType.TORCH, prefix="input")
+    runner = MagicMock(
+        is_native=False,
+        input_metadata=TensorMetadata(pytree_metadata=pytree_metadata),
+        output_metadata=TensorMetadata(pytree_metadata=PyTreeMetadata("output__0", TensorType.TORCH)),
+        infer=MagicMock(side_effect=lambda feed_dict: {"output__0": feed_dict["input__0"] * 2}),
+    )
+    module = get_optimized_module({pytree_metadata: runner})
+    from_sample_spy = mocker.spy(PyTreeMetadata, "from_sample")
+
+    outputs = [module(torch.ones(2)) for _ in range(3)]
+
+    assert all(torch.equal(output, torch.ones(2) * 2) for output in outputs)
+    assert from_sample_spy.call_count == 1
+    with pytest.raises(ValueError, match="No runner found"):
+        module(torch.ones(2), scale=2.0)
+    assert runner.infer.call_count == 3
+
+
+@pytest.mark.skipif(not find_spec("torch"), reason="PyTorch is not installed.")
+def test_sample_writer_save_snapshot_when_sample_modified_after_write(tmp_path):
+    import torch  # pytype: disable=import-error
+
+    writer = SampleWriter(max_queue_size=2)
+    sample = (torch.ones(2), {"x": torch.zeros(3), "flag": True})
+
+    writer.write(sample, tmp_path / "0.pt")
+    sample[0].add_(1)
+    writer.close()
+
+    saved_sample = torch.load(tmp_path / "0.pt")
+    assert torch.equal(saved_sample[0], torch.ones(2))
+    assert torch.equal(saved_sample[1]["x"], torch.zeros(3))
+    assert saved_sample[1]["flag"] is True
+
+
+@pytest.mark.skipif(not find_spec("torch"), reason="PyTorch is not installed.")
+def test_sample_writer_save_sample_synchronously_when_queue_size_is_0(tmp_path, mocker):
+    import torch  # pytype: disable=import-error
+
+    thread_mock = mocker.patch("model_navigator.inplace.utils.threading.Thread")
+    writer = SampleWriter(max_queue_size=0)
+
+    writer.write((torch.ones(2), {}), tmp_path / "0.pt")
+
+    assert (tmp_path / "0.pt").is_file()
+    assert thread_mock.call_count == 0
+
+
+@pytest.mark.skipif(not find_spec("torch"), reason="PyTorch is not installed.")
+def test_sample_writer_flush_raise_error_when_saving_failed(tmp_path):
+    import torch  # pytype: disable=import-error
+
+    writer = SampleWriter(max_queue_size=1)
+
+    writer.write((torch.ones(2), {}), tmp_path / "missing" / "0.pt")
+
+    with pytest.raises((RuntimeError, OSError)):
+        writer.flush()
+    writer.close()
+
+
+@pytest.mark.skipif(not find_spec("torch"), reason="PyTorch is not installed.")
+def test_recording_module_record_sample_return_shapes_and_save_sample_in_background():
+    import torch  # pytype: disable=import-error
+
+    module = RecordingModule(
+        module=get_test_module(),
+        name="model_name",
+        input_mapping=lambda x: x,
+        output_mapping=lambda x: x,
+        optimize_config=OptimizeConfig(),
+    )
+
+    module(torch.ones(4, 2))
+    module._sample_writer.flush()
+
+    (samples_shapes,) = module._samples_shapes.values()
+    (samples,) = module._samples.values()
+    assert samples_shapes == [{"input__0": (4, 2)}]
+    assert samples[0].is_file()
+    module.deactivate()
@@ -17,6 +17,8 @@ from model_navigator.configuration import (
     Format,
     JitType,
     OnnxConfig,
+    OnnxExecutionMode,
+    OnnxSessionOptions,
     TensorFlowConfig,
     TensorFlowTensorRTConfig,
     TensorRTCompatibilityLevel,
@@ -408,3 +410,43 @@ def test_generate_model_config_remove_redundant_formats_when_model_path_passed_i
     assert Format.TF_TRT not in model_configs
     assert Format.TORCHSCRIPT not in model_configs
     assert Format.TORCH_EXPORTEDPROGRAM not in model_configs
+
+
+def test_get_onnx_config_returns_session_options_variants_when_multiple_session_options_provided():
+    base_session_options = OnnxSessionOptions(intra_op_num_threads=4)
+    variant_session_options = OnnxSessionOptions(
+        intra_op_num_threads=2, inter_op_num_threads=2, execution_mode=OnnxExecutionMode.PARALLEL
+    )
+    onnx_config = OnnxConfig(
+        dynamo_export=True,
+        session_options=[base_session_options, variant_session_options],
+        cache_optimized_model=True,
+    )
+    model_configs = {Format.ONNX: []}
+    ModelConfigBuilder().get_onnx_config(Framework.TORCH, [onnx_config], model_configs)
+
+    assert [model_configuration.key for model_configuration in model_configs[Format.ONNX]] == [
+        "onnx-dynamo",
+        "onnx",
+        "onnx-dynamo-intra2_inter2_parallel",
+        "onnx-intra2_inter2_parallel",
+    ]
+    base_model_configs, variant_model_configs = model_configs[Format.ONNX][:2], model_configs[Format.ONNX][2:]
+    for base_model_configuration, variant_model_configuration in zip(base_model_configs, variant_model_configs):
+        assert not base_model_configuration.is_session_options_variant
+        assert base_model_configuration.runner_config.session_options == base_session_options
+        assert variant_model_configuration.is_session_options_variant
+        assert variant_model_configuration.parent_key == base_model_configuration.key
+        assert variant_model_configuration.runner_config.session_options == variant_session_options
+        assert variant_model_configuration.runner_config.cache_optimized_model is True
+
+
+def test_get_trt_config_skips_onnx_session_options_variants():
+    onnx_config = OnnxConfig(session_options=[OnnxSessionOptions(), OnnxSessionOptions(intra_op_num_threads=1)])
+    trt_config = TensorRTConfig(precision=(TensorRTPrecision.FP16,))
+    model_configs = {Format.ONNX: [], Format.TENSORRT: []}
+    ModelConfigBuilder().get_onnx_config(Framework.ONNX, [onnx_config, trt_config], model_configs)
+    ModelConfigBuilder().get_trt_config(Framework.ONNX, [onnx_config, trt_config], model_configs)
+
+    assert len(model_configs[Format.ONNX]) == 2
+    assert [model_configuration.parent_key for model_configuration in model_configs[Format.TENSORRT]] == ["onnx"]
@@ -19,6 +19,7 @@ import pytest
 
 from model_navigator.exceptions import ModelNavigatorNotFoundError
 from model_navigator.runners.onnx import OnnxrtCUDARunner, OnnxrtTensorRTRunner
+from model_navigator.runners.pool import RunnerPool
 from tests.unit.base.mocks.packages import (
     empty_package,
     onnx_package_with_cuda_runner,
@@ -55,3 +56,29 @@ def test_get_runner_returns_source_runner_when_source_runner_is_best_and_source_
         runner = package.get_runner()
 
         assert isinstance(runner, OnnxrtCUDARunner)
+
+
+def test_get_runner_pool_returns_pool_of_best_runner_instances():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workspace = pathlib.Path(tmp_dir) / "navigator_workspace"
+
+        package = onnx_package_with_tensorrt_runner(workspace)
+        pool = package.get_runner_pool(num_instances=2)
+
+        assert isinstance(pool, RunnerPool)
+        assert pool.num_instances == 2
+        assert pool.name() == f"{OnnxrtTensorRTRunner.name()}Pool"
+        assert not pool.is_active
+
+
+def test_get_dynamic_batcher_returns_batcher_with_parameters_from_profiling_results():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workspace = pathlib.Path(tmp_dir) / "navigator_workspace"
+
+        package = onnx_package_with_tensorrt_runner(workspace)
+        batcher = package.get_dynamic_batcher()
+        other_batcher = package.get_dynamic_batcher(max_queue_delay=5.0)
+
+        assert isinstance(batcher._runner, OnnxrtTensorRTRunner)
+        assert (batcher.max_batch_size, batcher.max_queue_delay) == (1, 1.0)
+        assert other_batcher.max_queue_delay == 5.0
@@ -11,11 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
 import os
 import pathlib
 import tempfile
+import threading
 import zipfile
 
+from model_navigator.configuration import PackageCompression
+from model_navigator.package import archive
+from model_navigator.package.archive import write_archive
 from model_navigator.package.builder import PackageBuilder
 from tests.unit.base.mocks.packages import (
     tensorflow_package_with_optimal_model_tensorflow_tensorrt_and_dummy_navigator_log_dummy_status_file,
@@ -95,3 +100,102 @@ def test_save_store_expected_files_with_tensorflow_tensorrt_optimal_model():
             assert len(zf.namelist()) == 4
             for filename in zf.namelist():
                 assert filename in expected_archive_content
+
+
+def test_save_compress_files_with_selected_compression_and_store_hashes():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workspace = pathlib.Path(tmp_dir) / "workspace"
+        package = tensorflow_package_with_optimal_model_tensorflow_tensorrt_and_dummy_navigator_log_dummy_status_file(
+            workspace
+        )
+        model_content = os.urandom(1024)
+        (workspace / "tf-trt-fp16" / "model.savedmodel").write_bytes(model_content)
+        (workspace / "model_input" / "profiling").mkdir(parents=True)
+        (workspace / "model_input" / "profiling" / "0.npz").write_bytes(b"0" * 4096)
+
+        package_path = pathlib.Path(tmp_dir) / "nav_package.nav"
+        builder = PackageBuilder()
+        builder.save(
+            package=package,
+            path=package_path,
+            models_compression=PackageCompression.STORED,
+            data_compression=PackageCompression.LZMA,
+        )
+
+        with zipfile.ZipFile(package_path) as zf:
+            assert zf.testzip() is None
+            model_info = zf.getinfo("tf-trt-fp16/model.savedmodel")
+            assert model_info.compress_type == zipfile.ZIP_STORED
+            assert model_info.comment == b"sha256:" + hashlib.sha256(model_content).hexdigest().encode()
+
+            sample_info = zf.getinfo("model_input/profiling/0.npz")
+            assert sample_info.compress_type == zipfile.ZIP_LZMA
+            assert sample_info.compress_size < sample_info.file_size
+            assert zf.read("model_input/profiling/0.npz") == b"0" * 4096
+            assert zf.getinfo("navigator.log").compress_type == zipfile.ZIP_LZMA
+
+
+def test_write_archive_store_files_compressed_in_chunks_in_order_of_members(mocker):
+    mocker.patch("model_navigator.package.archive.CHUNK_SIZE", 16)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workspace = pathlib.Path(tmp_dir) / "workspace"
+        (workspace / "model").mkdir(parents=True)
+        contents = {
+            workspace / "model" / "model.plan": os.urandom(100),
+            workspace / "model" / "empty.bin": b"",
+            workspace / "navigator.log": b"log" * 20,
+        }
+        for filepath, content in contents.items():
+            filepath.write_bytes(content)
+
+        members = {
+            workspace / "model": PackageCompression.STORED,
+            workspace / "model" / "model.plan": PackageCompression.STORED,
+            workspace / "model" / "empty.bin": PackageCompression.DEFLATED,
+            workspace / "navigator.log": PackageCompression.BZIP2,
+        }
+        archive_path = pathlib.Path(tmp_dir) / "nav_package.nav"
+        write_archive(path=archive_path, workspace=workspace, members=members, workers=2)
+
+        with zipfile.ZipFile(archive_path) as zf:
+            assert zf.testzip() is None
+            assert [info.filename for info in zf.infolist()] == [
+                "model/",
+                "model/model.plan",
+                "model/empty.bin",
+                "navigator.log",
+            ]
+            for filepath, content in contents.items():
+                info = zf.getinfo(filepath.relative_to(workspace).as_posix())
+                assert zf.read(info) == content
+                assert info.comment == b"sha256:" + hashlib.sha256(content).hexdigest().encode()
+            assert zf.getinfo("navigator.log").compress_type == zipfile.ZIP_BZIP2
+        # temporary archives of compressed members are removed
+        assert sorted(path.name for path in pathlib.Path(tmp_dir).iterdir()) == ["nav_package.nav", "workspace"]
+
+
+def test_write_archive_compress_files_concurrently(mocker):
+    barrier = threading.Barrier(2, timeout=10)
+    compress_member = archive._compress_member
+
+    def _compress_member(*args, **kwargs):
+        # fails with BrokenBarrierError when files are not compressed at the same time
+        barrier.wait()
+        return compress_member(*args, **kwargs)
+
+    mocker.patch("model_navigator.package.archive._compress_member", side_effect=_compress_member)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workspace = pathlib.Path(tmp_dir) / "workspace"
+        workspace.mkdir()
+        contents = {workspace / "model.onnx": b"model" * 1000, workspace / "model.plan": os.urandom(1000)}
+        for filepath, content in contents.items():
+            filepath.write_bytes(content)
+
+        archive_path = pathlib.Path(tmp_dir) / "nav_package.nav"
+        members = dict.fromkeys(contents, PackageCompression.LZMA)
+        write_archive(path=archive_path, workspace=workspace, members=members, workers=2)
+
+        with zipfile.ZipFile(archive_path) as zf:
+            assert zf.testzip() is None
+            assert [info.filename for info in zf.infolist()] == ["model.onnx", "model.plan"]
+            assert all(zf.read(filepath.name) == content for filepath, content in contents.items())
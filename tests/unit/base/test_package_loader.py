@@ -0,0 +1,114 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+import zipfile
+
+import pytest
+
+from model_navigator.configuration import PackageCompression
+from model_navigator.core.workspace import Workspace
+from model_navigator.exceptions import ModelNavigatorPackageIntegrityError
+from model_navigator.package.builder import PackageBuilder
+from model_navigator.package.loader import PackageLoader
+from model_navigator.runners.onnx import OnnxrtTensorRTRunner
+from tests.unit.base.mocks.packages import (
+    onnx_package_with_tensorrt_runner,
+    tensorflow_package_with_optimal_model_tensorflow_tensorrt_and_dummy_navigator_log_dummy_status_file,
+)
+
+
+def _save_tensorflow_package(tmp_path: pathlib.Path, **kwargs) -> pathlib.Path:
+    workspace = tmp_path / "workspace"
+    package = tensorflow_package_with_optimal_model_tensorflow_tensorrt_and_dummy_navigator_log_dummy_status_file(
+        workspace
+    )
+    (workspace / "tf-savedmodel" / "model.savedmodel").write_bytes(b"savedmodel" * 100)
+    (workspace / "tf-trt-fp16" / "model.savedmodel").write_bytes(b"tf-trt" * 100)
+    (workspace / "model_input" / "profiling").mkdir(parents=True)
+    (workspace / "model_input" / "profiling" / "0.npz").write_bytes(b"sample" * 100)
+
+    package_path = tmp_path / "package.nav"
+    PackageBuilder().save(package=package, path=package_path, **kwargs)
+
+    return package_path
+
+
+@pytest.mark.parametrize("compression", list(PackageCompression))
+def test_from_file_extract_same_files_when_package_saved_with_compression(tmp_path, compression):
+    package_path = _save_tensorflow_package(tmp_path, models_compression=compression, data_compression=compression)
+    workspace = Workspace(tmp_path / "loaded")
+
+    PackageLoader().from_file(package_path, workspace=workspace)
+
+    assert (workspace.path / "tf-savedmodel" / "model.savedmodel").read_bytes() == b"savedmodel" * 100
+    assert (workspace.path / "tf-trt-fp16" / "model.savedmodel").read_bytes() == b"tf-trt" * 100
+    assert (workspace.path / "model_input" / "profiling" / "0.npz").read_bytes() == b"sample" * 100
+    assert not (workspace.path / "navigator.log").exists()
+
+
+def test_from_file_extract_only_status_when_lazy(tmp_path):
+    package_path = _save_tensorflow_package(tmp_path)
+    workspace = Workspace(tmp_path / "loaded")
+
+    package = PackageLoader().from_file(package_path, workspace=workspace, lazy=True)
+
+    assert [path.name for path in workspace.path.iterdir()] == ["status.yaml"]
+    assert package.is_empty() is False
+
+
+def test_get_model_path_extract_only_selected_model_when_package_loaded_lazily(tmp_path):
+    package_path = _save_tensorflow_package(tmp_path)
+    workspace = Workspace(tmp_path / "loaded")
+    package = PackageLoader().from_file(package_path, workspace=workspace, lazy=True)
+
+    model_path = package.get_model_path("tf-trt-fp16")
+
+    assert model_path.read_bytes() == b"tf-trt" * 100
+    assert not (workspace.path / "tf-savedmodel").exists()
+    assert not (workspace.path / "model_input").exists()
+
+    package.extract()
+
+    assert (workspace.path / "tf-savedmodel" / "model.savedmodel").exists()
+    assert (workspace.path / "model_input" / "profiling" / "0.npz").exists()
+
+
+def test_get_runner_extract_best_model_when_package_loaded_lazily(tmp_path):
+    workspace = tmp_path / "workspace"
+    package = onnx_package_with_tensorrt_runner(workspace)
+    (workspace / "navigator.log").write_text("log")
+    package_path = tmp_path / "package.nav"
+    PackageBuilder().save(package=package, path=package_path)
+    loaded_workspace = Workspace(tmp_path / "loaded")
+    package = PackageLoader().from_file(package_path, workspace=loaded_workspace, lazy=True)
+
+    runner = package.get_runner()
+
+    assert isinstance(runner, OnnxrtTensorRTRunner)
+    assert runner.model == loaded_workspace.path / "onnx" / "model.onnx"
+    assert runner.model.exists()
+
+
+def test_from_file_raise_error_when_file_does_not_match_hash(tmp_path):
+    package_path = _save_tensorflow_package(tmp_path)
+    corrupted_package_path = tmp_path / "corrupted.nav"
+    with zipfile.ZipFile(package_path) as src, zipfile.ZipFile(corrupted_package_path, "w") as dst:
+        for info in src.infolist():
+            data = src.read(info)
+            if info.filename == "tf-trt-fp16/model.savedmodel":
+                data = b"corrupted" * 100
+            dst.writestr(info, data)
+
+    with pytest.raises(ModelNavigatorPackageIntegrityError):
+        PackageLoader().from_file(corrupted_package_path, workspace=Workspace(tmp_path / "loaded"))
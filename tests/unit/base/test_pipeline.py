@@ -11,10 +11,17 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import pathlib
+import threading
 from unittest.mock import MagicMock
 
-from model_navigator.commands.base import CommandOutput, CommandStatus
+from model_navigator.commands.base import Command, CommandOutput, CommandStatus, ExecutionUnit
+from model_navigator.configuration import Format, TensorRTPrecisionMode
+from model_navigator.configuration.model.model_config import ONNXModelConfig, TensorRTModelConfig
+from model_navigator.core.artifact_cache import DiskArtifactCache
+from model_navigator.core.workspace import Workspace
 from model_navigator.pipelines.pipeline import Pipeline
+from model_navigator.pipelines.scheduler import DeviceSlots, get_dependencies
 from model_navigator.reporting.optimize.events import OptimizeEvent
 from tests.unit.base.mocks.fixtures import mock_event_emitter  # noqa: F401
 
@@ -32,8 +39,10 @@ def test_pipeline_run_emits_events(mock_event_emitter):  # noqa: F811
     pipeline.event_emitter = mock_event_emitter
     mock_config = MagicMock()
     mock_config.debug = False
+    mock_context = MagicMock()
+    mock_context.get_previous_output.return_value = None
     # when
-    pipeline.run(workspace=MagicMock(), config=mock_config, context=MagicMock())
+    pipeline.run(workspace=MagicMock(), config=mock_config, context=mock_context)
     # then
     events = mock_event_emitter.history
     assert len(events) == 4
@@ -49,3 +58,203 @@ def test_pipeline_run_emits_events(mock_event_emitter):  # noqa: F811
     )
     assert events[2] == (OptimizeEvent.COMMAND_FINISHED, (), {"status": CommandStatus.OK})
     assert events[3] == (OptimizeEvent.PIPELINE_FINISHED, (), {})
+
+
+_BARRIER = threading.Barrier(2, timeout=10)
+
+
+class IndependentCommand(Command, is_concurrent=True):
+    def _run(self):
+        return CommandOutput(status=CommandStatus.OK)
+
+
+class BarrierCommand(Command, is_concurrent=True):
+    def _run(self):
+        # fails with BrokenBarrierError when units are not run at the same time
+        _BARRIER.wait()
+        return CommandOutput(status=CommandStatus.OK)
+
+
+class MainProcessCommand(Command):
+    def _run(self):
+        return CommandOutput(status=CommandStatus.OK)
+
+
+def _model_config(key, parent=None, format=Format.ONNX):
+    model_config = MagicMock()
+    model_config.key = key
+    model_config.path = pathlib.Path(key) / "model"
+    model_config.parent = parent
+    model_config.format = format
+    return model_config
+
+
+def _runner_cls(name):
+    runner_cls = MagicMock()
+    runner_cls.name.return_value = name
+    return runner_cls
+
+
+def test_get_dependencies_returns_only_units_for_same_model_runner_or_parent():
+    onnx = _model_config("onnx")
+    trt_fp16 = _model_config("trt-fp16", parent=onnx)
+    trt_fp32 = _model_config("trt-fp32", parent=onnx)
+    ort, trt = _runner_cls("OnnxCUDA"), _runner_cls("TensorRT")
+
+    execution_units = [
+        ExecutionUnit(command=IndependentCommand, model_config=onnx),
+        ExecutionUnit(command=IndependentCommand, model_config=trt_fp16),
+        ExecutionUnit(command=IndependentCommand, model_config=trt_fp32),
+        ExecutionUnit(command=IndependentCommand, model_config=onnx, runner_cls=ort),
+        ExecutionUnit(command=IndependentCommand, model_config=trt_fp16, runner_cls=trt),
+        ExecutionUnit(command=IndependentCommand, model_config=trt_fp16, runner_cls=trt),
+    ]
+
+    assert get_dependencies(execution_units) == [set(), {0}, {0}, {0}, {0, 1}, {0, 1, 4}]
+
+
+def test_get_dependencies_returns_all_units_when_unit_not_isolated():
+    execution_units = [
+        ExecutionUnit(command=IndependentCommand, model_config=_model_config("onnx")),
+        ExecutionUnit(command=MainProcessCommand, model_config=_model_config("torchscript")),
+        ExecutionUnit(command=IndependentCommand, model_config=_model_config("torch", format=Format.TORCH)),
+        ExecutionUnit(command=IndependentCommand, model_config=_model_config("trt")),
+    ]
+
+    assert get_dependencies(execution_units) == [set(), {0}, {0, 1}, {1, 2}]
+
+
+def test_device_slots_distribute_units_across_devices():
+    slots = DeviceSlots(devices=["0", "1"], slots_per_device=2, max_slots=8)
+
+    devices = [slots.acquire() for _ in range(4)]
+
+    assert devices == ["0", "1", "0", "1"]
+    assert not slots.available()
+
+    slots.release("1")
+
+    assert slots.available()
+    assert slots.acquire() == "1"
+
+
+def test_device_slots_run_exclusive_units_alone_on_device():
+    slots = DeviceSlots(devices=["0", "1"], slots_per_device=2, max_slots=8)
+
+    assert slots.acquire() == "0"
+    assert slots.acquire(exclusive=True) == "1"
+    # device with the exclusive unit is not shared
+    assert slots.acquire() == "0"
+    assert not slots.available()
+    assert not slots.available(exclusive=True)
+
+    slots.release("0")
+    slots.release("0")
+
+    assert slots.available(exclusive=True)
+    assert slots.acquire(exclusive=True) == "0"
+
+    slots.release("1")
+
+    assert slots.acquire() == "1"
+
+
+def test_device_slots_run_exclusive_units_alone_when_devices_not_provided():
+    slots = DeviceSlots(devices=[], slots_per_device=2, max_slots=4)
+
+    assert slots.acquire() is None
+    assert not slots.available(exclusive=True)
+
+    slots.release(None)
+
+    assert slots.acquire(exclusive=True) is None
+    assert not slots.available()
+
+
+def test_pipeline_run_executes_independent_units_concurrently(mocker, tmp_path, mock_event_emitter):  # noqa: F811
+    # given
+    mocker.patch("model_navigator.pipelines.pipeline.max_parallel_units", return_value=2)
+    execution_units = [
+        ExecutionUnit(command=BarrierCommand, model_config=_model_config("trt-fp16")),
+        ExecutionUnit(command=BarrierCommand, model_config=_model_config("trt-fp32")),
+        ExecutionUnit(command=MainProcessCommand),
+    ]
+    pipeline = Pipeline("test_pipeline", execution_units=execution_units)
+    pipeline.event_emitter = mock_event_emitter
+    mock_config = MagicMock()
+    mock_config.debug = False
+    mock_context = MagicMock()
+    mock_context.command_args.return_value = {}
+    mock_context.get_previous_output.return_value = None
+    mock_workspace = MagicMock()
+    mock_workspace.path = tmp_path
+    # when
+    pipeline.run(workspace=mock_workspace, config=mock_config, context=mock_context)
+    # then
+    updates = [call.kwargs for call in mock_context.update.call_args_list]
+    assert len(updates) == 3
+    assert all(update["command_output"].status == CommandStatus.OK for update in updates)
+    assert updates[-1]["execution_unit"] is execution_units[-1]
+    assert mock_context.save.call_count == 3
+
+    events = [event for event, _, _ in mock_event_emitter.history]
+    assert events == [
+        OptimizeEvent.PIPELINE_STARTED,
+        *[OptimizeEvent.COMMAND_STARTED, OptimizeEvent.COMMAND_FINISHED] * 3,
+        OptimizeEvent.PIPELINE_FINISHED,
+    ]
+
+
+class CacheableCommand(Command, is_cacheable=True):
+    calls = 0
+
+    def _run(self, workspace, path, parent_path):
+        CacheableCommand.calls += 1
+        (workspace.path / path).parent.mkdir(parents=True, exist_ok=True)
+        (workspace.path / path).write_bytes((workspace.path / parent_path).read_bytes() * 2)
+        return CommandOutput(status=CommandStatus.OK, output={"conversion_max_batch_size": 4})
+
+
+def test_pipeline_run_restores_model_from_artifact_cache_when_parent_model_unchanged(
+    mocker,
+    tmp_path,
+    mock_event_emitter,  # noqa: F811
+):
+    # given
+    cache = DiskArtifactCache(cache_dir=tmp_path / "cache", max_size=1024)
+    mocker.patch("model_navigator.pipelines.pipeline.get_artifact_cache", return_value=cache)
+    parent = ONNXModelConfig(opset=17, dynamo_export=False, graph_surgeon_optimization=True, dynamic_axes=None)
+    model_config = TensorRTModelConfig(
+        precision_mode=TensorRTPrecisionMode.HIERARCHY,
+        max_workspace_size=None,
+        optimization_level=None,
+        compatibility_level=None,
+        parent=parent,
+    )
+    mock_config = MagicMock()
+    mock_config.debug = False
+    CacheableCommand.calls = 0
+
+    outputs = []
+    for name in ["first", "second"]:
+        workspace = Workspace(tmp_path / name)
+        (workspace.path / parent.path).parent.mkdir(parents=True)
+        (workspace.path / parent.path).write_bytes(b"onnx")
+        mock_context = MagicMock()
+        mock_context.get_previous_output.return_value = None
+        mock_context.command_args.return_value = {
+            "workspace": workspace,
+            "path": model_config.path,
+            "parent_path": parent.path,
+        }
+        pipeline = Pipeline("test_pipeline", [ExecutionUnit(command=CacheableCommand, model_config=model_config)])
+        pipeline.event_emitter = mock_event_emitter
+        # when
+        pipeline.run(workspace=workspace, config=mock_config, context=mock_context)
+        outputs.append(mock_context.update.call_args.kwargs["command_output"])
+
+    # then
+    assert CacheableCommand.calls == 1
+    assert [output.status for output in outputs] == [CommandStatus.OK, CommandStatus.OK]
+    assert outputs[1].output == {"conversion_max_batch_size": 4}
+    assert (tmp_path / "second" / model_config.path).read_bytes() == b"onnxonnx"
@@ -0,0 +1,188 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from types import SimpleNamespace
+
+from model_navigator.commands.base import Command, CommandOutput, CommandStatus, ExecutionUnit
+from model_navigator.configuration import TensorRTPrecisionMode
+from model_navigator.configuration.model.model_config import ONNXModelConfig, TensorRTModelConfig
+from model_navigator.core.workspace import Workspace
+from model_navigator.pipelines.pipeline import Pipeline
+from model_navigator.pipelines.pipeline_context import PipelineContext
+from tests.unit.base.mocks.fixtures import mock_event_emitter  # noqa: F401
+
+CALLS = []
+
+
+class ExportCommand(Command):
+    status = CommandStatus.OK
+
+    def _run(self, workspace, path):
+        CALLS.append(type(self).name)
+        (workspace.path / path).parent.mkdir(parents=True, exist_ok=True)
+        (workspace.path / path).write_bytes(b"onnx")
+        return CommandOutput(status=ExportCommand.status, output={"exported_batch_size": 4})
+
+
+class ConvertCommand(Command):
+    def _run(self, workspace, path, parent_path):
+        CALLS.append(type(self).name)
+        (workspace.path / path).parent.mkdir(parents=True, exist_ok=True)
+        (workspace.path / path).write_bytes((workspace.path / parent_path).read_bytes() * 2)
+        return CommandOutput(status=CommandStatus.OK)
+
+
+class ProfileCommand(Command):
+    def _run(self, runner_cls, exported_batch_size=None):
+        CALLS.append(f"{type(self).name}-{runner_cls.name()}")
+        return CommandOutput(status=CommandStatus.OK, output={"profiled_batch_size": exported_batch_size})
+
+
+class OnnxRunner:
+    @classmethod
+    def name(cls):
+        return "OnnxCPU"
+
+
+class TensorRTRunner:
+    @classmethod
+    def name(cls):
+        return "TensorRT"
+
+
+def model(x):
+    return x
+
+
+def other_model(x):
+    return x * 2
+
+
+def _get_model_configs():
+    onnx = ONNXModelConfig(opset=17, dynamo_export=False, graph_surgeon_optimization=True, dynamic_axes=None)
+    trt = TensorRTModelConfig(
+        precision_mode=TensorRTPrecisionMode.HIERARCHY,
+        max_workspace_size=None,
+        optimization_level=None,
+        compatibility_level=None,
+        parent=onnx,
+    )
+    return onnx, trt
+
+
+def _get_execution_units(runners=(OnnxRunner,)):
+    onnx, trt = _get_model_configs()
+    return [
+        ExecutionUnit(command=ExportCommand, model_config=onnx),
+        ExecutionUnit(command=ConvertCommand, model_config=trt),
+        *[ExecutionUnit(command=ProfileCommand, model_config=onnx, runner_cls=runner) for runner in runners],
+        ExecutionUnit(command=ProfileCommand, model_config=trt, runner_cls=TensorRTRunner),
+    ]
+
+
+def _run(path, execution_units, event_emitter, model=model):
+    CALLS.clear()
+    workspace = Workspace(path)
+    context = PipelineContext(workspace=workspace)
+    context.resume()
+    context.initialize()
+    pipeline = Pipeline("test_pipeline", execution_units=execution_units)
+    pipeline.event_emitter = event_emitter
+    config = SimpleNamespace(model=model, debug=False, verbose=False)
+
+    pipeline.run(workspace=workspace, config=config, context=context)
+
+    return context
+
+
+def test_pipeline_run_reuses_outputs_when_resumed_with_same_inputs(tmp_path, mock_event_emitter):  # noqa: F811
+    first_context = _run(tmp_path, _get_execution_units(), mock_event_emitter)
+    assert len(CALLS) == 4
+
+    context = _run(tmp_path, _get_execution_units(), mock_event_emitter)
+
+    assert CALLS == []
+    assert context.commands.to_dict(parse=True) == first_context.commands.to_dict(parse=True)
+
+
+def test_pipeline_run_executes_only_failed_units_when_resumed(tmp_path, mock_event_emitter):  # noqa: F811
+    ExportCommand.status = CommandStatus.FAIL
+    try:
+        _run(tmp_path, _get_execution_units()[:1], mock_event_emitter)
+    finally:
+        ExportCommand.status = CommandStatus.OK
+
+    context = _run(tmp_path, _get_execution_units()[:1], mock_event_emitter)
+
+    assert CALLS == ["ExportCommand"]
+    onnx, _ = _get_model_configs()
+    assert context.commands.models_commands[onnx.key].commands["ExportCommand"].status == CommandStatus.OK
+
+
+def test_pipeline_run_executes_new_units_only_when_resumed_with_new_runner(
+    tmp_path,
+    mock_event_emitter,  # noqa: F811
+):
+    _run(tmp_path, _get_execution_units(), mock_event_emitter)
+
+    _run(tmp_path, _get_execution_units(runners=(OnnxRunner, TensorRTRunner)), mock_event_emitter)
+
+    assert CALLS == ["ProfileCommand-TensorRT"]
+
+
+def test_pipeline_run_executes_units_of_descendant_models_when_model_produced_again(
+    tmp_path,
+    mock_event_emitter,  # noqa: F811
+):
+    _run(tmp_path, _get_execution_units(), mock_event_emitter)
+    _, trt = _get_model_configs()
+    (tmp_path / trt.path).unlink()
+
+    _run(tmp_path, _get_execution_units(), mock_event_emitter)
+    assert CALLS == ["ConvertCommand", "ProfileCommand-TensorRT"]
+
+    _run(tmp_path, _get_execution_units(), mock_event_emitter, model=other_model)
+    assert CALLS == ["ExportCommand", "ConvertCommand", "ProfileCommand-OnnxCPU", "ProfileCommand-TensorRT"]
+
+
+def _scaled_model(scale):
+    def _model(x):
+        return x * scale
+
+    return _model
+
+
+def test_pipeline_run_executes_all_units_when_resumed_with_function_capturing_different_value(
+    tmp_path,
+    mock_event_emitter,  # noqa: F811
+):
+    _run(tmp_path, _get_execution_units(), mock_event_emitter, model=_scaled_model(2))
+
+    _run(tmp_path, _get_execution_units(), mock_event_emitter, model=_scaled_model(2))
+    assert CALLS == []
+
+    _run(tmp_path, _get_execution_units(), mock_event_emitter, model=_scaled_model(3))
+    assert CALLS == ["ExportCommand", "ConvertCommand", "ProfileCommand-OnnxCPU", "ProfileCommand-TensorRT"]
+
+
+def test_pipeline_run_executes_all_units_when_resumed_with_function_without_source(
+    tmp_path,
+    mock_event_emitter,  # noqa: F811
+):
+    namespace = {}
+    exec("def model(x):\n    return x", namespace)
+
+    _run(tmp_path, _get_execution_units(), mock_event_emitter, model=namespace["model"])
+
+    _run(tmp_path, _get_execution_units(), mock_event_emitter, model=namespace["model"])
+    assert CALLS == ["ExportCommand", "ConvertCommand", "ProfileCommand-OnnxCPU", "ProfileCommand-TensorRT"]
@@ -0,0 +1,183 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from model_navigator.configuration import DeviceKind, Format
+from model_navigator.core.tensor import TensorMetadata
+from model_navigator.exceptions import ModelNavigatorRuntimeError, ModelNavigatorWrongParameterError
+from model_navigator.runners.base import NavigatorRunner
+from model_navigator.runners.batcher import DynamicBatcher
+from tests.unit.base.mocks.profiling_results import profiling_result
+
+
+class RecordingRunner(NavigatorRunner):
+    @classmethod
+    def format(cls):
+        return Format.PYTHON
+
+    @classmethod
+    def devices_kind(cls):
+        return [DeviceKind.CPU]
+
+    def activate_impl(self):
+        self.batch_sizes = []
+        self.threads = set()
+        self._output = None
+
+    def infer_impl(self, feed_dict, *args, **kwargs):
+        self.batch_sizes.append(feed_dict["x"].shape[0])
+        self.threads.add(threading.get_ident())
+        # output buffer is reused between inferences
+        self._output = feed_dict["x"] * 2
+        return self.model(feed_dict, self._output)
+
+
+def _get_runner(model=lambda feed_dict, output: {"y": output}):
+    return RecordingRunner(model=model, input_metadata=TensorMetadata(), output_metadata=None)
+
+
+def _infer_concurrently(batcher, feed_dicts):
+    with ThreadPoolExecutor(max_workers=len(feed_dicts)) as executor:
+        return list(executor.map(batcher.infer, feed_dicts))
+
+
+def test_dynamic_batcher_concatenate_requests_up_to_max_batch_size_and_scatter_outputs():
+    runner = _get_runner()
+    feed_dicts = [{"x": np.full((1, 3), value, dtype=np.float32)} for value in range(8)]
+
+    with DynamicBatcher(runner, max_batch_size=4, max_queue_delay=1000) as batcher:
+        outputs = _infer_concurrently(batcher, feed_dicts)
+
+    assert runner.batch_sizes == [4, 4]
+    assert runner.threads == {batcher._thread.ident}
+    for feed_dict, output in zip(feed_dicts, outputs):
+        assert np.array_equal(output["y"], feed_dict["x"] * 2)
+    assert not runner.is_active
+
+
+def test_dynamic_batcher_infer_partial_batch_when_max_queue_delay_passed():
+    runner = _get_runner()
+
+    with DynamicBatcher(runner, max_batch_size=4, max_queue_delay=50) as batcher:
+        start = time.perf_counter()
+        output = batcher.infer({"x": np.ones((2, 3))})
+        elapsed = time.perf_counter() - start
+
+    assert runner.batch_sizes == [2]
+    assert output["y"].shape == (2, 3)
+    assert 0.05 <= elapsed < 1.0
+
+
+def test_dynamic_batcher_batch_only_requests_with_same_shapes():
+    runner = _get_runner()
+    feed_dicts = [
+        {"x": np.ones((1, 3))},
+        {"x": np.ones((1, 5))},
+        {"x": np.ones((2, 3))},
+        {"x": np.ones((6, 3))},
+    ]
+
+    with DynamicBatcher(runner, max_batch_size=4, max_queue_delay=200) as batcher:
+        outputs = _infer_concurrently(batcher, feed_dicts)
+
+    assert sorted(runner.batch_sizes) == [1, 3, 6]
+    assert [output["y"].shape for output in outputs] == [(1, 3), (1, 5), (2, 3), (6, 3)]
+
+
+def test_dynamic_batcher_infer_requests_one_by_one_when_outputs_cannot_be_split():
+    runner = _get_runner(model=lambda feed_dict, output: {"y": output.sum(keepdims=True)})
+    feed_dicts = [{"x": np.full((1, 2), value)} for value in range(4)]
+
+    with DynamicBatcher(runner, max_batch_size=4, max_queue_delay=1000) as batcher:
+        outputs = _infer_concurrently(batcher, feed_dicts)
+
+    assert runner.batch_sizes == [4, 1, 1, 1, 1]
+    assert [output["y"].tolist() for output in outputs] == [[[4 * value]] for value in range(4)]
+
+
+def test_dynamic_batcher_return_error_to_each_request_when_inference_fails():
+    def _model(feed_dict, output):
+        raise ValueError("Inference failed")
+
+    with DynamicBatcher(_get_runner(model=_model), max_batch_size=2, max_queue_delay=1000) as batcher:
+        futures = [batcher.submit({"x": np.ones((1, 2))}) for _ in range(2)]
+
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+
+
+def test_dynamic_batcher_infer_queued_requests_when_stopped():
+    runner = _get_runner()
+    batcher = DynamicBatcher(runner, max_batch_size=8, max_queue_delay=10000)
+    batcher.start()
+    futures = [batcher.submit({"x": np.ones((1, 2))}) for _ in range(3)]
+
+    batcher.stop()
+
+    assert runner.batch_sizes == [3]
+    assert all(future.result()["y"].shape == (1, 2) for future in futures)
+    with pytest.raises(ModelNavigatorRuntimeError):
+        batcher.submit({"x": np.ones((1, 2))})
+
+
+def test_dynamic_batcher_infer_async_when_called_from_event_loop():
+    runner = _get_runner()
+
+    async def _infer(batcher):
+        return await asyncio.gather(*[batcher.infer_async({"x": np.full((1, 2), value)}) for value in range(4)])
+
+    with DynamicBatcher(runner, max_batch_size=4, max_queue_delay=1000) as batcher:
+        outputs = asyncio.run(_infer(batcher))
+
+    assert runner.batch_sizes == [4]
+    assert [output["y"].tolist() for output in outputs] == [[[2 * value] * 2] for value in range(4)]
+
+
+def test_dynamic_batcher_raise_error_when_runner_activation_fails():
+    class FailingRunner(RecordingRunner):
+        def activate_impl(self):
+            raise ValueError("Activation failed")
+
+    batcher = DynamicBatcher(FailingRunner(model=None, input_metadata=TensorMetadata(), output_metadata=None), 4)
+
+    with pytest.raises(ValueError):
+        batcher.start()
+    assert not batcher.is_active
+
+
+def test_from_profiling_results_select_batch_size_with_max_throughput_and_latency_of_smallest_batch():
+    profiling_results = [
+        profiling_result(1, 2.0),
+        profiling_result(2, 2.5),
+        profiling_result(4, 3.0),
+        profiling_result(8, 7.0),
+        profiling_result(4, 1.0, concurrency=4),
+    ]
+
+    batcher = DynamicBatcher.from_profiling_results(_get_runner(), profiling_results)
+    limited_batcher = DynamicBatcher.from_profiling_results(
+        _get_runner(), profiling_results, max_batch_size=2, max_queue_delay=0.5
+    )
+
+    assert (batcher.max_batch_size, batcher.max_queue_delay) == (4, 2.0)
+    assert (limited_batcher.max_batch_size, limited_batcher.max_queue_delay) == (2, 0.5)
+    with pytest.raises(ModelNavigatorWrongParameterError):
+        DynamicBatcher.from_profiling_results(_get_runner(), [profiling_result(None, 2.0)])
@@ -0,0 +1,218 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import pathlib
+
+import numpy as np
+import pytest
+
+from model_navigator.configuration import OnnxExecutionMode, OnnxGraphOptimizationLevel, OnnxSessionOptions
+from model_navigator.core.tensor import TensorMetadata
+from model_navigator.core.workspace import Workspace
+from model_navigator.frameworks.onnx.utils import get_onnxrt_optimized_model_path
+from model_navigator.package.builder import PackageBuilder
+from model_navigator.package.loader import PackageLoader
+from tests.unit.base.mocks.packages import onnx_package_with_tensorrt_runner
+
+onnx = pytest.importorskip("onnx")
+onnxrt = pytest.importorskip("onnxruntime")
+
+from model_navigator.runners.onnx import OnnxrtCPURunner  # noqa: E402
+
+
+def _save_model(model_path: pathlib.Path) -> None:
+    # y = (x + 1) * 2, the constant subgraph is folded by graph optimizations
+    graph = onnx.helper.make_graph(
+        nodes=[
+            onnx.helper.make_node("Add", ["one", "one"], ["two"]),
+            onnx.helper.make_node("Add", ["x", "one"], ["x_plus_one"]),
+            onnx.helper.make_node("Mul", ["x_plus_one", "two"], ["y"]),
+        ],
+        name="test",
+        inputs=[onnx.helper.make_tensor_value_info("x", onnx.TensorProto.FLOAT, [None, 3])],
+        outputs=[onnx.helper.make_tensor_value_info("y", onnx.TensorProto.FLOAT, [None, 3])],
+        initializer=[onnx.numpy_helper.from_array(np.array(1.0, dtype=np.float32), name="one")],
+    )
+    model = onnx.helper.make_model(graph, opset_imports=[onnx.helper.make_opsetid("", 13)], ir_version=8)
+    onnx.save(model, model_path.as_posix())
+
+
+def _save_nonzero_model(model_path: pathlib.Path) -> None:
+    # shape of the output depends on values of the input
+    graph = onnx.helper.make_graph(
+        nodes=[onnx.helper.make_node("NonZero", ["x"], ["y"])],
+        name="test",
+        inputs=[onnx.helper.make_tensor_value_info("x", onnx.TensorProto.FLOAT, [None])],
+        outputs=[onnx.helper.make_tensor_value_info("y", onnx.TensorProto.INT64, [1, None])],
+    )
+    model = onnx.helper.make_model(graph, opset_imports=[onnx.helper.make_opsetid("", 13)], ir_version=8)
+    onnx.save(model, model_path.as_posix())
+
+
+def _get_runner(model_path: pathlib.Path, **kwargs):
+    return OnnxrtCPURunner(
+        model=model_path,
+        input_metadata=TensorMetadata().add("x", (-1, 3), np.float32),
+        output_metadata=TensorMetadata().add("y", (-1, 3), np.float32),
+        **kwargs,
+    )
+
+
+def _infer(model_path: pathlib.Path, **kwargs):
+    runner = _get_runner(model_path, **kwargs)
+    with runner:
+        return runner.infer({"x": np.ones((2, 3), dtype=np.float32)}), runner.sess
+
+
+def test_onnxrt_cpu_runner_apply_session_options_when_provided(tmp_path):
+    model_path = tmp_path / "model.onnx"
+    _save_model(model_path)
+    session_options = OnnxSessionOptions(
+        intra_op_num_threads=1,
+        inter_op_num_threads=2,
+        execution_mode=OnnxExecutionMode.PARALLEL,
+        graph_optimization_level=OnnxGraphOptimizationLevel.BASIC,
+        enable_cpu_mem_arena=False,
+        enable_mem_pattern=False,
+    )
+
+    outputs, sess = _infer(model_path, session_options=session_options.to_dict(parse=True))
+
+    assert np.array_equal(outputs["y"], np.full((2, 3), 4.0, dtype=np.float32))
+    sess_options = sess.get_session_options()
+    assert sess_options.intra_op_num_threads == 1
+    assert sess_options.inter_op_num_threads == 2
+    assert sess_options.execution_mode == onnxrt.ExecutionMode.ORT_PARALLEL
+    assert sess_options.graph_optimization_level == onnxrt.GraphOptimizationLevel.ORT_ENABLE_BASIC
+    assert sess_options.enable_cpu_mem_arena is False
+    assert sess_options.enable_mem_pattern is False
+
+
+def test_onnxrt_cpu_runner_load_optimized_model_when_cached(tmp_path):
+    model_path = tmp_path / "model.onnx"
+    _save_model(model_path)
+    optimized_model_path = get_onnxrt_optimized_model_path(model_path, "CPUExecutionProvider")
+
+    _infer(model_path, cache_optimized_model=True)
+
+    assert optimized_model_path.exists()
+    assert [path.name for path in tmp_path.iterdir() if path.name.endswith(".tmp")] == []
+
+    outputs, sess = _infer(model_path, cache_optimized_model=True)
+
+    assert np.array_equal(outputs["y"], np.full((2, 3), 4.0, dtype=np.float32))
+    assert sess.get_session_options().graph_optimization_level == onnxrt.GraphOptimizationLevel.ORT_DISABLE_ALL
+
+
+def test_onnxrt_cpu_runner_optimize_model_again_when_model_changed_after_caching(tmp_path):
+    model_path = tmp_path / "model.onnx"
+    _save_model(model_path)
+    optimized_model_path = get_onnxrt_optimized_model_path(model_path, "CPUExecutionProvider")
+    _infer(model_path, cache_optimized_model=True)
+    optimized_model_mtime = optimized_model_path.stat().st_mtime
+    os.utime(optimized_model_path, (optimized_model_mtime - 10, optimized_model_mtime - 10))
+    model = onnx.load(model_path.as_posix())
+    model.doc_string = "changed"
+    onnx.save(model, model_path.as_posix())
+
+    _, sess = _infer(model_path, cache_optimized_model=True)
+
+    assert sess.get_session_options().graph_optimization_level == onnxrt.GraphOptimizationLevel.ORT_ENABLE_ALL
+    assert optimized_model_path.stat().st_mtime > optimized_model_mtime - 10
+
+
+def test_onnxrt_cpu_runner_optimize_model_again_when_session_options_changed_after_caching(tmp_path):
+    model_path = tmp_path / "model.onnx"
+    _save_model(model_path)
+    _infer(model_path, cache_optimized_model=True)
+    session_options = OnnxSessionOptions(graph_optimization_level=OnnxGraphOptimizationLevel.BASIC)
+
+    _, sess = _infer(model_path, cache_optimized_model=True, session_options=session_options.to_dict(parse=True))
+
+    assert sess.get_session_options().graph_optimization_level == onnxrt.GraphOptimizationLevel.ORT_ENABLE_BASIC
+
+
+def test_onnxrt_cpu_runner_load_optimized_model_from_loaded_package_when_model_extracted_after_it(tmp_path):
+    workspace = tmp_path / "workspace"
+    package = onnx_package_with_tensorrt_runner(workspace)
+    model_path = workspace / "onnx" / "model.onnx"
+    _save_model(model_path)
+    _infer(model_path, cache_optimized_model=True)
+    (workspace / "navigator.log").write_text("log")
+    package_path = tmp_path / "package.nav"
+    PackageBuilder().save(package=package, path=package_path)
+
+    loaded_workspace = Workspace(tmp_path / "loaded")
+    PackageLoader().from_file(package_path, workspace=loaded_workspace)
+    loaded_model_path = loaded_workspace.path / "onnx" / "model.onnx"
+    optimized_model_path = get_onnxrt_optimized_model_path(loaded_model_path, "CPUExecutionProvider")
+    # extraction does not preserve modification times, so the model can be newer than the optimized model
+    optimized_model_mtime = optimized_model_path.stat().st_mtime
+    os.utime(loaded_model_path, (optimized_model_mtime + 10, optimized_model_mtime + 10))
+
+    outputs, sess = _infer(loaded_model_path, cache_optimized_model=True)
+
+    assert np.array_equal(outputs["y"], np.full((2, 3), 4.0, dtype=np.float32))
+    assert sess.get_session_options().graph_optimization_level == onnxrt.GraphOptimizationLevel.ORT_DISABLE_ALL
+
+
+def test_onnxrt_cpu_runner_return_new_outputs_when_inputs_shapes_repeat(tmp_path):
+    model_path = tmp_path / "model.onnx"
+    _save_model(model_path)
+    samples = [np.full((batch_size, 3), value, dtype=np.float32) for batch_size, value in [(2, 1), (4, 2), (2, 3)]]
+
+    with _get_runner(model_path) as runner:
+        outputs = [runner.infer({"x": sample}) for sample in samples * 2]
+
+    for output, sample in zip(outputs, samples * 2):
+        assert list(output) == ["y"]
+        assert np.array_equal(output["y"], (sample + 1) * 2)
+
+
+def test_onnxrt_cpu_runner_raise_error_when_input_bound_in_previous_inference_is_missing(tmp_path):
+    model_path = tmp_path / "model.onnx"
+    _save_model(model_path)
+
+    with _get_runner(model_path) as runner:
+        runner.infer({"x": np.ones((2, 3), dtype=np.float32)})
+        with pytest.raises(ValueError, match=r"\['x'\] are missing"):
+            runner.infer({"y": np.ones((2, 3), dtype=np.float32)})
+
+
+def test_onnxrt_cpu_runner_return_same_outputs_buffers_when_reuse_output_buffers_enabled(tmp_path):
+    model_path = tmp_path / "model.onnx"
+    _save_model(model_path)
+    sample = np.ones((2, 3), dtype=np.float32)
+
+    with _get_runner(model_path, reuse_output_buffers=True) as runner:
+        outputs = [runner.infer({"x": sample})["y"] for _ in range(3)]
+        sample[:] = 2.0
+        output = runner.infer({"x": sample})["y"]
+
+    assert outputs[1] is outputs[2]
+    assert output is outputs[2]
+    assert np.array_equal(output, np.full((2, 3), 6.0, dtype=np.float32))
+
+
+def test_onnxrt_cpu_runner_return_valid_outputs_when_outputs_shapes_depend_on_inputs_values(tmp_path):
+    model_path = tmp_path / "model.onnx"
+    _save_nonzero_model(model_path)
+    samples = [np.array([1, 0, 1], dtype=np.float32), np.array([1, 0, 0], dtype=np.float32)]
+
+    runner = OnnxrtCPURunner(model=model_path, input_metadata=TensorMetadata(), output_metadata=None)
+    with runner:
+        outputs = [runner.infer({"x": sample})["y"] for sample in samples * 2]
+
+    for output, sample in zip(outputs, samples * 2):
+        assert np.array_equal(output, np.stack(np.nonzero(sample)))
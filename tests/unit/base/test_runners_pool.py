@@ -0,0 +1,165 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import functools
+import os
+import pathlib
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from model_navigator.commands.performance.profiler import OptimizationProfile, Profiler
+from model_navigator.configuration import DeviceKind, Format
+from model_navigator.core.tensor import TensorMetadata
+from model_navigator.exceptions import ModelNavigatorRuntimeError, ModelNavigatorWrongParameterError
+from model_navigator.runners.base import NavigatorRunner
+from model_navigator.runners.pool import RunnerPool
+
+
+class SleepRunner(NavigatorRunner):
+    instances = []
+
+    @classmethod
+    def format(cls):
+        return Format.PYTHON
+
+    @classmethod
+    def devices_kind(cls):
+        return [DeviceKind.CPU]
+
+    def activate_impl(self):
+        SleepRunner.instances.append(self)
+        self.requests = 0
+
+    def infer_impl(self, feed_dict, *args, **kwargs):
+        self.requests += 1
+        time.sleep(self.model)
+        return {"y": feed_dict["x"] * 2, "pid": np.array(os.getpid())}
+
+
+class FailingRunner(SleepRunner):
+    def activate_impl(self):
+        raise ValueError("Activation failed")
+
+
+def _runner_factory(runner_cls=SleepRunner, delay=0.0):
+    return functools.partial(runner_cls, model=delay, input_metadata=TensorMetadata(), output_metadata=None)
+
+
+def test_runner_pool_dispatch_requests_to_free_instances_in_round_robin_order():
+    SleepRunner.instances = []
+    with RunnerPool(runner_factory=_runner_factory(), num_instances=3) as pool:
+        outputs = [pool.infer({"x": np.full(2, value)}) for value in range(6)]
+
+        assert [instance.requests for instance in SleepRunner.instances] == [2, 2, 2]
+
+    assert [output["y"].tolist() for output in outputs] == [[2 * value] * 2 for value in range(6)]
+    assert not any(instance.is_active for instance in SleepRunner.instances)
+
+
+def test_runner_pool_serve_concurrent_requests_with_all_instances():
+    SleepRunner.instances = []
+    with RunnerPool(runner_factory=_runner_factory(delay=0.2), num_instances=4) as pool:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: pool.infer({"x": np.ones(1)}), range(4)))
+        elapsed = time.perf_counter() - start
+
+        metrics = pool.metrics()
+
+    assert elapsed < 0.6
+    assert [instance.requests for instance in SleepRunner.instances] == [1, 1, 1, 1]
+    assert metrics.num_instances == 4
+    assert metrics.request_count == 4
+    assert metrics.max_queue_length <= 4
+    assert all(utilization > 0.0 for utilization in metrics.utilization)
+
+
+def test_runner_pool_report_queueing_when_requests_exceed_instances():
+    with RunnerPool(runner_factory=_runner_factory(delay=0.1), num_instances=1) as pool:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda _: pool.infer({"x": np.ones(1)}), range(3)))
+
+        metrics = pool.metrics()
+        # inference time is tracked for each thread
+        with pytest.raises(RuntimeError):
+            pool.last_inference_time()
+        pool.infer({"x": np.ones(1)})
+        assert pool.last_inference_time()["total"] >= 100
+
+        pool.reset_metrics()
+        assert pool.metrics().request_count == 0
+
+    assert metrics.request_count == 3
+    assert metrics.max_queue_length >= 2
+    assert metrics.max_queue_time >= 100
+    assert 0.0 < metrics.avg_queue_time < metrics.max_queue_time
+    assert metrics.utilization[0] > 0.5
+
+
+def test_runner_pool_run_instances_in_worker_processes_when_use_processes_is_set():
+    with RunnerPool(runner_factory=_runner_factory(), num_instances=2, use_processes=True) as pool:
+        outputs = [pool.infer({"x": np.full(2, value)}) for value in range(4)]
+
+    assert [output["y"].tolist() for output in outputs] == [[2 * value] * 2 for value in range(4)]
+    pids = {int(output["pid"]) for output in outputs}
+    assert len(pids) == 2
+    assert os.getpid() not in pids
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_runner_pool_raise_error_when_instance_activation_fails(use_processes):
+    pool = RunnerPool(runner_factory=_runner_factory(FailingRunner), num_instances=2, use_processes=use_processes)
+
+    with pytest.raises((ModelNavigatorRuntimeError, ValueError)):
+        pool.activate()
+
+    assert not pool.is_active
+    with pytest.raises(ModelNavigatorRuntimeError):
+        pool.infer({"x": np.ones(1)})
+
+
+def test_runner_pool_raise_error_when_number_of_instances_is_lower_than_one():
+    with pytest.raises(ModelNavigatorWrongParameterError):
+        RunnerPool(runner_factory=_runner_factory(), num_instances=0)
+
+
+def test_profiler_run_return_throughput_for_each_concurrency_when_runner_pool_profiled(mocker):
+    mocker.patch("model_navigator.commands.performance.profiler.expand_sample", side_effect=lambda sample, *_: sample)
+    optimization_profile = OptimizationProfile(
+        batch_sizes=[1],
+        concurrency=[1, 4],
+        window_size=5,
+        stabilization_windows=1,
+        min_trials=1,
+        max_trials=1,
+        throughput_cutoff_threshold=None,
+    )
+    pool = RunnerPool(runner_factory=_runner_factory(delay=0.02), num_instances=4)
+    with tempfile.NamedTemporaryFile() as temp:
+        profiler = Profiler(
+            profile=optimization_profile,
+            input_metadata=MagicMock(),
+            results_path=pathlib.Path(temp.name),
+        )
+
+        results = profiler.run(runner=pool, profiling_sample={"x": np.ones((1, 2))}, sample_id=0)
+
+    assert not pool.is_active
+    assert [result.concurrency for result in results] == [1, 4]
+    assert results[1].request_count == 20
+    assert results[1].throughput > 2 * results[0].throughput
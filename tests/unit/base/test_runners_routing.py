@@ -0,0 +1,172 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+import tempfile
+
+import numpy as np
+import pytest
+
+from model_navigator.configuration import DeviceKind, Format, TensorRTPrecisionMode, TensorRTProfile
+from model_navigator.configuration.model.model_config import ONNXModelConfig, TensorRTModelConfig
+from model_navigator.core.tensor import TensorMetadata
+from model_navigator.exceptions import ModelNavigatorRuntimeError, ModelNavigatorWrongParameterError
+from model_navigator.package.package import Package
+from model_navigator.runners.base import NavigatorRunner
+from model_navigator.runners.onnx import OnnxrtCUDARunner, OnnxrtTensorRTRunner
+from model_navigator.runners.routing import RouteBucket, RouteCandidate, RoutingRunner, get_routing_table
+from tests.unit.base.mocks.packages import onnx_package_with_tensorrt_runner
+from tests.unit.base.mocks.profiling_results import profiling_result
+
+_result = profiling_result
+
+
+class NamedRunner(NavigatorRunner):
+    @classmethod
+    def format(cls):
+        return Format.PYTHON
+
+    @classmethod
+    def devices_kind(cls):
+        return [DeviceKind.CPU]
+
+    def infer_impl(self, feed_dict, *args, **kwargs):
+        return {"runner": self.model}
+
+
+def _runner(name):
+    return NamedRunner(model=name, input_metadata=TensorMetadata(), output_metadata=None)
+
+
+def test_get_routing_table_assign_batch_sizes_to_runtime_with_lowest_latency():
+    candidates = [
+        RouteCandidate("torchscript", "TorchScriptCUDA", [_result(1, 1.0), _result(8, 6.0), _result(32, 24.0)]),
+        RouteCandidate("onnx", "OnnxCUDA", [_result(1, 2.0), _result(8, 5.0), _result(32, 10.0)]),
+    ]
+
+    routing_table = get_routing_table(candidates)
+
+    assert [(bucket.min_batch_size, bucket.max_batch_size, bucket.model_key) for bucket in routing_table] == [
+        (1, 1, "torchscript"),
+        (2, None, "onnx"),
+    ]
+    assert routing_table[-1].latency == 10.0
+
+
+def test_get_routing_table_respect_supported_batch_sizes_and_profiled_range():
+    candidates = [
+        # fastest, but supports only batch sizes up to 8
+        RouteCandidate("trt", "TensorRT", [_result(1, 0.5), _result(4, 1.0), _result(8, 2.0)], max_batch_size=8),
+        # interpolated at batch size 4 and not profiled above 8
+        RouteCandidate("onnx", "OnnxCUDA", [_result(1, 3.0), _result(8, 3.0)]),
+        RouteCandidate("torch", "TorchCUDA", [_result(1, 4.0), _result(16, 8.0), _result(32, 16.0)]),
+    ]
+
+    routing_table = get_routing_table(candidates)
+
+    assert [(bucket.min_batch_size, bucket.max_batch_size, bucket.runner_name) for bucket in routing_table] == [
+        (1, 8, "TensorRT"),
+        (9, None, "TorchCUDA"),
+    ]
+
+
+def test_routing_runner_send_requests_to_runner_of_batch_size():
+    routing_table = [
+        RouteBucket(min_batch_size=1, max_batch_size=4, model_key="a", runner_name="A", latency=1.0),
+        RouteBucket(min_batch_size=5, max_batch_size=8, model_key="b", runner_name="B", latency=2.0),
+    ]
+    runners = {("a", "A"): _runner("A"), ("b", "B"): _runner("B")}
+
+    with RoutingRunner(runners, routing_table) as runner:
+        assert all(routed_runner.is_active for routed_runner in runners.values())
+        assert runner.infer({"x": np.zeros((1, 3))})["runner"] == "A"
+        assert runner.infer({"x": np.zeros((4, 3))})["runner"] == "A"
+        assert runner.infer({"x": np.zeros((8, 3))})["runner"] == "B"
+        with pytest.raises(ModelNavigatorRuntimeError):
+            runner.infer({"x": np.zeros((9, 3))})
+
+    assert not any(routed_runner.is_active for routed_runner in runners.values())
+    assert runner.route_counts == {("a", "A"): 2, ("b", "B"): 1}
+
+
+def test_routing_runner_raise_error_when_runner_of_bucket_is_missing():
+    routing_table = [RouteBucket(min_batch_size=1, max_batch_size=None, model_key="a", runner_name="A", latency=1.0)]
+
+    with pytest.raises(ModelNavigatorWrongParameterError):
+        RoutingRunner({("b", "B"): _runner("B")}, routing_table)
+    with pytest.raises(ModelNavigatorWrongParameterError):
+        RoutingRunner({("a", "A"): _runner("A")}, [])
+
+
+def test_get_routing_runner_return_runner_routing_between_runtimes_from_package():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        package = onnx_package_with_tensorrt_runner(pathlib.Path(tmp_dir) / "navigator_workspace")
+        for model_status in package.status.models_status.values():
+            runners_status = model_status.runners_status
+            runners_status["OnnxCUDA"].result["Performance"]["profiling_results"] = [
+                _result(1, 1.0),
+                _result(16, 10.0),
+            ]
+            runners_status["OnnxTensorRT"].result["Performance"]["profiling_results"] = [
+                _result(1, 2.0),
+                _result(16, 4.0),
+                _result(16, 1.0, concurrency=2),
+            ]
+
+        runner = package.get_routing_runner()
+
+        assert isinstance(runner._runners[runner.get_route(1)], OnnxrtCUDARunner)
+        assert isinstance(runner._runners[runner.get_route(32)], OnnxrtTensorRTRunner)
+        assert [bucket.runner_name for bucket in runner.routing_table] == ["OnnxCUDA", "OnnxTensorRT"]
+
+
+def test_get_batch_size_range_return_range_supported_by_tensorrt_profiles():
+    model_config = TensorRTModelConfig(
+        precision_mode=TensorRTPrecisionMode.HIERARCHY,
+        max_workspace_size=None,
+        optimization_level=None,
+        compatibility_level=None,
+        trt_profiles=[
+            TensorRTProfile().add("x", (1, 3), (4, 3), (8, 3)).add("y", (2, 3), (4, 3), (16, 3)),
+            TensorRTProfile().add("x", (8, 3), (16, 3), (32, 3)).add("y", (8, 3), (16, 3), (32, 3)),
+        ],
+    )
+
+    assert Package._get_batch_size_range(model_config, batch_dim=0) == (2, 32)
+
+
+def test_get_batch_size_range_return_profiled_batch_sizes_when_tensorrt_model_has_no_profiles():
+    model_config = TensorRTModelConfig(
+        precision_mode=TensorRTPrecisionMode.HIERARCHY,
+        max_workspace_size=None,
+        optimization_level=None,
+        compatibility_level=None,
+        trt_profiles=None,
+    )
+    profiling_results = [_result(batch_size, 1.0) for batch_size in (1, 2, 4, 8, 16)]
+    dataloader_trt_profile = TensorRTProfile().add("x", (1, 3), (4, 3), (8, 3))
+
+    assert Package._get_batch_size_range(
+        model_config,
+        batch_dim=0,
+        profiling_results=profiling_results,
+        dataloader_trt_profile=dataloader_trt_profile,
+    ) == (1, 16)
+    assert Package._get_batch_size_range(model_config, batch_dim=0) == (1, None)
+
+
+def test_get_batch_size_range_return_unlimited_range_when_model_is_not_tensorrt():
+    model_config = ONNXModelConfig(opset=17, dynamic_axes=None, dynamo_export=False, graph_surgeon_optimization=True)
+    profiling_results = [_result(batch_size, 1.0) for batch_size in (1, 2, 4)]
+
+    assert Package._get_batch_size_range(model_config, batch_dim=0, profiling_results=profiling_results) == (1, None)
@@ -0,0 +1,183 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from model_navigator.configuration import DeviceKind, Format
+from model_navigator.core.tensor import TensorMetadata
+from model_navigator.exceptions import ModelNavigatorWrongParameterError
+from model_navigator.runners.base import InferenceStep, InferenceStepTimer, InferenceTime, NavigatorRunner
+from model_navigator.runners.telemetry import InferenceTelemetry, to_prometheus
+
+
+class SleepingRunner(NavigatorRunner):
+    @classmethod
+    def format(cls):
+        return Format.PYTHON
+
+    @classmethod
+    def devices_kind(cls):
+        return [DeviceKind.CPU]
+
+    def init_impl(self):
+        self.synchronizations = 0
+        self._inference_step_timer = InferenceStepTimer(
+            self._inference_time, enabled=self._enable_timer, callbacks=[self._synchronize]
+        )
+
+    def infer_impl(self, feed_dict, *args, **kwargs):
+        with self._inference_step_timer.measure_step(InferenceStep.H2D_MEMCPY):
+            pass
+        with self._inference_step_timer.measure_step(InferenceStep.COMPUTE):
+            time.sleep(0.002)
+        return feed_dict
+
+    def _synchronize(self):
+        self.synchronizations += 1
+
+
+def _get_runner(enable_timer=False):
+    return SleepingRunner(model=None, input_metadata=TensorMetadata(), output_metadata=None, enable_timer=enable_timer)
+
+
+def test_enable_telemetry_record_steps_without_device_synchronization():
+    runner = _get_runner()
+    telemetry = runner.enable_telemetry(capacity=16)
+
+    with runner:
+        for _ in range(10):
+            runner.infer({"x": np.ones(1)})
+
+    snapshot = telemetry.snapshot()
+    assert runner.synchronizations == 0
+    assert (snapshot.runner_name, snapshot.inference_count, snapshot.sample_count) == ("SleepingRunner", 10, 10)
+    assert set(snapshot.steps) == {"h2d_memcpy", "compute", "total"}
+    assert snapshot.steps["compute"].p50_time >= 2.0
+    assert snapshot.steps["total"].avg_time >= snapshot.steps["compute"].avg_time
+    assert 0 < snapshot.throughput < 1000
+    with pytest.raises(RuntimeError):
+        runner.last_inference_time()
+
+
+def test_enable_telemetry_record_steps_along_with_enabled_timer():
+    runner = _get_runner(enable_timer=True)
+    telemetry = runner.enable_telemetry()
+
+    with runner:
+        runner.infer({"x": np.ones(1)})
+
+    assert runner.synchronizations == 3
+    assert runner.last_inference_time()["compute"] == pytest.approx(telemetry.snapshot().steps["compute"].avg_time)
+
+
+def test_telemetry_record_only_sampled_inferences_and_keep_last_ones_up_to_capacity():
+    runner = _get_runner()
+    telemetry = runner.enable_telemetry(capacity=4, sampling_interval=3)
+
+    with runner:
+        for _ in range(20):
+            runner.infer({"x": np.ones(1)})
+
+    snapshot = telemetry.snapshot()
+    assert (snapshot.inference_count, snapshot.sample_count) == (20, 4)
+    np.testing.assert_array_equal(np.sort(telemetry._counts), [9, 12, 15, 18])
+
+    telemetry.reset()
+    assert telemetry.snapshot().sample_count == 0
+
+    runner.disable_telemetry()
+    assert runner.telemetry is None
+
+
+def test_telemetry_ignore_inference_which_failed():
+    telemetry = InferenceTelemetry("Runner")
+
+    assert telemetry.start()
+    telemetry.record("compute", 5.0)
+    assert telemetry.start()
+    telemetry.record("compute", 1.0)
+    telemetry.record("custom_step", 1.0)
+    telemetry.commit()
+
+    snapshot = telemetry.snapshot()
+    assert (snapshot.inference_count, snapshot.sample_count) == (2, 1)
+    assert snapshot.steps["compute"].total_time == 1.0
+
+
+def test_to_prometheus_export_summary_of_steps_throughput_and_inference_count():
+    telemetry = InferenceTelemetry('Runner "A"')
+    for value in [1.0, 2.0, 3.0]:
+        telemetry.start()
+        telemetry.record(InferenceStep.COMPUTE.value, value)
+        telemetry.commit()
+
+    text = to_prometheus([telemetry.snapshot(), InferenceTelemetry("B").snapshot()])
+
+    lines = text.splitlines()
+    assert lines.count("# TYPE model_navigator_inference_step_time_ms summary") == 1
+    assert 'model_navigator_inference_step_time_ms{runner="Runner \\"A\\"",step="compute",quantile="0.5"} 2.0' in lines
+    assert 'model_navigator_inference_step_time_ms_sum{runner="Runner \\"A\\"",step="compute"} 6.0' in lines
+    assert 'model_navigator_inference_step_time_ms_count{runner="Runner \\"A\\"",step="compute"} 3' in lines
+    assert 'model_navigator_inference_total{runner="B"} 0' in lines
+    assert 'model_navigator_inference_throughput{runner="B"} 0.0' in lines
+    assert telemetry.to_prometheus() == to_prometheus([telemetry.snapshot()])
+
+
+def test_telemetry_raise_error_when_parameters_are_not_valid():
+    with pytest.raises(ModelNavigatorWrongParameterError):
+        InferenceTelemetry("Runner", capacity=0)
+    with pytest.raises(ModelNavigatorWrongParameterError):
+        InferenceTelemetry("Runner", sampling_interval=0)
+
+
+def test_inference_step_timer_measure_nested_steps_with_callbacks():
+    calls = []
+    timer = InferenceStepTimer(InferenceTime(), enabled=True, callbacks=[lambda: calls.append(1)])
+
+    with timer.measure_step(InferenceStep.TOTAL):
+        with timer.measure_step("compute"):
+            time.sleep(0.001)
+    with timer.measure_step(InferenceStep.COMPUTE):
+        pass
+
+    assert len(calls) == 3
+    assert timer.inference_time["total"] >= timer.inference_time["compute"] >= 1.0
+
+
+def test_inference_step_timer_measure_step_from_start_in_the_same_thread_when_steps_overlap():
+    timer = InferenceStepTimer(InferenceTime(), enabled=True)
+    first_slept, second_done = threading.Event(), threading.Event()
+
+    def _first():
+        with timer.measure_step(InferenceStep.TOTAL):
+            time.sleep(0.05)
+            first_slept.set()
+            second_done.wait()
+
+    def _second():
+        first_slept.wait()
+        with timer.measure_step(InferenceStep.TOTAL):
+            pass
+        second_done.set()
+
+    threads = [threading.Thread(target=_first), threading.Thread(target=_second)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert timer.inference_time["total"] >= 50.0
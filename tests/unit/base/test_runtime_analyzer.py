@@ -333,3 +333,77 @@ def test_get_runtime_returns_min_latency_runner_when_strategy_is_min_latency_and
 
     assert isinstance(runtime_result.model_status.model_config, TorchScriptModelConfig)
     assert runtime_result.runner_status.runner_name == "TorchScriptCUDA"
+
+
+def _concurrency_runner_status(runner_name, throughput_per_concurrency):
+    return RunnerStatus(
+        runner_name=runner_name,
+        status={
+            "Correctness": CommandStatus.OK,
+            "Performance": CommandStatus.OK,
+        },
+        result={
+            "Correctness": {"per_output_tolerance": {"output__0": Tolerance(atol=0.0, rtol=0.0)}},
+            "Performance": {
+                "profiling_results": [
+                    ProfilingResults(
+                        sample_id=0,
+                        batch_size=1,
+                        avg_latency=1000.0 * concurrency / throughput,
+                        std_latency=0.0,
+                        p50_latency=1000.0 * concurrency / throughput,
+                        p90_latency=1000.0 * concurrency / throughput,
+                        p95_latency=1000.0 * concurrency / throughput,
+                        p99_latency=1000.0 * concurrency / throughput,
+                        throughput=throughput,
+                        avg_gpu_clock=1500.0,
+                        request_count=50,
+                        concurrency=concurrency,
+                    )
+                    for concurrency, throughput in throughput_per_concurrency.items()
+                ]
+            },
+        },
+    )
+
+
+model_statuses_concurrency = {
+    onnx_config.key: ModelStatus(
+        model_config=onnx_config,
+        runners_status={"OnnxCUDA": _concurrency_runner_status("OnnxCUDA", {1: 1000.0, 8: 2000.0})},
+    ),
+    tensorrt_config.key: ModelStatus(
+        model_config=tensorrt_config,
+        runners_status={"TensorRT": _concurrency_runner_status("TensorRT", {1: 800.0, 8: 4000.0})},
+    ),
+}
+
+
+def test_get_runtime_returns_max_throughput_runner_for_lowest_concurrency_when_concurrency_not_provided():
+    runtime_result = RuntimeAnalyzer.get_runtime(
+        model_statuses_concurrency,
+        strategy=MaxThroughputStrategy(),
+    )
+
+    assert runtime_result.runner_status.runner_name == "OnnxCUDA"
+    assert runtime_result.throughput == 1000.0
+
+
+def test_get_runtime_returns_max_throughput_runner_for_target_concurrency_when_concurrency_provided():
+    runtime_result = RuntimeAnalyzer.get_runtime(
+        model_statuses_concurrency,
+        strategy=MaxThroughputStrategy(concurrency=8),
+    )
+
+    assert runtime_result.runner_status.runner_name == "TensorRT"
+    assert runtime_result.throughput == 4000.0
+
+
+def test_get_runtime_returns_max_thr_within_lat_budget_runner_for_target_concurrency_when_concurrency_provided():
+    runtime_result = RuntimeAnalyzer.get_runtime(
+        model_statuses_concurrency,
+        strategy=MaxThroughputWithLatencyBudgetStrategy(latency_budget=3.0, concurrency=8),
+    )
+
+    assert runtime_result.runner_status.runner_name == "TensorRT"
+    assert runtime_result.latency == 2.0
@@ -0,0 +1,197 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import pathlib
+import tempfile
+
+import pytest
+
+from model_navigator.commands.performance.results import ProfilingResults
+from model_navigator.configuration import (
+    MaxThroughputWithConstraintsStrategy,
+    ParetoObjective,
+    TensorRTPrecision,
+    TensorRTPrecisionMode,
+)
+from model_navigator.configuration.model.model_config import ONNXModelConfig, TensorRTModelConfig
+from model_navigator.exceptions import ModelNavigatorConfigurationError, ModelNavigatorRuntimeAnalyzerError
+from model_navigator.package.status import ModelStatus
+from model_navigator.runners.base import InferenceTime
+from model_navigator.runtime_analyzer import RuntimeAnalyzer
+from model_navigator.runtime_analyzer.pareto import format_pareto_front, get_pareto_front, save_pareto_front
+from tests.unit.base.mocks.profiling_results import profiling_result, runner_status
+
+MiB = 2**20
+
+onnx_config = ONNXModelConfig(opset=13, dynamic_axes=None, dynamo_export=False, graph_surgeon_optimization=True)
+tensorrt_config = TensorRTModelConfig(
+    precision=TensorRTPrecision.FP16,
+    precision_mode=TensorRTPrecisionMode.HIERARCHY,
+    max_workspace_size=None,
+    optimization_level=None,
+    compatibility_level=None,
+)
+
+
+def _result(batch_size, throughput, p99_latency, device_memory=None, sample_id=0):
+    return profiling_result(
+        batch_size,
+        1000 * batch_size / throughput,
+        sample_id=sample_id,
+        std_latency=0.1,
+        p90_latency=p99_latency,
+        p95_latency=p99_latency,
+        p99_latency=p99_latency,
+        throughput=throughput,
+        host_memory=100 * MiB,
+        device_memory=device_memory,
+    )
+
+
+models_status = {
+    onnx_config.key: ModelStatus(
+        model_config=onnx_config,
+        runners_status={
+            # exact, moderate speed
+            "OnnxCUDA": runner_status(
+                "OnnxCUDA",
+                [_result(1, 500, 3.0, 200 * MiB), _result(8, 2000, 6.0, 300 * MiB)],
+                atol=1e-6,
+            ),
+            # dominated by OnnxCUDA on all objectives
+            "OnnxCPU": runner_status("OnnxCPU", [_result(1, 100, 12.0, 200 * MiB)], atol=1e-6),
+        },
+    ),
+    tensorrt_config.key: ModelStatus(
+        model_config=tensorrt_config,
+        runners_status={
+            # fast, inexact and memory hungry
+            "TensorRT": runner_status(
+                "TensorRT",
+                [
+                    _result(1, 1000, 2.0, 500 * MiB),
+                    _result(8, 6000, 4.0, 800 * MiB),
+                    _result(8, 5000, 5.0, 800 * MiB, sample_id=1),
+                ],
+                atol=1e-2,
+                rtol=1e-3,
+            ),
+        },
+    ),
+}
+
+
+def test_get_runtime_points_combine_samples_and_take_worst_tolerance_of_outputs():
+    points = RuntimeAnalyzer.get_runtime_points(models_status, runners=["TensorRT"])
+
+    assert [point.batch_size for point in points] == [1, 8]
+    # results without sketches are combined from latency statistics of samples
+    assert points[1].throughput == pytest.approx(1000 * 8 / ((8 / 6 + 8 / 5) / 2))
+    assert points[1].p99_latency == pytest.approx(4.99)
+    assert points[1].device_memory == 800 * MiB
+    assert (points[1].atol, points[1].rtol) == (1e-2, 1e-3)
+    assert points[1].format == "trt"
+
+
+def test_get_runtime_points_read_percentiles_from_sketches_merged_across_samples():
+    # 2 slow inferences are above the 99th percentile of all 200 measurements, but not of the first sample
+    profiling_results = [
+        ProfilingResults.from_measurements(
+            [InferenceTime(total=1.0)] * 98 + [InferenceTime(total=10.0)] * 2, [None], batch_size=8, sample_id=0
+        ),
+        ProfilingResults.from_measurements([InferenceTime(total=1.0)] * 100, [None], batch_size=8, sample_id=1),
+    ]
+    status = {
+        onnx_config.key: ModelStatus(
+            model_config=onnx_config,
+            runners_status={"OnnxCUDA": runner_status("OnnxCUDA", profiling_results, atol=0.0)},
+        )
+    }
+
+    (point,) = RuntimeAnalyzer.get_runtime_points(status)
+
+    assert profiling_results[0].p99_latency == 10.0
+    assert point.p99_latency == pytest.approx(1.0, rel=0.01)
+    assert point.throughput == pytest.approx(1000 * 8 / 1.09)
+
+
+def test_get_pareto_front_return_points_not_dominated_on_objectives():
+    front = RuntimeAnalyzer.get_pareto_front(models_status)
+
+    assert [(point.runner_name, point.batch_size) for point in front] == [
+        ("TensorRT", 8),
+        ("OnnxCUDA", 8),
+        ("TensorRT", 1),
+        ("OnnxCUDA", 1),
+    ]
+
+    front = RuntimeAnalyzer.get_pareto_front(models_status, objectives=[ParetoObjective.THROUGHPUT])
+    assert [(point.runner_name, point.batch_size) for point in front] == [("TensorRT", 8)]
+
+
+def test_get_pareto_front_treat_not_measured_values_as_worst():
+    points = RuntimeAnalyzer.get_runtime_points(models_status, runners=["OnnxCPU", "OnnxCUDA"])
+    front = get_pareto_front(points, objectives=[ParetoObjective.DEVICE_MEMORY, ParetoObjective.P99_LATENCY])
+    assert [(point.runner_name, point.batch_size) for point in front] == [("OnnxCUDA", 1)]
+
+    # without memory of batch size 1 other points are no longer dominated
+    points[0].device_memory = None
+    front = get_pareto_front(points, objectives=[ParetoObjective.DEVICE_MEMORY, ParetoObjective.P99_LATENCY])
+    assert [(point.runner_name, point.batch_size) for point in front] == [
+        ("OnnxCUDA", 8),
+        ("OnnxCUDA", 1),
+        ("OnnxCPU", 1),
+    ]
+
+
+def test_get_runtime_select_max_throughput_satisfying_constraints():
+    result = RuntimeAnalyzer.get_runtime(models_status, strategy=MaxThroughputWithConstraintsStrategy())
+    assert result.runner_status.runner_name == "TensorRT"
+
+    strategy = MaxThroughputWithConstraintsStrategy(max_atol=1e-4)
+    result = RuntimeAnalyzer.get_runtime(models_status, strategy=strategy)
+    assert (result.runner_status.runner_name, result.throughput) == ("OnnxCUDA", 2000)
+
+    strategy = MaxThroughputWithConstraintsStrategy(p99_latency_budget=3.0, max_device_memory=600 * MiB)
+    result = RuntimeAnalyzer.get_runtime(models_status, strategy=strategy)
+    assert (result.runner_status.runner_name, result.throughput) == ("TensorRT", 1000)
+
+    strategy = MaxThroughputWithConstraintsStrategy(max_host_memory=10 * MiB)
+    with pytest.raises(ModelNavigatorRuntimeAnalyzerError):
+        RuntimeAnalyzer.get_runtime(models_status, strategy=strategy)
+
+
+def test_max_throughput_with_constraints_strategy_raise_error_when_constraint_is_negative():
+    with pytest.raises(ModelNavigatorConfigurationError):
+        MaxThroughputWithConstraintsStrategy(max_atol=-1.0)
+
+    strategy = MaxThroughputWithConstraintsStrategy(p99_latency_budget=5.0, max_rtol=0.1, concurrency=2)
+    assert str(strategy) == "MaxThroughputWithConstraintsStrategy(p99_latency_budget=5.0, max_rtol=0.1, concurrency=2)"
+
+
+def test_pareto_front_can_be_exported_as_table_and_json():
+    front = RuntimeAnalyzer.get_pareto_front(models_status)
+
+    table = format_pareto_front(front)
+    assert "device_memory [MiB]" in table
+    assert "800.0" in table
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = pathlib.Path(tmp_dir) / "front.json"
+        save_pareto_front(front, path)
+        data = json.loads(path.read_text())
+
+    assert data["objectives"] == ["throughput", "p99_latency", "device_memory", "atol"]
+    assert data["points"][0]["runner_name"] == "TensorRT"
+    assert data["points"][0]["device_memory"] == 800 * MiB
@@ -0,0 +1,139 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import functools
+
+import pytest
+
+from model_navigator.commands.performance.results import ProfilingResults
+from model_navigator.configuration import WorkloadAwareStrategy, WorkloadObjective
+from model_navigator.configuration.model.model_config import ONNXModelConfig
+from model_navigator.exceptions import ModelNavigatorConfigurationError, ModelNavigatorRuntimeAnalyzerError
+from model_navigator.package.status import CommandStatus, ModelStatus
+from model_navigator.runners.base import InferenceTime
+from model_navigator.runtime_analyzer import RuntimeAnalyzer
+from tests.unit.base.mocks.profiling_results import profiling_result, runner_status
+
+onnx_config = ONNXModelConfig(opset=13, dynamic_axes=None, dynamo_export=False, graph_surgeon_optimization=True)
+
+
+_result = functools.partial(profiling_result, p90_factor=1.1, p95_factor=1.2, p99_factor=1.5)
+
+
+def _models_status(failed_status=CommandStatus.OK):
+    return {
+        onnx_config.key: ModelStatus(
+            model_config=onnx_config,
+            runners_status={
+                # fast for small batches
+                "OnnxCPU": runner_status("OnnxCPU", [_result(1, 1.0), _result(4, 4.0), _result(16, 16.0)]),
+                # fast for large batches
+                "OnnxCUDA": runner_status("OnnxCUDA", [_result(1, 3.0), _result(4, 3.5), _result(16, 5.0)]),
+                "TensorRT": runner_status("TensorRT", [_result(1, 0.1), _result(16, 0.2)], status=failed_status),
+            },
+        )
+    }
+
+
+def test_get_runtime_return_runtime_best_for_traffic_of_small_requests():
+    strategy = WorkloadAwareStrategy(traffic={1: 90, 2: 10})
+
+    result = RuntimeAnalyzer.get_runtime(_models_status(failed_status=CommandStatus.FAIL), strategy=strategy)
+
+    assert result.runner_status.runner_name == "OnnxCPU"
+    # batch size 2 is interpolated between 1 and 4
+    assert result.latency == pytest.approx(0.9 * 1.0 + 0.1 * 2.0)
+    assert result.throughput == pytest.approx(1000 / 1.1 * 1.1)
+
+
+def test_get_runtime_return_runtime_best_for_traffic_of_large_requests_given_as_shapes():
+    strategy = WorkloadAwareStrategy(
+        traffic={(8, 3, 224): 0.5, (16, 3, 224): 0.5}, objective=WorkloadObjective.P99_LATENCY
+    )
+
+    result = RuntimeAnalyzer.get_runtime(_models_status(failed_status=CommandStatus.FAIL), strategy=strategy)
+
+    assert strategy.traffic == {8: 0.5, 16: 0.5}
+    assert result.runner_status.runner_name == "OnnxCUDA"
+
+
+def test_get_workload_scores_split_requests_larger_than_profiled_batch_size():
+    strategy = WorkloadAwareStrategy(traffic={40: 1})
+
+    scores = RuntimeAnalyzer.get_workload_scores(_models_status(), strategy=strategy, runners=["OnnxCPU", "OnnxCUDA"])
+
+    scores = {score.runner_name: score for score in scores}
+    # 40 samples are processed as two batches of 16 and a batch of 8
+    assert scores["OnnxCPU"].expected_latency == pytest.approx(16.0 + 16.0 + 8.0)
+    assert scores["OnnxCUDA"].expected_latency == pytest.approx(5.0 + 5.0 + 4.0)
+    assert scores["OnnxCUDA"].expected_p99_latency == pytest.approx(14.0 * 1.5)
+    assert scores["OnnxCUDA"].qps == pytest.approx(1000 / 14.0)
+    assert scores["OnnxCUDA"].throughput == pytest.approx(40 * 1000 / 14.0)
+
+
+def test_get_workload_scores_return_p99_of_mixture_of_batch_sizes():
+    strategy = WorkloadAwareStrategy(traffic={1: 0.98, 16: 0.02})
+
+    (score,) = RuntimeAnalyzer.get_workload_scores(_models_status(), strategy=strategy, runners=["OnnxCPU"])
+
+    # 2% of requests take at least 16ms, so the 99th percentile falls into the latency of batch size 16
+    assert score.expected_latency == pytest.approx(0.98 * 1.0 + 0.02 * 16.0)
+    assert 16.0 <= score.expected_p99_latency < 24.0
+
+
+def test_get_workload_scores_return_p99_of_mixture_of_sketches_of_profiled_batch_sizes():
+    profiling_results = [
+        ProfilingResults.from_measurements(
+            [InferenceTime(total=1.0)] * 90 + [InferenceTime(total=3.0)] * 10, [None], batch_size=1, sample_id=0
+        ),
+        ProfilingResults.from_measurements([InferenceTime(total=2.0)] * 100, [None], batch_size=2, sample_id=0),
+    ]
+    status = {
+        onnx_config.key: ModelStatus(
+            model_config=onnx_config, runners_status={"OnnxCPU": runner_status("OnnxCPU", profiling_results)}
+        )
+    }
+    strategy = WorkloadAwareStrategy(traffic={1: 0.5, 2: 0.5})
+
+    (score,) = RuntimeAnalyzer.get_workload_scores(status, strategy=strategy)
+
+    # 5% of requests of batch size 1 take 3ms, so the 99th percentile of the mixture is 3ms
+    assert score.expected_p99_latency == pytest.approx(3.0, rel=0.01)
+
+
+def test_get_runtime_select_runtime_within_latency_budget():
+    strategy = WorkloadAwareStrategy(traffic={16: 1}, objective=WorkloadObjective.THROUGHPUT, latency_budget=10.0)
+
+    result = RuntimeAnalyzer.get_runtime(_models_status(failed_status=CommandStatus.FAIL), strategy=strategy)
+    assert result.runner_status.runner_name == "OnnxCUDA"
+
+    strategy = WorkloadAwareStrategy(traffic={16: 1}, latency_budget=1.0)
+    with pytest.raises(ModelNavigatorRuntimeAnalyzerError):
+        RuntimeAnalyzer.get_runtime(_models_status(failed_status=CommandStatus.FAIL), strategy=strategy)
+
+
+def test_workload_aware_strategy_raise_error_when_traffic_is_not_valid():
+    with pytest.raises(ModelNavigatorConfigurationError):
+        WorkloadAwareStrategy(traffic={})
+    with pytest.raises(ModelNavigatorConfigurationError):
+        WorkloadAwareStrategy(traffic={0: 1})
+    with pytest.raises(ModelNavigatorConfigurationError):
+        WorkloadAwareStrategy(traffic={1: -1})
+    with pytest.raises(ModelNavigatorConfigurationError):
+        WorkloadAwareStrategy(traffic={1: 0})
+
+
+def test_workload_aware_strategy_str_contain_objective_and_budget():
+    strategy = WorkloadAwareStrategy(traffic={1: 1}, objective="throughput", latency_budget=5.0)
+
+    assert str(strategy) == "WorkloadAwareStrategy(throughput, 5.0[ms])"
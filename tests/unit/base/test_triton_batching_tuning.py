@@ -0,0 +1,163 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import functools
+import pathlib
+import tempfile
+
+import yaml
+
+from model_navigator.pytriton import DynamicBatcher as PyTritonDynamicBatcher
+from model_navigator.pytriton import PyTritonAdapter
+from model_navigator.triton import DynamicBatcher, InstanceGroup, model_repository
+from model_navigator.triton.batching_tuning import BATCHING_TUNING_RESULT_KEY, tune_batching
+from model_navigator.triton.model_repository import add_model_from_package
+from tests.unit.base.mocks.packages import onnx_package_with_cpu_runner_only, onnx_package_with_cuda_runner
+from tests.unit.base.mocks.profiling_results import profiling_result
+
+_result = functools.partial(profiling_result, p99_factor=1.5)
+
+
+# throughput in samples/s: 500, 800, 1000, 1032, 1040
+PROFILING_RESULTS = [
+    _result(1, 2.0),
+    _result(2, 2.5),
+    _result(4, 4.0),
+    _result(8, 7.75),
+    _result(16, 15.38),
+]
+
+
+def _set_profiling_results(package, profiling_results, runner_name="OnnxCPU"):
+    for model_status in package.status.models_status.values():
+        model_status.runners_status[runner_name].result["Performance"]["profiling_results"] = profiling_results
+
+
+def test_tune_batching_prefer_batch_sizes_from_throughput_knee():
+    tuning = tune_batching(PROFILING_RESULTS)
+
+    assert tuning.max_batch_size == 16
+    assert tuning.preferred_batch_sizes == [4, 8, 16]
+    assert tuning.max_queue_delay_microseconds == 2000
+    assert tuning.instance_count is None
+    assert tuning.reasoning[0].startswith("Throughput knee at batch size 4")
+
+
+def test_tune_batching_limit_preferred_batch_sizes_and_queue_delay_to_latency_budget():
+    tuning = tune_batching(PROFILING_RESULTS, latency_budget=5.0)
+
+    # p99 latency of batch size 2 is 3.75ms and of batch size 4 is 6ms
+    assert tuning.preferred_batch_sizes == [2]
+    assert tuning.max_queue_delay_microseconds == 1250
+    assert tuning.latency_budget == 5.0
+
+
+def test_tune_batching_prefer_smallest_batch_size_when_none_fits_latency_budget():
+    tuning = tune_batching(PROFILING_RESULTS, latency_budget=1.0)
+
+    assert tuning.preferred_batch_sizes == [1]
+    assert tuning.max_queue_delay_microseconds == 0
+
+
+def test_tune_batching_select_instance_count_where_concurrency_stops_scaling():
+    concurrency_results = [
+        _result(4, 4.0, concurrency=2),
+        _result(4, 4.2, concurrency=4),
+        _result(4, 8.0, concurrency=8),
+    ]
+
+    tuning = tune_batching(PROFILING_RESULTS + concurrency_results)
+
+    # throughput of batch size 4 scales 1000 -> 2000 -> 3810 -> 4000
+    assert tuning.instance_count == 4
+    assert tuning.preferred_batch_sizes == [4, 8, 16]
+
+
+def test_tune_batching_average_results_of_samples():
+    profiling_results = [
+        _result(1, 2.0),
+        _result(1, 4.0, sample_id=1),
+        _result(2, 3.0),
+        _result(2, 3.0, sample_id=1),
+    ]
+
+    tuning = tune_batching(profiling_results)
+
+    assert tuning.preferred_batch_sizes == [2]
+    assert tuning.max_queue_delay_microseconds == 3000
+
+
+def test_tune_batching_return_none_when_profiled_without_batching():
+    result = _result(1, 2.0)
+    result.batch_size = None
+
+    assert tune_batching([result]) is None
+
+
+def test_add_model_from_package_apply_tuned_batching_and_record_reasoning_in_package(mocker):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workspace_path = pathlib.Path(tmp_dir) / "workspace"
+        model_repository_path = pathlib.Path(tmp_dir) / "model_repository"
+        package = onnx_package_with_cpu_runner_only(workspace_path)
+        _set_profiling_results(package, PROFILING_RESULTS + [_result(4, 4.0, concurrency=2)])
+        spy_add_model = mocker.spy(model_repository, "add_model")
+
+        add_model_from_package(model_repository_path, model_name="Model", package=package, tune_batching=True)
+
+        config = spy_add_model.call_args.kwargs["config"]
+        assert config.max_batch_size == 16
+        assert config.batcher == DynamicBatcher(max_queue_delay_microseconds=2000, preferred_batch_size=[4, 8, 16])
+        assert config.instance_groups == [InstanceGroup(count=2)]
+
+        model_config = (model_repository_path / "Model" / "config.pbtxt").read_text()
+        assert "preferred_batch_size: 4\n  preferred_batch_size: 8\n  preferred_batch_size: 16" in model_config
+        assert "max_queue_delay_microseconds: 2000" in model_config
+
+        with (workspace_path / "status.yaml").open() as fp:
+            status = yaml.safe_load(fp)
+        assert status["result"][BATCHING_TUNING_RESULT_KEY]["preferred_batch_sizes"] == [4, 8, 16]
+        assert status["result"][BATCHING_TUNING_RESULT_KEY]["reasoning"]
+
+
+def test_add_model_from_package_use_default_batcher_when_tuning_disabled(mocker):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workspace_path = pathlib.Path(tmp_dir) / "workspace"
+        package = onnx_package_with_cpu_runner_only(workspace_path)
+        _set_profiling_results(package, PROFILING_RESULTS)
+        spy_add_model = mocker.spy(model_repository, "add_model")
+
+        add_model_from_package(pathlib.Path(tmp_dir) / "model_repository", model_name="Model", package=package)
+
+        config = spy_add_model.call_args.kwargs["config"]
+        assert config.max_batch_size == 16
+        assert config.batcher == DynamicBatcher()
+        assert config.instance_groups == []
+        assert BATCHING_TUNING_RESULT_KEY not in package.status.result
+
+
+def test_pytriton_adapter_return_config_with_tuned_batching():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workspace = pathlib.Path(tmp_dir) / "navigator_workspace"
+        package = onnx_package_with_cuda_runner(workspace)
+        _set_profiling_results(package, PROFILING_RESULTS, runner_name="OnnxCUDA")
+        _set_profiling_results(package, [_result(batch_size, 100.0) for batch_size in [1, 2, 4, 8, 16]])
+
+        adapter = PyTritonAdapter(package, tune_batching=True, latency_budget=5.0)
+        model_config = adapter.config
+
+        assert model_config.max_batch_size == 16
+        assert model_config.batcher == PyTritonDynamicBatcher(
+            max_queue_delay_microseconds=1250, preferred_batch_size=[2]
+        )
+        assert adapter.batching_tuning.instance_count is None
+        assert package.status.result[BATCHING_TUNING_RESULT_KEY]["latency_budget"] == 5.0
@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
+
 import numpy as np
 import pytest
 
 from model_navigator.configuration import TensorType
-from model_navigator.core.tensor import TensorSpec, TensorUtils, get_tensor_type
+from model_navigator.core.tensor import PyTreeMetadata, TensorSpec, TensorUtils, get_tensor_type
 
 
 def test_numpy_eq():
@@ -85,3 +87,39 @@ def test_tensorspec_optional():
 def test_get_tensor_type_numpy():
     a = np.ones((8, 64), dtype=np.float32)
     assert get_tensor_type(a) == TensorType.NUMPY
+
+
+def test_pytree_metadata_flatten_sample_return_tensors_without_constants():
+    sample = ((np.zeros(1), [np.ones(2), 3]), {"c": (np.ones(4),), "a": None, "b": np.ones(3)})
+    pytree_metadata = PyTreeMetadata.from_sample(sample, TensorType.NUMPY, prefix="input")
+
+    flattened_sample = pytree_metadata.flatten_sample(sample)
+
+    assert list(flattened_sample.keys()) == ["input__0", "input__1", "input__3", "input__2"]
+    assert flattened_sample["input__2"].shape == (3,)
+
+
+def test_pytree_metadata_unflatten_sample_return_sample_with_original_structure():
+    sample = ((np.zeros(1), [np.ones(2), 3]), {"b": np.ones(3), "a": None, "c": (np.ones(4),)})
+    pytree_metadata = PyTreeMetadata.from_sample(sample, TensorType.NUMPY, prefix="input")
+
+    unflattened_sample = pytree_metadata.unflatten_sample(pytree_metadata.flatten_sample(sample))
+
+    assert unflattened_sample[0][0] is sample[0][0]
+    assert unflattened_sample[0][1][1] == 3
+    assert unflattened_sample[1]["a"] is None
+    assert unflattened_sample[1]["c"][0] is sample[1]["c"][0]
+    assert PyTreeMetadata.from_sample(unflattened_sample, TensorType.NUMPY, prefix="input") == pytree_metadata
+
+
+def test_pytree_metadata_pickle_return_equal_metadata_when_sample_was_flattened():
+    sample = (np.zeros(1), {"a": np.ones(2)})
+    pytree_metadata = PyTreeMetadata.from_sample(sample, TensorType.NUMPY, prefix="input")
+    pytree_metadata.flatten_sample(sample)
+    pytree_metadata.unflatten_sample({"input__0": 0, "input__1": 1})
+
+    unpickled_pytree_metadata = pickle.loads(pickle.dumps(pytree_metadata))
+
+    assert unpickled_pytree_metadata == pytree_metadata
+    assert hash(unpickled_pytree_metadata) == hash(pytree_metadata)
+    assert unpickled_pytree_metadata.flatten_sample(sample).keys() == {"input__0", "input__1"}
@@ -0,0 +1,79 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# pytype: disable=import-error
+
+import torch  # pytype: disable=import-error
+
+from model_navigator.core.artifact_cache import hash_model
+
+
+class _Scale(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.linear = torch.nn.Linear(3, 3)
+
+    def forward(self, x):
+        return self.linear(x) * 2
+
+
+def test_hash_model_return_different_hash_only_when_parameters_changed():
+    torch.manual_seed(0)
+    model = _Scale()
+    expected_hash = hash_model(model)
+
+    torch.manual_seed(0)
+    assert hash_model(_Scale()) == expected_hash
+    assert hash_model(_Scale().to(torch.bfloat16)) != expected_hash
+    with torch.no_grad():
+        model.linear.weight[0, 0] += 1.0
+    assert hash_model(model) != expected_hash
+
+
+class _ScaleWithAttributes(torch.nn.Module):
+    def __init__(self, scale=2.0, eps=1e-5):
+        super().__init__()
+        self.scale = scale
+        self.eps = eps
+        self.linear = torch.nn.Linear(3, 3)
+        self.register_buffer("offset", torch.zeros(3), persistent=False)
+
+    def forward(self, x):
+        return self.linear(x) * self.scale + self.offset + self.eps
+
+
+def test_hash_model_return_different_hash_when_attributes_or_non_persistent_buffers_changed():
+    torch.manual_seed(0)
+    model = _ScaleWithAttributes()
+    expected_hash = hash_model(model)
+
+    torch.manual_seed(0)
+    assert hash_model(_ScaleWithAttributes()) == expected_hash
+    torch.manual_seed(0)
+    assert hash_model(_ScaleWithAttributes(scale=3.0)) != expected_hash
+    torch.manual_seed(0)
+    assert hash_model(_ScaleWithAttributes(eps=1e-6)) != expected_hash
+
+    model.offset += 1.0
+    assert hash_model(model) != expected_hash
+
+
+def test_hash_model_return_none_when_attribute_cannot_be_hashed():
+    model = _ScaleWithAttributes()
+    model.lock = object()
+
+    assert hash_model(model) is None
+
+
+def test_hash_model_return_none_when_model_type_not_supported():
+    assert hash_model(lambda x: x) is None
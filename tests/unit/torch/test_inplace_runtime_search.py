@@ -0,0 +1,236 @@
+# Copyright (c) 2024, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from model_navigator.exceptions import ModelNavigatorRuntimeAnalyzerError, ModelNavigatorUserInputError
+from model_navigator.inplace import load_optimized, search_module_runtimes
+from model_navigator.inplace.config import inplace_config
+from model_navigator.inplace.registry import module_registry
+from model_navigator.inplace.runtime_search import (
+    EAGER_RUNTIME,
+    ModuleRuntimesObjective,
+    ModuleRuntimesSearchResult,
+    beam_search,
+    get_cost,
+    get_runtime_candidates,
+)
+from model_navigator.package.status import CommandStatus
+
+ONNX = ("onnx", "OnnxCUDA")
+TRT = ("trt-fp16", "TensorRT")
+TORCHSCRIPT = ("torchscript-trace", "TorchScriptCUDA")
+
+
+@pytest.fixture(autouse=True)
+def clean_up_registry():
+    """Clears registry after test case."""
+    yield
+    module_registry.clear()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, ms):
+        self.now += ms / 1000.0
+
+
+class FakeModule:
+    """Module which advances the clock by the cost of its loaded runtime."""
+
+    def __init__(self, clock, costs, packages):
+        self._clock = clock
+        self._costs = costs
+        self._module_timer = None
+        self.wrapper = SimpleNamespace(packages=packages)
+        self.runtime = None
+
+    def load_eager(self, device=None):
+        self.runtime = EAGER_RUNTIME
+
+    def load_optimized(self, strategies=None, device="cuda", activate_runners=True):
+        if not activate_runners:
+            return
+        runtime = (strategies[0].model_key, strategies[0].runner_name)
+        if runtime not in self._costs:
+            raise ModelNavigatorRuntimeAnalyzerError(f"Runtime {runtime} not found.")
+        self.runtime = runtime
+
+    def __call__(self, x):
+        if self._module_timer and self._module_timer.enabled:
+            with self._module_timer:
+                self._clock.advance(self._costs[self.runtime])
+        else:
+            self._clock.advance(self._costs[self.runtime])
+        return x
+
+
+def _package(latencies, failed=()):
+    models_status = {}
+    for (model_key, runner_name), latency in latencies.items():
+        status = CommandStatus.FAIL if (model_key, runner_name) in failed else CommandStatus.OK
+        runner_status = SimpleNamespace(
+            status={"Correctness": status, "Performance": status},
+            result={
+                "Performance": {
+                    "profiling_results": [
+                        SimpleNamespace(concurrency=1, p50_latency=latency),
+                        SimpleNamespace(concurrency=2, p50_latency=100 * latency),
+                    ]
+                }
+            },
+        )
+        models_status.setdefault(model_key, SimpleNamespace(runners_status={})).runners_status[runner_name] = (
+            runner_status
+        )
+
+    return SimpleNamespace(status=SimpleNamespace(models_status=models_status))
+
+
+def test_beam_search_return_assignments_with_lowest_summed_costs():
+    module_costs = {
+        "encoder": {ONNX: 4.0, TRT: 2.0, EAGER_RUNTIME: 10.0},
+        "decoder": {ONNX: 3.0, TRT: 2.5, EAGER_RUNTIME: 6.0},
+    }
+
+    candidates = beam_search(module_costs, beam_width=3)
+
+    assert [candidate.module_runtimes for candidate in candidates] == [
+        {"encoder": TRT, "decoder": TRT},
+        {"encoder": TRT, "decoder": ONNX},
+        {"encoder": ONNX, "decoder": TRT},
+    ]
+    assert [candidate.estimated_cost for candidate in candidates] == [4.5, 5.0, 6.5]
+    assert all(candidate.measured_cost is None for candidate in candidates)
+
+
+def test_beam_search_raise_error_when_beam_width_is_not_positive_or_module_has_no_runtime():
+    with pytest.raises(ModelNavigatorUserInputError):
+        beam_search({"encoder": {ONNX: 1.0}}, beam_width=0)
+    with pytest.raises(ModelNavigatorUserInputError):
+        beam_search({"encoder": {ONNX: 1.0}, "decoder": {}})
+
+
+def test_get_runtime_candidates_return_runtimes_valid_in_all_packages_ranked_by_latency():
+    packages = [
+        _package({ONNX: 3.0, TRT: 1.0, TORCHSCRIPT: 2.0}),
+        _package({ONNX: 3.0, TRT: 2.0, TORCHSCRIPT: 0.5}, failed=[TORCHSCRIPT]),
+    ]
+
+    candidates = get_runtime_candidates(
+        packages,
+        model_keys=["onnx", "trt-fp16", "torchscript-trace"],
+        runner_names=["OnnxCUDA", "TensorRT", "TorchScriptCUDA"],
+    )
+
+    assert candidates == [TRT, ONNX, EAGER_RUNTIME]
+    assert get_runtime_candidates(packages, ["onnx", "trt-fp16"], ["OnnxCUDA"]) == [ONNX, EAGER_RUNTIME]
+    assert get_runtime_candidates(packages, ["onnx", "trt-fp16"], ["OnnxCUDA", "TensorRT"], max_candidates=1) == [
+        TRT,
+        EAGER_RUNTIME,
+    ]
+
+
+def test_get_cost_return_time_per_call_for_latency_and_time_per_sample_for_throughput():
+    assert get_cost([2.0, 6.0], [1, 3], ModuleRuntimesObjective.LATENCY) == 4.0
+    assert get_cost([2.0, 6.0], [1, 3], "throughput") == 2.0
+    assert get_cost([], [], ModuleRuntimesObjective.LATENCY) == 0.0
+
+
+def test_search_module_runtimes_select_assignment_verified_end_to_end(mocker, monkeypatch, tmp_path):
+    monkeypatch.setattr(inplace_config, "cache_dir", tmp_path)
+    clock = FakeClock()
+    mocker.patch("time.monotonic", clock)
+
+    packages = [_package({ONNX: 4.0, TRT: 2.0})]
+    encoder = FakeModule(clock, {ONNX: 4.0, TRT: 2.0, EAGER_RUNTIME: 10.0}, packages)
+    decoder = FakeModule(clock, {ONNX: 3.0, TRT: 2.5, EAGER_RUNTIME: 6.0}, packages)
+    module_registry.modules["encoder"] = encoder
+    module_registry.modules["decoder"] = decoder
+
+    calls = []
+
+    def pipeline(x):
+        calls.append((encoder.runtime, decoder.runtime))
+        encoder(x)
+        decoder(x)
+        # both modules on TensorRT compete for the device, which is visible only end-to-end
+        if encoder.runtime == decoder.runtime == TRT:
+            clock.advance(2.0)
+
+    result = search_module_runtimes(
+        pipeline,
+        dataloader=[(1, MagicMock()), (1, MagicMock())],
+        target_formats=("onnx", "trt"),
+        runners=("OnnxCUDA", "TensorRT"),
+        beam_width=3,
+        repeats=2,
+        initialize=False,
+    )
+
+    assert result.module_runtimes == {"encoder": TRT, "decoder": ONNX}
+    assert result.latency == pytest.approx(5.0)
+    assert result.throughput == pytest.approx(200.0)
+    assert result.module_costs["encoder"] == {
+        "python on eager": pytest.approx(10.0),
+        "onnx on OnnxCUDA": pytest.approx(4.0),
+        "trt-fp16 on TensorRT": pytest.approx(2.0),
+    }
+    assert [candidate.measured_cost for candidate in result.candidates] == [
+        pytest.approx(6.5),
+        pytest.approx(5.0),
+        pytest.approx(6.5),
+    ]
+    # warm-up and measured passes for 3 runtimes and 3 verified candidates
+    assert len(calls) == 6 * 3 * 2
+    assert (encoder.runtime, decoder.runtime) == (TRT, ONNX)
+    assert encoder._module_timer is None
+
+    loaded = ModuleRuntimesSearchResult.load()
+    assert loaded.module_runtimes == result.module_runtimes
+    assert loaded.objective == ModuleRuntimesObjective.LATENCY
+
+    encoder.load_eager()
+    decoder.load_eager()
+    load_optimized(device="cpu", module_runtimes=loaded)
+    assert (encoder.runtime, decoder.runtime) == (TRT, ONNX)
+
+
+def test_search_module_runtimes_raise_error_when_beam_width_is_not_positive():
+    with pytest.raises(ModelNavigatorUserInputError):
+        search_module_runtimes(lambda x: x, dataloader=[], beam_width=0)
+
+
+def test_search_module_runtimes_raise_error_of_pipeline_failing_with_eager_modules(monkeypatch, tmp_path):
+    monkeypatch.setattr(inplace_config, "cache_dir", tmp_path)
+    module_registry.modules["encoder"] = FakeModule(FakeClock(), {EAGER_RUNTIME: 1.0}, [_package({ONNX: 1.0})])
+
+    def pipeline(x):
+        raise RuntimeError("Pipeline failed in eager mode.")
+
+    with pytest.raises(RuntimeError, match="Pipeline failed in eager mode."):
+        search_module_runtimes(
+            pipeline,
+            dataloader=[(1, MagicMock())],
+            target_formats=("onnx",),
+            runners=("OnnxCUDA",),
+            initialize=False,
+        )